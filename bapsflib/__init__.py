@@ -15,7 +15,7 @@ Los Angeles (UCLA).  It is a toolkit for reading, manipulating, and analyzing
 data collected at BaPSF.
 """
 
-__all__ = ["lapd", "phys180E"]
+__all__ = ["lapd", "phys180E", "profile"]
 
 import sys
 
@@ -25,6 +25,7 @@ if sys.version_info < (3, 10):  # coverage: ignore
 from importlib.metadata import PackageNotFoundError, version
 
 from bapsflib import _hdf, lapd, phys180E, utils
+from bapsflib.utils.profiling import profile
 
 # --- Define version -----------------------------------------------------------
 try:
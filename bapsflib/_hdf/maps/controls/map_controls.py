@@ -14,7 +14,7 @@ __all__ = ["HDFMapControls"]
 
 import h5py
 
-from typing import Dict, Tuple, Type
+from typing import Callable, Dict, List, Tuple, Type
 
 from bapsflib._hdf.maps.controls.bmotion import HDFMapControlBMotion
 from bapsflib._hdf.maps.controls.n5700ps import HDFMapControlN5700PS
@@ -28,11 +28,12 @@ from bapsflib._hdf.maps.controls.templates import (
     HDFMapControlTemplate,
 )
 from bapsflib._hdf.maps.controls.waveform import HDFMapControlWaveform
+from bapsflib._hdf.maps.templates import HDFMapDict
 from bapsflib.utils import TableDisplay
 from bapsflib.utils.exceptions import HDFMappingError
 
 
-class HDFMapControls(dict):
+class HDFMapControls(HDFMapDict):
     """
     A dictionary that contains mapping objects for all the discovered
     control devices in the HDF5 data group.  The dictionary keys are
@@ -53,13 +54,18 @@ class HDFMapControls(dict):
     device mapping classes.
     """
 
-    def __init__(self, data_group: h5py.Group):
+    def __init__(self, data_group: h5py.Group, lazy: bool = False):
         """
         Parameters
         ----------
         data_group : `h5py.Group`
             HDF5 group object to be mapped
 
+        lazy : `bool`, optional
+            If `True`, then the control device groups are discovered,
+            but a control device mapping object is only built when it
+            is first requested.  (DEFAULT `False`)
+
         Examples
         --------
 
@@ -93,7 +99,12 @@ class HDFMapControls(dict):
                 self.data_group_subgnames.append(gname)
 
         # Build the self dictionary
-        dict.__init__(self, self.__build_dict)
+        if lazy:
+            dict.__init__(self)
+            for name, builder in self.__map_builders.items():
+                self._add_lazy(name, builder)
+        else:
+            dict.__init__(self, self.__build_dict)
 
     def __str__(self):
         if len(self) == 0:
@@ -144,19 +155,11 @@ class HDFMapControls(dict):
         return tuple(self._defined_mapping_classes.keys())
 
     @property
-    def __build_dict(self) -> Dict[str, ControlMap]:
+    def __map_builders(self) -> Dict[str, Callable[[], ControlMap]]:
         """
-        Discovers the HDF5 control devices and builds the dictionary
-        containing the control device mapping objects.  This is the
-        dictionary used to initialize ``self``.
-
-        Returns
-        -------
-        dict
-            control device mapping dictionary
+        Discovers the HDF5 control devices and returns a dictionary of
+        callables that build the control device mapping objects.
         """
-        control_dict = {}
-
         # update the mapping dictionary to include the original keys, as
         # well as the associated EXPECTED_GROUP_NAME
         _mapper_dict = (
@@ -177,7 +180,10 @@ class HDFMapControls(dict):
 
                 _mapper_dict[alt_key] = tuple(mappers)
 
-        # try mapping
+        # gather the candidate (mapper, group) pairs for each key
+        candidates = (
+            {}
+        )  # type: Dict[str, List[Tuple[Type[HDFMapControlTemplate], h5py.Group]]]
         for name in self.data_group_subgnames:
             try:
                 _mappers = _mapper_dict[name]
@@ -187,17 +193,61 @@ class HDFMapControls(dict):
                 continue
 
             for _key, _mapper in _mappers:
+                # Note: always add to the control dictionary using
+                #       the original key, and not the alternate key
+                #       that corresponds to the _EXPECTED_GROUP_NAME
+                #       map class attribute
+                #
+                candidates.setdefault(_key, []).append((_mapper, self.__data_group[name]))
+
+        return {
+            _key: self.__candidates_builder(_key, _candidates)
+            for _key, _candidates in candidates.items()
+        }
+
+    @staticmethod
+    def __candidates_builder(
+        key: str, candidates: List[Tuple[Type[HDFMapControlTemplate], h5py.Group]]
+    ) -> Callable[[], ControlMap]:
+        """
+        Returns a callable that builds the mapping object for control
+        device ``key`` from the last of the ``candidates`` (mapping
+        class and group pairs) that maps successfully.
+        """
+
+        def builder() -> ControlMap:
+            for _mapper, _group in reversed(candidates):
                 try:
-                    # Note: always add to the control dictionary using
-                    #       the original key, and not the alternate key
-                    #       that corresponds to the _EXPECTED_GROUP_NAME
-                    #       map class attribute
-                    #
-                    _map = _mapper(self.__data_group[name])
-                    control_dict[_key] = _map
+                    return _mapper(_group)
                 except HDFMappingError:
                     # mapping failed
                     continue
 
+            raise HDFMappingError(key, why="no candidate group could be mapped")
+
+        return builder
+
+    @property
+    def __build_dict(self) -> Dict[str, ControlMap]:
+        """
+        Discovers the HDF5 control devices and builds the dictionary
+        containing the control device mapping objects.  This is the
+        dictionary used to initialize ``self``.
+
+        Returns
+        -------
+        dict
+            control device mapping dictionary
+        """
+        control_dict = {}
+
+        # try mapping
+        for _key, builder in self.__map_builders.items():
+            try:
+                control_dict[_key] = builder()
+            except HDFMappingError:
+                # mapping failed
+                continue
+
         # return dictionary
         return control_dict
@@ -14,17 +14,19 @@ __all__ = ["HDFMapDigitizers"]
 
 import h5py
 
-from typing import Dict, Tuple
+from functools import partial
+from typing import Callable, Dict, Tuple
 
 from bapsflib._hdf.maps.digitizers.lecroy import HDFMapDigiLeCroy180E
 from bapsflib._hdf.maps.digitizers.sis3301 import HDFMapDigiSIS3301
 from bapsflib._hdf.maps.digitizers.siscrate import HDFMapDigiSISCrate
 from bapsflib._hdf.maps.digitizers.templates import HDFMapDigiTemplate
+from bapsflib._hdf.maps.templates import HDFMapDict
 from bapsflib.utils import TableDisplay
 from bapsflib.utils.exceptions import HDFMappingError
 
 
-class HDFMapDigitizers(dict):
+class HDFMapDigitizers(HDFMapDict):
     """
     A dictionary that contains mapping objects for all the discovered
     digitizers in the HDF5 data group.  The dictionary keys are the
@@ -41,13 +43,18 @@ class HDFMapDigitizers(dict):
     mapping classes.
     """
 
-    def __init__(self, data_group: h5py.Group):
+    def __init__(self, data_group: h5py.Group, lazy: bool = False):
         """
         Parameters
         ----------
         data_group : `h5py.Group`
             HDF5 group object
 
+        lazy : `bool`, optional
+            If `True`, then the digitizer groups are discovered, but a
+            digitizer mapping object is only built when it is first
+            requested.  (DEFAULT `False`)
+
         Examples
         --------
 
@@ -68,7 +75,12 @@ class HDFMapDigitizers(dict):
         self.__data_group = data_group
 
         # Build the self dictionary
-        dict.__init__(self, self.__build_dict)
+        if lazy:
+            dict.__init__(self)
+            for name, builder in self.__map_builders.items():
+                self._add_lazy(name, builder)
+        else:
+            dict.__init__(self, self.__build_dict)
 
     def __str__(self):
         if len(self) == 0:
@@ -137,16 +149,10 @@ class HDFMapDigitizers(dict):
         return tuple(self._defined_mapping_classes)
 
     @property
-    def __build_dict(self) -> Dict[str, HDFMapDigiTemplate]:
+    def __map_builders(self) -> Dict[str, Callable[[], HDFMapDigiTemplate]]:
         """
-        Discovers the HDF5 digitizers and builds the dictionary
-        containing the digitizer mapping objects.  This is the
-        dictionary used to initialize ``self``.
-
-        Returns
-        -------
-        dict
-            digitizer mapping dictionary
+        Discovers the HDF5 digitizers and returns a dictionary of
+        callables that build the digitizer mapping objects.
         """
         # all data_group subgroups
         # - each of these subgroups can fall into one of four 'LaPD
@@ -163,17 +169,35 @@ class HDFMapDigitizers(dict):
                 subgnames.append(name)
 
         # build dictionary
-        digi_dict = {}
+        builders = {}
         for name in subgnames:
             if name in self._defined_mapping_classes:
-                # only add mappings that succeed
-                try:
-                    digi_dict[name] = self._defined_mapping_classes[name](
-                        self.__data_group[name]
-                    )
-                except HDFMappingError:
-                    # mapping failed
-                    pass
+                builders[name] = partial(
+                    self._defined_mapping_classes[name], self.__data_group[name]
+                )
+
+        return builders
+
+    @property
+    def __build_dict(self) -> Dict[str, HDFMapDigiTemplate]:
+        """
+        Discovers the HDF5 digitizers and builds the dictionary
+        containing the digitizer mapping objects.  This is the
+        dictionary used to initialize ``self``.
+
+        Returns
+        -------
+        dict
+            digitizer mapping dictionary
+        """
+        digi_dict = {}
+        for name, builder in self.__map_builders.items():
+            # only add mappings that succeed
+            try:
+                digi_dict[name] = builder()
+            except HDFMappingError:
+                # mapping failed
+                pass
 
         # return dictionary
         return digi_dict
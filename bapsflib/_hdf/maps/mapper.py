@@ -19,7 +19,7 @@ import h5py
 import numpy as np
 import os
 
-from typing import List, Union
+from typing import Any, Dict, List, Tuple, Type, Union
 from warnings import warn
 
 from bapsflib._hdf.maps.controls import HDFMapControls
@@ -32,6 +32,7 @@ from bapsflib._hdf.maps.digitizers import HDFMapDigitizers
 from bapsflib._hdf.maps.digitizers.templates import HDFMapDigiTemplate
 from bapsflib._hdf.maps.msi import HDFMapMSI
 from bapsflib._hdf.maps.msi.templates import HDFMapMSITemplate
+from bapsflib._hdf.maps.templates import HDFMapDict, HDFMapTemplate
 from bapsflib.utils import _bytes_to_str
 from bapsflib.utils.warnings import HDFMappingWarning
 
@@ -49,7 +50,15 @@ class HDFMapper(object):
     """
 
     def __init__(
-        self, hdf_obj: h5py.File, control_path: str, digitizer_path: str, msi_path: str
+        self,
+        hdf_obj: h5py.File,
+        control_path: str,
+        digitizer_path: str,
+        msi_path: str,
+        lazy: bool = False,
+        cached_maps: Union[
+            Dict[str, Dict[str, Tuple[Type[HDFMapTemplate], Dict[str, Any]]]], None
+        ] = None,
     ):
         """
         Parameters
@@ -66,6 +75,18 @@ class HDFMapper(object):
         msi_path : `str`
             internal HDF5 path to group containing MSI diagnostics
 
+        lazy : `bool`, optional
+            If `True`, then the devices are discovered, but each device
+            mapping object is only built when it is first accessed.
+            This reduces the time to open files with many devices when
+            only a few of those devices are used.  (DEFAULT `False`)
+
+        cached_maps : `dict`, optional
+            previously cached device mappings, as returned by
+            :meth:`_get_cache_state`.  Discovered devices found in
+            ``cached_maps`` are restored instead of being re-mapped.
+            (DEFAULT `None`)
+
         Notes
         -----
         The following classes are leveraged to construct the mappings:
@@ -90,6 +111,9 @@ class HDFMapper(object):
             if path == "":
                 self.DEVICE_PATHS[device] = "/"
 
+        self._lazy = bool(lazy)
+        self._cached_maps = {} if cached_maps is None else cached_maps
+
         # attach the mapping dictionaries
         self.__attach_msi()
         self.__attach_digitizers()
@@ -112,7 +136,10 @@ class HDFMapper(object):
         """
         control_path = self.DEVICE_PATHS["control"]
         if control_path in self._hdf_obj:
-            self.__controls = HDFMapControls(self._hdf_obj[control_path])
+            self.__controls = HDFMapControls(
+                self._hdf_obj[control_path], lazy=self.__lazy_attach("control")
+            )
+            self.__restore_maps(self.__controls, "control")
         else:
             warn(
                 f"Group for control devices ('{control_path}') does NOT exist.",
@@ -128,7 +155,10 @@ class HDFMapper(object):
         """
         digi_path = self.DEVICE_PATHS["digitizer"]
         if digi_path in self._hdf_obj:
-            self.__digitizers = HDFMapDigitizers(self._hdf_obj[digi_path])
+            self.__digitizers = HDFMapDigitizers(
+                self._hdf_obj[digi_path], lazy=self.__lazy_attach("digitizer")
+            )
+            self.__restore_maps(self.__digitizers, "digitizer")
         else:
             warn(
                 f"Group for digitizers ('{digi_path}') does NOT exist.",
@@ -144,11 +174,65 @@ class HDFMapper(object):
         """
         msi_path = self.DEVICE_PATHS["msi"]
         if msi_path in self._hdf_obj:
-            self.__msi = HDFMapMSI(self._hdf_obj[msi_path])
+            self.__msi = HDFMapMSI(
+                self._hdf_obj[msi_path], lazy=self.__lazy_attach("msi")
+            )
+            self.__restore_maps(self.__msi, "msi")
         else:
             warn(f"MSI ('{msi_path}') does NOT exist.", HDFMappingWarning)
             self.__msi = {}
 
+    def __lazy_attach(self, device: str) -> bool:
+        """
+        `True` if the mapping dictionary for ``device`` type devices
+        (e.g. ``'control'``) should be attached lazily, which is
+        needed to restore cached mappings.
+        """
+        return self._lazy or bool(self._cached_maps.get(device, None))
+
+    def __restore_maps(self, maps: HDFMapDict, device: str):
+        """
+        Restore the pending devices in ``maps`` from the cached mappings
+        of ``device`` type devices (e.g. ``'control'``).  The remaining
+        pending devices are mapped now, unless mapping is lazy.
+        """
+        cached = self._cached_maps.get(device, {})
+        for name in maps.pending:
+            try:
+                map_class, state = cached[name]
+                group = self._hdf_obj[state["_info"]["group path"]]
+                _map = map_class._from_cache_state(group, state)
+            except (KeyError, TypeError):
+                # device not cached or cached state is incompatible
+                continue
+
+            maps._set_built(name, _map)
+
+        if not self._lazy:
+            maps.build_all()
+
+    def _get_cache_state(
+        self,
+    ) -> Dict[str, Dict[str, Tuple[Type[HDFMapTemplate], Dict[str, Any]]]]:
+        """
+        Serializable state of all the built device mappings, which can be
+        given to the ``cached_maps`` argument of a new mapper.  Devices
+        that are still pending (lazy mapping) are not included.
+        """
+        state = {}
+        for device, maps in zip(
+            ("control", "digitizer", "msi"), (self.controls, self.digitizers, self.msi)
+        ):
+            if not isinstance(maps, HDFMapDict):
+                continue
+
+            state[device] = {
+                name: (type(_map), _map._get_cache_state())
+                for name, _map in maps._built_items()
+            }
+
+        return state
+
     def __attach_unknowns(self):
         """
         Attaches the :attr:`__unknowns` list, which contains all the
@@ -237,16 +321,14 @@ class HDFMapper(object):
             >>> # which is equivalent to
             >>> dmap = fmap.digitizers['SIS 3301']
         """
-        if name in self.controls:
-            _map = self.controls[name]
-        elif name in self.digitizers:
-            _map = self.digitizers[name]
-        elif name in self.msi:
-            _map = self.msi[name]
-        else:
-            _map = None
-
-        return _map
+        for mappings in (self.controls, self.digitizers, self.msi):
+            if name in mappings:
+                # a lazily built mapping can still fail, so use get()
+                _map = mappings.get(name, None)
+                if _map is not None:
+                    return _map
+
+        return None
 
     @property
     def main_digitizer(self) -> Union[None, DigiMap]:
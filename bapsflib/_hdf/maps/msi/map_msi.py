@@ -14,7 +14,8 @@ __all__ = ["HDFMapMSI"]
 
 import h5py
 
-from typing import Dict
+from functools import partial
+from typing import Callable, Dict
 
 from bapsflib._hdf.maps.msi.discharge import HDFMapMSIDischarge
 from bapsflib._hdf.maps.msi.gaspressure import HDFMapMSIGasPressure
@@ -22,10 +23,11 @@ from bapsflib._hdf.maps.msi.heater import HDFMapMSIHeater
 from bapsflib._hdf.maps.msi.interferometerarray import HDFMapMSIInterferometerArray
 from bapsflib._hdf.maps.msi.magneticfield import HDFMapMSIMagneticField
 from bapsflib._hdf.maps.msi.templates import HDFMapMSITemplate
+from bapsflib._hdf.maps.templates import HDFMapDict
 from bapsflib.utils.exceptions import HDFMappingError
 
 
-class HDFMapMSI(dict):
+class HDFMapMSI(HDFMapDict):
     """
     A dictionary containing mapping objects for all the discovered
     MSI diagnostic HDF5 groups.  The dictionary keys are the MSI
@@ -44,13 +46,18 @@ class HDFMapMSI(dict):
     diagnostic mapping classes.
     """
 
-    def __init__(self, msi_group: h5py.Group):
+    def __init__(self, msi_group: h5py.Group, lazy: bool = False):
         """
         Parameters
         ----------
         msi_group : `h5py.Group`
             HDF5 group object
 
+        lazy : `bool`, optional
+            If `True`, then the MSI diagnostic groups are discovered,
+            but a diagnostic mapping object is only built when it is
+            first requested.  (DEFAULT `False`)
+
         Examples
         --------
 
@@ -77,7 +84,12 @@ class HDFMapMSI(dict):
                 self.msi_group_subgnames.append(diag)
 
         # Build the self dictionary
-        dict.__init__(self, self.__build_dict)
+        if lazy:
+            dict.__init__(self)
+            for name, builder in self.__map_builders.items():
+                self._add_lazy(name, builder)
+        else:
+            dict.__init__(self, self.__build_dict)
 
     @property
     def mappable_devices(self) -> tuple:
@@ -87,6 +99,22 @@ class HDFMapMSI(dict):
         """
         return tuple(self._defined_mapping_classes.keys())
 
+    @property
+    def __map_builders(self) -> Dict[str, Callable[[], HDFMapMSITemplate]]:
+        """
+        Returns a dictionary of callables that build the mapping objects
+        of the discovered (and known) MSI diagnostics.
+        """
+        # do not attach item if mapping is not known
+        builders = {}
+        for name in self.msi_group_subgnames:
+            if name in self._defined_mapping_classes:
+                builders[name] = partial(
+                    self._defined_mapping_classes[name], self.__msi_group[name]
+                )
+
+        return builders
+
     @property
     def __build_dict(self) -> Dict[str, HDFMapMSITemplate]:
         """
@@ -99,17 +127,14 @@ class HDFMapMSI(dict):
         dict
             MSI diagnostic mapping dictionary
         """
-        # do not attach item if mapping is not known
         msi_dict = {}
-        for name in self.msi_group_subgnames:
-            if name in self._defined_mapping_classes:
-                # only add mapping that succeeded
-                try:
-                    diag_map = self._defined_mapping_classes[name](self.__msi_group[name])
-                    msi_dict[name] = diag_map
-                except HDFMappingError:
-                    # mapping failed
-                    pass
+        for name, builder in self.__map_builders.items():
+            # only add mapping that succeeded
+            try:
+                msi_dict[name] = builder()
+            except HDFMappingError:
+                # mapping failed
+                pass
 
         # return dictionary
         return msi_dict
@@ -2,14 +2,16 @@
 Module for the primary mapping template base class.
 """
 
-__all__ = ["HDFMapTemplate", "MapTypes"]
+__all__ = ["HDFMapDict", "HDFMapTemplate", "MapTypes"]
 
 import h5py
 import os
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+
+from bapsflib.utils.exceptions import HDFMappingError
 
 
 class MapTypes(Enum):
@@ -184,3 +186,203 @@ class HDFMapTemplate(ABC):
         their specific purposes.
         """
         ...
+
+    def _get_cache_state(self) -> Dict[str, Any]:
+        """
+        Serializable state of the mapping object (i.e. all instance
+        attributes, except the mapped group), used to cache the
+        mapping on disk.  Any HDF5 objects in the state are replaced by
+        their internal HDF5 paths.
+        """
+        return {
+            key: _hdf_objects_to_paths(val)
+            for key, val in vars(self).items()
+            if key != "_group"
+        }
+
+    @classmethod
+    def _from_cache_state(cls, group: h5py.Group, state: Dict[str, Any]):
+        """
+        Re-create a mapping object of ``group`` from the ``state``
+        returned by :meth:`_get_cache_state`, without re-running
+        :meth:`_build_configs`.
+        """
+        obj = cls.__new__(cls)
+        obj._group = group
+        for key, val in state.items():
+            setattr(obj, key, _paths_to_hdf_objects(val, group.file))
+
+        return obj
+
+
+class HDFMapDict(dict):
+    """
+    Base dictionary for the device mapping dictionaries (e.g.
+    `~bapsflib._hdf.maps.controls.map_controls.HDFMapControls`).  The
+    dictionary keys are the device names and the values are the device
+    mapping objects.
+
+    When a device is added with :meth:`_add_lazy`, its mapping object
+    is not constructed until it is first requested (e.g. ``d[name]``,
+    :meth:`get`, :meth:`items`, or :meth:`values`).  If the delayed
+    mapping fails, then the device is removed from the dictionary and
+    a `KeyError` is raised, just as if the device had never been mapped.
+    Methods that expose all the mapping objects (:meth:`keys`,
+    :meth:`items`, :meth:`values`, etc.) first build all pending
+    mappings, while ``len()``, ``in``, and iteration do not.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _PendingMap):
+            try:
+                value = value.build()
+            except HDFMappingError:
+                super().__delitem__(key)
+                raise KeyError(key)
+            super().__setitem__(key, value)
+
+        return value
+
+    def __iter__(self):
+        # Defining __iter__ prevents dict(self) and {**self} from
+        # copying pending (unbuilt) values, they will use keys() and
+        # __getitem__ instead.  Iterating itself does not build the
+        # pending values.
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self.build_all()
+        if isinstance(other, HDFMapDict):
+            other.build_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self.build_all()
+        return super().__repr__()
+
+    def __reduce_ex__(self, protocol):
+        self.build_all()
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def pending(self) -> Tuple[str, ...]:
+        """Names of the devices whose mapping has not been built yet."""
+        return tuple(
+            key for key, value in super().items() if isinstance(value, _PendingMap)
+        )
+
+    def _add_lazy(self, name: str, builder: Callable[[], Any]):
+        """
+        Add device ``name`` to the dictionary, where ``builder`` builds
+        its mapping object on first access.  ``builder`` should raise
+        `~bapsflib.utils.exceptions.HDFMappingError` if the mapping
+        fails.
+        """
+        super().__setitem__(name, _PendingMap(builder))
+
+    def build_all(self):
+        """Build the mapping objects of all :attr:`pending` devices."""
+        for key in self.pending:
+            try:
+                self[key]
+            except KeyError:
+                # mapping failed and the device was removed
+                pass
+
+    def copy(self) -> dict:
+        self.build_all()
+        return super().copy()
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        self.build_all()
+        return super().items()
+
+    def keys(self):
+        self.build_all()
+        return super().keys()
+
+    def _built_items(self) -> List[Tuple[str, Any]]:
+        """
+        List of ``(name, mapping object)`` pairs for all the devices
+        that are already mapped, without building :attr:`pending`
+        devices.
+        """
+        return [
+            (key, value)
+            for key, value in super().items()
+            if not isinstance(value, _PendingMap)
+        ]
+
+    def _set_built(self, name: str, value: Any):
+        """
+        Set the mapping object of device ``name``, replacing its pending
+        builder (e.g. with a mapping restored from the mapping cache).
+        """
+        super().__setitem__(name, value)
+
+    def pop(self, key, *args):
+        try:
+            value = self[key]
+        except KeyError:
+            if args:
+                return args[0]
+            raise
+
+        super().__delitem__(key)
+        return value
+
+    def values(self):
+        self.build_all()
+        return super().values()
+
+
+class _PendingMap:
+    """Placeholder for a device mapping object that is not built yet."""
+
+    __slots__ = ("_builder",)
+
+    def __init__(self, builder: Callable[[], Any]):
+        self._builder = builder
+
+    def build(self):
+        return self._builder()
+
+
+class _HDFObjectPath(str):
+    """Internal HDF5 path standing in for a cached HDF5 object."""
+
+
+def _hdf_objects_to_paths(obj):
+    """Recursively replace HDF5 objects in ``obj`` with their paths."""
+    if isinstance(obj, (h5py.Group, h5py.Dataset)):
+        return _HDFObjectPath(obj.name)
+    elif type(obj) in (list, tuple):
+        return type(obj)(_hdf_objects_to_paths(item) for item in obj)
+    elif type(obj) is dict:
+        return {key: _hdf_objects_to_paths(val) for key, val in obj.items()}
+
+    return obj
+
+
+def _paths_to_hdf_objects(obj, hdf_file: h5py.File):
+    """Inverse of `_hdf_objects_to_paths` for the HDF5 file ``hdf_file``."""
+    if isinstance(obj, _HDFObjectPath):
+        return hdf_file[str(obj)]
+    elif type(obj) in (list, tuple):
+        return type(obj)(_paths_to_hdf_objects(item, hdf_file) for item in obj)
+    elif type(obj) is dict:
+        return {key: _paths_to_hdf_objects(val, hdf_file) for key, val in obj.items()}
+
+    return obj
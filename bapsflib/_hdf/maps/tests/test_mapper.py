@@ -25,6 +25,7 @@ from bapsflib._hdf.maps.mapper import HDFMapper
 from bapsflib._hdf.maps.msi import HDFMapMSI
 from bapsflib._hdf.maps.msi.templates import HDFMapMSITemplate
 from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib.utils.exceptions import HDFMappingError
 from bapsflib.utils.warnings import HDFMappingWarning
 
 
@@ -295,6 +296,119 @@ class TestHDFMap(ut.TestCase):
         device_map = _map.get("Not a device")
         self.assertIs(device_map, None)
 
+    def test_lazy(self):
+        """Test lazy building of the device mappings."""
+        # populate with one of each device
+        self.f.add_module("Waveform")
+        self.f.add_module("SIS 3301")
+        self.f.add_module("Discharge")
+        self.f.add_module("Heater")
+        paths = {
+            "msi_path": "MSI",
+            "digitizer_path": "Raw data + config",
+            "control_path": "Raw data + config",
+        }
+        eager_map = self.map_file(self.f, **paths)
+
+        mock_discharge = mock.Mock(
+            side_effect=HDFMapMSI._defined_mapping_classes["Discharge"]
+        )
+        with mock.patch.dict(
+            HDFMapMSI._defined_mapping_classes, {"Discharge": mock_discharge}
+        ):
+            _map = self.MAP_CLASS(self.f, lazy=True, **paths)
+            mock_discharge.assert_not_called()
+
+            # devices are discovered, but not mapped
+            self.assertEqual(sorted(_map.controls.pending), ["Waveform"])
+            self.assertEqual(sorted(_map.digitizers.pending), ["SIS 3301"])
+            self.assertEqual(sorted(_map.msi.pending), ["Discharge", "Heater"])
+            self.assertEqual(_map.unknowns, eager_map.unknowns)
+            for name in ("controls", "digitizers", "msi"):
+                self.assertEqual(
+                    list(getattr(_map, name)), list(getattr(eager_map, name))
+                )
+
+            # mapping is built on first access, and only once
+            _dmap = _map.msi["Discharge"]
+            mock_discharge.assert_called_once()
+            self.assertIs(_map.get("Discharge"), _dmap)
+            mock_discharge.assert_called_once()
+            self.assertEqual(_map.msi.pending, ("Heater",))
+            self.assertIsInstance(_dmap, type(eager_map.msi["Discharge"]))
+            self.assertEqual(_dmap.info, eager_map.msi["Discharge"].info)
+
+            # mappings built through the mapping views
+            for name in ("controls", "digitizers", "msi"):
+                dmaps = dict(getattr(_map, name))
+                self.assertEqual(getattr(_map, name).pending, ())
+                for key, dmap in dmaps.items():
+                    eager_dmap = getattr(eager_map, name)[key]
+                    self.assertIsInstance(dmap, type(eager_dmap))
+                    self.assertEqual(dmap.info, eager_dmap.info)
+
+        # a failed lazy mapping removes the device
+        mock_discharge = mock.Mock(side_effect=HDFMappingError("Discharge"))
+        with mock.patch.dict(
+            HDFMapMSI._defined_mapping_classes, {"Discharge": mock_discharge}
+        ):
+            _map = self.MAP_CLASS(self.f, lazy=True, **paths)
+            self.assertIn("Discharge", _map.msi)
+            self.assertIs(_map.get("Discharge"), None)
+            self.assertNotIn("Discharge", _map.msi)
+            with self.assertRaises(KeyError):
+                _map.msi["Discharge"]
+
+    def test_cached_maps(self):
+        """Test restoring device mappings from cached mapping states."""
+        self.f.add_module("Waveform")
+        self.f.add_module("SIS 3301")
+        self.f.add_module("Discharge")
+        self.f.add_module("Heater")
+        paths = {
+            "msi_path": "MSI",
+            "digitizer_path": "Raw data + config",
+            "control_path": "Raw data + config",
+        }
+        eager_map = self.map_file(self.f, **paths)
+        state = eager_map._get_cache_state()
+        self.assertEqual(
+            {device: sorted(maps) for device, maps in state.items()},
+            {
+                "control": ["Waveform"],
+                "digitizer": ["SIS 3301"],
+                "msi": ["Discharge", "Heater"],
+            },
+        )
+
+        # drop 'Heater' from the cache, it should be mapped again
+        del state["msi"]["Heater"]
+        mock_discharge = mock.Mock(
+            side_effect=HDFMapMSI._defined_mapping_classes["Discharge"]
+        )
+        mock_heater = mock.Mock(side_effect=HDFMapMSI._defined_mapping_classes["Heater"])
+        with mock.patch.dict(
+            HDFMapMSI._defined_mapping_classes,
+            {"Discharge": mock_discharge, "Heater": mock_heater},
+        ):
+            _map = self.MAP_CLASS(self.f, cached_maps=state, **paths)
+            mock_discharge.assert_not_called()
+            mock_heater.assert_called_once()
+
+        for name in ("controls", "digitizers", "msi"):
+            maps = getattr(_map, name)
+            self.assertEqual(maps.pending, ())
+            self.assertEqual(list(maps), list(getattr(eager_map, name)))
+            for device, dmap in maps.items():
+                self.assertIsInstance(dmap, type(getattr(eager_map, name)[device]))
+                self.assertEqual(dmap.info, getattr(eager_map, name)[device].info)
+        self.assertEqual(_map.unknowns, eager_map.unknowns)
+
+        # lazy mapping leaves un-cached devices pending
+        _map = self.MAP_CLASS(self.f, lazy=True, cached_maps=state, **paths)
+        self.assertEqual(_map.msi.pending, ("Heater",))
+        self.assertEqual(_map._get_cache_state()["msi"].keys(), {"Discharge"})
+
     def test_main_digitizer(self):
         """Test identification of the "main" digitizer"""
         # 1. there are no mapped digitizers
@@ -1,11 +1,14 @@
 import numpy as np
+import pickle
 import unittest as ut
 
 from abc import ABC
 from enum import Enum
+from unittest import mock
 
-from bapsflib._hdf.maps.templates import HDFMapTemplate, MapTypes
+from bapsflib._hdf.maps.templates import HDFMapDict, HDFMapTemplate, MapTypes
 from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib.utils.exceptions import HDFMappingError
 
 
 class TestMapTypesEnum(ut.TestCase):
@@ -22,6 +25,70 @@ class TestMapTypesEnum(ut.TestCase):
         assert hasattr(MapTypes, "MSI")
 
 
+class TestHDFMapDict(ut.TestCase):
+    def setUp(self):
+        self.builder_a = mock.Mock(return_value="map a")
+        self.builder_b = mock.Mock(side_effect=HDFMappingError("b"))
+
+        self.map_dict = HDFMapDict({"eager": "map eager"})
+        self.map_dict._add_lazy("a", self.builder_a)
+        self.map_dict._add_lazy("b", self.builder_b)
+
+    def test_subclass(self):
+        self.assertTrue(issubclass(HDFMapDict, dict))
+
+    def test_lazy_build(self):
+        map_dict = self.map_dict
+
+        # nothing is built until accessed
+        self.assertEqual(list(map_dict), ["eager", "a", "b"])
+        self.assertEqual(len(map_dict), 3)
+        self.assertIn("a", map_dict)
+        self.assertEqual(map_dict.pending, ("a", "b"))
+        self.builder_a.assert_not_called()
+        self.builder_b.assert_not_called()
+
+        # build on access
+        self.assertEqual(map_dict["a"], "map a")
+        self.assertEqual(map_dict.get("a"), "map a")
+        self.builder_a.assert_called_once_with()
+        self.assertEqual(map_dict.pending, ("b",))
+
+        # failed builds remove the key
+        self.assertIsNone(map_dict.get("b"))
+        self.builder_b.assert_called_once_with()
+        self.assertNotIn("b", map_dict)
+        self.assertEqual(map_dict.pending, ())
+        with self.assertRaises(KeyError):
+            map_dict["b"]
+
+    def test_build_all(self):
+        _conditions = [
+            lambda _md: dict(_md),
+            lambda _md: list(_md.items()),
+            lambda _md: list(_md.values()),
+            lambda _md: _md.copy(),
+            lambda _md: repr(_md),
+            lambda _md: _md == {},
+            lambda _md: _md.build_all(),
+        ]
+        for func in _conditions:
+            self.setUp()
+            with self.subTest(func=func):
+                func(self.map_dict)
+                self.assertEqual(self.map_dict.pending, ())
+                self.assertEqual(
+                    dict(self.map_dict), {"eager": "map eager", "a": "map a"}
+                )
+
+    def test_pop(self):
+        self.assertEqual(self.map_dict.pop("a"), "map a")
+        self.assertNotIn("a", self.map_dict)
+        self.assertEqual(self.map_dict.pop("b", None), None)
+        with self.assertRaises(KeyError):
+            self.map_dict.pop("b")
+
+
 class TestHDFMapTemplate(ut.TestCase):
 
     def __init__(self, methodName="runTest"):
@@ -108,3 +175,22 @@ class TestHDFMapTemplate(ut.TestCase):
             with self.subTest(key=key, expected=expected):
                 val = key if not isinstance(key, str) else _map.info[key]
                 self.assertEqual(val, expected)
+
+    def test_cache_state(self):
+        _map = self._DummyMap(self.f["MSI"])
+        _map._configs["config"] = {"value": np.arange(3), "dset": self.f["MSI/d1"]}
+        _map._groups = [self.f["MSI/g1"], (self.f["MSI/g2"], "g2")]
+
+        state = _map._get_cache_state()
+        self.assertNotIn("_group", state)
+        self.assertEqual(state["_configs"]["config"]["dset"], "/MSI/d1")
+        self.assertEqual(state["_groups"], ["/MSI/g1", ("/MSI/g2", "g2")])
+        pickle.dumps(state)
+
+        _map2 = self._DummyMap._from_cache_state(self.f["MSI"], state)
+        self.assertIsInstance(_map2, self._DummyMap)
+        self.assertEqual(_map2.group, self.f["MSI"])
+        self.assertEqual(_map2.info, _map.info)
+        self.assertTrue(np.array_equal(_map2.configs["config"]["value"], np.arange(3)))
+        self.assertEqual(_map2.configs["config"]["dset"], self.f["MSI/d1"])
+        self.assertEqual(_map2._groups, [self.f["MSI/g1"], (self.f["MSI/g2"], "g2")])
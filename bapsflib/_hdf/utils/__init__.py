@@ -16,10 +16,18 @@ access and interface with the HDF5 files generated at BaPSF.
 __all__ = []
 
 from bapsflib._hdf.utils import (
+    chunk_reader,
+    columnar,
     file,
+    grid,
     hdfoverview,
     hdfreadcontrols,
     hdfreaddata,
     hdfreadmsi,
+    hdfreducedata,
     helpers,
+    map_cache,
+    parallel,
+    shotnum_cache,
+    spatial_index,
 )
@@ -0,0 +1,310 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing `~bapsflib._hdf.utils.chunk_reader.read_dset_rows_threaded`,
+a read engine that decompresses the chunks of a filtered dataset in a
+thread pool.
+
+h5py decompresses a filtered (e.g. gzip compressed) dataset one chunk
+at a time, on a single core, while holding the HDF5 library lock.
+Instead, this engine pulls the raw (still compressed) chunks with
+`h5py.h5d.DatasetID.read_direct_chunk`, which is a cheap sequential
+disk read, and decodes the chunks in a
+`~concurrent.futures.ThreadPoolExecutor`.  Since `zlib` releases the
+GIL while decompressing, the chunks are decoded on multiple cores.
+"""
+
+__all__ = [
+    "can_read_chunks",
+    "condition_engine",
+    "ENGINES",
+    "read_dset_rows_threaded",
+]
+
+import concurrent.futures
+import h5py
+import numpy as np
+import os
+import zlib
+
+from collections import deque
+from typing import List, Optional, Tuple
+
+from bapsflib._hdf.utils.helpers import read_dset_rows
+from bapsflib.utils import profiling
+
+#: supported read engines of the digitizer data
+#:
+#: - ``'h5py'`` reads (and decompresses) with h5py
+#: - ``'threads'`` decompresses the dataset chunks in a thread pool
+#:   (see `read_dset_rows_threaded`)
+ENGINES = ("h5py", "threads")
+
+#: HDF5 filters that can be decoded by `read_dset_rows_threaded`
+_DECODABLE_FILTERS = (h5py.h5z.FILTER_DEFLATE, h5py.h5z.FILTER_SHUFFLE)
+
+
+def condition_engine(engine: str) -> str:
+    """
+    Condition the ``engine`` argument of the data readers, raising a
+    `ValueError` if it is not one of `ENGINES`.
+    """
+    if not isinstance(engine, str) or engine not in ENGINES:
+        raise ValueError(f"Argument `engine` must be one of {ENGINES}, got {engine}.")
+    return engine
+
+
+def _dset_filters(dset: h5py.Dataset) -> List[int]:
+    """Return the filter codes of the filter pipeline of ``dset``."""
+    plist = dset.id.get_create_plist()
+    return [plist.get_filter(ii)[0] for ii in range(plist.get_nfilters())]
+
+
+def can_read_chunks(dset: h5py.Dataset) -> bool:
+    """
+    `True` if the chunks of ``dset`` can be decoded by
+    `read_dset_rows_threaded`, i.e. ``dset`` is a chunked 2D dataset of
+    a numeric type that is only filtered by the gzip (deflate) and/or
+    shuffle filters.
+    """
+    return (
+        dset.chunks is not None
+        and dset.ndim == 2
+        and dset.dtype.names is None
+        and dset.dtype.kind in "iuf"
+        and all(code in _DECODABLE_FILTERS for code in _dset_filters(dset))
+    )
+
+
+def _unshuffle(buf: bytes, itemsize: int) -> bytes:
+    """
+    Reverse the HDF5 shuffle filter on ``buf``, i.e. interleave the
+    byte planes of elements of size ``itemsize``.
+    """
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    nelem = raw.size // itemsize
+    nbytes = nelem * itemsize
+    unshuffled = np.empty_like(raw)
+    unshuffled[:nbytes].reshape(nelem, itemsize)[...] = (
+        raw[:nbytes].reshape(itemsize, nelem).T
+    )
+    # - bytes that do not fill a whole element are not shuffled
+    unshuffled[nbytes:] = raw[nbytes:]
+    return unshuffled.tobytes()
+
+
+def _decode_chunk(
+    buf: bytes,
+    filter_mask: int,
+    filters: List[int],
+    dtype: np.dtype,
+    chunks: Tuple[int, ...],
+) -> np.ndarray:
+    """
+    Decode the raw chunk ``buf`` by reversing the filter pipeline
+    ``filters``, skipping the filters flagged in ``filter_mask``.
+    """
+    for ii in reversed(range(len(filters))):
+        if filter_mask & (1 << ii):
+            # filter was not applied to this chunk
+            continue
+        elif filters[ii] == h5py.h5z.FILTER_DEFLATE:
+            buf = zlib.decompress(buf)
+        elif filters[ii] == h5py.h5z.FILTER_SHUFFLE:
+            buf = _unshuffle(buf, dtype.itemsize)
+
+    return np.frombuffer(buf, dtype=dtype).reshape(chunks)
+
+
+def _fill_chunk(
+    out: np.ndarray,
+    chunk_buf: Optional[Tuple[int, bytes]],
+    fillvalue,
+    filters: List[int],
+    dtype: np.dtype,
+    chunks: Tuple[int, ...],
+    dest: Tuple[slice, slice],
+    rows: np.ndarray,
+    columns: slice,
+):
+    """
+    Decode one chunk and copy its rows ``rows`` and columns ``columns``
+    into ``out[dest]``.  ``chunk_buf`` is the ``(filter_mask, bytes)``
+    tuple of the raw chunk, or `None` if the chunk is not allocated in
+    the file (then ``out[dest]`` is set to ``fillvalue``).
+    """
+    if chunk_buf is None:
+        out[dest] = fillvalue
+        return
+
+    chunk = _decode_chunk(chunk_buf[1], chunk_buf[0], filters, dtype, chunks)
+    out[dest] = chunk[rows, columns]
+
+
+def read_dset_rows_threaded(
+    dset: h5py.Dataset,
+    index: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    columns: Optional[slice] = None,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Read the rows ``index`` of dataset ``dset``, decompressing the
+    dataset chunks in a thread pool.
+
+    The raw chunks covering the requested rows and columns are read
+    sequentially with `h5py.h5d.DatasetID.read_direct_chunk`, then
+    decoded (inflated and unshuffled) and copied into ``out`` by a
+    pool of threads.  Each chunk is only read and decoded once.  If
+    ``dset`` can not be decoded by this engine (see
+    `can_read_chunks`), then the read falls back to
+    `~bapsflib._hdf.utils.helpers.read_dset_rows`.
+
+    Parameters
+    ----------
+    dset : `h5py.Dataset`
+        Dataset to read from.
+
+    index : :term:`array_like`
+        1D array of strictly increasing, non-negative row indices of
+        ``dset``.
+
+    out : `numpy.ndarray`, optional
+        Array to read the rows into.  Its shape must be
+        ``(index.size, ncolumns)``.
+
+    columns : `slice`, optional
+        Slice of the second dimension of ``dset`` to read.  If `None`
+        (DEFAULT), then the full rows are read.
+
+    max_workers : `int`, optional
+        maximum number of decoding threads.  If `None` (DEFAULT), then
+        `os.cpu_count` threads are used.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The read rows, which is ``out`` if it was given.
+
+    Examples
+    --------
+    >>> dset = f.create_dataset(
+    ...     'signal', data=data, chunks=(64, 1024), compression='gzip'
+    ... )
+    >>> index = np.arange(100, 400)
+    >>> rows = read_dset_rows_threaded(dset, index, max_workers=4)
+    >>> np.array_equal(rows, dset[100:400])
+    True
+    """
+    if not can_read_chunks(dset):
+        return read_dset_rows(dset, index, out=out, columns=columns)
+
+    index = np.asarray(index)
+    if index.ndim != 1:
+        raise ValueError("Argument `index` must be a 1D array.")
+    elif np.any(np.diff(index) <= 0):
+        raise ValueError("Argument `index` must be strictly increasing.")
+    elif index.size and (index[0] < 0 or index[-1] >= dset.shape[0]):
+        raise IndexError(
+            f"Argument `index` is out of range for dataset with {dset.shape[0]} rows."
+        )
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    elif (
+        not isinstance(max_workers, (int, np.integer))
+        or isinstance(max_workers, bool)
+        or max_workers < 1
+    ):
+        raise ValueError(
+            f"Argument `max_workers` must be a positive integer, got {max_workers}."
+        )
+
+    # ---- Condition `columns` and `out`                            ----
+    if columns is None:
+        columns = slice(0, dset.shape[1])
+    col_start, col_stop, col_step = columns.indices(dset.shape[1])
+    if col_step != 1:
+        return read_dset_rows(dset, index, out=out, columns=columns)
+    ncols = max(0, col_stop - col_start)
+
+    if out is None:
+        out = np.empty((index.size, ncols), dtype=dset.dtype)
+    elif out.shape != (index.size, ncols):
+        raise ValueError(
+            f"Argument `out` has shape {out.shape}, expected {(index.size, ncols)}."
+        )
+
+    if index.size == 0 or ncols == 0:
+        return out
+
+    # ---- Determine the chunks to be read                          ----
+    chunk_rows, chunk_cols = dset.chunks
+    filters = _dset_filters(dset)
+    dtype = dset.dtype
+    fillvalue = dset.fillvalue
+
+    # runs of `index` that fall in the same row of chunks
+    row_chunk_id = index // chunk_rows
+    breaks = np.flatnonzero(np.diff(row_chunk_id)) + 1
+    starts = np.concatenate(([0], breaks)).tolist()
+    stops = np.concatenate((breaks, [index.size])).tolist()
+
+    col_chunk_ids = range(col_start // chunk_cols, (col_stop - 1) // chunk_cols + 1)
+
+    # ---- Read raw chunks and decode in the thread pool            ----
+    # - the number of raw chunks held in memory is bounded by the
+    #   number of in-flight decode tasks
+    max_pending = 4 * max_workers
+    pending = deque()
+    stored_nbytes = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for start, stop in zip(starts, stops):
+            row_offset = int(row_chunk_id[start]) * chunk_rows
+            rows = index[start:stop] - row_offset
+            for cid in col_chunk_ids:
+                col_offset = cid * chunk_cols
+                cstart = max(col_start, col_offset)
+                cstop = min(col_stop, col_offset + chunk_cols)
+
+                try:
+                    chunk_buf = dset.id.read_direct_chunk((row_offset, col_offset))
+                except RuntimeError:
+                    # chunk storage is not allocated
+                    chunk_buf = None
+                else:
+                    stored_nbytes += len(chunk_buf[1])
+
+                pending.append(
+                    pool.submit(
+                        _fill_chunk,
+                        out,
+                        chunk_buf,
+                        fillvalue,
+                        filters,
+                        dtype,
+                        dset.chunks,
+                        (
+                            slice(start, stop),
+                            slice(cstart - col_start, cstop - col_start),
+                        ),
+                        rows,
+                        slice(cstart - col_offset, cstop - col_offset),
+                    )
+                )
+                if len(pending) >= max_pending:
+                    pending.popleft().result()
+
+        while pending:
+            pending.popleft().result()
+
+    profiling.record_bytes(dset.name, out.size * dtype.itemsize, stored=stored_nbytes)
+    return out
@@ -0,0 +1,164 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.columnar.ColumnarData`
+container, the columnar (struct-of-arrays) layout of the data read by
+`~bapsflib._hdf.utils.hdfreaddata.HDFReadData` and
+`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls`.
+"""
+
+__all__ = ["ColumnarData", "condition_layout", "LAYOUTS"]
+
+import numpy as np
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple, Union
+
+#: supported layouts of the read data
+LAYOUTS = ("structured", "columnar")
+
+
+def condition_layout(layout: str) -> str:
+    """
+    Condition the ``layout`` argument of the data readers, raising a
+    `ValueError` if it is not one of `LAYOUTS`.
+    """
+    if not isinstance(layout, str) or layout not in LAYOUTS:
+        raise ValueError(f"Argument `layout` must be one of {LAYOUTS}, got {layout}.")
+    return layout
+
+
+class ColumnarData(Mapping):
+    """
+    A lightweight struct-of-arrays container.  Each field is stored as
+    a separate C-contiguous `numpy.ndarray` whose first dimension is the
+    shot dimension, so a field (e.g. ``'signal'``) can be handed to
+    BLAS/FFT routines without a copy.
+
+    The container is indexed like a structured array:
+
+    * ``data['signal']`` returns the array of a field
+    * ``data['signal'] = values`` assigns ``values`` into the existing
+      field array (in place)
+    * ``data[10:20]`` (any non-`str` index) returns a new container of
+      the selected rows of every field
+
+    Meta-info of the data is stored in the :attr:`info` attribute.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], info: Union[dict, None] = None):
+        """
+        Parameters
+        ----------
+        columns : Dict[str, numpy.ndarray]
+            field arrays of the container, all with the same length
+            first dimension
+
+        info : `dict`, optional
+            meta-info of the data
+        """
+        nshots = {arr.shape[0] for arr in columns.values()}
+        if len(nshots) > 1:
+            raise ValueError("All columns must have the same first dimension.")
+
+        self._columns = dict(columns)  # type: Dict[str, np.ndarray]
+        self._info = {} if info is None else info
+
+    @classmethod
+    def empty(cls, shape: Tuple[int], dtype: np.dtype, **kwargs) -> "ColumnarData":
+        """
+        Allocate an (uninitialized) container with a separate
+        C-contiguous array for each field of the structured ``dtype``.
+
+        Parameters
+        ----------
+        shape : Tuple[int]
+            shape of the shot dimension, i.e. ``(nshots,)``
+
+        dtype : `numpy.dtype`
+            structured `numpy.dtype` whose fields define the columns
+
+        kwargs
+            keywords passed to the container constructor
+        """
+        dtype = np.dtype(dtype)
+        columns = {
+            name: np.empty(tuple(shape) + dtype[name].shape, dtype=dtype[name].base)
+            for name in dtype.names
+        }
+        return cls(columns, **kwargs)
+
+    def __getitem__(self, key: Union[str, Any]):
+        if isinstance(key, str):
+            return self._columns[key]
+
+        # row selection
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__.update(self.__dict__)
+        obj._columns = {name: arr[key] for name, arr in self._columns.items()}
+        return obj
+
+    def __setitem__(self, key: str, value):
+        if key not in self._columns:
+            raise KeyError(f"There is no field of name '{key}'.")
+        self._columns[key][...] = value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"'{name}': {arr.dtype}{list(arr.shape)}"
+            for name, arr in self._columns.items()
+        )
+        return f"{self.__class__.__name__}({{{fields}}})"
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The (packed) structured `numpy.dtype` equivalent to the
+        columns, i.e. the `numpy.dtype` of :meth:`to_structured`.
+        """
+        return np.dtype(
+            [(name, arr.dtype, arr.shape[1:]) for name, arr in self._columns.items()]
+        )
+
+    @property
+    def info(self) -> dict:
+        """A dictionary of meta-info for the data."""
+        return self._info
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Names of the fields (columns)."""
+        return tuple(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes consumed by the columns."""
+        return sum(arr.nbytes for arr in self._columns.values())
+
+    @property
+    def shape(self) -> Tuple[int]:
+        """Shape of the shot dimension, i.e. ``(nshots,)``."""
+        for arr in self._columns.values():
+            return arr.shape[:1]
+        return (0,)
+
+    def to_structured(self) -> np.ndarray:
+        """Copy the columns into a packed structured `numpy.ndarray`."""
+        data = np.empty(self.shape, dtype=self.dtype)
+        for name, arr in self._columns.items():
+            data[name] = arr
+        return data
@@ -20,19 +20,25 @@ import numpy as np
 import os
 import warnings
 
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from bapsflib._hdf.maps import HDFMapControls, HDFMapDigitizers, HDFMapMSI, HDFMapper
+from bapsflib._hdf.utils import map_cache as _map_cache
+from bapsflib._hdf.utils.shotnum_cache import ShotnumIndexCache
+from bapsflib.utils import profiling
 from bapsflib.utils.warnings import BaPSFWarning, HDFMappingWarning
 
 if TYPE_CHECKING:  # pragma: no cover
     # This is done for typing purposes only.
     # An actual import would cause cyclical imports.
     from bapsflib._hdf.maps.digitizers.templates import HDFMapDigiTemplate
+    from bapsflib._hdf.utils.columnar import ColumnarData
     from bapsflib._hdf.utils.hdfoverview import HDFOverview
     from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
-    from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+    from bapsflib._hdf.utils.hdfreaddata import HDFReadData, HDFReadDataColumns
     from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
+    from bapsflib._hdf.utils.hdfreducedata import HDFReduceData
+    from bapsflib._hdf.utils.spatial_index import SpatialIndex
 
 
 class File(h5py.File):
@@ -51,6 +57,8 @@ class File(h5py.File):
         digitizer_path="/",
         msi_path="/",
         silent=False,
+        lazy_map=False,
+        map_cache=True,
         **kwargs,
     ):
         """
@@ -72,6 +80,18 @@ class File(h5py.File):
 
         silent : `bool`, optional
             set `True` to suppress warnings (`False` DEFAULT)
+
+        lazy_map : `bool`, optional
+            set `True` to only build a device mapping when the device
+            is first accessed, instead of mapping all devices when the
+            file is opened (`False` DEFAULT)
+
+        map_cache : `bool`, optional
+            set `False` to disable the persistent on-disk cache of the
+            file mapping and :attr:`info` (`True` DEFAULT).  The cache
+            is only used for files opened readonly (``mode='r'``), see
+            `~bapsflib._hdf.utils.map_cache` for details.
+
         kwargs : `dict`, optional
             additional keywords passed on to `h5py.File`
 
@@ -105,16 +125,39 @@ class File(h5py.File):
         #: Internal HDF5 path for MSI devices. (DEFAULT ``'/'``)
         self.MSI_PATH = msi_path
 
+        self._lazy_map = bool(lazy_map)
+        self._readonly = mode == "r"
+        self._map_cache = bool(map_cache) and self._readonly
+        self._cached_maps = None
+
         # -- map and build info --
         warn_filter = "ignore" if silent else "default"
         with warnings.catch_warnings():
             warnings.simplefilter(warn_filter, category=BaPSFWarning)
 
+            # load mapping cache
+            cache = None
+            if self._map_cache:
+                cache = _map_cache.load_map_cache(self.filename, self._device_paths)
+                profiling.record_cache("file map", cache is not None)
+            if cache is not None:
+                self._cached_maps = cache["maps"]
+
             # create map
-            self._map_file()
+            try:
+                self._map_file()
+            finally:
+                self._cached_maps = None
 
             # build `_info` attribute
-            self._build_info()
+            if cache is None:
+                self._build_info()
+            else:
+                self._info = cache["info"]
+
+            # update mapping cache
+            if self._map_cache:
+                self._save_map_cache(cache)
 
     def _build_info(self):
         """Builds the general :attr:`info` dictionary for the file."""
@@ -131,8 +174,42 @@ class File(h5py.File):
             control_path=self.CONTROL_PATH,
             digitizer_path=self.DIGITIZER_PATH,
             msi_path=self.MSI_PATH,
+            lazy=self._lazy_map,
+            cached_maps=self._cached_maps,
+        )
+
+    @property
+    def _device_paths(self) -> Dict[str, str]:
+        """Internal HDF5 paths of the device groups."""
+        return {
+            "control": self.CONTROL_PATH,
+            "digitizer": self.DIGITIZER_PATH,
+            "msi": self.MSI_PATH,
+        }
+
+    def _save_map_cache(self, cache: Optional[Dict[str, Any]] = None):
+        """
+        Save the built device mappings and :attr:`info` to the mapping
+        cache, unless they are all already in the loaded ``cache``.
+        """
+        maps = self.file_map._get_cache_state()
+        if cache is not None and all(
+            set(maps[device]) <= set(cache["maps"].get(device, {})) for device in maps
+        ):
+            return
+
+        _map_cache.save_map_cache(
+            self.filename, self._device_paths, {"maps": maps, "info": self.info}
         )
 
+    def invalidate_map_cache(self):
+        """
+        Remove the persistent on-disk cache of the file mapping and
+        :attr:`info` for this file.  The current mapping is not
+        changed, use a newly opened `File` to re-map the file.
+        """
+        _map_cache.invalidate_map_cache(self.filename)
+
     @property
     def controls(self) -> HDFMapControls:
         """Dictionary of control device mappings."""
@@ -161,6 +238,29 @@ class File(h5py.File):
         """Dictionary of MSI device mappings."""
         return self.file_map.msi
 
+    @property
+    def shotnum_cache(self) -> Optional[ShotnumIndexCache]:
+        """
+        Cache of the dataset shot number indices
+        (`~bapsflib._hdf.utils.shotnum_cache.ShotnumIndexCache`), shared
+        by all data reads of the file so repeat reads skip re-reading
+        the shot number and configuration columns.  The cache is reset
+        when the file is re-mapped, and is `None` for files not opened
+        readonly.
+        """
+        if not self._readonly:
+            return None
+
+        file_map, cache = getattr(self, "_shotnum_cache", (None, None))
+        if file_map is not self._file_map:
+            max_bytes = (
+                ShotnumIndexCache.DEFAULT_MAX_BYTES if cache is None else cache.max_bytes
+            )
+            cache = ShotnumIndexCache(max_bytes=max_bytes)
+            self._shotnum_cache = (self._file_map, cache)
+
+        return cache
+
     @property
     def overview(self) -> HDFOverview:
         """
@@ -304,22 +404,71 @@ class File(h5py.File):
 
         return _info
 
-    def get_time_array(self, data_info: HDFReadData | Dict[str, Any]) -> np.ndarray:
+    def get_spatial_index(self, control=None) -> SpatialIndex:
+        """
+        Get the index of the shot numbers grouped by the probe positions
+        of a motion control device.  The index is built from the
+        control device data on first use and, for files opened
+        readonly, cached until the file is re-mapped.  (see
+        `~.spatial_index.SpatialIndex` for details)
+
+        Parameters
+        ----------
+        control : Union[str, Tuple[str, Any]], optional
+            name, or ``(name, config)`` tuple, of the motion control
+            device.  If `None` (DEFAULT), then the only motion control
+            device in the file is used.
+
+        Returns
+        -------
+        `~.spatial_index.SpatialIndex`
+            the probe position index of ``control``
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.spatial_index import (
+            build_spatial_index,
+            condition_motion_control,
+        )
+
+        control = condition_motion_control(self, control)
+        if not self._readonly:
+            return build_spatial_index(self, control)
+
+        file_map, cache = getattr(self, "_spatial_indexes", (None, None))
+        if file_map is not self._file_map:
+            cache = {}
+            self._spatial_indexes = (self._file_map, cache)
+
+        sindex = cache.get(control, None)
+        profiling.record_cache("spatial index", sindex is not None)
+        if sindex is None:
+            sindex = build_spatial_index(self, control)
+            cache[control] = sindex
+
+        return sindex
+
+    def get_time_array(
+        self, data_info: HDFReadData | ColumnarData | Dict[str, Any]
+    ) -> np.ndarray:
         """
         Get the time `numpy` array associated with the ``data_info``
         argument.
 
         ``data_info`` can be an
         `~bapsflib._hdf.utils.hdfreaddata.HDFReadData` object obtained
-        using :meth:`read_data` or and information `dict` generated using
-        :meth:`get_digitizer_specs`.
+        using :meth:`read_data`, its columnar layout
+        `~bapsflib._hdf.utils.hdfreaddata.HDFReadDataColumns` (i.e.
+        ``layout='columnar'``), or and information `dict` generated
+        using :meth:`get_digitizer_specs`.
 
         Parameters
         ----------
-        data_info : HDFReadData | Dict[str, Any]
+        data_info : HDFReadData | ColumnarData | Dict[str, Any]
             An `~bapsflib._hdf.utils.hdfreaddata.HDFReadData` object
-            instance or a dictionary containing the necessary time
-            meta-data.
+            instance, a `~bapsflib._hdf.utils.columnar.ColumnarData`
+            container (e.g.
+            `~bapsflib._hdf.utils.hdfreaddata.HDFReadDataColumns`), or
+            a dictionary containing the necessary time meta-data.
 
         Returns
         -------
@@ -344,6 +493,12 @@ class File(h5py.File):
         series is stored in a dedicated dataset which is indicated by
         the ``"time_dset_path"`` key.
 
+        If the information dictionary contains a ``"time index"`` slice
+        (i.e. the data was read with a ``time_index`` or ``time_window``,
+        see :meth:`read_data`), then only the time values of that sample
+        range are returned, offset from the start of the digitizer time
+        series.
+
         Examples
         --------
 
@@ -363,16 +518,18 @@ class File(h5py.File):
 
         """
         # to avoid cyclical imports
+        from bapsflib._hdf.utils.columnar import ColumnarData
         from bapsflib._hdf.utils.hdfreaddata import HDFReadData
 
-        if isinstance(data_info, HDFReadData):
+        if isinstance(data_info, (HDFReadData, ColumnarData)):
             _info = data_info.info.copy()
 
             if "nt" not in _info:
                 _info["nt"] = data_info["signal"].shape[1]
         elif not isinstance(data_info, dict):
             raise TypeError(
-                "Argument 'data_info' must be a HDFReadData or dict object.  "
+                "Argument 'data_info' must be a HDFReadData, ColumnarData, or dict "
+                "object.  "
                 "Pass in either data retrieved from `read_data()` or the "
                 "information dictionary generated by `get_digitizer_specs()`."
             )
@@ -387,6 +544,11 @@ class File(h5py.File):
                 "information dictionary generated by `get_digitizer_specs()`."
             )
 
+        # time sample range of the data
+        time_index = _info.get("time index", None)
+        if time_index is None:
+            time_index = slice(None)
+
         # calculate time array based on clock rate and sample size (nt)
         clock_rate = _info.get("clock rate", None)
         if isinstance(clock_rate, u.Quantity):
@@ -400,8 +562,9 @@ class File(h5py.File):
 
             dt = (1 / clock_rate).to("s").value * sample_average
             nt = _info["nt"]
+            start = 0 if time_index.start is None else time_index.start
 
-            time = np.arange(0, nt, 1, dtype=np.float32) * dt
+            time = np.arange(start, start + nt, 1, dtype=np.float32) * dt
             return time
 
         # look for a dedicate time array in the HDF5 file
@@ -419,13 +582,170 @@ class File(h5py.File):
                 f"{time_dset_path}."
             )
 
-        return self[time_dset_path][...]
+        return self[time_dset_path][time_index]
+
+    def iter_data(
+        self,
+        board: int,
+        channel: int,
+        chunk_shots: int = 1000,
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        adc=None,
+        config_name=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        where=None,
+        intersection_set=True,
+        time_index=None,
+        time_window=None,
+        engine="h5py",
+        silent=False,
+    ) -> Iterator[HDFReadData]:
+        """
+        Iterate over the digitizer data in blocks of (at most)
+        ``chunk_shots`` shots, attaching control device data when
+        requested.  (see `.hdfreaddata.HDFReadData.iter_blocks` for
+        details)
+
+        This allows processing runs that do not fit in memory, since
+        only one block of data is held in memory at a time.
+
+        Parameters
+        ----------
+        board : `int`
+            digitizer board number
+
+        channel : `int`
+            digitizer channel number
+
+        chunk_shots : `int`, optional
+            maximum number of shots per yielded block (DEFAULT ``1000``)
+
+        index : int | list(int) | slice() | numpy.array, optional
+            dataset row index
+
+        shotnum : int | list(int) | slice() | numpy.array, optional
+            HDF5 global shot number
+
+        digitizer : `str`, optional
+            name of digitizer
+
+        adc : `str`, optional
+            name of the digitizer's analog-digital converter
+
+        config_name : `str`, optional
+            name of digitizer configuration
+
+        keep_bits : `bool`, optional
+            `True` to keep digitizer signal in bits, `False` (default)
+            to convert digitizer signal to voltage
+
+        add_controls : List[str | Tuple[str, Any]], optional
+            A list of strings and/or 2-element tuples indicating the
+            control device(s).  (see :meth:`read_data` for details)
+
+        add_msi : List[str | Tuple[str, List[str]]], optional
+            A list of strings and/or 2-element tuples indicating the
+            MSI diagnostic(s) to be merged.  (see :meth:`read_data` for
+            details)
+
+        where : Callable | Tuple[str, str, Any] | List, optional
+            predicate(s) selecting the shots to be read.  (see
+            :meth:`read_data` for details)
+
+        intersection_set : `bool`, optional
+            `True` (DEFAULT) will force the returned shot numbers to be
+            the intersection of ``shotnum``, the digitizer dataset
+            shot numbers, and, if requested, the shot numbers contained
+            in  each control device dataset. `False` will return the
+            union instead of the intersection, minus
+            :math:`shotnum \\le 0`.
+
+        time_index : `slice`, optional
+            contiguous slice of time sample indices to be read (see
+            :meth:`read_data` for details)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read (see :meth:`read_data` for details)
+
+        engine : `str`, optional
+            ``'h5py'`` (DEFAULT) or ``'threads'`` (see
+            :meth:`read_data` for details)
+
+        silent : `bool`, optional
+            `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
+            (soft-warnings)
+
+        Yields
+        ------
+        `~.hdfreaddata.HDFReadData`
+            consecutive blocks of digitized data
+
+        Notes
+        -----
+
+        Every yielded block is a view into the same output buffer, which
+        is overwritten by the next block.  Copy a block if it is needed
+        beyond the current iteration.
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = File('sample.hdf5')
+        >>>
+        >>> # per-shot peak signal over the whole run
+        >>> peaks = []
+        >>> for block in f.iter_data(1, 1, chunk_shots=500):
+        ...     peaks.append(block['signal'].max(axis=1))
+        >>> peaks = np.concatenate(peaks)
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+        blocks = HDFReadData.iter_blocks(
+            self,
+            board,
+            channel,
+            chunk_shots=chunk_shots,
+            index=index,
+            shotnum=shotnum,
+            digitizer=digitizer,
+            adc=adc,
+            config_name=config_name,
+            keep_bits=keep_bits,
+            add_controls=add_controls,
+            add_msi=add_msi,
+            where=where,
+            intersection_set=intersection_set,
+            time_index=time_index,
+            time_window=time_window,
+            engine=engine,
+        )
+
+        # only filter warnings while a block is read, not while the
+        # caller processes it
+        warn_filter = "ignore" if silent else "default"
+        while True:
+            with warnings.catch_warnings():
+                warnings.simplefilter(warn_filter, category=BaPSFWarning)
+                try:
+                    block = next(blocks)
+                except StopIteration:
+                    return
+
+            yield block
 
     def read_controls(
         self,
         controls: List[str | Tuple[str, Any]],
         shotnum=slice(None),
         intersection_set=True,
+        layout="structured",
         silent=False,
         **kwargs,
     ) -> HDFReadControls:
@@ -457,6 +777,12 @@ class File(h5py.File):
             :math:`shotnum \\le 0`. (see
             `~.hdfreadcontrols.HDFReadControls` for details)
 
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) to return a structured numpy
+            array, or ``'columnar'`` to return a
+            `~.columnar.ColumnarData` container of separate contiguous
+            arrays
+
         silent : bool, optional
             `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
              (soft-warnings)
@@ -507,13 +833,14 @@ class File(h5py.File):
         from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
 
         warn_filter = "ignore" if silent else "default"
-        with warnings.catch_warnings():
+        with warnings.catch_warnings(), profiling.span("read controls"):
             warnings.simplefilter(warn_filter, category=BaPSFWarning)
             data = HDFReadControls(
                 self,
                 controls,
                 shotnum=shotnum,
                 intersection_set=intersection_set,
+                layout=layout,
                 **kwargs,
             )
 
@@ -530,7 +857,14 @@ class File(h5py.File):
         config_name=None,
         keep_bits=False,
         add_controls=None,
+        add_msi=None,
+        where=None,
         intersection_set=True,
+        time_index=None,
+        time_window=None,
+        layout="structured",
+        out=None,
+        engine="h5py",
         silent=False,
         **kwargs,
     ) -> HDFReadData:
@@ -576,6 +910,25 @@ class File(h5py.File):
             ``('control', 'config')`` in the list. (see
             :func:`~.helpers.condition_controls` for details)
 
+        add_msi : List[str | Tuple[str, List[str]]], optional
+            A list of strings and/or 2-element tuples indicating the
+            MSI diagnostic(s) to be merged into the returned array by
+            shot number.  Passing the diagnostic name ``'diag'`` merges
+            all its ``'meta'`` fields, while the tuple
+            ``('diag', ['field', ...])`` merges only the listed fields.
+            Only the MSI rows matching the read shot numbers are read.
+            (see `.hdfreaddata.HDFReadData` for details)
+
+        where : Callable | Tuple[str, str, Any] | List, optional
+            predicate(s) selecting the shots to be read.  A predicate
+            is either a ``(field, op, value)`` tuple, e.g.
+            ``('peak current', '>', 5000.0)``, or a callable returning a
+            boolean mask of the shots to keep.  The predicates are
+            evaluated on the ``add_controls`` and ``add_msi`` data
+            before the digitizer data is read, so only the digitizer
+            rows of the selected shots are read.  (see
+            `.hdfreaddata.HDFReadData` for details)
+
         intersection_set : `bool`, optional
             `True` (DEFAULT) will force the returned shot numbers to be
             the intersection of ``shotnum``, the digitizer dataset
@@ -585,6 +938,34 @@ class File(h5py.File):
             :math:`shotnum \\le 0`. (see `~.hdfreaddata.HDFReadData`
             for details)
 
+        time_index : `slice`, optional
+            contiguous slice of time sample indices to be read, only
+            this column range is read from disk (see
+            `~.hdfreaddata.HDFReadData` for details)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read, floats are in seconds (see
+            `~.hdfreaddata.HDFReadData` for details)
+
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) to return a structured numpy
+            array, or ``'columnar'`` to return a
+            `~.hdfreaddata.HDFReadDataColumns` container of separate
+            contiguous arrays (e.g. ``'signal'`` is a C-contiguous
+            ``(nshots, nt)`` array)
+
+        out : numpy.ndarray | `~.columnar.ColumnarData`, optional
+            pre-allocated (e.g. reused or shared memory) output buffer
+            to read the data into, the returned data is a view of
+            ``out`` (see `~.hdfreaddata.HDFReadData` for details)
+
+        engine : `str`, optional
+            ``'h5py'`` (DEFAULT) to read with h5py, or ``'threads'`` to
+            decompress the chunks of a compressed digitizer dataset on
+            multiple cores (see `~.hdfreaddata.HDFReadData` for
+            details)
+
         silent : `bool`, optional
             `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
             (soft-warnings)
@@ -655,13 +1036,304 @@ class File(h5py.File):
                 config_name=config_name,
                 keep_bits=keep_bits,
                 add_controls=add_controls,
+                add_msi=add_msi,
+                where=where,
                 intersection_set=intersection_set,
+                time_index=time_index,
+                time_window=time_window,
+                layout=layout,
+                out=out,
+                engine=engine,
                 **kwargs,
             )
 
         return data
 
-    def read_msi(self, msi_diag: str, silent=False, **kwargs) -> HDFReadMSI:
+    def read_data_many(
+        self,
+        connections: List[Tuple[int, int]],
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        adc=None,
+        config_name=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        where=None,
+        intersection_set=True,
+        time_index=None,
+        time_window=None,
+        layout="structured",
+        engine="h5py",
+        silent=False,
+    ) -> List[HDFReadData]:
+        """
+        Reads data from several digitizer board/channel connections
+        at once.  The digitizer mapping, shot number relation, and
+        control device data are only resolved once for all the
+        connections.  (see `.hdfreaddata.HDFReadData.read_many` for
+        details)
+
+        Parameters
+        ----------
+        connections : List[Tuple[int, int]]
+            list of ``(board, channel)`` pairs to be read
+
+        index : int | list(int) | slice() | numpy.array, optional
+            dataset row index
+
+        shotnum : int | list(int) | slice() | numpy.array, optional
+            HDF5 global shot number
+
+        digitizer : `str`, optional
+            name of digitizer
+
+        adc : `str`, optional
+            name of the digitizer's analog-digital converter
+
+        config_name : `str`, optional
+            name of digitizer configuration
+
+        keep_bits : `bool`, optional
+            `True` to keep digitizer signal in bits, `False` (default)
+            to convert digitizer signal to voltage
+
+        add_controls : List[str | Tuple[str, Any]], optional
+            A list of strings and/or 2-element tuples indicating the
+            control device(s).  (see :meth:`read_data` for details)
+
+        add_msi : List[str | Tuple[str, List[str]]], optional
+            A list of strings and/or 2-element tuples indicating the
+            MSI diagnostic(s) to be merged.  (see :meth:`read_data` for
+            details)
+
+        where : Callable | Tuple[str, str, Any] | List, optional
+            predicate(s) selecting the shots to be read.  (see
+            :meth:`read_data` for details)
+
+        intersection_set : `bool`, optional
+            `True` (DEFAULT) will force the returned shot numbers to be
+            the intersection of ``shotnum``, all the digitizer dataset
+            shot numbers, and, if requested, the shot numbers contained
+            in  each control device dataset. `False` will return the
+            union instead of the intersection, minus
+            :math:`shotnum \\le 0`.
+
+        time_index : `slice`, optional
+            contiguous slice of time sample indices to be read (see
+            :meth:`read_data` for details)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read (see :meth:`read_data` for details)
+
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) or ``'columnar'`` (see
+            :meth:`read_data` for details)
+
+        engine : `str`, optional
+            ``'h5py'`` (DEFAULT) or ``'threads'`` (see
+            :meth:`read_data` for details)
+
+        silent : `bool`, optional
+            `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
+            (soft-warnings)
+
+        Returns
+        -------
+        List[`~.hdfreaddata.HDFReadData`]
+            one structured numpy array of digitized data per connection,
+            all sharing the same ``'shotnum'`` and control device fields
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = File('sample.hdf5')
+        >>>
+        >>> # read channels 1-3 of board 1 with '6K Compumotor' data
+        >>> data = f.read_data_many(
+        ...     [(1, 1), (1, 2), (1, 3)],
+        ...     add_controls=[('6K Compumotor', 3)],
+        ... )
+        >>> len(data)
+        3
+        >>> data[0].info['channel'], data[2].info['channel']
+        (1, 3)
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+        warn_filter = "ignore" if silent else "default"
+        with warnings.catch_warnings():
+            warnings.simplefilter(warn_filter, category=BaPSFWarning)
+            data = HDFReadData.read_many(
+                self,
+                connections,
+                index=index,
+                shotnum=shotnum,
+                digitizer=digitizer,
+                adc=adc,
+                config_name=config_name,
+                keep_bits=keep_bits,
+                add_controls=add_controls,
+                add_msi=add_msi,
+                where=where,
+                intersection_set=intersection_set,
+                time_index=time_index,
+                time_window=time_window,
+                layout=layout,
+                engine=engine,
+            )
+
+        return data
+
+    def read_data_parallel(
+        self,
+        connections: List[Tuple[int, int]],
+        max_workers: Optional[int] = None,
+        chunk_shots: Optional[int] = None,
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        adc=None,
+        config_name=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        where=None,
+        intersection_set=True,
+        time_index=None,
+        time_window=None,
+        silent=False,
+    ) -> List[HDFReadDataColumns]:
+        """
+        Reads data from several digitizer board/channel connections
+        with a pool of worker processes.  The ``'signal'`` arrays are
+        filled by the workers through shared memory.  (see
+        `.parallel.read_data_parallel` for details)
+
+        Parameters
+        ----------
+        connections : List[Tuple[int, int]]
+            list of ``(board, channel)`` pairs to be read
+
+        max_workers : `int`, optional
+            maximum number of worker processes (DEFAULT
+            `os.cpu_count`)
+
+        chunk_shots : `int`, optional
+            maximum number of shots read by a single worker task
+            (DEFAULT splits the shots evenly across the workers)
+
+        index : int | list(int) | slice() | numpy.array, optional
+            dataset row index
+
+        shotnum : int | list(int) | slice() | numpy.array, optional
+            HDF5 global shot number
+
+        digitizer : `str`, optional
+            name of digitizer
+
+        adc : `str`, optional
+            name of the digitizer's analog-digital converter
+
+        config_name : `str`, optional
+            name of digitizer configuration
+
+        keep_bits : `bool`, optional
+            `True` to keep digitizer signal in bits, `False` (default)
+            to convert digitizer signal to voltage
+
+        add_controls : List[str | Tuple[str, Any]], optional
+            A list of strings and/or 2-element tuples indicating the
+            control device(s).  (see :meth:`read_data` for details)
+
+        add_msi : List[str | Tuple[str, List[str]]], optional
+            A list of strings and/or 2-element tuples indicating the
+            MSI diagnostic(s) to be merged.  (see :meth:`read_data` for
+            details)
+
+        where : Callable | Tuple[str, str, Any] | List, optional
+            predicate(s) selecting the shots to be read.  (see
+            :meth:`read_data` for details)
+
+        intersection_set : `bool`, optional
+            `True` (DEFAULT) will force the returned shot numbers to be
+            the intersection of ``shotnum``, all the digitizer dataset
+            shot numbers, and, if requested, the shot numbers contained
+            in  each control device dataset. `False` will return the
+            union instead of the intersection, minus
+            :math:`shotnum \\le 0`.
+
+        time_index : `slice`, optional
+            contiguous slice of time sample indices to be read (see
+            :meth:`read_data` for details)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read (see :meth:`read_data` for details)
+
+        silent : `bool`, optional
+            `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
+            (soft-warnings)
+
+        Returns
+        -------
+        List[`~.hdfreaddata.HDFReadDataColumns`]
+            one columnar container of digitized data per connection,
+            all sharing the same ``'shotnum'`` and control device fields
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = File('sample.hdf5')
+        >>>
+        >>> # read all 8 channels of board 1 with 4 processes
+        >>> data = f.read_data_parallel(
+        ...     [(1, ch) for ch in range(1, 9)], max_workers=4
+        ... )
+        >>> len(data)
+        8
+        """
+        # to avoid cyclical imports
+        from bapsflib._hdf.utils.parallel import read_data_parallel
+
+        warn_filter = "ignore" if silent else "default"
+        with warnings.catch_warnings():
+            warnings.simplefilter(warn_filter, category=BaPSFWarning)
+            data = read_data_parallel(
+                self,
+                connections,
+                max_workers=max_workers,
+                chunk_shots=chunk_shots,
+                index=index,
+                shotnum=shotnum,
+                digitizer=digitizer,
+                adc=adc,
+                config_name=config_name,
+                keep_bits=keep_bits,
+                add_controls=add_controls,
+                add_msi=add_msi,
+                where=where,
+                intersection_set=intersection_set,
+                time_index=time_index,
+                time_window=time_window,
+            )
+
+        return data
+
+    def read_msi(
+        self,
+        msi_diag: str,
+        shotnum=slice(None),
+        fields: Optional[Sequence[str]] = None,
+        meta_only: bool = False,
+        silent=False,
+        **kwargs,
+    ) -> HDFReadMSI:
         """
         Reads data from MSI Diagnostic datasets.  See
         `~.hdfreadmsi.HDFReadMSI` for more detail.
@@ -671,6 +1343,17 @@ class File(h5py.File):
         msi_diag : `str`
             name of MSI diagnostic
 
+        shotnum : int | list(int) | slice() | numpy.array, optional
+            HDF5 file shot number(s) indicating data entries to be
+            extracted, only the rows of these shot numbers are read
+
+        fields : Sequence[str], optional
+            names of the signal fields and/or ``'meta'`` sub-fields to
+            read, if `None` (DEFAULT) then all fields are read
+
+        meta_only : `bool`, optional
+            `True` to only read the ``'meta'`` fields (DEFAULT `False`)
+
         silent : `bool`, optional
             `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
             (soft-warnings)
@@ -696,12 +1379,163 @@ class File(h5py.File):
         >>> mdata = f.read_msi('Interferometer array')
         >>> type(mdata)
         bapsflib._hdf.utils.hdfreadmsi.HDFReadMSI
+        >>>
+        >>> # read only the peak field of shots 1 to 50
+        >>> mdata = f.read_msi(
+        ...     'Magnetic field',
+        ...     shotnum=slice(1, 51),
+        ...     fields=['peak magnetic field'],
+        ... )
         """
         from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
 
         warn_filter = "ignore" if silent else "default"
         with warnings.catch_warnings():
             warnings.simplefilter(warn_filter, category=BaPSFWarning)
-            data = HDFReadMSI(self, msi_diag, **kwargs)
+            data = HDFReadMSI(
+                self,
+                msi_diag,
+                shotnum=shotnum,
+                fields=fields,
+                meta_only=meta_only,
+                **kwargs,
+            )
 
         return data
+
+    def reduce_data(
+        self,
+        board: int,
+        channel: int,
+        group_by: str = "xyz",
+        stats=("mean", "var"),
+        chunk_shots: int = 1000,
+        silent=False,
+        **kwargs,
+    ) -> HDFReduceData:
+        """
+        Reduce digitizer data into per-group statistics (e.g. the
+        average signal at each probe position) while streaming through
+        the shots, so only one block of shots is held in memory at a
+        time.  See `~.hdfreducedata.HDFReduceData` for more detail.
+
+        Parameters
+        ----------
+        board : `int`
+            digitizer board number
+
+        channel : `int`
+            digitizer channel number
+
+        group_by : `str`, optional
+            name of the read data field used to group shots (DEFAULT
+            ``'xyz'``)
+
+        stats : Union[str, Iterable[str]], optional
+            statistics to calculate for each group, any of ``'mean'``,
+            ``'var'``, ``'std'``, ``'min'``, and ``'max'``.  (DEFAULT
+            ``('mean', 'var')``)
+
+        chunk_shots : `int`, optional
+            number of shots read per block (DEFAULT ``1000``)
+
+        silent : `bool`, optional
+            `False` (DEFAULT).  Set `True` to ignore any `BaPSFWarning`
+            (soft-warnings)
+
+        kwargs
+            keywords used to read the digitizer data, like
+            ``add_controls`` and ``shotnum`` (see :meth:`iter_data`)
+
+        Returns
+        -------
+        `~.hdfreducedata.HDFReduceData`
+            `structured numpy array
+            <https://numpy.org/doc/stable/user/basics.rec.html>`_ with
+            one row per unique ``group_by`` value
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = File('sample.hdf5')
+        >>>
+        >>> # average and variance of the signal at each probe position
+        >>> rdata = f.reduce_data(
+        ...     1, 1, add_controls=[('6K Compumotor', 3)], group_by='xyz'
+        ... )
+        >>> rdata['xyz'][0], rdata['count'][0]
+        (array([-32., 15., 1022.4], dtype=float32), 20)
+        >>> rdata['mean'].shape == rdata['var'].shape
+        True
+        """
+        from bapsflib._hdf.utils.hdfreducedata import HDFReduceData
+
+        warn_filter = "ignore" if silent else "default"
+        with warnings.catch_warnings():
+            warnings.simplefilter(warn_filter, category=BaPSFWarning)
+            data = HDFReduceData(
+                self,
+                board,
+                channel,
+                group_by=group_by,
+                stats=stats,
+                chunk_shots=chunk_shots,
+                **kwargs,
+            )
+
+        return data
+
+    def select_shots(
+        self, region: Dict[str, Any], control=None, atol: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Select the shot numbers whose probe position lies inside
+        ``region``, without reading any digitizer data.  The returned
+        shot numbers can be passed directly to the ``shotnum`` argument
+        of :meth:`read_data`.  (see
+        `~.spatial_index.SpatialIndex.select` for details)
+
+        Parameters
+        ----------
+        region : Dict[str, Any]
+            region of the probe positions to be selected.  The keys
+            ``'x'``, ``'y'``, and ``'z'`` select an axis value or, for a
+            2-element tuple ``(lo, hi)``, the inclusive axis bounds.
+            The keys ``'center'`` and ``'radius'`` select the positions
+            within ``radius`` of the ``(x, y)`` or ``(x, y, z)``
+            position ``center``.
+
+        control : Union[str, Tuple[str, Any]], optional
+            name, or ``(name, config)`` tuple, of the motion control
+            device (see :meth:`get_spatial_index`)
+
+        atol : `float`, optional
+            absolute tolerance used to compare positions (DEFAULT
+            `~.spatial_index.SpatialIndex.DEFAULT_ATOL`)
+
+        Returns
+        -------
+        `numpy.ndarray`
+            ascending shot numbers of the selected shots
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = File('sample.hdf5')
+        >>>
+        >>> # read the shots within 1 cm of (x, y) = (0, 0)
+        >>> shotnum = f.select_shots(
+        ...     {'center': (0.0, 0.0), 'radius': 1.0},
+        ...     control=('6K Compumotor', 3),
+        ... )
+        >>> data = f.read_data(
+        ...     1, 1, shotnum=shotnum, add_controls=[('6K Compumotor', 3)]
+        ... )
+        """
+        sindex = self.get_spatial_index(control)
+        if atol is None:
+            return sindex.select(region)
+
+        return sindex.select(region, atol=atol)
@@ -0,0 +1,268 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing `~bapsflib._hdf.utils.grid.to_grid`, the
+reconstruction of a position grid "cube" from the probe positions
+(``'xyz'`` field) of read digitizer or control device data.
+"""
+
+__all__ = ["DEFAULT_ATOL", "GridCube", "to_grid"]
+
+import itertools
+import numpy as np
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+#: motion list keys of the grid step size along each axis
+#: - '6K Compumotor' motion lists record a 3-element 'delta'
+#: - 'NI_XYZ' and 'NI_XZ' motion lists record 'dx', 'dy', and 'dz'
+_ML_DELTA_KEYS = ("dx", "dy", "dz")
+
+#: fraction of the motion list step size used as the coordinate
+#: tolerance
+_DELTA_TOL_FRACTION = 0.25
+
+#: coordinate tolerance used when no motion list step size is known
+DEFAULT_ATOL = 1.0e-3
+
+
+class GridCube(NamedTuple):
+    """The position grid cube returned by `to_grid`."""
+
+    #: data arranged as ``(nx, ny, nz, nshots_per_pos, ...)``, a
+    #: `numpy.ma.MaskedArray` if the grid is incomplete (i.e. some
+    #: positions have fewer shots than others)
+    cube: Union[np.ndarray, np.ma.MaskedArray]
+
+    #: unique x coordinates of the grid
+    x: np.ndarray
+
+    #: unique y coordinates of the grid
+    y: np.ndarray
+
+    #: unique z coordinates of the grid
+    z: np.ndarray
+
+    #: ``(nshots, 4)`` array of the ``(ix, iy, iz, ishot)`` cube index
+    #: of each row of the source data
+    index: np.ndarray
+
+
+def _motion_list_deltas(info: Optional[Dict[str, Any]]) -> np.ndarray:
+    """
+    Gather the grid step size of each axis from the motion lists
+    recorded in the ``info['controls']`` meta-info of the read data.
+    Axes without a known (non-zero) step size are `numpy.nan`.  If
+    multiple motion lists are recorded, then the smallest step size of
+    each axis is used.
+    """
+    deltas = np.full(3, np.nan)
+    if not isinstance(info, dict) or not isinstance(info.get("controls"), dict):
+        return deltas
+
+    for cinfo in info["controls"].values():
+        motion_lists = cinfo.get("motion lists", None)
+        if not isinstance(motion_lists, dict):
+            continue
+
+        for ml in motion_lists.values():
+            if "delta" in ml:
+                delta = ml["delta"]
+            else:
+                delta = [ml.get(key, None) for key in _ML_DELTA_KEYS]
+            for ii, val in enumerate(delta):
+                try:
+                    val = abs(float(val))
+                except (TypeError, ValueError):
+                    continue
+                if val > 0.0 and not val >= deltas[ii]:
+                    deltas[ii] = val
+
+    return deltas
+
+
+def _condition_atol(atol, info: Optional[Dict[str, Any]]) -> np.ndarray:
+    """
+    Condition the ``atol`` argument of `to_grid` into a 3-element array
+    of per-axis tolerances.  If `None`, then the tolerances are derived
+    from the motion list step sizes (see `_motion_list_deltas`),
+    falling back to `DEFAULT_ATOL`.
+    """
+    if atol is None:
+        atol = _DELTA_TOL_FRACTION * _motion_list_deltas(info)
+        atol[np.isnan(atol)] = DEFAULT_ATOL
+        return atol
+
+    atol = np.broadcast_to(np.asarray(atol, dtype=np.float64), (3,)).copy()
+    if np.any(np.isnan(atol)) or np.any(atol < 0.0):
+        raise ValueError(
+            f"Argument `atol` must be non-negative finite tolerance(s), got {atol}."
+        )
+    return atol
+
+
+def _axis_index(values: np.ndarray, atol: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group the coordinates ``values`` of one axis into unique grid
+    coordinates, merging sorted neighbors that are within ``atol`` of
+    each other.  Returns the sorted unique coordinates (the mean of
+    each group) and the grid index of each value.
+    """
+    order = np.argsort(values, kind="stable")
+    svals = values[order]
+    new_group = np.empty(svals.shape, dtype=bool)
+    new_group[:1] = True
+    np.greater(np.diff(svals), atol, out=new_group[1:])
+    group = np.cumsum(new_group) - 1
+
+    index = np.empty(values.shape, dtype=np.intp)
+    index[order] = group
+    counts = np.bincount(group)
+    coords = np.bincount(group, weights=svals) / counts
+
+    return coords, index
+
+
+def _grid_view(
+    values: np.ndarray, pos_index: np.ndarray, shape: Tuple[int, ...], nper: int
+) -> Optional[np.ndarray]:
+    """
+    Return the ``(nx, ny, nz, nper, ...)`` cube as a view of
+    ``values`` if the rows of ``values`` are already ordered as a
+    raster scan (with any axis nesting order) of a complete grid with
+    ``nper`` consecutive shots per position, otherwise `None`.
+    """
+    for axes in itertools.permutations(range(3)):
+        _shape = tuple(shape[ax] for ax in axes)
+        pos_id = np.ravel_multi_index(tuple(pos_index[:, ax] for ax in axes), _shape)
+        if np.array_equal(pos_id, np.arange(pos_id.size) // nper):
+            cube = values.reshape(_shape + (nper,) + values.shape[1:])
+            return cube.transpose(tuple(np.argsort(axes)) + tuple(range(3, cube.ndim)))
+
+    return None
+
+
+def to_grid(data, field: Optional[str] = "signal", atol=None) -> GridCube:
+    """
+    Arrange read data into a position grid cube of shape
+    ``(nx, ny, nz, nshots_per_pos, ...)`` using the probe positions in
+    the ``'xyz'`` field.
+
+    The unique grid coordinates of each axis are detected by grouping
+    the recorded positions that are within a tolerance of each other,
+    and the shot to grid index map is computed with vectorized
+    operations.  If the shots were recorded as a raster scan of a
+    complete grid (the usual case for a motion list), then the cube is
+    a view of the data, otherwise the data is copied into the cube.
+
+    Parameters
+    ----------
+    data : Union[~bapsflib._hdf.utils.hdfreaddata.HDFReadData, ~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls, ~bapsflib._hdf.utils.columnar.ColumnarData]
+        read data containing the ``'xyz'`` field
+
+    field : `str`, optional
+        name of the field to arrange into the cube (DEFAULT
+        ``'signal'``).  If `None`, then the (structured) records of
+        ``data`` are arranged.
+
+    atol : Union[float, Tuple[float, float, float]], optional
+        absolute tolerance of the grid coordinates, either one value
+        or one value per axis.  If `None` (DEFAULT), then a quarter of
+        the grid step size recorded in the motion lists of
+        ``data.info['controls']`` is used, falling back to
+        `DEFAULT_ATOL` when no step size is recorded.
+
+    Returns
+    -------
+    GridCube
+        the cube, the unique coordinates of each axis, and the cube
+        index of each row of ``data``
+
+    Notes
+    -----
+
+    If some positions have fewer shots than others (e.g. the motion
+    list was interrupted), then the cube is a `numpy.ma.MaskedArray`
+    with the missing shots masked.
+
+    Examples
+    --------
+
+    >>> # read board 1, channel 1 with probe positions
+    >>> data = f.read_data(1, 1, add_controls=[('6K Compumotor', 3)])
+    >>> grid = to_grid(data)
+    >>> grid.cube.shape
+    (21, 11, 1, 10, 16384)
+    >>>
+    >>> # shot-averaged signal at each position
+    >>> avg = grid.cube.mean(axis=3)
+    """
+    if field is None:
+        if isinstance(data, np.ndarray):
+            values = data.view(np.ndarray)
+        else:
+            raise TypeError(
+                "Argument `field` must be given for data that is not a "
+                "structured numpy array."
+            )
+    elif not isinstance(field, str):
+        raise TypeError(f"Argument `field` must be a string, got type {type(field)}.")
+    else:
+        values = np.asarray(data[field])
+
+    try:
+        xyz = np.asarray(data["xyz"], dtype=np.float64)
+    except (KeyError, ValueError):
+        raise ValueError("Argument `data` has no 'xyz' field.")
+    if xyz.ndim != 2 or xyz.shape[1] != 3:
+        raise ValueError(f"Field 'xyz' must have shape (nshots, 3), got {xyz.shape}.")
+    elif xyz.shape[0] == 0:
+        raise ValueError("Argument `data` contains no shots.")
+    elif np.any(np.isnan(xyz)):
+        raise ValueError(
+            "Field 'xyz' contains NaN positions, probe positions are needed "
+            "to build the grid."
+        )
+
+    atol = _condition_atol(atol, getattr(data, "info", None))
+
+    # ---- Determine grid coordinates and shot -> grid index map   ----
+    coords = []
+    pos_index = np.empty((xyz.shape[0], 3), dtype=np.intp)
+    for ax in range(3):
+        _coords, pos_index[:, ax] = _axis_index(xyz[:, ax], atol[ax])
+        coords.append(_coords)
+    shape = tuple(_coords.size for _coords in coords)
+
+    pos_id = np.ravel_multi_index(tuple(pos_index.T), shape)
+    counts = np.bincount(pos_id, minlength=int(np.prod(shape)))
+    nper = int(counts.max())
+
+    # rank of each shot within its position (in recorded order)
+    order = np.argsort(pos_id, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.empty(pos_id.shape, dtype=np.intp)
+    rank[order] = np.arange(pos_id.size) - starts[pos_id[order]]
+    index = np.column_stack((pos_index, rank))
+
+    # ---- Build cube                                              ----
+    cube = None
+    if np.all(counts == nper):
+        cube = _grid_view(values, pos_index, shape, nper)
+    if cube is None:
+        cube_shape = shape + (nper,) + values.shape[1:]
+        if np.all(counts == nper):
+            cube = np.empty(cube_shape, dtype=values.dtype)
+        else:
+            cube = np.ma.masked_all(cube_shape, dtype=values.dtype)
+        cube[tuple(index.T)] = values
+
+    return GridCube(cube=cube, x=coords[0], y=coords[1], z=coords[2], index=index)
@@ -19,7 +19,6 @@ import copy
 import h5py
 import numpy as np
 import os
-import time
 
 from functools import reduce
 from typing import Any, Dict, Iterable, List, Tuple, Union
@@ -30,14 +29,18 @@ from bapsflib._hdf.maps.controls.templates import (
     HDFMapControlCLTemplate,
     HDFMapControlTemplate,
 )
+from bapsflib._hdf.utils.columnar import ColumnarData, condition_layout
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.grid import GridCube, to_grid
 from bapsflib._hdf.utils.helpers import (
     build_shotnum_dset_relation,
     condition_controls,
     condition_shotnum,
     do_shotnum_intersection,
     IndexDict,
+    read_dset_rows,
 )
+from bapsflib.utils import profiling
 from bapsflib.utils.warnings import BaPSFWarning, HDFMappingWarning
 
 # define type aliases
@@ -83,6 +86,7 @@ class HDFReadControls(np.ndarray):
         controls: ControlsType,
         shotnum=slice(None),
         intersection_set=True,
+        layout="structured",
         **kwargs,
     ):
         """
@@ -105,6 +109,12 @@ class HDFReadControls(np.ndarray):
             contained in each control device dataset. `False` will
             return the union instead of the intersection
 
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) to return a structured
+            `HDFReadControls` array, or ``'columnar'`` to return a
+            `~bapsflib._hdf.utils.columnar.ColumnarData` container with
+            each field stored as a separate contiguous array
+
         Notes
         -----
         Behavior of ``shotnum`` and ``intersection_set``:
@@ -144,16 +154,12 @@ class HDFReadControls(np.ndarray):
         >>> data['command'][0:2:]
         array(['FREQ 50000.000000', 'FREQ 50000.000000'], dtype='<U18')
         """
-        # initialize timing
-        tt = []
-        if "timeit" in kwargs:  # pragma: no cover
-            timeit = kwargs["timeit"]
-            if timeit:
-                tt.append(time.time())
-            else:
-                timeit = False
-        else:
-            timeit = False
+        if kwargs.pop("timeit", False):
+            warn(
+                "Keyword `timeit` is deprecated and ignored, use "
+                "`bapsflib.profile()` to time the read phases.",
+                FutureWarning,
+            )
 
         # ---- Condition `hdf_file`                                 ----
         # - `hdf_file` is a lapd.File object
@@ -162,161 +168,156 @@ class HDFReadControls(np.ndarray):
             raise TypeError(
                 f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
             )
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - hdf_file conditioning: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
-        # ---- Examine file map object                              ----
-        # grab instance of _fmap
-        _fmap = hdf_file.file_map
-
-        # Check for non-empty controls
-        if not bool(_fmap.controls):
-            raise ValueError("There are no control devices in the HDF5 file.")
-
-        # ---- Condition 'controls' Argument                        ----
-        # - some calling routines (such as, lapd.File.read_data)
-        #   already properly condition 'controls', so passing a keyword
-        #   'assume_controls_conditioned' allows for a bypass of
-        #   conditioning here
-        #
-        try:
-            # check if `controls` was already conditioned
-            if not kwargs["assume_controls_conditioned"]:
+        layout = condition_layout(layout)
+
+        with profiling.span("mapping lookup"):
+            # ---- Examine file map object                          ----
+            # grab instance of _fmap
+            _fmap = hdf_file.file_map
+
+            # Check for non-empty controls
+            if not bool(_fmap.controls):
+                raise ValueError("There are no control devices in the HDF5 file.")
+
+            # ---- Condition 'controls' Argument                    ----
+            # - some calling routines (such as, lapd.File.read_data)
+            #   already properly condition 'controls', so passing a keyword
+            #   'assume_controls_conditioned' allows for a bypass of
+            #   conditioning here
+            #
+            try:
+                # check if `controls` was already conditioned
+                if not kwargs["assume_controls_conditioned"]:
+                    controls = condition_controls(hdf_file, controls)
+            except KeyError:
                 controls = condition_controls(hdf_file, controls)
-        except KeyError:
-            controls = condition_controls(hdf_file, controls)
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - condition controls: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
-        # ---- Condition shotnum                                    ----
-        # shotnum -- global HDF5 file shot number
-        #            ~ this is the parameter used to link values between
-        #              datasets
-        #
-        # Through conditioning the following are (re-)defined:
-        # index   -- row index of the control dataset(s)
-        #            ~ numpy.ndarray
-        #            ~ dtype = np.integer
-        #            ~ shape = (len(controls), num_of_indices)
-        #
-        # shotnum -- global HDF5 shot numbers
-        #            ~ index at 1
-        #            ~ will be a filtered version of input kwarg shotnum
-        #              based on intersection_set
-        #            ~ numpy.ndarray
-        #            ~ dtype = np.uint32
-        #            ~ shape = (sn_size, )
-        #
-        # sni     -- bool array for providing a one-to-one mapping
-        #            between shotnum and index
-        #            ~ shotnum[sni] = cdset[index, shotnumkey]
-        #            ~ numpy.ndarray
-        #            ~ dtype = np.bool
-        #            ~ shape = (len(controls), sn_size)
-        #            ~ np.count_nonzero(arr[0,...]) = num_of_indices
-        #
-        # - Indexing behavior: (depends on intersection_set)
-        #
-        #   ~ shotnum
-        #     * intersection_set = True
-        #       > the returned array will only contain shot numbers that
-        #         are in the intersection of shotnum and all the
-        #         specified control device datasets
-        #
-        #     * intersection_set = False
-        #       > the returned array will contain all shot numbers
-        #         specified by shotnum (>= 1)
-        #       > if a dataset does not included a shot number contained
-        #         in shotnum, then its entry in the returned array will
-        #         be given a NULL value depending on the dtype
-        #
-        # Gather control datasets and associated shot number field names
-        # - things needed to perform the conditioning
-        dset_list = []  # type: List[h5py.Dataset]
-        shotnumkey_list = []  # type: List[str]
-        for control in controls:
-            # control name (control_name) and configuration name (config_name)
-            control_name = control[0]
-            config_name = control[1]
-
-            # gather control datasets and shotnumkey's
-            control_config = _fmap.controls[control_name].configs[config_name]
 
-            if control_config["shotnum"]["dset paths"] is None:
-                # state values have differing dset paths and shotnum
-                # is pulled from those paths
-                for _key, _entry in control_config["state values"].items():
-                    dset_list.append(hdf_file.get(_entry["dset paths"][0]))
+        with profiling.span("shotnum conditioning"):
+            # ---- Condition shotnum                                ----
+            # shotnum -- global HDF5 file shot number
+            #            ~ this is the parameter used to link values between
+            #              datasets
+            #
+            # Through conditioning the following are (re-)defined:
+            # index   -- row index of the control dataset(s)
+            #            ~ numpy.ndarray
+            #            ~ dtype = np.integer
+            #            ~ shape = (len(controls), num_of_indices)
+            #
+            # shotnum -- global HDF5 shot numbers
+            #            ~ index at 1
+            #            ~ will be a filtered version of input kwarg shotnum
+            #              based on intersection_set
+            #            ~ numpy.ndarray
+            #            ~ dtype = np.uint32
+            #            ~ shape = (sn_size, )
+            #
+            # sni     -- bool array for providing a one-to-one mapping
+            #            between shotnum and index
+            #            ~ shotnum[sni] = cdset[index, shotnumkey]
+            #            ~ numpy.ndarray
+            #            ~ dtype = np.bool
+            #            ~ shape = (len(controls), sn_size)
+            #            ~ np.count_nonzero(arr[0,...]) = num_of_indices
+            #
+            # - Indexing behavior: (depends on intersection_set)
+            #
+            #   ~ shotnum
+            #     * intersection_set = True
+            #       > the returned array will only contain shot numbers that
+            #         are in the intersection of shotnum and all the
+            #         specified control device datasets
+            #
+            #     * intersection_set = False
+            #       > the returned array will contain all shot numbers
+            #         specified by shotnum (>= 1)
+            #       > if a dataset does not included a shot number contained
+            #         in shotnum, then its entry in the returned array will
+            #         be given a NULL value depending on the dtype
+            #
+            # Gather control datasets and associated shot number field names
+            # - things needed to perform the conditioning
+            dset_list = []  # type: List[h5py.Dataset]
+            shotnumkey_list = []  # type: List[str]
+            for control in controls:
+                # control name (control_name) and configuration name (config_name)
+                control_name = control[0]
+                config_name = control[1]
+
+                # gather control datasets and shotnumkey's
+                control_config = _fmap.controls[control_name].configs[config_name]
+
+                if control_config["shotnum"]["dset paths"] is None:
+                    # state values have differing dset paths and shotnum
+                    # is pulled from those paths
+                    for _key, _entry in control_config["state values"].items():
+                        dset_list.append(hdf_file.get(_entry["dset paths"][0]))
+                        shotnumkey_list.append(control_config["shotnum"]["dset field"][0])
+                else:
+                    dset_list.append(
+                        hdf_file.get(control_config["shotnum"]["dset paths"][0])
+                    )
                     shotnumkey_list.append(control_config["shotnum"]["dset field"][0])
-            else:
-                dset_list.append(hdf_file.get(control_config["shotnum"]["dset paths"][0]))
-                shotnumkey_list.append(control_config["shotnum"]["dset field"][0])
-
-        # perform `shotnum` conditioning
-        # - `shotnum` is returned as a numpy array
-        shotnum = condition_shotnum(
-            shotnum=shotnum,
-            dset_list=dset_list,
-            shotnumkey_list=shotnumkey_list,
-        )
 
-        # ---- Build `index` and `sni` arrays for each dataset      ----
-        #
-        # - Satisfies the condition:
-        #
-        #       shotnum[sni] = dset[index, shotnumkey]
-        #
-        # Notes:
-        # 1. every entry in `index_dict` and `sni_dict` will be a numpy
-        #    array
-        # 2. all entries in `index_dict` and `sni_dict` are build with
-        #    respect to shotnum
-        #
-        index_dict = dict()  # type: IndexDict
-        sni_dict = dict()  # type: IndexDict
-        for control in controls:
-            # control name (control_name) and configuration name (config_name)
-            control_name = control[0]
-            config_name = control[1]
-            control_map = _fmap.controls[control_name]  # type: HDFMapControlTemplate
-            control_config = control_map.configs[config_name]
-
-            # build `index` and `sni` for each dataset
-            index_dict[control_name] = dict()
-            sni_dict[control_name] = dict()
-            for key, entry in control_config["state values"].items():  # type: str, dict
-                config_column = entry.get("config column")
-                n_configs = (
-                    1 if control_map.one_config_per_dset else len(control_map.configs)
-                )
-                _index, _sni = build_shotnum_dset_relation(
-                    shotnum=shotnum,
-                    dset=hdf_file.get(entry["dset paths"][0]),
-                    shotnumkey=control_config["shotnum"]["dset field"][0],
-                    n_configs=n_configs,
-                    config_column_value=control_map.get_config_column_value(config_name),
-                    config_column=config_column,
-                )
-                index_dict[control_name][key] = _index
-                sni_dict[control_name][key] = _sni
-
-        # re-filter `index`, `shotnum`, and `sni` if intersection_set
-        # requested
-        if intersection_set:
-            shotnum, sni_dict, index_dict = do_shotnum_intersection(
-                shotnum, sni_dict, index_dict
+            # perform `shotnum` conditioning
+            # - `shotnum` is returned as a numpy array
+            shotnum = condition_shotnum(
+                shotnum=shotnum,
+                dset_list=dset_list,
+                shotnumkey_list=shotnumkey_list,
             )
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - condition shotnum: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+            # ---- Build `index` and `sni` arrays for each dataset  ----
+            #
+            # - Satisfies the condition:
+            #
+            #       shotnum[sni] = dset[index, shotnumkey]
+            #
+            # Notes:
+            # 1. every entry in `index_dict` and `sni_dict` will be a numpy
+            #    array
+            # 2. all entries in `index_dict` and `sni_dict` are build with
+            #    respect to shotnum
+            #
+            index_dict = dict()  # type: IndexDict
+            sni_dict = dict()  # type: IndexDict
+            for control in controls:
+                # control name (control_name) and configuration name (config_name)
+                control_name = control[0]
+                config_name = control[1]
+                control_map = _fmap.controls[control_name]  # type: HDFMapControlTemplate
+                control_config = control_map.configs[config_name]
+
+                # build `index` and `sni` for each dataset
+                index_dict[control_name] = dict()
+                sni_dict[control_name] = dict()
+                for key, entry in control_config[
+                    "state values"
+                ].items():  # type: str, dict
+                    config_column = entry.get("config column")
+                    n_configs = (
+                        1 if control_map.one_config_per_dset else len(control_map.configs)
+                    )
+                    _index, _sni = build_shotnum_dset_relation(
+                        shotnum=shotnum,
+                        dset=hdf_file.get(entry["dset paths"][0]),
+                        shotnumkey=control_config["shotnum"]["dset field"][0],
+                        n_configs=n_configs,
+                        config_column_value=control_map.get_config_column_value(
+                            config_name
+                        ),
+                        config_column=config_column,
+                        index_cache=hdf_file.shotnum_cache,
+                    )
+                    index_dict[control_name][key] = _index
+                    sni_dict[control_name][key] = _sni
+
+            # re-filter `index`, `shotnum`, and `sni` if intersection_set
+            # requested
+            if intersection_set:
+                shotnum, sni_dict, index_dict = do_shotnum_intersection(
+                    shotnum, sni_dict, index_dict
+                )
 
         # ---- Build obj                                            ----
         # Define dtype and shape for numpy array
@@ -338,191 +339,191 @@ class HDFReadControls(np.ndarray):
                     )
                 )
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - define dtype: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
         # Initialize Control Data
-        data = np.empty(shape, dtype=dtype)
+        if layout == "columnar":
+            data = ColumnarData.empty(shape, dtype)
+        else:
+            data = np.empty(shape, dtype=dtype)
         data["shotnum"] = shotnum
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - initialize data np.ndarray: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
         # Assign Control Data to Numpy array
         for control in controls:
             # control name (control_name) and configuration name (config_name)
             control_name = control[0]
             config_name = control[1]
-
-            # get control dataset
-            cmap = _fmap.controls[control_name]
-            control_config = cmap.configs[config_name]
-
-            # populate control data array
-            # 1. scan over numpy fields
-            # 2. scan over the dset fields that will fill the numpy
-            #    fields
-            # 3. split between a command list fill or a direct fill
-            # 4. NaN fill if intersection_set = False
-            #
-            for state_field, state_config in control_config["state values"].items():
-                # state_field = the numpy field name
-                # state_config = the mapping dictionary for state_field
+            with profiling.span("control read", control=control_name):
+
+                # get control dataset
+                cmap = _fmap.controls[control_name]
+                control_config = cmap.configs[config_name]
+
+                # gather the dataset fields needed from each control
+                # dataset, so the rows of a dataset are read only once
+                dset_fields = {}  # type: Dict[str, List[str]]
+                for state_config in control_config["state values"].values():
+                    dset_path = state_config["dset paths"][0]
+                    dset_names = hdf_file.get(dset_path).dtype.names or ()
+                    fields = dset_fields.setdefault(dset_path, [])
+                    for df_name in state_config["dset field"]:
+                        if df_name in dset_names and df_name not in fields:
+                            fields.append(df_name)
+                dset_blocks = {}  # type: Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+                # populate control data array
+                # 1. scan over numpy fields
+                # 2. read the dataset rows (all needed fields at once)
+                # 3. scan over the dset fields that will fill the numpy
+                #    fields
+                # 4. split between a command list fill or a direct fill
+                # 5. NaN fill if intersection_set = False
                 #
-
-                cdset = hdf_file.get(state_config["dset paths"][0])
-                sni = sni_dict[control_name][state_field]
-                index = index_dict[control_name][state_field].tolist()  # type: List
-                for npi, df_name in enumerate(state_config["dset field"]):
-                    # df_name
-                    #   the dset field name that will fill the numpy
-                    #   field
-                    # npi
-                    #   the index of the numpy array corresponding to
-                    #   state_field that df_name will fill
+                for state_field, state_config in control_config["state values"].items():
+                    # state_field = the numpy field name
+                    # state_config = the mapping dictionary for state_field
                     #
-                    # assign data
-                    if cmap.has_command_list:
-                        # command list fill
-                        # get command list
-                        cl = state_config["command list"]
-
-                        # retrieve the array of command indices
-                        ci_arr = cdset[index, df_name]
-
-                        # assign command values to data
-                        for ci, command in enumerate(cl):
-                            # Order of operations
-                            # 1. find where command index (ci) is in the
-                            #    command index array (ci_arr)
-                            # 2. construct a new sni for ci
-                            # 3. fill data
-                            #
-                            # find where ci is in ci_arr
-                            ii = np.where(ci_arr == ci, True, False)
-
-                            # construct new sni
-                            sni_for_ci = np.zeros(sni.shape, dtype=bool)
-                            sni_for_ci[np.where(sni)[0][ii]] = True
-
-                            # assign values
-                            data[state_field][sni_for_ci] = command
-                    else:
-                        # direct fill (NO command list)
-                        try:
-                            arr = cdset[index, df_name]
-                        except ValueError as err:
-                            mlist = [1] + list(data.dtype[state_field].shape)
-                            size = reduce(lambda x, y: x * y, mlist)
-                            dtype = data.dtype[state_field].base
-                            if df_name == "":
-                                # a mapping module gives an empty string
-                                # '' when the dataset does not have a
-                                # necessary field but you want the read
-                                # out to still function
-                                # - e.g. 'xyz' but the dataset only
-                                #   contains values of 'x' and 'z'
-                                #   (the NI_XZ module)
-                                #
-                                # create zero array
-                                arr = np.zeros((len(index),), dtype=dtype)
-                            elif size > 1:
-                                # expected field df_name is missing but
-                                # belongs to an array
-                                warn(
-                                    f"Dataset missing field '{df_name}', applying "
-                                    f"NaN fill to to data array",
-                                    HDFMappingWarning,
-                                )
-                                arr = np.zeros((len(index),), dtype=dtype)
-
-                                # NaN fill
-                                if np.issubdtype(dtype, np.signedinteger):
-                                    # any signed-integer
-                                    # unsigned has a 0 fill
-                                    arr[:] = -99999
-                                elif np.issubdtype(dtype, np.floating):
-                                    # any float type
-                                    arr[:] = np.nan
-                                elif np.issubdtype(dtype, np.flexible):
-                                    # string, unicode, void
-                                    # np.zero satisfies this
-                                    pass
-                                else:  # pragma: no cover
-                                    # no real NaN concept exists
-                                    # - this shouldn't happen though
-                                    warn(
-                                        f"dtype ({dtype}) of {state_field} has no NaN "
-                                        f"concept...no NaN fill done",
-                                        BaPSFWarning,
-                                    )
-                            else:
-                                # expected field df_name is missing
-                                raise err
-
-                        if data.dtype[state_field].shape != ():
-                            # field contains an array (e.g. 'xyz')
-                            # data[state_field][sni, npi] = \
-                            #     cdset[index, df_name]
-                            data[state_field][sni, npi] = arr
+                    dset_path = state_config["dset paths"][0]
+                    cdset = hdf_file.get(dset_path)
+                    sni = sni_dict[control_name][state_field]
+                    index = index_dict[control_name][state_field]
+
+                    # read the dataset rows, reusing the block already read
+                    # for another state field of the same dataset
+                    block = dset_blocks.get(dset_path, None)
+                    if block is None or not np.array_equal(block[0], index):
+                        if dset_fields[dset_path]:
+                            rows = read_dset_rows(
+                                cdset, index, field=dset_fields[dset_path]
+                            )
                         else:
-                            # field is a constant
-                            # data[state_field][sni] = \
-                            #     cdset[index, df_name]
-                            data[state_field][sni] = arr
-
-                    # handle NaN fill
-                    if not intersection_set:
-                        # overhead
-                        sni_not = np.logical_not(sni)
-                        dtype = data.dtype[state_field].base
-
+                            # none of the needed fields are in the dataset
+                            rows = np.zeros(index.shape, dtype=[])
+                        block = (index, rows)
+                        dset_blocks[dset_path] = block
+                    rows = block[1]
+                    for npi, df_name in enumerate(state_config["dset field"]):
+                        # df_name
+                        #   the dset field name that will fill the numpy
+                        #   field
+                        # npi
+                        #   the index of the numpy array corresponding to
+                        #   state_field that df_name will fill
                         #
-                        if data.dtype[state_field].shape != ():
-                            ii = np.s_[sni_not, npi]
-                        else:
-                            ii = np.s_[sni_not]
-
-                        # NaN fill
-                        if np.issubdtype(dtype, np.signedinteger):
-                            data[state_field][ii] = -99999
-                        elif np.issubdtype(dtype, np.unsignedinteger):
-                            data[state_field][ii] = 0
-                        elif np.issubdtype(dtype, np.floating):
-                            # any float type
-                            data[state_field][ii] = np.nan
-                        elif np.issubdtype(dtype, np.flexible):
-                            # string, unicode, void
-                            data[state_field][ii] = ""
+                        # assign data
+                        if cmap.has_command_list:
+                            # command list fill
+                            # get command list
+                            cl = np.asarray(state_config["command list"])
+
+                            # retrieve the array of command indices
+                            ci_arr = np.asarray(rows[df_name], dtype=np.intp)
+
+                            # assign command values to data
+                            # - gather the commands for all shots at once,
+                            #   indices outside the command list are
+                            #   left unassigned
+                            valid = np.logical_and(ci_arr >= 0, ci_arr < cl.shape[0])
+                            data[state_field][np.where(sni)[0][valid]] = cl[ci_arr[valid]]
                         else:
-                            # no real NaN concept exists
-                            # - this shouldn't happen though
-                            warn(
-                                f"dtype ({dtype}) of {state_field} has no NaN concept"
-                                f"...no NaN fill done",
-                                BaPSFWarning,
-                            )
+                            # direct fill (NO command list)
+                            if df_name in rows.dtype.names:
+                                arr = rows[df_name]
+                            else:
+                                mlist = [1] + list(data.dtype[state_field].shape)
+                                size = reduce(lambda x, y: x * y, mlist)
+                                dtype = data.dtype[state_field].base
+                                if df_name == "":
+                                    # a mapping module gives an empty string
+                                    # '' when the dataset does not have a
+                                    # necessary field but you want the read
+                                    # out to still function
+                                    # - e.g. 'xyz' but the dataset only
+                                    #   contains values of 'x' and 'z'
+                                    #   (the NI_XZ module)
+                                    #
+                                    # create zero array
+                                    arr = np.zeros((len(index),), dtype=dtype)
+                                elif size > 1:
+                                    # expected field df_name is missing but
+                                    # belongs to an array
+                                    warn(
+                                        f"Dataset missing field '{df_name}', applying "
+                                        f"NaN fill to to data array",
+                                        HDFMappingWarning,
+                                    )
+                                    arr = np.zeros((len(index),), dtype=dtype)
+
+                                    # NaN fill
+                                    if np.issubdtype(dtype, np.signedinteger):
+                                        # any signed-integer
+                                        # unsigned has a 0 fill
+                                        arr[:] = -99999
+                                    elif np.issubdtype(dtype, np.floating):
+                                        # any float type
+                                        arr[:] = np.nan
+                                    elif np.issubdtype(dtype, np.flexible):
+                                        # string, unicode, void
+                                        # np.zero satisfies this
+                                        pass
+                                    else:  # pragma: no cover
+                                        # no real NaN concept exists
+                                        # - this shouldn't happen though
+                                        warn(
+                                            f"dtype ({dtype}) of {state_field} has no "
+                                            f"NaN concept...no NaN fill done",
+                                            BaPSFWarning,
+                                        )
+                                else:
+                                    # expected field df_name is missing
+                                    raise ValueError(
+                                        f"Dataset '{dset_path}' is missing field "
+                                        f"'{df_name}'."
+                                    )
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(f"tt - fill data - {control_name}: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            n_controls = len(controls)
-            tt.append(time.time())
-            print(
-                f"tt - fill data array: {(tt[-1] - tt[-n_controls - 2]) * 1.0e3} ms "
-                f"(intersection_set={intersection_set})"
-            )
+                            if data.dtype[state_field].shape != ():
+                                # field contains an array (e.g. 'xyz')
+                                # data[state_field][sni, npi] = \
+                                #     cdset[index, df_name]
+                                data[state_field][sni, npi] = arr
+                            else:
+                                # field is a constant
+                                # data[state_field][sni] = \
+                                #     cdset[index, df_name]
+                                data[state_field][sni] = arr
+
+                        # handle NaN fill
+                        if not intersection_set:
+                            # overhead
+                            sni_not = np.logical_not(sni)
+                            dtype = data.dtype[state_field].base
+
+                            #
+                            if data.dtype[state_field].shape != ():
+                                ii = np.s_[sni_not, npi]
+                            else:
+                                ii = np.s_[sni_not]
+
+                            # NaN fill
+                            if np.issubdtype(dtype, np.signedinteger):
+                                data[state_field][ii] = -99999
+                            elif np.issubdtype(dtype, np.unsignedinteger):
+                                data[state_field][ii] = 0
+                            elif np.issubdtype(dtype, np.floating):
+                                # any float type
+                                data[state_field][ii] = np.nan
+                            elif np.issubdtype(dtype, np.flexible):
+                                # string, unicode, void
+                                data[state_field][ii] = ""
+                            else:
+                                # no real NaN concept exists
+                                # - this shouldn't happen though
+                                warn(
+                                    f"dtype ({dtype}) of {state_field} has no NaN concept"
+                                    f"...no NaN fill done",
+                                    BaPSFWarning,
+                                )
 
         # -- Define `obj`                                           ----
-        obj = data.view(cls)
+        obj = data if layout == "columnar" else data.view(cls)
 
         # -- Populate `_info`                                      ----
         # initialize `_info`
@@ -554,11 +555,6 @@ class HDFReadControls(np.ndarray):
                 if key not in ["dset paths", "shotnum", "state values"]:
                     obj._info["controls"][control_name][key] = copy.deepcopy(val)
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - total execution time: {(tt[-1] - tt[0]) * 1.0e3} ms")
-
         # return obj
         return obj
 
@@ -585,3 +581,36 @@ class HDFReadControls(np.ndarray):
     def info(self) -> dict:
         """A dictionary of meta-info for the control device."""
         return self._info
+
+    def to_grid(self, field: Union[str, None] = None, atol=None) -> GridCube:
+        """
+        Arrange the control data into a
+        ``(nx, ny, nz, nshots_per_pos, ...)`` position grid cube using
+        the probe positions in the ``'xyz'`` field.  (see
+        `~bapsflib._hdf.utils.grid.to_grid` for details)
+
+        Parameters
+        ----------
+        field : `str`, optional
+            name of the field to arrange into the cube.  If `None`
+            (DEFAULT), then the records of the control data are
+            arranged.
+
+        atol : Union[float, Tuple[float, float, float]], optional
+            absolute tolerance of the grid coordinates.  If `None`
+            (DEFAULT), then the tolerance is derived from the motion
+            list step sizes in ``info['controls']``.
+
+        Returns
+        -------
+        ~bapsflib._hdf.utils.grid.GridCube
+
+        Examples
+        --------
+
+        >>> cdata = f.read_controls([('6K Compumotor', 3)])
+        >>> grid = cdata.to_grid()
+        >>> grid.cube['shotnum'][0, 0, 0]
+        array([ 1,  2,  3,  4,  5,  6,  7,  8,  9, 10], dtype=uint32)
+        """
+        return to_grid(self, field=field, atol=atol)
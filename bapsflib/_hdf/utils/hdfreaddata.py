@@ -14,28 +14,46 @@ Module containing the main
 `~bapsflib._hdf.utils.hdfreaddata.HDFReadData` class.
 """
 
-__all__ = ["HDFReadData"]
+__all__ = ["HDFReadData", "HDFReadDataColumns", "VoltageView"]
 
 import astropy.units as u
 import copy
 import numpy as np
 import os
-import time
 
-from typing import Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 from warnings import warn
 
+from bapsflib._hdf.utils.chunk_reader import condition_engine, read_dset_rows_threaded
+from bapsflib._hdf.utils.columnar import ColumnarData, condition_layout
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.grid import GridCube, to_grid
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
 from bapsflib._hdf.utils.helpers import (
     build_shotnum_dset_relation,
     condition_controls,
     condition_shotnum,
     do_shotnum_intersection,
+    IndexDict,
+    read_dset_rows,
 )
-from bapsflib.plasma import core
+from bapsflib.plasma import core, vectorized
+from bapsflib.utils import profiling
 from bapsflib.utils.warnings import BaPSFWarning, HDFMappingWarning
 
+#: comparison operators of the ``(field, op, value)`` predicates of
+#: the ``where`` argument
+_WHERE_OPS = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "in": np.isin,
+}
+
 
 # noinspection PyInitNewSignature
 class HDFReadData(np.ndarray):
@@ -78,7 +96,14 @@ class HDFReadData(np.ndarray):
         adc=None,
         keep_bits=False,
         add_controls=None,
+        add_msi=None,
+        where=None,
         intersection_set=True,
+        time_index=None,
+        time_window=None,
+        layout="structured",
+        out=None,
+        engine="h5py",
         **kwargs,
     ):
         """
@@ -113,17 +138,73 @@ class HDFReadData(np.ndarray):
 
         keep_bits : `bool`, optional
             set `True` to keep data in bits, `False` (DEFAULT) to
-            convert data to voltage
+            convert data to voltage.  Data kept in bits can be
+            converted to voltage on access with :attr:`voltage`.
 
         add_controls : Union[str, Iterable[str, Tuple[str, Any]]], optional
             a list indicating the desired control device names and their
             configuration name (if more than one configuration exists)
 
+        add_msi : Union[str, Iterable[str, Tuple[str, List[str]]]], optional
+            a list indicating the MSI diagnostics to be merged into the
+            returned data.  Each entry is either the diagnostic name,
+            which merges all its ``'meta'`` fields, or a 2-element tuple
+            ``(name, fields)`` of the diagnostic name and the fields to
+            be merged.  Only the rows matching the read shot numbers are
+            read from the MSI datasets.
+
+        where : Union[Callable, Tuple[str, str, Any], List], optional
+            predicate(s) selecting the shots to be read.  A predicate is
+            either a 3-element tuple ``(field, op, value)``, with ``op``
+            one of ``'=='``, ``'!='``, ``'<'``, ``'<='``, ``'>'``,
+            ``'>='``, or ``'in'``, or a callable that takes a
+            `~bapsflib._hdf.utils.columnar.ColumnarData` container of the
+            ``'shotnum'``, control device, and MSI fields and returns a
+            boolean mask of the shots to keep.  A list of predicates
+            keeps the shots satisfying all of them.  (DEFAULT `None`)
+
         intersection_set : `bool`, optional
             `True` (DEFAULT) will force the returned shot numbers to be
             the intersection of ``shotnum`` and the shot numbers
-            contained in each control device and digitizer dataset.
-            `False` will return the union of shot numbers.
+            contained in each control device, MSI diagnostic, and
+            digitizer dataset.  `False` will return the union of shot
+            numbers.
+
+        time_index : `slice`, optional
+            slice of time sample indices to be read from the digitizer
+            dataset, only this column range is read from disk.  Can
+            not be used with ``time_window``.  (DEFAULT `None`)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read from the digitizer dataset.  Floats are taken to be
+            in seconds.  The bounds are resolved against the time array
+            given by :meth:`~bapsflib._hdf.utils.file.File.get_time_array`
+            and are inclusive.  Can not be used with ``time_index``.
+            (DEFAULT `None`)
+
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) to return a structured
+            `HDFReadData` array, or ``'columnar'`` to return a
+            `HDFReadDataColumns` container with each field stored as a
+            separate contiguous array
+
+        out : Union[numpy.ndarray, ~bapsflib._hdf.utils.columnar.ColumnarData], optional
+            pre-allocated output buffer the data is read into, instead
+            of allocating a new array.  Either a structured array or a
+            `~bapsflib._hdf.utils.columnar.ColumnarData` container
+            (which also sets the layout of the returned data) with the
+            same fields as the read data and at least as many rows as
+            read shots.  The returned data is a view of the first rows
+            of ``out``.  (DEFAULT `None`)
+
+        engine : `str`, optional
+            ``'h5py'`` (DEFAULT) to read the digitizer dataset with
+            h5py, or ``'threads'`` to decompress the chunks of a gzip
+            and/or shuffle filtered dataset in a thread pool (see
+            `~bapsflib._hdf.utils.chunk_reader.read_dset_rows_threaded`).
+            Datasets that can not be decoded by ``'threads'`` are read
+            with h5py.
 
         Notes
         -----
@@ -138,6 +219,42 @@ class HDFReadData(np.ndarray):
               digitizer dataset, the ``index`` keyword will always
               execute quicker than the ``shotnum`` keyword.
 
+        Behavior of ``time_index`` and ``time_window``:
+
+        .. note::
+
+            * Only the selected time samples are read from disk.  The
+              selected sample range is recorded in :attr:`info` under
+              ``"time index"``, so
+              :meth:`~bapsflib._hdf.utils.file.File.get_time_array`
+              returns the time array of the selected samples (i.e.
+              offset from the digitizer trigger).
+
+        Behavior of ``add_msi``:
+
+        .. note::
+
+            * Only the MSI dataset rows matching the read shot numbers
+              are read, and they are joined onto the digitizer data by
+              shot number.  The selected ``'meta'`` fields are added as
+              top-level fields of the returned array, so field names
+              must be unique across the digitizer, control device, and
+              MSI data.
+            * For ``intersection_set=False``, shot numbers not recorded
+              by an MSI diagnostic are filled with `numpy.nan` (or
+              ``0`` for non-float fields).
+
+        Behavior of ``where``:
+
+        .. note::
+
+            * The predicates are evaluated on the control device and MSI
+              data (see ``add_controls`` and ``add_msi``) before any
+              digitizer data is read, so only the digitizer rows of the
+              selected shots are read.
+            * For ``intersection_set=False``, the `numpy.nan` filled
+              values of missing shots do not satisfy any comparison.
+
         Examples
         --------
 
@@ -181,53 +298,614 @@ class HDFReadData(np.ndarray):
         >>> # show 'xyz' values for shot number 1
         >>> data['xyz'][0]
         array([ -32. ,   15. , 1022.4], dtype=float32)
+        >>>
+        >>> # read digitizer data while adding the 'peak current' of
+        >>> # the 'Discharge' MSI diagnostic
+        >>> data = HDFReadData(
+        ...     f, 1, 1, add_msi=[('Discharge', ['peak current'])]
+        ... )
+        >>> data.dtype
+        dtype([('shotnum', '<u4'), ('signal', '<f4', (100,)),
+               ('xyz', '<f4', (3,)), ('peak current', '<f4')])
+        >>>
+        >>> # only read the shots with a peak discharge current above
+        >>> # 5 kA and the probe at x > 0
+        >>> data = HDFReadData(
+        ...     f,
+        ...     1,
+        ...     1,
+        ...     add_controls=[('6K Compumotor', 3)],
+        ...     add_msi=[('Discharge', ['peak current'])],
+        ...     where=[
+        ...         ('peak current', '>', 5000.0),
+        ...         lambda d: d['xyz'][:, 0] > 0,
+        ...     ],
+        ... )
 
         """
-        # initialize timing
-        tt = []
-        if "timeit" in kwargs:  # pragma: no cover
-            timeit = kwargs["timeit"]
-            if timeit:
-                tt.append(time.time())
-            else:
-                timeit = False
-        else:
-            timeit = False
+        if kwargs.pop("timeit", False):
+            warn(
+                "Keyword `timeit` is deprecated and ignored, use "
+                "`bapsflib.profile()` to time the read phases.",
+                FutureWarning,
+            )
 
-        # ---- Condition hdf_file                                   ----
-        # - `hdf_file` is a lapd.File object
-        #
-        if not isinstance(hdf_file, File):
-            raise TypeError(
-                f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
+        with profiling.span("read data", board=board, channel=channel):
+            # ---- Condition `layout` and `engine`                  ----
+            layout = condition_layout(layout)
+            engine = condition_engine(engine)
+
+            # ---- Resolve datasets, shots, controls, and MSI       ----
+            (
+                _dmap,
+                dsets_list,
+                time_index_list,
+                shotnum,
+                index_list,
+                sni_list,
+                cdata,
+                mdata,
+            ) = cls._resolve_many(
+                hdf_file,
+                [(board, channel)],
+                index=index,
+                shotnum=shotnum,
+                digitizer=digitizer,
+                config_name=config_name,
+                adc=adc,
+                add_controls=add_controls,
+                add_msi=add_msi,
+                where=where,
+                intersection_set=intersection_set,
+                time_index=time_index,
+                time_window=time_window,
             )
+            dsets = dsets_list[0]
+            time_index = time_index_list[0]
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - `hdf_file` conditioning: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+            # ---- Build `obj`                                      ----
+            obj = cls._build_obj(
+                hdf_file,
+                _dmap,
+                dsets,
+                shotnum=shotnum,
+                index=index_list[0],
+                sni=sni_list[0],
+                cdata=cdata,
+                keep_bits=keep_bits,
+                intersection_set=intersection_set,
+                time_index=time_index,
+                layout=layout,
+                out=cls._condition_out(out, shotnum.shape[0]),
+                engine=engine,
+                mdata=mdata,
+            )
 
-        # ---- Examine file map object                              ----
-        # grab instance of `HDFMapper`
-        _fmap = hdf_file.file_map
+        # return obj
+        return obj
+
+    @classmethod
+    def read_many(
+        cls,
+        hdf_file: File,
+        connections: List[Tuple[int, int]],
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        adc=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        where=None,
+        intersection_set=True,
+        time_index=None,
+        time_window=None,
+        layout="structured",
+        engine="h5py",
+    ) -> List[Union["HDFReadData", "HDFReadDataColumns"]]:
+        """
+        Read several digitizer board/channel connections in one pass.
+
+        The digitizer mapping, the shot number relation, and the control
+        device data are resolved once and shared by every connection,
+        so all the returned arrays have identical ``'shotnum'``,
+        ``'xyz'``, and control device fields.
+
+        Parameters
+        ----------
+        hdf_file : `~bapsflib._hdf.utils.file.File`
+            HDF5 file object
+
+        connections : List[Tuple[int, int]]
+            list of ``(board, channel)`` pairs to be read
+
+        index : Union[int, List[int], slice, numpy.ndarray], optional
+            dataset row indices to be sliced.  Every connection is
+            sliced with the same row indices, so the connection
+            datasets must record the same shot numbers.  Overridden by
+            argument ``shotnum``. (DEFAULT ``slice(None)``)
+
+        shotnum : Union[int, List[int], slice, numpy.ndarray], optional
+            HDF5 file shot number(s) indicating data entries to be
+            extracted.  Overrides argument ``index``.  (DEFAULT
+            ``slice(None)``)
+
+        digitizer : `str`, optional
+            name of the digitizer
+
+        config_name : `str`, optional
+            name of the digitizer configuration
+
+        adc : `str`, optional
+            name of the analog-digital-converter
+
+        keep_bits : `bool`, optional
+            set `True` to keep data in bits, `False` (DEFAULT) to
+            convert data to voltage
+
+        add_controls : Union[str, Iterable[str, Tuple[str, Any]]], optional
+            a list indicating the desired control device names and their
+            configuration name (if more than one configuration exists)
+
+        add_msi : Union[str, Iterable[str, Tuple[str, List[str]]]], optional
+            a list indicating the MSI diagnostics (and their fields) to
+            be merged into every returned array (see `HDFReadData`)
+
+        where : Union[Callable, Tuple[str, str, Any], List], optional
+            predicate(s) selecting the shots to be read (see
+            `HDFReadData`)
+
+        intersection_set : `bool`, optional
+            `True` (DEFAULT) will force the returned shot numbers to be
+            the intersection of ``shotnum`` and the shot numbers
+            contained in each control device, MSI diagnostic, and all
+            the digitizer datasets.  `False` will return the union of
+            shot numbers.
+
+        time_index : `slice`, optional
+            slice of time sample indices to be read for every
+            connection (see `HDFReadData`)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read for every connection (see `HDFReadData`)
+
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) or ``'columnar'`` (see
+            `HDFReadData`)
+
+        engine : `str`, optional
+            ``'h5py'`` (DEFAULT) or ``'threads'`` (see `HDFReadData`)
+
+        Returns
+        -------
+        List[Union[HDFReadData, HDFReadDataColumns]]
+            one `HDFReadData` array (or `HDFReadDataColumns` container)
+            per entry in ``connections``, in the same order as
+            ``connections``
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = bapsflib.lapd.File('test.hdf5')
+        >>>
+        >>> # read board 1, channels 1 & 2 with probe positions
+        >>> data = HDFReadData.read_many(
+        ...     f, [(1, 1), (1, 2)], add_controls=[('6K Compumotor', 3)]
+        ... )
+        >>> np.array_equal(data[0]['xyz'], data[1]['xyz'])
+        True
+        """
+        with profiling.span("read data", connections=connections):
+            # ---- Condition `layout` and `engine`                  ----
+            layout = condition_layout(layout)
+            engine = condition_engine(engine)
+
+            # ---- Resolve mappings, shots, and control data        ----
+            (
+                _dmap,
+                dsets_list,
+                time_index_list,
+                shotnum,
+                index_list,
+                sni_list,
+                cdata,
+                mdata,
+            ) = cls._resolve_many(
+                hdf_file,
+                connections,
+                index=index,
+                shotnum=shotnum,
+                digitizer=digitizer,
+                config_name=config_name,
+                adc=adc,
+                add_controls=add_controls,
+                add_msi=add_msi,
+                where=where,
+                intersection_set=intersection_set,
+                time_index=time_index,
+                time_window=time_window,
+            )
+
+            # ---- Build objects                                    ----
+            return [
+                cls._build_obj(
+                    hdf_file,
+                    _dmap,
+                    dsets,
+                    shotnum=shotnum,
+                    index=_index,
+                    sni=_sni,
+                    cdata=cdata,
+                    keep_bits=keep_bits,
+                    intersection_set=intersection_set,
+                    time_index=_time_index,
+                    layout=layout,
+                    engine=engine,
+                    mdata=mdata,
+                )
+                for dsets, _index, _sni, _time_index in zip(
+                    dsets_list, index_list, sni_list, time_index_list
+                )
+            ]
+
+    @classmethod
+    def iter_blocks(
+        cls,
+        hdf_file: File,
+        board: int,
+        channel: int,
+        chunk_shots: int = 1000,
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        adc=None,
+        keep_bits=False,
+        add_controls=None,
+        add_msi=None,
+        where=None,
+        intersection_set=True,
+        time_index=None,
+        time_window=None,
+        layout="structured",
+        out=None,
+        engine="h5py",
+    ) -> Iterator[Union["HDFReadData", "HDFReadDataColumns"]]:
+        """
+        Iterate over the digitizer data in blocks of (at most)
+        ``chunk_shots`` shots.
+
+        The digitizer mapping, shot number relation, and control device
+        data are resolved once up front, and every block is written into
+        the same pre-allocated output buffer.  Thus, memory usage is
+        bounded by ``chunk_shots`` regardless of the size of the
+        dataset.  If the digitizer dataset is chunked, then the block
+        boundaries are aligned to the HDF5 chunk layout so each chunk
+        is only read (and decompressed) once.
+
+        Parameters
+        ----------
+        hdf_file : `~bapsflib._hdf.utils.file.File`
+            HDF5 file object
+
+        board : `int`
+            analog-digital-converter board number
+
+        channel : `int`
+            analog-digital-converter channel number
+
+        chunk_shots : `int`, optional
+            maximum number of shots per yielded block (DEFAULT ``1000``)
+
+        index : Union[int, List[int], slice, numpy.ndarray], optional
+            dataset row indices to be sliced. Overridden by argument
+            ``shotnum``. (DEFAULT ``slice(None)``)
+
+        shotnum : Union[int, List[int], slice, numpy.ndarray], optional
+            HDF5 file shot number(s) indicating data entries to be
+            extracted.  Overrides argument ``index``.  (DEFAULT
+            ``slice(None)``)
+
+        digitizer : `str`, optional
+            name of the digitizer
+
+        config_name : `str`, optional
+            name of the digitizer configuration
+
+        adc : `str`, optional
+            name of the analog-digital-converter
+
+        keep_bits : `bool`, optional
+            set `True` to keep data in bits, `False` (DEFAULT) to
+            convert data to voltage
+
+        add_controls : Union[str, Iterable[str, Tuple[str, Any]]], optional
+            a list indicating the desired control device names and their
+            configuration name (if more than one configuration exists)
+
+        add_msi : Union[str, Iterable[str, Tuple[str, List[str]]]], optional
+            a list indicating the MSI diagnostics (and their fields) to
+            be merged into the data (see `HDFReadData`)
+
+        where : Union[Callable, Tuple[str, str, Any], List], optional
+            predicate(s) selecting the shots to be read (see
+            `HDFReadData`)
+
+        intersection_set : `bool`, optional
+            `True` (DEFAULT) will force the returned shot numbers to be
+            the intersection of ``shotnum`` and the shot numbers
+            contained in each control device, MSI diagnostic, and
+            digitizer dataset.  `False` will return the union of shot
+            numbers.
+
+        time_index : `slice`, optional
+            slice of time sample indices to be read (see `HDFReadData`)
+
+        time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+            2-element tuple ``(t_start, t_stop)`` of the time bounds to
+            be read (see `HDFReadData`)
+
+        layout : `str`, optional
+            ``'structured'`` (DEFAULT) or ``'columnar'`` (see
+            `HDFReadData`)
 
-        # ---- Condition `add_controls`                             ----
+        out : Union[numpy.ndarray, ~bapsflib._hdf.utils.columnar.ColumnarData], optional
+            pre-allocated output buffer used for every block, with at
+            least ``chunk_shots`` rows (see `HDFReadData`).  If `None`
+            (DEFAULT), then a buffer is allocated.
+
+        engine : `str`, optional
+            ``'h5py'`` (DEFAULT) or ``'threads'`` (see `HDFReadData`)
+
+        Yields
+        ------
+        Union[HDFReadData, HDFReadDataColumns]
+            consecutive blocks of the digitizer data
+
+        Notes
+        -----
+
+        Every yielded block is a view into the same output buffer (or
+        ``out``), which is overwritten when the next block is read.  Copy a block (e.g.
+        ``block.copy()``) if it is needed beyond the current iteration.
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = bapsflib.lapd.File('test.hdf5')
+        >>>
+        >>> # accumulate the shot-averaged signal of board 1, channel 1
+        >>> total = 0.0
+        >>> for block in HDFReadData.iter_blocks(f, 1, 1, chunk_shots=500):
+        ...     total = total + block['signal'].sum(axis=0)
+        """
+        # ---- Condition `chunk_shots`                              ----
+        if (
+            not isinstance(chunk_shots, (int, np.integer))
+            or isinstance(chunk_shots, bool)
+            or chunk_shots < 1
+        ):
+            raise ValueError(
+                f"Argument `chunk_shots` must be a positive integer, got {chunk_shots}."
+            )
+        chunk_shots = int(chunk_shots)
+        layout = condition_layout(layout)
+        engine = condition_engine(engine)
+
+        # ---- Resolve mappings, shot relation, and control data    ----
+        (
+            _dmap,
+            dsets_list,
+            time_index_list,
+            shotnum,
+            index_list,
+            sni_list,
+            cdata,
+            mdata,
+        ) = cls._resolve_many(
+            hdf_file,
+            [(board, channel)],
+            index=index,
+            shotnum=shotnum,
+            digitizer=digitizer,
+            config_name=config_name,
+            adc=adc,
+            add_controls=add_controls,
+            add_msi=add_msi,
+            where=where,
+            intersection_set=intersection_set,
+            time_index=time_index,
+            time_window=time_window,
+        )
+        dsets = dsets_list[0]
+        time_index = time_index_list[0]
+        index = index_list[0]
+        sni = sni_list[0]
+        offset_row = None if index.size == 0 else int(index[0])
+
+        # ---- Determine block boundaries                           ----
+        bounds = cls._block_bounds(index, sni, chunk_shots, dsets["dset"].chunks)
+        if not bounds:
+            # no shots selected, there are no blocks to yield
+            return
+
+        # row of `index` at which each shot position starts
+        index_start = np.concatenate(([0], np.cumsum(sni)))
+
+        # ---- Yield blocks                                         ----
+        shape = (max(stop - start for start, stop in bounds),)
+        dtype = cls._build_dtype(dsets, cdata, keep_bits, time_index, mdata=mdata)
+        if out is not None:
+            buffer = cls._condition_out(out, shape[0])
+        elif layout == "columnar":
+            buffer = HDFReadDataColumns.empty(shape, dtype)
+        else:
+            buffer = np.empty(shape, dtype=dtype)
+        for start, stop in bounds:
+            yield cls._build_obj(
+                hdf_file,
+                _dmap,
+                dsets,
+                shotnum=shotnum[start:stop],
+                index=index[index_start[start] : index_start[stop]],
+                sni=sni[start:stop],
+                cdata=None if cdata is None else cdata[start:stop],
+                keep_bits=keep_bits,
+                intersection_set=intersection_set,
+                time_index=time_index,
+                out=buffer[: stop - start],
+                offset_row=offset_row,
+                engine=engine,
+                mdata=None if mdata is None else mdata[start:stop],
+            )
+
+    @staticmethod
+    def _block_bounds(
+        index: np.ndarray,
+        sni: np.ndarray,
+        chunk_shots: int,
+        chunks: Union[Tuple[int, ...], None] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Determine the ``(start, stop)`` shot positions of each block
+        yielded by `iter_blocks`.  Blocks contain at most
+        ``chunk_shots`` shots.  If the dataset ``chunks`` shape is
+        given and ``chunk_shots`` spans at least one chunk, then blocks
+        are split on dataset rows that are a multiple of the largest
+        chunk-aligned block size.
+        """
+        nshots = sni.size
+        if chunks is not None and chunk_shots >= chunks[0] and index.size != 0:
+            rows_per_block = (chunk_shots // chunks[0]) * chunks[0]
+
+            # split where the (chunk-aligned) block of the dataset row
+            # changes
+            block_id = index // rows_per_block
+            positions = np.flatnonzero(sni)
+            edges = positions[np.flatnonzero(np.diff(block_id)) + 1].tolist()
+        else:
+            edges = []
+        edges = [0] + edges + [nshots]
+
+        # restrict block sizes to chunk_shots
+        bounds = []
+        for start, stop in zip(edges[:-1], edges[1:]):
+            for _start in range(start, stop, chunk_shots):
+                bounds.append((_start, min(_start + chunk_shots, stop)))
+
+        return bounds
+
+    @staticmethod
+    def _condition_add_controls(hdf_file: File, add_controls) -> List[Tuple[str, Any]]:
+        """
+        Condition the ``add_controls`` argument.  Returns an empty list
+        if no controls are requested.
+        """
         # Check for non-empty controls
-        if bool(add_controls) and not bool(_fmap.controls):
+        if bool(add_controls) and not bool(hdf_file.file_map.controls):
             raise ValueError("There are no control devices in the HDF5 file.")
 
         # condition controls
         if bool(add_controls):
-            controls = condition_controls(hdf_file, add_controls)
-        else:
-            controls = []
+            return condition_controls(hdf_file, add_controls)
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - `add_controls` conditioning: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        return []
+
+    @staticmethod
+    def _condition_add_msi(
+        hdf_file: File, add_msi
+    ) -> List[Tuple[str, Union[List[str], None]]]:
+        """
+        Condition the ``add_msi`` argument into a list of
+        ``(name, fields)`` tuples, where ``fields=None`` selects all the
+        ``'meta'`` fields of the MSI diagnostic ``name``.  Returns an
+        empty list if no MSI diagnostics are requested.
+        """
+        if not bool(add_msi):
+            return []
+        elif not bool(hdf_file.file_map.msi):
+            raise ValueError("There are no MSI diagnostics in the HDF5 file.")
+
+        if isinstance(add_msi, (str, tuple)):
+            add_msi = [add_msi]
+        elif not isinstance(add_msi, list):
+            raise TypeError(
+                f"Argument `add_msi` must be a string, tuple, or list, got "
+                f"type {type(add_msi)}."
+            )
+
+        msi = []
+        for entry in add_msi:
+            if isinstance(entry, str):
+                name, fields = entry, None
+            elif (
+                isinstance(entry, tuple) and len(entry) == 2 and isinstance(entry[0], str)
+            ):
+                name, fields = entry
+                if isinstance(fields, str):
+                    fields = [fields]
+            else:
+                raise TypeError(
+                    f"Elements of `add_msi` must be a diagnostic name or a "
+                    f"2-element tuple (name, fields), got {entry}."
+                )
+
+            if name in [_name for _name, _ in msi]:
+                raise ValueError(
+                    f"MSI diagnostic '{name}' is specified more than once in "
+                    f"`add_msi`."
+                )
+            msi.append((name, fields))
+
+        return msi
+
+    @staticmethod
+    def _condition_where(where) -> List[Union[Callable, Tuple[str, str, Any]]]:
+        """
+        Condition the ``where`` argument into a list of predicates, each
+        a callable or a ``(field, op, value)`` tuple.  Returns an empty
+        list if no predicates are given.
+        """
+        if where is None:
+            return []
+        elif callable(where) or isinstance(where, tuple):
+            where = [where]
+        elif not isinstance(where, list):
+            raise TypeError(
+                f"Argument `where` must be a callable, tuple, or list, got "
+                f"type {type(where)}."
+            )
+
+        for pred in where:
+            if callable(pred):
+                continue
+            elif (
+                not isinstance(pred, tuple)
+                or len(pred) != 3
+                or not isinstance(pred[0], str)
+                or not isinstance(pred[1], str)
+            ):
+                raise TypeError(
+                    f"Elements of `where` must be a callable or a 3-element "
+                    f"tuple (field, op, value), got {pred}."
+                )
+            elif pred[1] not in _WHERE_OPS:
+                raise ValueError(
+                    f"Operator '{pred[1]}' of `where` predicate is not one of "
+                    f"{tuple(_WHERE_OPS)}."
+                )
+
+        return where
+
+    @staticmethod
+    def _condition_digitizer(hdf_file: File, digitizer: Union[str, None]):
+        """Get the mapping object of the requested ``digitizer``."""
+        _fmap = hdf_file.file_map
 
-        # ---- Condition `digitizer` keyword                        ----
         if not bool(_fmap.digitizers):
             raise ValueError("There are no digitizers in the HDF5 file.")
         elif digitizer is None:
@@ -252,18 +930,37 @@ class HDFReadData(np.ndarray):
                     f"digitizers ({list(_fmap.digitizers)})"
                 )
 
-        # ---- Gather Digi Dataset Info                             ----
-        #
+        return _dmap
+
+    @staticmethod
+    def _get_digitizer_datasets(
+        hdf_file: File,
+        _dmap,
+        board: int,
+        channel: int,
+        adc=None,
+        config_name=None,
+    ) -> Dict[str, Any]:
+        """
+        Gather the digitizer dataset, header dataset, and meta-info for
+        the given ``board`` and ``channel``.
+
+        The returned dictionary contains the keys:
+
+        * ``"board"`` & ``"channel"`` - the requested board and channel
+        * ``"dname"`` - digitizer dataset name
+        * ``"dpath"`` - full path to digitizer group (with trailing
+          ``/``)
+        * ``"dset"`` - digitizer `h5py.Dataset` object
+        * ``"dheader"`` - digitizer header `h5py.Dataset` object
+        * ``"d_info"`` - dataset meta-info from
+          ``construct_dataset_name``
+        * ``"shotnumkey"`` - field name for shot number column in
+          ``"dheader"`` (`None` if there is no such column)
+        """
         # Note: _dmap.construct_dataset_name has conditioning for
         #       board, channel, adc, and
         #
-        # dname      - digitizer dataset name
-        # dhname     - digitizer header dataset name
-        # dpath      - full path to digitizer group
-        # dset       - digitizer h5py.Dataset object
-        # dheader    - dset associated header dataset
-        # shotnumkey - field name for shot number column in dheader
-        #
         # Build kwargs for construct_dataset_name()
         kwargs = {"return_info": True}
         if config_name is not None:
@@ -275,8 +972,6 @@ class HDFReadData(np.ndarray):
         dname, d_info = _dmap.construct_dataset_name(board, channel, **kwargs)
         dhname = _dmap.construct_header_dataset_name(board, channel, **kwargs)
         dpath = f"{_dmap.info['group path']}/"
-        dset = hdf_file.get(dpath + dname)
-        dheader = hdf_file.get(dpath + dhname)
 
         # define `config_name`
         if config_name is None:
@@ -286,12 +981,287 @@ class HDFReadData(np.ndarray):
         shotnum_config = _dmap.configs[config_name]["shotnum"]
         shotnumkey = None if shotnum_config is None else shotnum_config["dset field"][0]
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - get dset and dheader: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        return {
+            "board": board,
+            "channel": channel,
+            "dname": dname,
+            "dpath": dpath,
+            "dset": hdf_file.get(dpath + dname),
+            "dheader": hdf_file.get(dpath + dhname),
+            "d_info": d_info,
+            "shotnumkey": shotnumkey,
+        }
+
+    @staticmethod
+    def _condition_time_index(
+        hdf_file: File,
+        dsets: Dict[str, Any],
+        time_index=None,
+        time_window=None,
+    ) -> slice:
+        """
+        Condition the ``time_index`` and ``time_window`` arguments into
+        a contiguous slice of time sample indices ``slice(start, stop)``
+        of the digitizer dataset.
+        """
+        nt = dsets["dset"].shape[1]
+
+        if time_index is not None and time_window is not None:
+            raise ValueError(
+                "Arguments `time_index` and `time_window` can not be used together."
+            )
+        elif time_window is not None:
+            if not isinstance(time_window, (list, tuple)) or len(time_window) != 2:
+                raise TypeError(
+                    "Argument `time_window` must be a 2-element tuple "
+                    "(t_start, t_stop)."
+                )
+
+            bounds = []
+            for tval in time_window:
+                if isinstance(tval, u.Quantity):
+                    try:
+                        tval = tval.to_value(u.s)
+                    except u.UnitConversionError:
+                        raise ValueError(
+                            f"Argument `time_window` element {tval} is not "
+                            f"convertible to seconds."
+                        )
+                elif not isinstance(tval, (int, float, np.integer, np.floating)):
+                    raise TypeError(
+                        "Argument `time_window` elements must be floats (in "
+                        "seconds) or astropy Quantities."
+                    )
+                bounds.append(float(tval))
+            if bounds[0] > bounds[1]:
+                raise ValueError(
+                    f"Argument `time_window` start time ({time_window[0]}) is "
+                    f"after the stop time ({time_window[1]})."
+                )
+
+            d_info = dsets["d_info"]
+            time_dset_path = d_info.get("time_dset_path", None)
+            if time_dset_path is not None:
+                time_dset_path = dsets["dpath"] + time_dset_path
+            time = hdf_file.get_time_array(
+                {
+                    "clock rate": d_info["clock rate"],
+                    "sample average": d_info["sample average (hardware)"],
+                    "nt": nt,
+                    "time_dset_path": time_dset_path,
+                }
+            )
+            # allow for the round-off of the (float32) time array so the
+            # bounds remain inclusive
+            tol = 0.0
+            if np.issubdtype(time.dtype, np.floating) and time.size:
+                tol = 4 * np.finfo(time.dtype).eps * np.max(np.abs(time[[0, -1]]))
+            start = int(np.searchsorted(time, bounds[0] - tol, side="left"))
+            stop = int(np.searchsorted(time, bounds[1] + tol, side="right"))
+        elif time_index is not None:
+            if not isinstance(time_index, slice):
+                raise TypeError("Argument `time_index` must be a slice object.")
+            start, stop, step = time_index.indices(nt)
+            if step != 1:
+                raise ValueError(
+                    "Argument `time_index` must be a contiguous slice, step "
+                    f"size of {step} is not supported."
+                )
+        else:
+            return slice(0, nt)
+
+        if stop <= start:
+            raise ValueError(
+                "Arguments `time_index` / `time_window` select no time samples."
+            )
+
+        return slice(start, stop)
+
+    @staticmethod
+    def _condition_out(
+        out: Union[np.ndarray, ColumnarData, None], nshots: int
+    ) -> Union[np.ndarray, "HDFReadDataColumns", None]:
+        """
+        Condition the caller provided output buffer ``out`` to hold
+        ``nshots`` shots, returning the view of its first ``nshots``
+        rows.  The fields of ``out`` are validated against the read
+        data in `_build_obj`.
+        """
+        if out is None:
+            return None
+
+        if isinstance(out, ColumnarData):
+            if not isinstance(out, HDFReadDataColumns):
+                out = HDFReadDataColumns(dict(out.items()))
+        elif not isinstance(out, np.ndarray) or out.dtype.names is None:
+            raise TypeError(
+                "Argument `out` must be a structured numpy array or a "
+                "ColumnarData container."
+            )
+
+        if len(out.shape) != 1:
+            raise ValueError(
+                f"Argument `out` must be one dimensional, got shape {out.shape}."
+            )
+        elif out.shape[0] < nshots:
+            raise ValueError(
+                f"Argument `out` has {out.shape[0]} rows, but {nshots} shots "
+                f"are to be read."
+            )
+
+        return out[:nshots]
+
+    @classmethod
+    def _resolve_many(
+        cls,
+        hdf_file: File,
+        connections: List[Tuple[int, int]],
+        index=slice(None),
+        shotnum=slice(None),
+        digitizer=None,
+        config_name=None,
+        adc=None,
+        add_controls=None,
+        add_msi=None,
+        where=None,
+        intersection_set=True,
+        time_index=None,
+        time_window=None,
+    ) -> Tuple[
+        Any,
+        List[Dict[str, Any]],
+        List[slice],
+        np.ndarray,
+        List[np.ndarray],
+        List[np.ndarray],
+        Union[HDFReadControls, None],
+        Union[np.ndarray, None],
+    ]:
+        """
+        Resolve the digitizer mapping, datasets, time slices, shot
+        number relation (filtered by the ``where`` predicates), control
+        device data, and MSI data shared by the ``connections``.  This
+        is the single shot resolution path of `__new__`, `read_many`,
+        and `iter_blocks`.  Returns the tuple
+        ``(_dmap, dsets_list, time_index_list, shotnum, index_list,
+        sni_list, cdata, mdata)``.
+        """
+        # ---- Condition hdf_file                                   ----
+        if not isinstance(hdf_file, File):
+            raise TypeError(
+                f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
+            )
+
+        # ---- Condition `connections`                              ----
+        if isinstance(connections, tuple) and len(connections) == 2:
+            connections = [connections]
+        if not isinstance(connections, (list, tuple)) or len(connections) == 0:
+            raise TypeError(
+                "Argument `connections` must be a non-empty list of "
+                "(board, channel) tuples."
+            )
+        if not all(
+            isinstance(conn, (list, tuple)) and len(conn) == 2 for conn in connections
+        ):
+            raise ValueError(
+                "All elements of `connections` must be (board, channel) tuples."
+            )
+        connections = [tuple(conn) for conn in connections]
+        if len(set(connections)) != len(connections):
+            raise ValueError("Argument `connections` contains duplicate entries.")
+
+        with profiling.span("mapping lookup"):
+            # ---- Condition `add_controls`, `add_msi`, and        ----
+            # ---- `digitizer`                                      ----
+            controls = cls._condition_add_controls(hdf_file, add_controls)
+            msi = cls._condition_add_msi(hdf_file, add_msi)
+            where = cls._condition_where(where)
+            _dmap = cls._condition_digitizer(hdf_file, digitizer)
+
+            # ---- Gather Digi Dataset Info                         ----
+            dsets_list = [
+                cls._get_digitizer_datasets(
+                    hdf_file, _dmap, brd, ch, adc=adc, config_name=config_name
+                )
+                for brd, ch in connections
+            ]
 
-        # ---- Condition shots, index, and shotnum ----
+            # ---- Condition `time_index` and `time_window`         ----
+            time_index_list = [
+                cls._condition_time_index(
+                    hdf_file, dsets, time_index=time_index, time_window=time_window
+                )
+                for dsets in dsets_list
+            ]
+
+        # ---- Condition shots, index, and shotnum                  ----
+        with profiling.span("shotnum conditioning"):
+            shotnum, index_list, sni_list = cls._condition_shots(
+                dsets_list,
+                index=index,
+                shotnum=shotnum,
+                intersection_set=intersection_set,
+                index_cache=hdf_file.shotnum_cache,
+            )
+
+        # ---- Retrieve MSI Data                                    ----
+        shotnum, index_list, sni_list, mdata = cls._read_msi(
+            hdf_file,
+            msi,
+            shotnum=shotnum,
+            index_list=index_list,
+            sni_list=sni_list,
+            intersection_set=intersection_set,
+        )
+
+        # ---- Retrieve Control Data                                ----
+        shotnum, index_list, sni_list, cdata = cls._read_controls(
+            hdf_file,
+            controls,
+            shotnum=shotnum,
+            index_list=index_list,
+            sni_list=sni_list,
+            intersection_set=intersection_set,
+        )
+
+        # ---- Apply `where` predicates                             ----
+        shotnum, index_list, sni_list, cdata, mdata = cls._apply_where(
+            where,
+            shotnum=shotnum,
+            index_list=index_list,
+            sni_list=sni_list,
+            cdata=cdata,
+            mdata=mdata,
+        )
+
+        return (
+            _dmap,
+            dsets_list,
+            time_index_list,
+            shotnum,
+            index_list,
+            sni_list,
+            cdata,
+            mdata,
+        )
+
+    @staticmethod
+    def _condition_shots(
+        dsets_list: List[Dict[str, Any]],
+        index=slice(None),
+        shotnum=slice(None),
+        intersection_set=True,
+        index_cache=None,
+    ) -> Tuple[np.ndarray, List[np.ndarray], List[np.ndarray]]:
+        """
+        Condition the ``index`` and ``shotnum`` arguments against all
+        the digitizer datasets in ``dsets_list`` (as generated by
+        :meth:`_get_digitizer_datasets`).  ``index_cache`` is passed
+        to `~bapsflib._hdf.utils.helpers.build_shotnum_dset_relation`.
+
+        Returns the conditioned ``shotnum`` array, and a list of
+        ``index`` and ``sni`` arrays (one per entry in ``dsets_list``).
+        """
         # index   -- row index of digitizer dataset
         #            ~ indexed at 0
         #            ~ supersedes any other indexing keywords
@@ -361,7 +1331,7 @@ class HDFReadData(np.ndarray):
             # - Note: h5py datasets can NOT be sliced using numpy arrays
             #
             # convert `index` to np.ndarray
-            sn_size = dheader.size
+            sn_size = dsets_list[0]["dheader"].size
             if isinstance(index, int):
                 index = np.array([index], dtype=np.int32)
             elif isinstance(index, list):
@@ -384,132 +1354,419 @@ class HDFReadData(np.ndarray):
             index = np.unique(index)
 
             # define `shotnum`
-            if shotnumkey is not None:
-                shotnum = dheader[index.tolist(), shotnumkey]
-            else:
-                # The header dataset for the associated digitizer does NOT
-                # contain shot number information.  Assume the shot number
-                # is the index value plus one
-                shotnum = index + 1
+            shotnum = None
+            for dsets in dsets_list:
+                if dsets["shotnumkey"] is not None:
+                    _shotnum = read_dset_rows(
+                        dsets["dheader"], index, field=dsets["shotnumkey"]
+                    )
+                else:
+                    # The header dataset for the associated digitizer does
+                    # NOT contain shot number information.  Assume the shot
+                    # number is the index value plus one
+                    _shotnum = index + 1
+
+                if shotnum is None:
+                    shotnum = _shotnum
+                elif not np.array_equal(shotnum, _shotnum):
+                    raise ValueError(
+                        "The digitizer datasets do NOT record the same shot "
+                        "numbers for the given `index`, use `shotnum` instead."
+                    )
 
             # define sni
             sni = np.ones(shotnum.shape[0], dtype=bool)
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(f"tt - condition index: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-        else:
-            # perform `shotnum` conditioning
-            # - `shotnum` is returned as a numpy array
-            shotnum = condition_shotnum(shotnum, [dheader], [shotnumkey])
+            return shotnum, [index] * len(dsets_list), [sni] * len(dsets_list)
 
-            # Calc. the corresponding `index` and `sni`
-            # - `shotnum` will be converted from list to np.array
-            # - `index` and `sni` will be np.array's
-            #
+        # perform `shotnum` conditioning
+        # - `shotnum` is returned as a numpy array
+        shotnum = condition_shotnum(
+            shotnum,
+            [dsets["dheader"] for dsets in dsets_list],
+            [dsets["shotnumkey"] for dsets in dsets_list],
+        )
+
+        # Calc. the corresponding `index` and `sni`
+        # - `shotnum` will be converted from list to np.array
+        # - `index` and `sni` will be np.array's
+        #
+        index_dict = {"digi": {}}  # type: IndexDict
+        sni_dict = {"digi": {}}  # type: IndexDict
+        for ii, dsets in enumerate(dsets_list):
             index, sni = build_shotnum_dset_relation(
                 shotnum=shotnum,
-                dset=dheader,
-                shotnumkey=shotnumkey,
+                dset=dsets["dheader"],
+                shotnumkey=dsets["shotnumkey"],
                 n_configs=1,
                 config_column_value=None,
+                index_cache=index_cache,
             )
+            key = "signal" if ii == 0 else f"signal{ii}"
+            index_dict["digi"][key] = index
+            sni_dict["digi"][key] = sni
 
-            # perform intersection
-            if intersection_set:
-                shotnum, sni_dict, index_dict = do_shotnum_intersection(
-                    shotnum, {"digi": {"signal": sni}}, {"digi": {"signal": index}}
-                )
-                sni = sni_dict["digi"]["signal"]
-                index = index_dict["digi"]["signal"]
+        # perform intersection
+        if intersection_set:
+            shotnum, sni_dict, index_dict = do_shotnum_intersection(
+                shotnum, sni_dict, index_dict
+            )
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(f"tt - condition shotnum: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        return (
+            shotnum,
+            list(index_dict["digi"].values()),
+            list(sni_dict["digi"].values()),
+        )
 
-        # ---- Retrieve Control Data                                ----
+    @staticmethod
+    def _read_msi(
+        hdf_file: File,
+        msi: List[Tuple[str, Union[List[str], None]]],
+        shotnum: np.ndarray,
+        index_list: List[np.ndarray],
+        sni_list: List[np.ndarray],
+        intersection_set=True,
+    ) -> Tuple[np.ndarray, List[np.ndarray], List[np.ndarray], Union[np.ndarray, None]]:
+        """
+        Read the conditioned ``msi`` diagnostics for the shot numbers
+        ``shotnum`` and join them into the structured array ``mdata``,
+        whose rows are one-to-one with the returned ``shotnum``.  The
+        ``'meta'`` fields are flattened into ``mdata`` and shot numbers
+        not recorded by a diagnostic are filled with `numpy.nan` (or
+        ``0`` for non-float fields).  ``shotnum``, ``index_list``, and
+        ``sni_list`` are re-filtered if ``intersection_set=True``.
+        """
+        if len(msi) == 0:
+            return shotnum, index_list, sni_list, None
+
+        found = np.ones(shotnum.shape, dtype=bool)
+        columns = {}  # type: Dict[str, np.ndarray]
+        for name, fields in msi:
+            # only the MSI rows matching shotnum are read
+            # - shotnum is copied since it is sorted in place by
+            #   condition_shotnum
+            with profiling.span("msi read", diagnostic=name):
+                try:
+                    data = HDFReadMSI(
+                        hdf_file,
+                        name,
+                        shotnum=shotnum.copy(),
+                        fields=fields,
+                        meta_only=fields is None,
+                    )
+                except ValueError:
+                    # none of shotnum might be recorded by the
+                    # diagnostic, then read a single recorded shot for
+                    # the field layout and join zero rows
+                    msn = HDFReadMSI(hdf_file, name, meta_only=True)["shotnum"]
+                    if msn.size == 0 or np.any(np.isin(shotnum, msn)):
+                        raise
+                    data = HDFReadMSI(
+                        hdf_file,
+                        name,
+                        shotnum=msn[:1],
+                        fields=fields,
+                        meta_only=fields is None,
+                    )[:0]
+
+            # sorted-merge join of the MSI shot numbers onto shotnum
+            # - shotnum is already sorted
+            msn = data["shotnum"]
+            order = (
+                None if np.all(msn[1:] >= msn[:-1]) else np.argsort(msn, kind="stable")
+            )
+            if order is not None:
+                msn = msn[order]
+            pos = np.searchsorted(msn, shotnum)
+            pos[pos == msn.size] = max(msn.size - 1, 0)
+            match = msn[pos] == shotnum if msn.size else np.zeros(pos.shape, dtype=bool)
+            rows = pos[match] if order is None else order[pos[match]]
+            found &= match
+
+            # flatten 'meta' and signal fields into columns
+            values_list = []
+            for field in data.dtype.names:
+                if field == "meta":
+                    meta = data["meta"]
+                    values_list.extend((key, meta[key]) for key in meta.dtype.names)
+                elif field != "shotnum":
+                    values_list.append((field, data[field]))
+            for field, values in values_list:
+                if field in columns:
+                    raise ValueError(
+                        f"MSI field '{field}' is selected from more than one "
+                        f"diagnostic in `add_msi`."
+                    )
+                shape = shotnum.shape + values.shape[1:]
+                if np.issubdtype(values.dtype, np.inexact):
+                    column = np.full(shape, np.nan, dtype=values.dtype)
+                else:
+                    column = np.zeros(shape, dtype=values.dtype)
+                column[match] = values[rows]
+                columns[field] = column
+
+        # re-filter index, shotnum, and sni
+        # - for intersection_set=True, shotnum and index are
+        #   one-to-one
+        if intersection_set:
+            if not np.any(found):
+                raise ValueError("Input `shotnum` would result in a NULL array")
+            shotnum = shotnum[found]
+            index_list = [index[found] for index in index_list]
+            sni_list = [np.ones(shotnum.shape[0], dtype=bool) for _ in sni_list]
+            columns = {field: column[found] for field, column in columns.items()}
+
+        mdata = np.empty(
+            shotnum.shape,
+            dtype=[
+                (field, column.dtype, column.shape[1:])
+                for field, column in columns.items()
+            ],
+        )
+        for field, column in columns.items():
+            mdata[field] = column
+
+        return shotnum, index_list, sni_list, mdata
+
+    @staticmethod
+    def _read_controls(
+        hdf_file: File,
+        controls: List[Tuple[str, Any]],
+        shotnum: np.ndarray,
+        index_list: List[np.ndarray],
+        sni_list: List[np.ndarray],
+        intersection_set=True,
+    ) -> Tuple[
+        np.ndarray, List[np.ndarray], List[np.ndarray], Union[HDFReadControls, None]
+    ]:
+        """
+        Read the conditioned ``controls`` for the shot numbers
+        ``shotnum``, and re-filter ``shotnum``, ``index_list``, and
+        ``sni_list`` if ``intersection_set=True``.
+        """
         # 1. retrieve the numpy array for control data
         # 2. re-filter shotnum if intersection_set=True s.t. only
         #    shotnum's w/ control data are returned
         #
-        # grab control device dataset
-        #
         # - this will ensure cdata.shape == data.shape all the time
         # - shotnum should always be a ndarray at this point
         #
-        if len(controls) != 0:
-            cdata = HDFReadControls(
-                hdf_file,
-                controls,
-                assume_controls_conditioned=True,
-                shotnum=shotnum,
-                intersection_set=intersection_set,
-            )
+        if len(controls) == 0:
+            return shotnum, index_list, sni_list, None
+
+        cdata = HDFReadControls(
+            hdf_file,
+            controls,
+            assume_controls_conditioned=True,
+            shotnum=shotnum,
+            intersection_set=intersection_set,
+        )
 
-            # print execution timing
-            if timeit:  # pragma: no cover
-                tt.append(time.time())
-                print(
-                    f"tt - read in cdata (control data): {(tt[-1] - tt[-2]) * 1.0e3} ms"
+        # re-filter index, shotnum, and sni
+        # - only need to be filtered if intersection_set=True
+        # - for intersection_set=True, shotnum and index are
+        #   one-to-one
+        #
+        if intersection_set:
+            new_sn_mask = np.isin(shotnum, cdata["shotnum"])
+            shotnum = shotnum[new_sn_mask]
+            index_list = [index[new_sn_mask] for index in index_list]
+            sni_list = [np.ones(shotnum.shape[0], dtype=bool) for _ in sni_list]
+
+        return shotnum, index_list, sni_list, cdata
+
+    @staticmethod
+    def _apply_where(
+        where: List[Union[Callable, Tuple[str, str, Any]]],
+        shotnum: np.ndarray,
+        index_list: List[np.ndarray],
+        sni_list: List[np.ndarray],
+        cdata: Union[HDFReadControls, None],
+        mdata: Union[np.ndarray, None],
+    ) -> Tuple[
+        np.ndarray,
+        List[np.ndarray],
+        List[np.ndarray],
+        Union[HDFReadControls, None],
+        Union[np.ndarray, None],
+    ]:
+        """
+        Evaluate the conditioned ``where`` predicates on the control
+        data ``cdata`` and MSI data ``mdata``, and filter ``shotnum``,
+        ``index_list``, ``sni_list``, ``cdata``, and ``mdata`` down to
+        the selected shots.
+        """
+        if len(where) == 0:
+            return shotnum, index_list, sni_list, cdata, mdata
+
+        # gather the fields the predicates are evaluated on
+        columns = {"shotnum": shotnum}
+        for data in (cdata, mdata):
+            if data is not None:
+                columns.update(
+                    (field, data[field])
+                    for field in data.dtype.names
+                    if field != "shotnum"
                 )
-
-            # re-filter index, shotnum, and sni
-            # - only need to be filtered if intersection_set=True
-            # - for intersection_set=True, shotnum and index are
-            #   one-to-one
-            #
-            if intersection_set:
-                new_sn_mask = np.isin(shotnum, cdata["shotnum"])
-                shotnum = shotnum[new_sn_mask]
-                index = index[new_sn_mask]
-                sni = np.ones(shotnum.shape[0], dtype=bool)
-        else:
-            cdata = None
-
-        # ---- Build `obj`                                          ----
-        # Define dtype and shape
+        columns = ColumnarData(columns)
+
+        with profiling.span("shot filtering"):
+            mask = np.ones(shotnum.shape, dtype=bool)
+            for pred in where:
+                if callable(pred):
+                    pred_mask = pred(columns)
+                else:
+                    field, op, value = pred
+                    if field not in columns:
+                        raise ValueError(
+                            f"Field '{field}' of `where` predicate is not among "
+                            f"the control device and MSI fields {columns.names}."
+                        )
+                    pred_mask = _WHERE_OPS[op](columns[field], value)
+
+                pred_mask = np.asarray(pred_mask)
+                if pred_mask.dtype != np.bool_ or pred_mask.shape != shotnum.shape:
+                    raise ValueError(
+                        f"The `where` predicates must evaluate to a boolean "
+                        f"mask of shape {shotnum.shape}, got dtype "
+                        f"{pred_mask.dtype} and shape {pred_mask.shape}."
+                    )
+                mask &= pred_mask
+
+        if not np.any(mask):
+            raise ValueError("Input `where` would result in a NULL array")
+        elif np.all(mask):
+            return shotnum, index_list, sni_list, cdata, mdata
+
+        # filter
+        # - index only holds the rows of shot numbers with sni=True
+        index_list = [index[mask[sni]] for index, sni in zip(index_list, sni_list)]
+        sni_list = [sni[mask] for sni in sni_list]
+        shotnum = shotnum[mask]
+        if cdata is not None:
+            cdata = cdata[mask]
+        if mdata is not None:
+            mdata = mdata[mask]
+
+        return shotnum, index_list, sni_list, cdata, mdata
+
+    @staticmethod
+    def _build_dtype(
+        dsets: Dict[str, Any],
+        cdata: Union[HDFReadControls, None],
+        keep_bits: bool,
+        time_index: slice,
+        mdata: Union[np.ndarray, None] = None,
+    ) -> np.dtype:
+        """
+        Build the structured `numpy.dtype` of the `HDFReadData` array
+        for the digitizer datasets ``dsets``, control data ``cdata``,
+        time sample slice ``time_index``, and MSI data ``mdata`` (see
+        `_read_msi`).
+        """
         # - 1st column of the digi data header contains the global HDF5
         #   file shot number
         # - shotkey = is the field name/key of the dheader shot number
         #   column
+        dset = dsets["dset"]
         sigtype = np.float32 if not keep_bits else dset.dtype
-        shape = shotnum.shape
         dtype = [
             ("shotnum", np.uint32, ()),
-            ("signal", sigtype, (dset.shape[1],)),
+            ("signal", sigtype, (time_index.stop - time_index.start,)),
             ("xyz", np.float32, (3,)),
         ]
-        if len(controls) != 0:
+        if cdata is not None:
             for subdtype in cdata.dtype.descr:
                 if subdtype[0] not in [d[0] for d in dtype]:
                     dtype.append(subdtype)
+        if mdata is not None:
+            for subdtype in mdata.dtype.descr:
+                if subdtype[0] in [d[0] for d in dtype]:
+                    raise ValueError(
+                        f"MSI field '{subdtype[0]}' conflicts with an existing "
+                        f"field of the read data."
+                    )
+                dtype.append(subdtype)
+
+        return np.dtype(dtype)
+
+    @classmethod
+    def _build_obj(
+        cls,
+        hdf_file: File,
+        _dmap,
+        dsets: Dict[str, Any],
+        shotnum: np.ndarray,
+        index: np.ndarray,
+        sni: np.ndarray,
+        cdata: Union[HDFReadControls, None],
+        keep_bits=False,
+        intersection_set=True,
+        time_index: Union[slice, None] = None,
+        out: Union[np.ndarray, "HDFReadDataColumns", None] = None,
+        offset_row: Union[int, None] = None,
+        layout="structured",
+        fill_signal=True,
+        engine="h5py",
+        mdata: Union[np.ndarray, None] = None,
+    ) -> Union["HDFReadData", "HDFReadDataColumns"]:
+        """
+        Construct the `HDFReadData` object (or `HDFReadDataColumns`
+        container if ``layout='columnar'``) from the conditioned shot
+        number relation and control device data.  ``time_index`` is the
+        conditioned slice of time samples to be read (see
+        `_condition_time_index`).  If given, ``out`` is a pre-allocated
+        structured array (or `HDFReadDataColumns` container) the data
+        is written into and ``offset_row`` is the header dataset row
+        used to determine the voltage offset (defaults to
+        ``index[0]``).  If ``fill_signal`` is `False`, then the
+        ``'signal'`` field is left untouched (neither read nor converted
+        to voltage) so it can be filled elsewhere, e.g. by
+        `~bapsflib._hdf.utils.parallel.read_data_parallel`.
+        ``engine`` is the conditioned read engine of the ``'signal'``
+        field (see `~bapsflib._hdf.utils.chunk_reader.condition_engine`).
+        ``mdata`` is the MSI data merged into the array (see
+        `_read_msi`).
+        """
+        dset = dsets["dset"]
+        dheader = dsets["dheader"]
+        d_info = dsets["d_info"]
+        dpath = dsets["dpath"]
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - define dtype: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # Define dtype and shape
+        if time_index is None:
+            time_index = slice(0, dset.shape[1])
+        shape = shotnum.shape
+        dtype = cls._build_dtype(dsets, cdata, keep_bits, time_index, mdata=mdata)
 
         # Initialize data array
-        data = np.empty(shape, dtype=dtype)
-
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - initialize data np.ndarray: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        if out is None and layout == "columnar":
+            data = HDFReadDataColumns.empty(shape, dtype)
+        elif out is None:
+            data = np.empty(shape, dtype=dtype)
+        elif out.shape != shape or out.dtype != dtype:
+            raise ValueError(
+                f"Output buffer of shape {out.shape} and dtype {out.dtype} does "
+                f"not match the required shape {shape} and dtype {dtype}."
+            )
+        else:
+            data = out
 
         # fill 'shotnum' field of data array
         data["shotnum"] = shotnum
 
         # fill 'signal' fields of data array
-        index = index.tolist()
-        if intersection_set:
+        read_rows = read_dset_rows_threaded if engine == "threads" else read_dset_rows
+        if not fill_signal:
+            pass
+        elif intersection_set:
             # fill signal
-            data["signal"] = dset[index, ...]
+            with profiling.span("signal read", dataset=dset.name, engine=engine):
+                read_rows(dset, index, out=data["signal"], columns=time_index)
         else:
             # fill signal
-            data["signal"][sni] = dset[index, ...]
+            with profiling.span("signal read", dataset=dset.name, engine=engine):
+                data["signal"][sni] = read_rows(dset, index, columns=time_index)
             if np.issubdtype(data["signal"].dtype, np.integer):
                 data["signal"][np.logical_not(sni)] = 0
             else:
@@ -517,7 +1774,7 @@ class HDFReadData(np.ndarray):
                 data["signal"][np.logical_not(sni)] = np.nan
 
         # fill fields related to controls
-        if len(controls) != 0:
+        if cdata is not None:
             # Note: shot numbers of cdata and data are one-to-one
             #       by this point so intersection_set is irrelevant
             #
@@ -539,13 +1796,14 @@ class HDFReadData(np.ndarray):
             # fill xyz
             data["xyz"] = np.nan
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - fill data array: {(tt[-1] - tt[-2]) * 1.0e3} ms")
+        # fill fields related to MSI diagnostics
+        # - shot numbers of mdata and data are one-to-one
+        if mdata is not None:
+            for field in mdata.dtype.names:
+                data[field] = mdata[field]
 
         # Define obj to be returned
-        obj = data.view(cls)
+        obj = data if isinstance(data, HDFReadDataColumns) else data.view(cls)
 
         # get voltage offset
         try:
@@ -557,7 +1815,9 @@ class HDFReadData(np.ndarray):
                 voffset = None
                 _signal_units = u.volt
             else:
-                voffset = dheader[index[0], "Offset"]
+                if offset_row is None:
+                    offset_row = index[0]
+                voffset = dheader[offset_row, "Offset"]
 
             if voffset == 0:
                 warn(
@@ -592,7 +1852,7 @@ class HDFReadData(np.ndarray):
         obj._info = {
             "source file": os.path.abspath(hdf_file.filename),
             "device group path": _dmap.info["group path"],
-            "device dataset path": dpath + dname,
+            "device dataset path": dpath + dsets["dname"],
             "digitizer": d_info["digitizer"],
             "configuration name": d_info["configuration name"],
             "adc": d_info["adc"],
@@ -600,13 +1860,14 @@ class HDFReadData(np.ndarray):
             "clock rate": d_info["clock rate"],
             "sample average": d_info["sample average (hardware)"],
             "shot average": d_info["shot average (software)"],
-            "board": board,
-            "channel": channel,
+            "board": dsets["board"],
+            "channel": dsets["channel"],
             "voltage offset": voffset,
             "probe name": None,
             "port": (None, None),
             "signal units": _signal_units,
             "time_dset_path": d_info.get("time_dset_path", None),
+            "time index": time_index,
         }
 
         if obj._info["time_dset_path"] is not None:
@@ -648,16 +1909,17 @@ class HDFReadData(np.ndarray):
                 offset = abs(obj.info["voltage offset"].value)
 
                 # calc voltage
-                obj["signal"] = (obj.dv.value * obj["signal"]) - offset
+                # - done in place so no temporary array the size of
+                #   'signal' is allocated
+                if fill_signal:
+                    with profiling.span("conversion"):
+                        signal = obj["signal"]
+                        np.multiply(signal, obj.dv.value, out=signal)
+                        np.subtract(signal, offset, out=signal)
 
                 # update 'signal units'
                 obj._info["signal units"] = u.volt
 
-        # print execution timing
-        if timeit:  # pragma: no cover
-            tt.append(time.time())
-            print(f"tt - execution time: {(tt[-1] - tt[-2]) * 1.0e3} ms")
-
         # return obj
         return obj
 
@@ -687,6 +1949,7 @@ class HDFReadData(np.ndarray):
                 "probe name": None,
                 "port": (None, None),
                 "signal units": None,
+                "time index": None,
                 "controls": {},
             },
         )
@@ -787,6 +2050,10 @@ class HDFReadData(np.ndarray):
             * - ``"time_dset_path"``
               - `str` | None
               - internal HDF5 path to a time array dataset (if present)
+            * - ``"time index"``
+              - `slice` | None
+              - contiguous slice of the digitizer dataset time samples
+                contained in ``"signal"``
             * - ``"controls"``
               - `dict`
               - meta-data of the control device data included in the
@@ -847,11 +2114,85 @@ class HDFReadData(np.ndarray):
         dv = 2.0 * abs(self.info["voltage offset"]) / (2.0 ** self.info["bit"] - 1.0)
         return dv
 
+    @property
+    def voltage(self) -> Union["VoltageView", None]:
+        """
+        A `VoltageView` of the ``'signal'`` field, which converts the
+        signal to voltage (as `numpy.float32`) on access.  This allows
+        data read with ``keep_bits=True`` to be stored as the raw
+        digitizer integers, while only the accessed shots (or chunks of
+        shots) are converted to voltage.  Returns `None` if the
+        ``'signal'`` units are unknown, or the ``'signal'`` is in bits
+        and the voltage step size :attr:`dv` can not be calculated.
+
+        Examples
+        --------
+
+        >>> data = f.read_data(1, 1, keep_bits=True)
+        >>> data['signal'].dtype
+        dtype('int16')
+        >>> data.voltage[0:2].dtype
+        dtype('float32')
+        >>> for volts in data.voltage.iter_chunks(chunk_shots=500):
+        ...     total = volts.sum(axis=0)
+        """
+        signal = np.asarray(self["signal"])
+        units = self.info["signal units"]
+        if units == u.volt:
+            # signal is already in volts
+            return VoltageView(signal, 1.0, 0.0, dtype=signal.dtype)
+        elif units != u.bit:
+            # unknown units (e.g. a zero or missing voltage 'Offset')
+            return
+
+        dv = self.dv
+        if dv is None or self.info["voltage offset"] is None:
+            return
+
+        offset = abs(self.info["voltage offset"].value)
+        return VoltageView(signal, dv.value, offset)
+
+    def to_grid(self, field: Union[str, None] = "signal", atol=None) -> GridCube:
+        """
+        Arrange the data into a ``(nx, ny, nz, nshots_per_pos, ...)``
+        position grid cube using the probe positions in the ``'xyz'``
+        field.  (see `~bapsflib._hdf.utils.grid.to_grid` for details)
+
+        Parameters
+        ----------
+        field : `str`, optional
+            name of the field to arrange into the cube (DEFAULT
+            ``'signal'``).  If `None`, then the records of the data
+            are arranged.
+
+        atol : Union[float, Tuple[float, float, float]], optional
+            absolute tolerance of the grid coordinates.  If `None`
+            (DEFAULT), then the tolerance is derived from the motion
+            list step sizes in ``info['controls']``.
+
+        Returns
+        -------
+        ~bapsflib._hdf.utils.grid.GridCube
+
+        Examples
+        --------
+
+        >>> data = f.read_data(1, 1, add_controls=[('6K Compumotor', 3)])
+        >>> grid = data.to_grid()
+        >>> grid.cube.shape
+        (21, 11, 1, 10, 16384)
+        >>> grid.x
+        array([-10., -9., ..., 9., 10.])
+        """
+        return to_grid(self, field=field, atol=atol)
+
     @property
     def plasma(self):  # pragma: no cover
         """
         Dictionary of plasma parameters. (All quantities are in cgs
-        units except temperature is in eV)
+        units except temperature is in eV)  If the base values are
+        set with arrays (see :meth:`set_plasma`), then all values are
+        `~astropy.units.Quantity` arrays.
 
         +----------------+---------------------------------------------+
         | Base Values                                                  |
@@ -918,61 +2259,81 @@ class HDFReadData(np.ndarray):
         Set :attr:`plasma` and add key frequency, length, and velocity
         parameters. (all quantities in cgs except temperature is in eV)
 
+        Any of the base values may be a `numpy` array or an
+        `astropy.units.Quantity` (e.g. a per-shot magnetic field read
+        with `~bapsflib._hdf.utils.file.File.read_msi`), in which case
+        all base values are stored as `~astropy.units.Quantity` objects
+        and the calculated values are broadcast over the base values
+        in one vectorized call to `bapsflib.plasma.vectorized`.
+
         Parameters
         ----------
-        Bo : `float`
+        Bo : `float` | `numpy.ndarray` | `astropy.units.Quantity`
             magnetic field (in Gauss)
 
-        kTe : `float`
+        kTe : `float` | `numpy.ndarray` | `astropy.units.Quantity`
             electron temperature (in eV)
 
-        kTi : `float`
+        kTi : `float` | `numpy.ndarray` | `astropy.units.Quantity`
             ion temperature (in eV)
 
-        m_i : `float`
+        m_i : `float` | `numpy.ndarray` | `astropy.units.Quantity`
             ion mass (in g)
 
-        n_e : `float`
+        n_e : `float` | `numpy.ndarray` | `astropy.units.Quantity`
             electron number density (in cm^-3)
 
-        Z : `int`
+        Z : `int` | `numpy.ndarray`
             ion charge number
 
-        gamma : `float`
+        gamma : `float` | `numpy.ndarray`
             adiabatic index (arb.)
+
+        Examples
+        --------
+
+        >>> data = f.read_data(0, 0)
+        >>> msi = f.read_msi('Magnetic field')
+        >>> data.set_plasma(
+        ...     Bo=msi['meta']['peak magnetic field'],
+        ...     kTe=5.0,
+        ...     kTi=1.0,
+        ...     m_i=4.0 * core.MP,
+        ...     n_e=1.0e12,
+        ...     Z=1,
+        ... )
+        >>> data.plasma['fce']  # one value per shot
         """
         # define base values
-        self._plasma["Bo"] = core.FloatUnit(Bo, "G")
-        self._plasma["kTe"] = core.FloatUnit(kTe, "eV")
-        self._plasma["kTi"] = core.FloatUnit(kTi, "eV")
-        self._plasma["m_i"] = core.FloatUnit(m_i, "g")
-        self._plasma["n_e"] = core.FloatUnit(n_e, "cm^-3")
-        self._plasma["Z"] = core.IntUnit(Z, "arb")
+        self._plasma["Bo"] = self._plasma_value("Bo", Bo)
+        self._plasma["kTe"] = self._plasma_value("kTe", kTe)
+        self._plasma["kTi"] = self._plasma_value("kTi", kTi)
+        self._plasma["m_i"] = self._plasma_value("m_i", m_i)
+        self._plasma["n_e"] = self._plasma_value("n_e", n_e)
+        self._plasma["Z"] = self._plasma_value("Z", Z)
 
         # define ion number density
-        self._plasma["n_i"] = core.FloatUnit(
-            self._plasma["n_e"] / self._plasma["Z"], "cm^-3"
-        )
+        self._update_ion_density()
 
         # define gamma (adiabatic index)
         # - default = 1.0
         if gamma is not None:
-            self._plasma["gamma"] = core.FloatUnit(gamma, "arb")
+            self._plasma["gamma"] = self._plasma_value("gamma", gamma)
 
         # define plasma temperature
         # - if omitted then assumed kTe
         # TODO: double check assumption
         if "kT" in kwargs:
-            self._plasma["kT"] = core.FloatUnit(kwargs["kT"], "eV")
+            self._plasma["kT"] = self._plasma_value("kT", kwargs["kT"])
         else:
-            self._plasma["kT"] = core.FloatUnit(kTe, "eV")
+            self._plasma["kT"] = self._plasma_value("kT", kTe)
 
         # define plasma number density
         # - if omitted then assumed n_e
         if "n" in kwargs:
-            self._plasma["n"] = core.FloatUnit(kwargs["n"], "cm^-3")
+            self._plasma["n"] = self._plasma_value("n", kwargs["n"])
         else:
-            self._plasma["n"] = core.FloatUnit(n_e, "cm^-3")
+            self._plasma["n"] = self._plasma_value("n", n_e)
 
         # add key plasma constants
         self._update_plasma_constants()
@@ -987,65 +2348,248 @@ class HDFReadData(np.ndarray):
         key : str
             one of the base plasma values
 
-        value :
-            value for key
+        value : `float` | `numpy.ndarray` | `astropy.units.Quantity`
+            value for key (see :meth:`set_plasma`)
         """
         # set plasma value
-        if key == "Bo":
-            self._plasma["Bo"] = core.FloatUnit(value, "G")
-        elif key == "gamma":
-            self._plasma["gamma"] = core.FloatUnit(value, "arb")
-        elif key in ["kT", "kTe", "kTi"]:
-            self._plasma[key] = core.FloatUnit(value, "eV")
-
-            if key == "kTe" and self._plasma["kt"] is None:
-                self._plasma["kT"] = self._plasma[key]
-        elif key == "m_i":
-            self._plasma[key] = core.FloatUnit(value, "g")
-        elif key in ["n", "n_e"]:
-            self._plasma[key] = core.FloatUnit(value, "cm^-3")
+        if key in ("Bo", "gamma", "kT", "kTi", "m_i", "n"):
+            self._plasma[key] = self._plasma_value(key, value)
+        elif key == "kTe":
+            self._plasma[key] = self._plasma_value(key, value)
+
+            if self._plasma["kT"] is None:
+                self._plasma["kT"] = self._plasma_value("kT", value)
+        elif key == "n_e":
+            self._plasma[key] = self._plasma_value(key, value)
 
             # re-calc n_i and n
-            if key == "n_e":
-                self._plasma["n_i"] = core.FloatUnit(
-                    self._plasma["n_e"] / self._plasma["Z"], "cm^-3"
-                )
+            self._update_ion_density()
 
-                if self._plasma["n"] is None:
-                    self._plasma["n"] = self._plasma["n_e"]
+            if self._plasma["n"] is None:
+                self._plasma["n"] = self._plasma_value("n", value)
         elif key == "Z":
-            self._plasma[key] = core.IntUnit(value, "arb")
+            self._plasma[key] = self._plasma_value(key, value)
 
             # re-calc n_i
-            self._plasma["n_i"] = core.FloatUnit(
-                self._plasma["n_e"] / self._plasma["Z"], "cm^-3"
-            )
+            self._update_ion_density()
 
         # update key plasma constants
         self._update_plasma_constants()
 
+    def _update_ion_density(self):  # pragma: no cover
+        """Re-calculate the ion number density ``n_i = n_e / Z``."""
+        n_e = self._plasma["n_e"]
+        Z = self._plasma["Z"]
+        if isinstance(n_e, u.Quantity) or isinstance(Z, u.Quantity):
+            # the 'unit' attribute of FloatUnit and IntUnit is a string
+            # that astropy can not interpret
+            n_e = vectorized.as_quantity("n_e", n_e)
+            Z = vectorized.as_quantity("Z", Z)
+        self._plasma["n_i"] = self._plasma_value("n_i", n_e / Z)
+
+    @staticmethod
+    def _plasma_value(key: str, value):
+        """
+        Condition the base plasma ``value`` for ``key`` of
+        :attr:`plasma`.  Arrays and `~astropy.units.Quantity` objects
+        are converted to a `~astropy.units.Quantity` in cgs units
+        (see `bapsflib.plasma.vectorized.as_quantity`), and scalars to
+        a `~bapsflib.plasma.core.FloatUnit` (or
+        `~bapsflib.plasma.core.IntUnit` for ``Z``).
+        """
+        if isinstance(value, u.Quantity) or np.ndim(value) != 0:
+            return vectorized.as_quantity(key, value)
+        elif key == "Z":
+            return core.IntUnit(value, "arb")
+
+        cgs_units = {
+            "Bo": "G",
+            "gamma": "arb",
+            "kT": "eV",
+            "kTe": "eV",
+            "kTi": "eV",
+            "m_i": "g",
+            "n": "cm^-3",
+            "n_e": "cm^-3",
+            "n_i": "cm^-3",
+        }
+        return core.FloatUnit(value, cgs_units[key])
+
     def _update_plasma_constants(self):  # pragma: no cover
         """
         Updates the calculated plasma constants (fci, fce, fpe, etc.) in
-        :attr:`plasma`.
+        :attr:`plasma`.  If any base value is a
+        `~astropy.units.Quantity`, then the constants are calculated
+        with `bapsflib.plasma.vectorized`, otherwise with
+        `bapsflib.plasma.core`.
         """
+        base_keys = ("Bo", "gamma", "kT", "kTe", "kTi", "m_i", "n", "n_e", "n_i", "Z")
+        formulary = (
+            vectorized
+            if any(isinstance(self._plasma[key], u.Quantity) for key in base_keys)
+            else core
+        )
+
         # add key frequencies
-        self._plasma["fce"] = core.fce(**self._plasma)
-        self._plasma["fci"] = core.fci(**self._plasma)
-        self._plasma["fpe"] = core.fpe(**self._plasma)
-        self._plasma["fpi"] = core.fpi(**self._plasma)
-        self._plasma["fUH"] = core.fUH(**self._plasma)
-        self._plasma["fLH"] = core.fLH(**self._plasma)
+        self._plasma["fce"] = formulary.fce(**self._plasma)
+        self._plasma["fci"] = formulary.fci(**self._plasma)
+        self._plasma["fpe"] = formulary.fpe(**self._plasma)
+        self._plasma["fpi"] = formulary.fpi(**self._plasma)
+        self._plasma["fUH"] = formulary.fUH(**self._plasma)
+        self._plasma["fLH"] = formulary.fLH(**self._plasma)
 
         # add key lengths
-        self._plasma["lD"] = core.lD(**self._plasma)
-        self._plasma["lpe"] = core.lpe(**self._plasma)
-        self._plasma["lpi"] = core.lpi(**self._plasma)
-        self._plasma["rce"] = core.rce(**self._plasma)
-        self._plasma["rci"] = core.rci(**self._plasma)
+        self._plasma["lD"] = formulary.lD(**self._plasma)
+        self._plasma["lpe"] = formulary.lpe(**self._plasma)
+        self._plasma["lpi"] = formulary.lpi(**self._plasma)
+        self._plasma["rce"] = formulary.rce(**self._plasma)
+        self._plasma["rci"] = formulary.rci(**self._plasma)
 
         # add key velocities
-        self._plasma["cs"] = core.cs(**self._plasma)
-        self._plasma["VA"] = core.VA(**self._plasma)
-        self._plasma["vTe"] = core.vTe(**self._plasma)
-        self._plasma["vTi"] = core.vTi(**self._plasma)
+        self._plasma["cs"] = formulary.cs(**self._plasma)
+        self._plasma["VA"] = formulary.VA(**self._plasma)
+        self._plasma["vTe"] = formulary.vTe(**self._plasma)
+        self._plasma["vTi"] = formulary.vTi(**self._plasma)
+
+
+class HDFReadDataColumns(ColumnarData):
+    """
+    Columnar (struct-of-arrays) layout of `HDFReadData`, returned when
+    reading with ``layout='columnar'``.
+
+    The ``'shotnum'``, ``'signal'``, ``'xyz'``, and control device
+    fields are stored as separate C-contiguous arrays (e.g.
+    ``'signal'`` has shape ``(nshots, nt)``) instead of being
+    interleaved in one structured array.  The container has the same
+    :attr:`info`, :attr:`dt`, :attr:`dv`, and :attr:`plasma` accessors
+    as `HDFReadData`.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], info: Union[dict, None] = None):
+        super().__init__(columns, info=info)
+
+        # plasma parameter dict
+        self._plasma = {
+            "Bo": None,
+            "kT": None,
+            "kTe": None,
+            "kTi": None,
+            "gamma": core.FloatUnit(1.0, "arb"),
+            "m_e": core.ME,
+            "m_i": None,
+            "n": None,
+            "n_e": None,
+            "n_i": None,
+            "Z": None,
+        }
+
+    # the accessors only depend on `_info` and `_plasma`, so they are
+    # shared with HDFReadData
+    info = HDFReadData.info
+    dt = HDFReadData.dt
+    dv = HDFReadData.dv
+    voltage = HDFReadData.voltage
+    to_grid = HDFReadData.to_grid
+    plasma = HDFReadData.plasma
+    set_plasma = HDFReadData.set_plasma
+    set_plasma_value = HDFReadData.set_plasma_value
+    _plasma_value = staticmethod(HDFReadData._plasma_value)
+    _update_ion_density = HDFReadData._update_ion_density
+    _update_plasma_constants = HDFReadData._update_plasma_constants
+
+
+class VoltageView:
+    r"""
+    A read-only view of a digitizer signal stored in bits, which
+    converts the signal to voltage on access,
+
+    .. math::
+
+        \text{voltage} = dv * \text{bits} - \text{offset}
+
+    Indexing the view (e.g. ``view[0:100]``) returns a newly allocated
+    voltage array of only the selected shots, so the full signal is
+    never held in memory as both bits and volts.  Use
+    :meth:`iter_chunks` to stream over the voltage in blocks of shots.
+    """
+
+    def __init__(self, signal: np.ndarray, dv: float, offset: float, dtype=np.float32):
+        """
+        Parameters
+        ----------
+        signal : `numpy.ndarray`
+            the digitizer signal (in bits) with shape ``(nshots, nt)``
+
+        dv : `float`
+            voltage step size (in volts)
+
+        offset : `float`
+            voltage offset (in volts)
+
+        dtype : `numpy.dtype`, optional
+            `numpy.dtype` of the converted voltage (DEFAULT
+            `numpy.float32`)
+        """
+        self._signal = signal
+        self._dv = dv
+        self._offset = offset
+        self._dtype = np.dtype(dtype)
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self[...]
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+
+    def __getitem__(self, key) -> np.ndarray:
+        return self._convert(self._signal[key])
+
+    def __len__(self) -> int:
+        return len(self._signal)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(shape={self.shape}, dtype={self.dtype}, "
+            f"dv={self._dv}, offset={self._offset})"
+        )
+
+    @property
+    def dtype(self) -> np.dtype:
+        """`numpy.dtype` of the converted voltage."""
+        return self._dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the signal."""
+        return self._signal.ndim
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the signal."""
+        return self._signal.shape
+
+    def _convert(self, bits) -> np.ndarray:
+        """Convert ``bits`` to voltage with one output allocation."""
+        volts = np.multiply(bits, self._dv, dtype=self._dtype)
+        volts -= self._offset
+        return volts
+
+    def iter_chunks(self, chunk_shots: int = 1000) -> Iterator[np.ndarray]:
+        """
+        Iterate over the voltage in blocks of (at most) ``chunk_shots``
+        shots.
+
+        Parameters
+        ----------
+        chunk_shots : `int`, optional
+            maximum number of shots per yielded block (DEFAULT ``1000``)
+        """
+        if (
+            not isinstance(chunk_shots, (int, np.integer))
+            or isinstance(chunk_shots, bool)
+            or chunk_shots < 1
+        ):
+            raise ValueError(
+                f"Argument `chunk_shots` must be a positive integer, got {chunk_shots}."
+            )
+
+        for start in range(0, len(self), int(chunk_shots)):
+            yield self[start : start + int(chunk_shots)]
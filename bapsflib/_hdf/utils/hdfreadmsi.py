@@ -16,10 +16,19 @@ Module containing the main `~bapsflib._hdf.utils.hdfreadmsi.HDFReadMSI` class.
 __all__ = ["HDFReadMSI"]
 
 import copy
+import h5py
 import numpy as np
 import os
 
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from bapsflib._hdf.maps.msi.templates import HDFMapMSITemplate
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.helpers import (
+    build_shotnum_dset_relation,
+    condition_shotnum,
+    read_dset_rows,
+)
 
 
 class HDFReadMSI(np.ndarray):
@@ -41,7 +50,15 @@ class HDFReadMSI(np.ndarray):
     attribute.
     """
 
-    def __new__(cls, hdf_file: File, dname: str, **kwargs):
+    def __new__(
+        cls,
+        hdf_file: File,
+        dname: str,
+        shotnum=slice(None),
+        fields: Optional[Sequence[str]] = None,
+        meta_only: bool = False,
+        **kwargs,
+    ):
         """
         Parameters
         ----------
@@ -51,6 +68,25 @@ class HDFReadMSI(np.ndarray):
         dname : `str`
             name of desired MSI diagnostic
 
+        shotnum : int | list(int) | slice() | numpy.array, optional
+            HDF5 file shot number(s) indicating data entries to be
+            extracted (see `~.helpers.condition_shotnum`).  Only the
+            rows of the requested shot numbers are read, and requested
+            shot numbers not recorded by the diagnostic are dropped.
+            (DEFAULT: ``slice(None)``, i.e. all rows)
+
+        fields : Sequence[str], optional
+            names of the signal fields (e.g. ``'current'``) and/or the
+            ``'meta'`` sub-fields (e.g. ``'peak current'``) to read.
+            Only the datasets (and dataset columns) of these fields are
+            read.  The ``'shotnum'`` field is always included, and the
+            ``'meta'`` field is dropped if none of its sub-fields are
+            requested.  If `None` (DEFAULT), then all fields are read.
+
+        meta_only : `bool`, optional
+            `True` to skip all signal fields, i.e. only read the
+            (typically small) ``'meta'`` datasets.  (DEFAULT: `False`)
+
         Examples
         --------
 
@@ -97,6 +133,13 @@ class HDFReadMSI(np.ndarray):
         >>> # get time step for the data arrays
         >>> mdata.info['dt'][0]
         4.88e-05
+        >>>
+        >>> # only read the peak current of two shots
+        >>> mdata = HDFReadMSI(
+        ...     f, 'Discharge', shotnum=[1, 50], fields=['peak current']
+        ... )
+        >>> mdata.dtype
+        dtype([('shotnum', '<i4'), ('meta', [('peak current', '<f4')])])
         """
         # ---- Condition `hdf_file`                                 ----
         # - `hdf_file` is a lapd.File object
@@ -139,6 +182,42 @@ class HDFReadMSI(np.ndarray):
         except KeyError:
             raise ValueError("Specified MSI Diagnostic is not among known diagnostics")
 
+        # ---- Condition `fields`                                   ----
+        signal_fields, meta_fields = cls._condition_fields(
+            _map, fields=fields, meta_only=meta_only
+        )
+
+        # ---- Condition `shotnum`                                  ----
+        # - `index` are the dataset rows to be read, `None` reads all
+        #   rows
+        #
+        sn_config = _map.configs["shotnum"]
+        sn_dsets = [hdf_file[path] for path in sn_config["dset paths"]]
+        sn_keys = [
+            (
+                sn_config["dset field"][0]
+                if len(sn_config["dset field"]) == 1
+                else sn_config["dset field"][ii]
+            )
+            for ii in range(len(sn_dsets))
+        ]
+        if isinstance(shotnum, slice) and shotnum == slice(None):
+            index = None
+            shape = _map.configs["shape"]
+        else:
+            shotnum = condition_shotnum(shotnum, sn_dsets[:1], sn_keys[:1])
+            index, _sni = build_shotnum_dset_relation(
+                shotnum,
+                sn_dsets[0],
+                shotnumkey=sn_keys[0],
+                n_configs=1,
+                config_column_value=None,
+                index_cache=hdf_file.shotnum_cache,
+            )
+            if index.size == 0:
+                raise ValueError("Input `shotnum` would result in a NULL array")
+            shape = index.shape
+
         # ---- Construct shape and dtype for np.ndarray             ----
         #
         # initialize dtype_list
@@ -156,13 +235,13 @@ class HDFReadMSI(np.ndarray):
         dtype_list = [
             (
                 "shotnum",
-                _map.configs["shotnum"]["dtype"],
-                _map.configs["shotnum"]["shape"],
+                sn_config["dtype"],
+                sn_config["shape"],
             ),
         ]
 
         # add signal fields
-        for field in _map.configs["signals"]:
+        for field in signal_fields:
             dtype_list.append(
                 (
                     field,
@@ -176,11 +255,7 @@ class HDFReadMSI(np.ndarray):
         #   the signal fields
         #
         meta_dtype_list = []
-        for field in _map.configs["meta"]:
-            # skip the 'shape' field
-            if field == "shape":
-                continue
-
+        for field in meta_fields:
             # add to meta_dtype_list
             meta_dtype_list.append(
                 (
@@ -191,36 +266,26 @@ class HDFReadMSI(np.ndarray):
             )
 
         # add 'meta' to dtype_list
-        dtype_list.append(
-            ("meta", meta_dtype_list, _map.configs["meta"]["shape"]),
-        )
+        if meta_dtype_list:
+            dtype_list.append(
+                ("meta", meta_dtype_list, _map.configs["meta"]["shape"]),
+            )
 
         # define dtype
         dtype = np.dtype(dtype_list)
 
         # ---- Define and Populate Numpy Array                      ----
         # create empty array
-        data = np.empty(_map.configs["shape"], dtype=dtype)
+        data = np.empty(shape, dtype=dtype)
 
         # fill 'shotnum'
-        sn_config = _map.configs["shotnum"]
-        for ii, path in enumerate(sn_config["dset paths"]):
-            # get dataset
-            dset = hdf_file[path]
-
-            # get field
-            field = (
-                sn_config["dset field"][0]
-                if len(sn_config["dset field"]) == 1
-                else sn_config["dset field"][ii]
-            )
-
+        for ii, (dset, field) in enumerate(zip(sn_dsets, sn_keys)):
             # fill array
             if ii == 0:
-                data["shotnum"] = dset[:, field]
+                data["shotnum"] = _read_rows(dset, index, field)
             else:
                 # ensure every data set has matching shot numbers
-                if not np.array_equal(data["shotnum"], dset[field]):
+                if not np.array_equal(data["shotnum"], _read_rows(dset, index, field)):
                     raise ValueError(
                         "Datasets do NOT have the same shot number "
                         "values, do NOT know how to handle"
@@ -230,14 +295,14 @@ class HDFReadMSI(np.ndarray):
         # TODO: ADD ABILITY TO READ FROM A STRUCTURED DATASET
         # - i.e. 'dset field' is not empty
         sig_config = _map.configs["signals"]
-        for field in sig_config:
+        for field in signal_fields:
             if len(sig_config[field]["dset paths"]) == 1:
                 # get dataset
                 path = sig_config[field]["dset paths"][0]
                 dset = hdf_file[path]
 
                 # fill array
-                data[field] = dset
+                data[field] = _read_rows(dset, index)
             else:
                 # there are multiple rows in the dataset
                 # (e.g. interferometer)
@@ -249,39 +314,42 @@ class HDFReadMSI(np.ndarray):
                     dset = hdf_file[path]
 
                     # fill array
-                    data[field][:, ii, ...] = dset
+                    data[field][:, ii, ...] = _read_rows(dset, index)
 
         # fill 'meta'
+        # - the requested columns of each dataset are read in one pass
         # TODO: ADD ABILITY TO READ FROM A REGULAR DATASET
         # - i.e. 'dset field' is empty
         meta_config = _map.configs["meta"]
-        for field in meta_config:
-            # skip 'shape' key
-            if field == "shape":
-                continue
-
+        meta_reads = {}  # type: Dict[str, List[Tuple[str, str, int]]]
+        for field in meta_fields:
             # scan thru all datasets
             for ii, path in enumerate(meta_config[field]["dset paths"]):
-                # get dataset
-                dset = hdf_file[path]
-
                 # get dset_field
                 dset_field = (
                     meta_config[field]["dset field"][0]
                     if len(meta_config[field]["dset field"]) == 1
                     else meta_config[field]["dset field"][ii]
                 )
+                meta_reads.setdefault(path, []).append((field, dset_field, ii))
 
-                # fill array
+        for path, reads in meta_reads.items():
+            # get dataset
+            dset = hdf_file[path]
+            dset_fields = list(dict.fromkeys(dset_field for _, dset_field, _ in reads))
+            rows = _read_rows(dset, index, dset_fields)
+
+            # fill array
+            for field, dset_field, ii in reads:
                 if len(meta_config[field]["dset paths"]) == 1:
-                    data["meta"][field] = dset[dset_field]
+                    data["meta"][field] = rows[dset_field]
                 else:
                     # there are multiple rows in the dataset
                     # (e.g. interferometer)
                     # - indices look like
                     #   [shot number, device number, time series]
                     #
-                    data["meta"][field][:, ii, ...] = dset[dset_field]
+                    data["meta"][field][:, ii, ...] = rows[dset_field]
 
         # ---- Define `obj`                                         ----
         obj = data.view(cls)
@@ -299,6 +367,51 @@ class HDFReadMSI(np.ndarray):
         # ---- Return `obj`                                         ----
         return obj
 
+    @staticmethod
+    def _condition_fields(
+        _map: HDFMapMSITemplate,
+        fields: Optional[Sequence[str]] = None,
+        meta_only: bool = False,
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Condition the ``fields`` and ``meta_only`` arguments into the
+        lists of signal fields and ``'meta'`` sub-fields to be read.
+        """
+        signal_names = list(_map.configs["signals"])
+        meta_names = [name for name in _map.configs["meta"] if name != "shape"]
+
+        if fields is None:
+            fields = meta_names if meta_only else signal_names + meta_names
+        elif isinstance(fields, str):
+            fields = [fields]
+        else:
+            fields = list(dict.fromkeys(fields))
+
+        unknown = [
+            field
+            for field in fields
+            if not isinstance(field, str)
+            or (field not in signal_names and field not in meta_names)
+        ]
+        if unknown:
+            raise ValueError(
+                f"Fields {unknown} are not fields of MSI diagnostic "
+                f"'{_map.device_name}', valid fields are "
+                f"{signal_names + meta_names}."
+            )
+
+        signal_fields = [field for field in signal_names if field in fields]
+        meta_fields = [field for field in meta_names if field in fields]
+        if meta_only and signal_fields:
+            raise ValueError(
+                f"Signal fields {signal_fields} were requested, but "
+                f"`meta_only` is True."
+            )
+        elif not (signal_fields or meta_fields):
+            raise ValueError("Argument `fields` would result in an empty dtype.")
+
+        return signal_fields, meta_fields
+
     def __array_finalize__(self, obj):
         # This should only be True during explicit construction
         # if obj is None:
@@ -321,3 +434,21 @@ class HDFReadMSI(np.ndarray):
     def info(self):
         """A dictionary of meta-info for the MSI diagnostic."""
         return self._info
+
+
+def _read_rows(
+    dset: h5py.Dataset,
+    index: Union[np.ndarray, None],
+    field: Optional[Union[str, Sequence[str]]] = None,
+) -> np.ndarray:
+    """
+    Read the rows ``index`` (all rows if `None`) and fields ``field``
+    of ``dset`` (see `~bapsflib._hdf.utils.helpers.read_dset_rows`).
+    """
+    if index is not None:
+        return read_dset_rows(dset, index, field=field)
+    elif field is None:
+        return dset[...]
+    elif isinstance(field, str):
+        return dset[field]
+    return read_dset_rows(dset, np.arange(dset.shape[0]), field=field)
@@ -0,0 +1,368 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib._hdf.utils.hdfreducedata.HDFReduceData`
+class, a streaming reducer of digitizer data.
+"""
+
+__all__ = ["HDFReduceData"]
+
+import copy
+import numpy as np
+
+from typing import Dict, Iterable, List, Tuple, Union
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+
+
+class HDFReduceData(np.ndarray):
+    """
+    Reduces digitizer data into per-group statistics (e.g. the
+    shot-averaged signal at each probe position) while streaming
+    through the shots.
+
+    The digitizer data is read in blocks of shots via
+    `~bapsflib._hdf.utils.hdfreaddata.HDFReadData.iter_blocks`, so no
+    more than one block of raw traces is held in memory.  The statistics
+    of each block are merged into running accumulators using the
+    pairwise update of Chan et al. (a batched form of Welford's
+    algorithm), which is numerically stable for the mean and variance.
+
+    This class constructs and returns a structured numpy array with one
+    row per unique value of the ``group_by`` field, sorted by that
+    value.  The array contains the fields:
+
+    * the ``group_by`` field (e.g. ``'xyz'``) with the group value
+    * ``'count'`` with the number of shots in the group
+    * one field per requested statistic (e.g. ``'mean'``) with the same
+      shape as the digitizer ``'signal'`` field
+
+    Meta-info of the reduced data is stored in the :attr:`info`
+    attribute.
+    """
+
+    #: statistics supported by the reducer
+    STATS = ("mean", "var", "std", "min", "max")
+
+    def __new__(
+        cls,
+        hdf_file: File,
+        board: int,
+        channel: int,
+        group_by: str = "xyz",
+        stats: Union[str, Iterable[str]] = ("mean", "var"),
+        chunk_shots: int = 1000,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        hdf_file : `~bapsflib._hdf.utils.file.File`
+            HDF5 file object
+
+        board : `int`
+            analog-digital-converter board number
+
+        channel : `int`
+            analog-digital-converter channel number
+
+        group_by : `str`, optional
+            name of the field of the read digitizer data used to group
+            shots, e.g. ``'xyz'`` (DEFAULT) or a control device field
+            like ``'command'``
+
+        stats : Union[str, Iterable[str]], optional
+            statistics to calculate for each group, any of ``'mean'``,
+            ``'var'``, ``'std'``, ``'min'``, and ``'max'``.  The
+            variance is the population variance (i.e. ``ddof=0``).
+            (DEFAULT ``('mean', 'var')``)
+
+        chunk_shots : `int`, optional
+            number of shots read per block (DEFAULT ``1000``)
+
+        kwargs
+            keywords passed to
+            `~bapsflib._hdf.utils.hdfreaddata.HDFReadData.iter_blocks`
+            (e.g. ``add_controls``, ``shotnum``, ``time_window``)
+
+        Examples
+        --------
+
+        >>> # open HDF5 file
+        >>> f = bapsflib.lapd.File('test.hdf5')
+        >>>
+        >>> # average board 1, channel 1 at each probe position
+        >>> rdata = HDFReduceData(
+        ...     f, 1, 1, add_controls=[('6K Compumotor', 3)],
+        ...     stats=('mean', 'std'),
+        ... )
+        >>> rdata.dtype
+        dtype([('xyz', '<f4', (3,)), ('count', '<i8'),
+               ('mean', '<f8', (100,)), ('std', '<f8', (100,))])
+        """
+        # ---- Condition hdf_file                                   ----
+        if not isinstance(hdf_file, File):
+            raise TypeError(
+                f"`hdf_file` is NOT type `{File.__module__}.{File.__qualname__}`"
+            )
+
+        # ---- Condition `stats`                                    ----
+        if isinstance(stats, str):
+            stats = (stats,)
+        stats = tuple(stats)
+        if len(stats) == 0 or not all(isinstance(stat, str) for stat in stats):
+            raise TypeError("Argument `stats` must be a non-empty list of strings.")
+        bad_stats = [stat for stat in stats if stat not in cls.STATS]
+        if bad_stats:
+            raise ValueError(
+                f"Argument `stats` contains unsupported statistics {bad_stats}, "
+                f"supported statistics are {cls.STATS}."
+            )
+        if len(set(stats)) != len(stats):
+            raise ValueError("Argument `stats` contains duplicate entries.")
+
+        # ---- Condition `group_by`                                 ----
+        # field names are only known once the data is read, so the
+        # field itself is verified against the first block
+        if not isinstance(group_by, str):
+            raise TypeError(
+                f"Argument `group_by` must be a field name string, got type "
+                f"{type(group_by)}."
+            )
+
+        if "intersection_set" in kwargs:
+            raise TypeError(
+                "Argument `intersection_set` is not supported, only shots "
+                "recorded by all the devices are reduced."
+            )
+
+        # ---- Stream through digitizer data                        ----
+        accumulator = None  # type: Union[_GroupAccumulator, None]
+        info = None
+        for block in HDFReadData.iter_blocks(
+            hdf_file, board, channel, chunk_shots=chunk_shots, **kwargs
+        ):
+            if accumulator is None:
+                if group_by not in block.dtype.names:
+                    raise ValueError(
+                        f"Argument `group_by` ({group_by}) must be one of the "
+                        f"read data fields {block.dtype.names}."
+                    )
+                accumulator = _GroupAccumulator(
+                    block.dtype[group_by],
+                    block.dtype["signal"].shape,
+                    track_minmax=any(stat in ("min", "max") for stat in stats),
+                )
+                info = copy.deepcopy(block.info)
+
+            accumulator.update(block[group_by], block["signal"])
+
+        if accumulator is None:
+            raise ValueError("There are no shots to reduce.")
+
+        # ---- Build `obj`                                          ----
+        keys, results = accumulator.results()
+        dtype = [
+            (group_by, keys.dtype.base, keys.shape[1:]),
+            ("count", np.int64),
+        ]
+        for stat in stats:
+            dtype.append((stat, np.float64, results["mean"].shape[1:]))
+        data = np.empty(keys.shape[0], dtype=dtype)
+        data[group_by] = keys
+        data["count"] = results["count"]
+        for stat in stats:
+            data[stat] = results[stat]
+
+        obj = data.view(cls)
+        info.update(
+            {
+                "group by": group_by,
+                "stats": stats,
+                "nshots": int(np.sum(results["count"])),
+            }
+        )
+        obj._info = info
+
+        return obj
+
+    def __array_finalize__(self, obj):
+        # This should only be True during explicit construction
+        # if obj is None:
+        if obj is None or obj.__class__ is np.ndarray:
+            return
+
+        # Define info attribute
+        # (for view casting and new from template)
+        self._info = getattr(
+            obj,
+            "_info",
+            {
+                "source file": None,
+                "device dataset path": None,
+                "group by": None,
+                "stats": (),
+                "nshots": 0,
+            },
+        )
+
+    @property
+    def info(self) -> dict:
+        """
+        A dictionary of meta-info for the reduced data.  The dictionary
+        contains the
+        `~bapsflib._hdf.utils.hdfreaddata.HDFReadData.info` items of
+        the read digitizer data, plus the keys:
+
+        .. list-table::
+            :widths: 5 3 11
+
+            * - ``"group by"``
+              - `str`
+              - name of the field used to group shots
+            * - ``"stats"``
+              - Tuple[str, ...]
+              - names of the calculated statistics
+            * - ``"nshots"``
+              - `int`
+              - total number of reduced shots
+        """
+        return self._info
+
+
+class _GroupAccumulator:
+    """
+    Accumulates the running count, mean, sum of squared deviations
+    (``M2``), minimum, and maximum of values grouped by a key.
+    """
+
+    def __init__(
+        self, key_dtype: np.dtype, value_shape: Tuple[int, ...], track_minmax=True
+    ):
+        self._key_dtype = np.dtype(key_dtype).base
+        self._value_shape = tuple(value_shape)
+        self._track_minmax = track_minmax
+
+        self._group_ids = {}  # type: Dict[bytes, int]
+        self._keys = []  # type: List[np.ndarray]
+        self._ngroups = 0
+
+        capacity = 16
+        self._count = np.zeros(capacity, dtype=np.int64)
+        self._mean = np.zeros((capacity,) + self._value_shape, dtype=np.float64)
+        self._m2 = np.zeros_like(self._mean)
+        if self._track_minmax:
+            self._min = np.full_like(self._mean, np.inf)
+            self._max = np.full_like(self._mean, -np.inf)
+
+    def _grow(self, ngroups: int):
+        """Grow the accumulator arrays to hold at least ``ngroups``."""
+        capacity = self._count.shape[0]
+        if ngroups <= capacity:
+            return
+
+        while capacity < ngroups:
+            capacity *= 2
+        extra = capacity - self._count.shape[0]
+
+        self._count = np.concatenate((self._count, np.zeros(extra, dtype=np.int64)))
+        pad = np.zeros((extra,) + self._value_shape, dtype=np.float64)
+        self._mean = np.concatenate((self._mean, pad))
+        self._m2 = np.concatenate((self._m2, pad))
+        if self._track_minmax:
+            self._min = np.concatenate((self._min, pad + np.inf))
+            self._max = np.concatenate((self._max, pad - np.inf))
+
+    def update(self, keys: np.ndarray, values: np.ndarray):
+        """
+        Merge the statistics of ``values`` (grouped by ``keys``) into the
+        accumulators.
+        """
+        if keys.shape[0] == 0:
+            return
+
+        # normalize keys so equal values have equal bytes (-0.0 == 0.0)
+        keys = np.ascontiguousarray(keys, dtype=self._key_dtype)
+        if np.issubdtype(self._key_dtype.base, np.floating):
+            keys = keys + 0.0
+        keys_2d = keys.reshape(keys.shape[0], -1)
+
+        # group the block
+        ukeys, first, inverse = np.unique(
+            keys_2d, axis=0, return_index=True, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind="stable")
+        counts = np.bincount(inverse, minlength=ukeys.shape[0])
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        # block statistics
+        sorted_values = np.asarray(values[order], dtype=np.float64)
+        block_mean = np.add.reduceat(sorted_values, starts, axis=0)
+        block_mean /= counts.reshape((-1,) + (1,) * len(self._value_shape))
+        deviations = sorted_values - block_mean[inverse[order]]
+        block_m2 = np.add.reduceat(deviations * deviations, starts, axis=0)
+
+        # map block groups to accumulator groups
+        gids = np.empty(ukeys.shape[0], dtype=np.intp)
+        for ii, ukey in enumerate(ukeys):
+            key_bytes = ukey.tobytes()
+            gid = self._group_ids.get(key_bytes, None)
+            if gid is None:
+                gid = self._ngroups
+                self._group_ids[key_bytes] = gid
+                self._keys.append(keys[first[ii]].copy())
+                self._ngroups += 1
+            gids[ii] = gid
+        self._grow(self._ngroups)
+
+        # merge (Chan et al. pairwise update)
+        n_a = self._count[gids]
+        n_ab = n_a + counts
+        expand = (-1,) + (1,) * len(self._value_shape)
+        delta = block_mean - self._mean[gids]
+        self._mean[gids] += delta * (counts / n_ab).reshape(expand)
+        self._m2[gids] += block_m2 + delta * delta * (n_a * counts / n_ab).reshape(expand)
+        self._count[gids] = n_ab
+
+        if self._track_minmax:
+            self._min[gids] = np.minimum(
+                self._min[gids], np.minimum.reduceat(sorted_values, starts, axis=0)
+            )
+            self._max[gids] = np.maximum(
+                self._max[gids], np.maximum.reduceat(sorted_values, starts, axis=0)
+            )
+
+    def results(self) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Return the group keys (sorted) and a dictionary of the
+        accumulated statistics for each group.
+        """
+        ngroups = self._ngroups
+        keys = np.array(self._keys, dtype=self._key_dtype)
+        order = np.lexsort(keys.reshape(ngroups, -1).T[::-1])
+
+        count = self._count[:ngroups][order]
+        var = self._m2[:ngroups][order] / count.reshape(
+            (-1,) + (1,) * len(self._value_shape)
+        )
+        results = {
+            "count": count,
+            "mean": self._mean[:ngroups][order],
+            "var": var,
+            "std": np.sqrt(var),
+        }
+        if self._track_minmax:
+            results["min"] = self._min[:ngroups][order]
+            results["max"] = self._max[:ngroups][order]
+
+        return keys[order], results
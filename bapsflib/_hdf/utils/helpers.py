@@ -19,18 +19,26 @@ __all__ = [
     "condition_shotnum",
     "do_shotnum_intersection",
     "IndexDict",
+    "read_dset_rows",
 ]
 
 import h5py
 import numpy as np
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.shotnum_cache import ShotnumIndex, ShotnumIndexCache
+from bapsflib.utils import profiling
 
 # define type aliases
 IndexDict = Dict[str, Dict[str, np.ndarray]]
 
+#: Minimum average length of consecutive index runs for
+#: `read_dset_rows` to read the runs as contiguous hyperslabs instead
+#: of a single fancy (point) selection.
+HYPERSLAB_MIN_RUN_LENGTH = 8
+
 
 def build_shotnum_dset_relation(
     shotnum: np.ndarray,
@@ -39,6 +47,7 @@ def build_shotnum_dset_relation(
     n_configs: int,
     config_column_value: Any,
     config_column: Optional[str] = None,
+    index_cache: Optional[ShotnumIndexCache] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compares the ``shotnum`` `numpy` array to the specified dataset,
@@ -78,6 +87,15 @@ def build_shotnum_dset_relation(
         If omitted, then ``dset`` columns are searched for a name
         containing 'configuration'.  (DEFAULT: `None`)
 
+    index_cache : Optional[`~bapsflib._hdf.utils.shotnum_cache.ShotnumIndexCache`]
+        Cache of the shot number indices, keyed by the dataset path and
+        the configuration.  If the index of ``dset`` is cached, then no
+        columns of ``dset`` are read.  If the index was evicted, but
+        the dataset was recorded as sorted, then the requested shot
+        numbers are located with a binary search of the shot number
+        column, which only reads :math:`O(k \\log n)` elements for
+        :math:`k` requested shot numbers.  (DEFAULT: `None`)
+
     Returns
     -------
     index : `numpy.ndarray`
@@ -131,6 +149,25 @@ def build_shotnum_dset_relation(
             f"HDF5 dataset '{dset.name}'.  Present columns are {dset.dtype.names}."
         )
 
+    shotnum = np.asarray(shotnum)
+    if shotnumkey is None and config_column is None:
+        # Header dataset does not contain shot number information, assuming
+        # shot number is index + 1.
+        sni = shotnum <= dset.shape[0]
+        index = shotnum[sni].astype(np.intp) - 1
+        return index.view(), sni.view()
+
+    cache_key = (dset.name, shotnumkey, config_column, config_column_value)
+    if index_cache is not None:
+        entry = index_cache.get(cache_key)
+        if entry is not None:
+            # cached index, no column reads needed
+            return _shotnum_index_relation(shotnum, entry)
+        elif index_cache.is_searchable(cache_key):
+            # Fast path: the shot number column is known to be sorted
+            # and all its (non-zero) entries belong to the configuration.
+            return _sorted_shotnum_dset_relation(shotnum, dset, shotnumkey)
+
     if shotnumkey is None:
         # Header dataset does not contain shot number information, assuming
         # shot number is index + 1.
@@ -179,20 +216,54 @@ def build_shotnum_dset_relation(
         )
 
     dset_shotnum_subset = dset_shotnum[config_mask]
-
-    intersection, sni_index, dset_subset_index = np.intersect1d(
-        shotnum, dset_shotnum_subset, assume_unique=True, return_indices=True
+    subset_sorted = bool(np.all(dset_shotnum_subset[1:] > dset_shotnum_subset[:-1]))
+
+    # the binary search fast path can be used if the column is sorted,
+    # zero shot numbers only front fill the column, and all other rows
+    # belong to the configuration
+    nonzero_start = int(np.argmax(nonzero_mask))
+    entry = ShotnumIndex(
+        shotnum=dset_shotnum_subset,
+        config_mask=config_mask,
+        is_sorted=subset_sorted,
+        searchable=(
+            subset_sorted
+            and bool(np.all(nonzero_mask[nonzero_start:]))
+            and np.array_equal(config_mask, nonzero_mask)
+        ),
     )
+    if index_cache is not None:
+        index_cache.put(cache_key, entry)
+
+    return _shotnum_index_relation(shotnum, entry)
+
+
+def _shotnum_index_relation(
+    shotnum: np.ndarray, entry: ShotnumIndex
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `build_shotnum_dset_relation` for the shot number index ``entry``
+    of a dataset configuration.
+    """
+    dset_shotnum_subset = entry.shotnum
+    rows = np.flatnonzero(entry.config_mask)
+    if entry.is_sorted:
+        # locate shot numbers with a binary search
+        positions = np.searchsorted(dset_shotnum_subset, shotnum)
+        sni = positions < dset_shotnum_subset.size
+        sni[sni] = dset_shotnum_subset[positions[sni]] == shotnum[sni]
+        index = rows[positions[sni]]
+    else:
+        intersection, sni_index, dset_subset_index = np.intersect1d(
+            shotnum, dset_shotnum_subset, assume_unique=True, return_indices=True
+        )
 
-    # construct sni
-    sni = np.zeros_like(shotnum, dtype=bool)
-    sni[sni_index] = True
+        # construct sni
+        sni = np.zeros_like(shotnum, dtype=bool)
+        sni[sni_index] = True
 
-    # construct index
-    mask = np.zeros_like(dset_shotnum_subset, dtype=bool)
-    mask[dset_subset_index] = True
-    config_mask[config_mask] = mask
-    index = np.where(config_mask)[0]
+        # construct index
+        index = rows[np.sort(dset_subset_index)]
 
     if np.count_nonzero(sni) != index.size:  # coverage: ignore
         raise ValueError(
@@ -204,6 +275,48 @@ def build_shotnum_dset_relation(
     return index.view(), sni.view()
 
 
+def _sorted_shotnum_dset_relation(
+    shotnum: np.ndarray, dset: h5py.Dataset, shotnumkey: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `build_shotnum_dset_relation` for a dataset whose shot number column
+    is sorted (allowing a zero front fill).  The requested shot numbers
+    are located with a vectorized binary search that reads only the
+    probed elements of the column, unless reading the whole column is
+    cheaper.
+    """
+    nrows = dset.shape[0]
+    nprobes = shotnum.size * (int(np.log2(max(nrows, 1))) + 2)
+    if nprobes >= nrows:
+        # reading the whole column is cheaper than probing it
+        dset_shotnum = dset[shotnumkey]
+        positions = np.searchsorted(dset_shotnum, shotnum)
+        sni = positions < nrows
+        sni[sni] = dset_shotnum[positions[sni]] == shotnum[sni]
+        return positions[sni].view(), sni.view()
+
+    # binary search, all shot numbers at once
+    lo = np.zeros(shotnum.size, dtype=np.intp)
+    hi = np.full(shotnum.size, nrows, dtype=np.intp)
+    active = lo < hi
+    while np.any(active):
+        mid = (lo[active] + hi[active]) // 2
+        probe_index, inverse = np.unique(mid, return_inverse=True)
+        values = read_dset_rows(dset, probe_index, field=shotnumkey)[inverse]
+        go_right = values < shotnum[active]
+        lo[active] = np.where(go_right, mid + 1, lo[active])
+        hi[active] = np.where(go_right, hi[active], mid)
+        active = lo < hi
+
+    # lo is the first row with a shot number >= the requested shot number
+    sni = lo < nrows
+    found_index, inverse = np.unique(lo[sni], return_inverse=True)
+    values = read_dset_rows(dset, found_index, field=shotnumkey)[inverse]
+    sni[sni] = values == shotnum[sni]
+
+    return lo[sni].view(), sni.view()
+
+
 def condition_controls(hdf_file: File, controls: Any) -> List[Tuple[str, Any]]:
     """
     Conditions the ``controls`` argument for
@@ -520,3 +633,146 @@ def do_shotnum_intersection(
 
     # return
     return shotnum, sni_dict, index_dict
+
+
+def read_dset_rows(
+    dset: h5py.Dataset,
+    index: np.ndarray,
+    field: Optional[Union[str, Sequence[str]]] = None,
+    out: Optional[np.ndarray] = None,
+    columns: Optional[slice] = None,
+) -> np.ndarray:
+    """
+    Read the rows ``index`` of dataset ``dset``, coalescing runs of
+    consecutive indices into contiguous hyperslab reads.
+
+    HDF5 point (fancy) selections are considerably slower than
+    contiguous hyperslab selections, so the strictly increasing
+    ``index`` array is broken into runs of consecutive values and each
+    run is read as a single slice.  If the runs are too short to
+    benefit (see `HYPERSLAB_MIN_RUN_LENGTH`), then the read falls back
+    to a single fancy selection.  The number of bytes read is reported
+    with `~bapsflib.utils.profiling.record_bytes`.
+
+    Parameters
+    ----------
+    dset : `h5py.Dataset`
+        Dataset to read from.
+
+    index : :term:`array_like`
+        1D array of strictly increasing, non-negative row indices of
+        ``dset``.
+
+    field : Union[str, Sequence[str]], optional
+        If ``dset`` has a structured `numpy.dtype`, then only read the
+        field named ``field``.  If a sequence of field names is given,
+        then those fields are read together in a single pass and
+        returned as a structured array with the fields in the given
+        order.
+
+    out : `numpy.ndarray`, optional
+        Array to read the rows into.  Its first dimension must equal
+        the size of ``index`` and the remaining dimensions must match
+        the (selected) rows of ``dset``.  If a C-contiguous array is
+        given and no ``field`` is specified, then the data is read
+        directly into ``out`` without intermediate copies.
+
+    columns : `slice`, optional
+        Slice of the second dimension of ``dset`` to read.  If `None`
+        (DEFAULT), then the full rows are read.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The read rows, which is ``out`` if it was given.
+
+    Examples
+    --------
+    >>> index = np.array([0, 1, 2, 3, 10, 11, 12])
+    >>> data = read_dset_rows(dset, index)
+    >>> np.array_equal(data, dset[index.tolist(), ...])
+    True
+    """
+    data = _read_dset_rows(dset, index, field=field, out=out, columns=columns)
+    if profiling.is_active():
+        # bytes of the stored (not the converted `out`) dtype
+        if field is None:
+            nbytes = data.size * dset.dtype.itemsize
+        else:
+            names = (field,) if isinstance(field, str) else field
+            nbytes = data.shape[0] * sum(dset.dtype[name].itemsize for name in names)
+        profiling.record_bytes(dset.name, nbytes)
+    return data
+
+
+def _read_dset_rows(
+    dset: h5py.Dataset,
+    index: np.ndarray,
+    field: Optional[Union[str, Sequence[str]]] = None,
+    out: Optional[np.ndarray] = None,
+    columns: Optional[slice] = None,
+) -> np.ndarray:
+    """The uninstrumented `read_dset_rows`."""
+    index = np.asarray(index)
+    if index.ndim != 1:
+        raise ValueError("Argument `index` must be a 1D array.")
+
+    # determine runs of consecutive indices
+    #   run ii covers index[starts[ii]:stops[ii]]
+    steps = np.diff(index)
+    if np.any(steps <= 0):
+        raise ValueError("Argument `index` must be strictly increasing.")
+    breaks = np.flatnonzero(steps != 1) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [index.size]))
+
+    # selections trailing the row selection
+    trailing_sel = () if columns is None else (columns,)
+    if isinstance(field, str):
+        trailing_sel += (field,)
+    elif field is not None:
+        field = tuple(field)
+        if len(field) == 1:
+            # h5py returns a plain (non-structured) array when only
+            # one field is selected
+            if out is None:
+                out = np.empty(index.shape, dtype=[(field[0], dset.dtype[field[0]])])
+            _read_dset_rows(dset, index, field=field[0], out=out[field[0]])
+            return out
+
+        trailing_sel += field
+
+    if 0 < index.size < HYPERSLAB_MIN_RUN_LENGTH * starts.size:
+        # indices are too scattered, use a fancy selection
+        data = dset[(index.tolist(),) + trailing_sel]
+        if out is None:
+            return data
+
+        out[...] = data
+        return out
+
+    if out is None:
+        row_shape = dset.shape[1:]
+        if columns is not None:
+            ncols = len(range(*columns.indices(dset.shape[1])))
+            row_shape = (ncols,) + row_shape[1:]
+        if field is None:
+            dtype = dset.dtype
+        elif isinstance(field, str):
+            dtype = dset.dtype[field]
+        else:
+            dtype = np.dtype([(name, dset.dtype[name]) for name in field])
+        out = np.empty((index.size,) + row_shape, dtype=dtype)
+
+    if index.size == 0:
+        return out
+
+    direct = field is None and out.flags.c_contiguous
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        source_sel = (np.s_[int(index[start]) : int(index[stop - 1]) + 1],) + trailing_sel
+        if direct:
+            dset.read_direct(out, source_sel=source_sel, dest_sel=np.s_[start:stop])
+        else:
+            out[start:stop] = dset[source_sel]
+
+    return out
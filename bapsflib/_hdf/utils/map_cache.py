@@ -0,0 +1,305 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module for the persistent on-disk cache of the HDF5 file mappings (and
+file info) built by `~bapsflib._hdf.utils.file.File`.
+
+A cache entry is keyed by the absolute path, size, and modification
+time of the HDF5 file, the internal device paths, and the `bapsflib`
+version.  If any of these change, then the entry is ignored and the
+file is re-mapped.  Cache entries are written to the user cache
+directory (e.g. ``~/.cache/bapsflib/maps``), never next to the HDF5
+file.  Setting the environment variable ``BAPSFLIB_MAP_CACHE_DIR``
+forces all cache entries into that directory.
+
+A cache entry is a JSON header line holding the key, followed by the
+JSON encoded mapping state.  The state is only decoded once the header
+matches the HDF5 file, and decoding never executes code: only plain
+data (numbers, strings, containers, `numpy` arrays and scalars,
+`~astropy.units.Quantity`, compiled regular expressions) and
+`bapsflib` mapping classes are restored.
+"""
+
+__all__ = [
+    "MAP_CACHE_DIR_ENV",
+    "invalidate_map_cache",
+    "load_map_cache",
+    "map_cache_path",
+    "save_map_cache",
+]
+
+import astropy.units as u
+import base64
+import hashlib
+import importlib
+import json
+import numpy as np
+import os
+import re
+import tempfile
+
+from typing import Any, Dict, Union
+
+import bapsflib
+
+from bapsflib._hdf.maps.templates import _HDFObjectPath, HDFMapTemplate
+
+#: environment variable to force the directory of the mapping cache
+MAP_CACHE_DIR_ENV = "BAPSFLIB_MAP_CACHE_DIR"
+
+#: version of the cache entry layout, bump when the layout changes
+_MAP_CACHE_FORMAT = 2
+
+_MAP_CACHE_SUFFIX = ".bapsfmap"
+
+#: builtin types that may be restored from a cache entry
+_BUILTIN_TYPES = {t.__name__: t for t in (bool, bytes, complex, float, int, str)}
+
+
+def _user_cache_dir() -> str:
+    """Directory of the mapping cache inside the user cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME", "") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "bapsflib", "maps")
+
+
+def map_cache_path(filename: str) -> str:
+    """
+    Path of the mapping cache entry for HDF5 file ``filename``.
+
+    Parameters
+    ----------
+    filename : `str`
+        name (and path) of the HDF5 file
+    """
+    path = os.path.abspath(filename)
+    hashed_name = hashlib.sha256(path.encode("utf-8")).hexdigest() + _MAP_CACHE_SUFFIX
+    cache_dir = os.environ.get(MAP_CACHE_DIR_ENV, "") or _user_cache_dir()
+    return os.path.join(cache_dir, hashed_name)
+
+
+def _cache_key(filename: str, device_paths: Dict[str, str]) -> Dict[str, Any]:
+    """Dictionary identifying the HDF5 file and how it was mapped."""
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    return {
+        "path": path,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "device paths": dict(device_paths),
+        "bapsflib version": bapsflib.__version__,
+        "format": _MAP_CACHE_FORMAT,
+    }
+
+
+# ---- State encoding                                               ----
+# Every JSON object of an encoded state is a ``{"t": tag, "v": value}``
+# pair, so plain dictionaries can never be mistaken for tagged values.
+
+
+def _encode(obj) -> Any:
+    """Encode the mapping state ``obj`` into JSON compatible values."""
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+    elif type(obj) is _HDFObjectPath:
+        return {"t": "hdf path", "v": str(obj)}
+    elif type(obj) is list:
+        return [_encode(item) for item in obj]
+    elif type(obj) is tuple:
+        return {"t": "tuple", "v": [_encode(item) for item in obj]}
+    elif type(obj) is dict:
+        return {"t": "dict", "v": [[_encode(k), _encode(v)] for k, v in obj.items()]}
+    elif type(obj) is bytes:
+        return {"t": "bytes", "v": base64.b64encode(obj).decode("ascii")}
+    elif type(obj) is complex:
+        return {"t": "complex", "v": [obj.real, obj.imag]}
+    elif isinstance(obj, u.Quantity):
+        return {"t": "quantity", "v": [_encode(obj.value), obj.unit.to_string()]}
+    elif type(obj) is np.ndarray or isinstance(obj, np.generic):
+        if obj.dtype.hasobject:
+            raise TypeError(f"Can not cache object arrays, got dtype {obj.dtype}.")
+        tag = "ndarray" if isinstance(obj, np.ndarray) else "numpy scalar"
+        return {"t": tag, "v": [_encode_dtype(obj.dtype), _encode(obj.tolist())]}
+    elif isinstance(obj, np.dtype):
+        return {"t": "dtype", "v": _encode_dtype(obj)}
+    elif isinstance(obj, re.Pattern):
+        return {"t": "pattern", "v": [_encode(obj.pattern), obj.flags]}
+    elif isinstance(obj, type):
+        _type_from_name(obj.__module__, obj.__qualname__)  # must be restorable
+        return {"t": "type", "v": [obj.__module__, obj.__qualname__]}
+
+    raise TypeError(f"Can not cache objects of type {type(obj)}.")
+
+
+def _encode_dtype(dtype: np.dtype) -> Any:
+    return _encode(np.lib.format.dtype_to_descr(dtype))
+
+
+def _decode(obj) -> Any:
+    """Inverse of `_encode`."""
+    if isinstance(obj, list):
+        return [_decode(item) for item in obj]
+    elif not isinstance(obj, dict):
+        return obj
+
+    tag, val = obj["t"], obj["v"]
+    if tag == "hdf path":
+        return _HDFObjectPath(val)
+    elif tag == "tuple":
+        return tuple(_decode(item) for item in val)
+    elif tag == "dict":
+        return {_decode(k): _decode(v) for k, v in val}
+    elif tag == "bytes":
+        return base64.b64decode(val)
+    elif tag == "complex":
+        return complex(*val)
+    elif tag == "quantity":
+        return u.Quantity(_decode(val[0]), u.Unit(val[1]))
+    elif tag in ("ndarray", "numpy scalar"):
+        arr = np.array(_decode(val[1]), dtype=_decode_dtype(val[0]))
+        return arr if tag == "ndarray" else arr[()]
+    elif tag == "dtype":
+        return _decode_dtype(val)
+    elif tag == "pattern":
+        return re.compile(_decode(val[0]), val[1])
+    elif tag == "type":
+        return _type_from_name(*val)
+
+    raise ValueError(f"Unknown cache entry tag '{tag}'.")
+
+
+def _decode_dtype(descr) -> np.dtype:
+    descr = _decode(descr)
+    if isinstance(descr, list):
+        # structured dtype, fields are (name, descr[, shape]) tuples
+        descr = [tuple(field) for field in descr]
+    return np.lib.format.descr_to_dtype(descr)
+
+
+def _type_from_name(module: str, qualname: str) -> type:
+    """
+    Look up the type ``qualname`` of ``module``.  Only builtin scalar
+    types, `numpy` scalar types, and `bapsflib` mapping classes are
+    allowed.
+    """
+    if module == "builtins" and qualname in _BUILTIN_TYPES:
+        return _BUILTIN_TYPES[qualname]
+    elif module == "numpy" or module.startswith("numpy."):
+        obj = getattr(np, qualname, None)
+        if isinstance(obj, type) and issubclass(obj, np.generic):
+            return obj
+    elif module.startswith("bapsflib.") and "<" not in qualname:
+        obj = importlib.import_module(module)
+        for name in qualname.split("."):
+            obj = getattr(obj, name, None)
+        if isinstance(obj, type) and issubclass(obj, HDFMapTemplate):
+            return obj
+
+    raise ValueError(f"Type '{module}.{qualname}' can not be restored from the cache.")
+
+
+# ---- Cache entries                                                ----
+
+
+def load_map_cache(
+    filename: str, device_paths: Dict[str, str]
+) -> Union[Dict[str, Any], None]:
+    """
+    Load the cached mapping state for HDF5 file ``filename``.  Returns
+    `None` if there is no valid cache entry.
+
+    Parameters
+    ----------
+    filename : `str`
+        name (and path) of the HDF5 file
+
+    device_paths : Dict[str, str]
+        internal HDF5 paths of the ``'control'``, ``'digitizer'``, and
+        ``'msi'`` device groups
+    """
+    try:
+        key = json.loads(json.dumps(_cache_key(filename, device_paths)))
+    except OSError:
+        return None
+
+    try:
+        with open(map_cache_path(filename), "r", encoding="utf-8") as cache_file:
+            # only decode the state of an entry for this file
+            if json.loads(cache_file.readline()) != key:
+                return None
+            return _decode(json.loads(cache_file.read()))
+    except Exception:
+        # missing, unreadable, or incompatible cache entry
+        return None
+
+
+def save_map_cache(
+    filename: str, device_paths: Dict[str, str], state: Dict[str, Any]
+) -> bool:
+    """
+    Save the mapping ``state`` of HDF5 file ``filename`` to
+    :func:`map_cache_path`.  Returns `True` if the cache entry was
+    written.
+
+    Parameters
+    ----------
+    filename : `str`
+        name (and path) of the HDF5 file
+
+    device_paths : Dict[str, str]
+        internal HDF5 paths of the ``'control'``, ``'digitizer'``, and
+        ``'msi'`` device groups
+
+    state : Dict[str, Any]
+        mapping state, only the types listed in the module description
+        can be cached
+    """
+    try:
+        header = json.dumps(_cache_key(filename, device_paths))
+        data = f"{header}\n{json.dumps(_encode(state))}"
+    except Exception:
+        return False
+
+    path = map_cache_path(filename)
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+
+        # write to a temporary file and move it into place, so
+        # concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=_MAP_CACHE_SUFFIX
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            cache_file.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+    return True
+
+
+def invalidate_map_cache(filename: str):
+    """
+    Remove the cache entry for HDF5 file ``filename``.
+
+    Parameters
+    ----------
+    filename : `str`
+        name (and path) of the HDF5 file
+    """
+    try:
+        os.remove(map_cache_path(filename))
+    except FileNotFoundError:
+        pass
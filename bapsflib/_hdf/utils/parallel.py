@@ -0,0 +1,417 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing `~bapsflib._hdf.utils.parallel.read_data_parallel`,
+a process pool engine for reading many digitizer connections.
+
+The parent process resolves the digitizer mapping, the shot number
+relation, and the control device data once (exactly like
+`~bapsflib._hdf.utils.hdfreaddata.HDFReadData.read_many`).  The
+``'signal'`` read is then split into ``(board, channel, shot-range)``
+tasks that are fanned out to a pool of worker processes.  Each worker
+opens its own read-only handle to the HDF5 file and receives a
+pre-resolved read plan (dataset path and dataset rows), so no device
+mapping is re-discovered in the workers.  Workers write the signal
+directly into `multiprocessing.shared_memory` blocks allocated by the
+parent, which are returned as the ``'signal'`` arrays of the read
+data.
+"""
+
+__all__ = ["read_data_parallel"]
+
+import concurrent.futures
+import h5py
+import multiprocessing
+import numpy as np
+import os
+
+from multiprocessing import shared_memory
+from typing import List, NamedTuple, Tuple, Union
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData, HDFReadDataColumns
+from bapsflib._hdf.utils.helpers import read_dset_rows
+
+#: keywords used by workers to open the HDF5 file
+#: - the parent process already holds the file open (possibly
+#:   writable), so the workers' read-only handles must not take the
+#:   HDF5 file lock
+_OPEN_KWARGS = {"locking": False} if h5py.version.version_tuple >= (3, 5) else {}
+
+#: read-only HDF5 file handle of a worker process
+_worker_file = None  # type: Union[h5py.File, None]
+
+
+class _ReadTask(NamedTuple):
+    """Read plan of one ``(board, channel, shot-range)`` task."""
+
+    #: HDF5 path of the digitizer dataset
+    dset_path: str
+
+    #: dataset rows to be read
+    rows: np.ndarray
+
+    #: rows of the ``'signal'`` array the dataset rows are written to,
+    #: a ``(start, stop)`` tuple for a contiguous block
+    dest: Union[Tuple[int, int], np.ndarray]
+
+    #: name of the shared memory block of the ``'signal'`` array
+    shm_name: str
+
+    #: shape of the ``'signal'`` array
+    shape: Tuple[int, ...]
+
+    #: dtype of the ``'signal'`` array
+    dtype: str
+
+    #: slice of the time samples to be read
+    time_index: slice
+
+    #: ``(dv, offset)`` of the bits to voltage conversion, `None` to
+    #: leave the signal as read
+    scale: Union[Tuple[float, float], None]
+
+
+class _SharedArray(np.ndarray):
+    """
+    Root array of a `~multiprocessing.shared_memory.SharedMemory`
+    block.  The array references the block, so the block stays mapped
+    as long as the array, or any view of it, exists.  (NumPy does not
+    collapse the base of a view past an array of a different type, so
+    every view of this array references it.)
+    """
+
+
+def _shared_signal(shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """
+    Allocate a `~multiprocessing.shared_memory.SharedMemory` block and
+    return it as a `numpy.ndarray` whose base (a `_SharedArray`) holds
+    the block.  The block is unmapped once the array is garbage
+    collected.
+    """
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+    )
+    root = _SharedArray(shape, dtype=dtype, buffer=shm.buf)
+    root._shared_memory = shm
+    return root.view(np.ndarray)
+
+
+def _init_worker(filename: str):
+    """Open the read-only HDF5 file handle of a worker process."""
+    global _worker_file
+    _worker_file = h5py.File(filename, mode="r", **_OPEN_KWARGS)
+
+
+def _fill_task(hdf_file: h5py.File, task: _ReadTask):
+    """
+    Read the dataset rows of ``task`` from ``hdf_file`` into the shared
+    ``'signal'`` array, converting to voltage in place if requested.
+    """
+    shm = shared_memory.SharedMemory(name=task.shm_name)
+    try:
+        signal = np.ndarray(task.shape, dtype=task.dtype, buffer=shm.buf)
+        dset = hdf_file[task.dset_path]
+        if isinstance(task.dest, tuple):
+            block = signal[task.dest[0] : task.dest[1]]
+            read_dset_rows(dset, task.rows, out=block, columns=task.time_index)
+        else:
+            block = read_dset_rows(dset, task.rows, columns=task.time_index)
+            block = block.astype(signal.dtype, copy=False)
+
+        if task.scale is not None:
+            dv, offset = task.scale
+            np.multiply(block, dv, out=block)
+            np.subtract(block, offset, out=block)
+
+        if not isinstance(task.dest, tuple):
+            signal[task.dest] = block
+
+        del signal, block
+    finally:
+        shm.close()
+
+
+def _run_task(task: _ReadTask):
+    """Execute ``task`` in a worker process."""
+    _fill_task(_worker_file, task)
+
+
+def read_data_parallel(
+    hdf_file: File,
+    connections: List[Tuple[int, int]],
+    max_workers: Union[int, None] = None,
+    chunk_shots: Union[int, None] = None,
+    mp_context=None,
+    index=slice(None),
+    shotnum=slice(None),
+    digitizer=None,
+    config_name=None,
+    adc=None,
+    keep_bits=False,
+    add_controls=None,
+    add_msi=None,
+    where=None,
+    intersection_set=True,
+    time_index=None,
+    time_window=None,
+) -> List[HDFReadDataColumns]:
+    """
+    Read several digitizer board/channel connections with a pool of
+    worker processes.
+
+    The arguments and returned data mirror
+    `~bapsflib._hdf.utils.hdfreaddata.HDFReadData.read_many` with
+    ``layout='columnar'``, except the ``'signal'`` array of each
+    returned container lives in a `multiprocessing.shared_memory`
+    block that was filled by the worker processes.
+
+    Parameters
+    ----------
+    hdf_file : `~bapsflib._hdf.utils.file.File`
+        HDF5 file object
+
+    connections : List[Tuple[int, int]]
+        list of ``(board, channel)`` pairs to be read
+
+    max_workers : `int`, optional
+        maximum number of worker processes.  If `None` (DEFAULT), then
+        `os.cpu_count` workers are used.  If ``1``, then the tasks
+        are read in the calling process.
+
+    chunk_shots : `int`, optional
+        maximum number of shots per ``(board, channel, shot-range)``
+        task.  If `None` (DEFAULT), then the shots of each connection
+        are split evenly across the workers.  Task boundaries are
+        aligned to the HDF5 chunk layout of the digitizer datasets
+        (see `~bapsflib._hdf.utils.hdfreaddata.HDFReadData.iter_blocks`).
+
+    mp_context : `multiprocessing.context.BaseContext`, optional
+        multiprocessing context of the process pool.  If `None`
+        (DEFAULT), then the ``'spawn'`` context is used since HDF5
+        library state is not safe to inherit across :func:`os.fork`.
+
+    index : Union[int, List[int], slice, numpy.ndarray], optional
+        dataset row indices to be sliced.  Overridden by argument
+        ``shotnum``. (DEFAULT ``slice(None)``)
+
+    shotnum : Union[int, List[int], slice, numpy.ndarray], optional
+        HDF5 file shot number(s) indicating data entries to be
+        extracted.  Overrides argument ``index``.  (DEFAULT
+        ``slice(None)``)
+
+    digitizer : `str`, optional
+        name of the digitizer
+
+    config_name : `str`, optional
+        name of the digitizer configuration
+
+    adc : `str`, optional
+        name of the analog-digital-converter
+
+    keep_bits : `bool`, optional
+        set `True` to keep data in bits, `False` (DEFAULT) to convert
+        data to voltage
+
+    add_controls : Union[str, Iterable[str, Tuple[str, Any]]], optional
+        a list indicating the desired control device names and their
+        configuration name (if more than one configuration exists)
+
+    add_msi : Union[str, Iterable[str, Tuple[str, List[str]]]], optional
+        a list indicating the MSI diagnostics (and their fields) to be
+        merged into every returned container (see
+        `~bapsflib._hdf.utils.hdfreaddata.HDFReadData`)
+
+    where : Union[Callable, Tuple[str, str, Any], List], optional
+        predicate(s) selecting the shots to be read (see
+        `~bapsflib._hdf.utils.hdfreaddata.HDFReadData`)
+
+    intersection_set : `bool`, optional
+        `True` (DEFAULT) will force the returned shot numbers to be the
+        intersection of ``shotnum`` and the shot numbers contained in
+        each control device, MSI diagnostic, and all the digitizer
+        datasets.  `False` will return the union of shot numbers.
+
+    time_index : `slice`, optional
+        slice of time sample indices to be read for every connection
+        (see `~bapsflib._hdf.utils.hdfreaddata.HDFReadData`)
+
+    time_window : Tuple[float | `astropy.units.Quantity`, ...], optional
+        2-element tuple ``(t_start, t_stop)`` of the time bounds to be
+        read for every connection (see
+        `~bapsflib._hdf.utils.hdfreaddata.HDFReadData`)
+
+    Returns
+    -------
+    List[~bapsflib._hdf.utils.hdfreaddata.HDFReadDataColumns]
+        one container per entry in ``connections``, in the same order
+        as ``connections``
+
+    Notes
+    -----
+
+    The shared memory blocks are unlinked as soon as the workers are
+    done, so no named blocks outlive the call.  The memory of a block
+    is released once the returned container, and every array taken
+    from it, is garbage collected.
+
+    Examples
+    --------
+
+    >>> # open HDF5 file
+    >>> f = bapsflib.lapd.File('test.hdf5')
+    >>>
+    >>> # read all channels of board 1 with 4 worker processes
+    >>> data = read_data_parallel(
+    ...     f, [(1, ch) for ch in range(1, 9)], max_workers=4
+    ... )
+    >>> data[0]['signal'].shape
+    (2000, 16384)
+    """
+    # ---- Condition `max_workers` and `chunk_shots`               ----
+    for name, val in (("max_workers", max_workers), ("chunk_shots", chunk_shots)):
+        if val is not None and (
+            not isinstance(val, (int, np.integer)) or isinstance(val, bool) or val < 1
+        ):
+            raise ValueError(f"Argument `{name}` must be a positive integer, got {val}.")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if mp_context is None:
+        mp_context = multiprocessing.get_context("spawn")
+
+    # ---- Resolve mappings, shot relation, and control data       ----
+    (
+        _dmap,
+        dsets_list,
+        time_index_list,
+        shotnum,
+        index_list,
+        sni_list,
+        cdata,
+        mdata,
+    ) = HDFReadData._resolve_many(
+        hdf_file,
+        connections,
+        index=index,
+        shotnum=shotnum,
+        digitizer=digitizer,
+        config_name=config_name,
+        adc=adc,
+        add_controls=add_controls,
+        add_msi=add_msi,
+        where=where,
+        intersection_set=intersection_set,
+        time_index=time_index,
+        time_window=time_window,
+    )
+    nshots = shotnum.size
+    if chunk_shots is None:
+        chunk_shots = max(1, -(-nshots // max_workers))
+    index_start_list = [np.concatenate(([0], np.cumsum(sni))) for sni in sni_list]
+
+    # ---- Allocate shared signal blocks and build objects         ----
+    blocks = []  # type: List[shared_memory.SharedMemory]
+    tasks = []  # type: List[_ReadTask]
+    data = []  # type: List[HDFReadDataColumns]
+    try:
+        for dsets, _index, _sni, _index_start, _time_index in zip(
+            dsets_list, index_list, sni_list, index_start_list, time_index_list
+        ):
+            dtype = HDFReadData._build_dtype(
+                dsets, cdata, keep_bits, _time_index, mdata=mdata
+            )
+            shape = (nshots,) + dtype["signal"].shape
+            columns = {
+                name: np.empty((nshots,) + dtype[name].shape, dtype=dtype[name].base)
+                for name in dtype.names
+            }
+            columns["signal"] = _shared_signal(shape, dtype["signal"].base)
+            shm = columns["signal"].base._shared_memory
+            blocks.append(shm)
+            obj = HDFReadData._build_obj(
+                hdf_file,
+                _dmap,
+                dsets,
+                shotnum=shotnum,
+                index=_index,
+                sni=_sni,
+                cdata=cdata,
+                keep_bits=keep_bits,
+                intersection_set=intersection_set,
+                time_index=_time_index,
+                out=HDFReadDataColumns(columns),
+                fill_signal=False,
+                mdata=mdata,
+            )
+            data.append(obj)
+
+            # fill shots missing from the dataset
+            if not intersection_set:
+                missing = np.logical_not(_sni)
+                if np.issubdtype(obj["signal"].dtype, np.integer):
+                    obj["signal"][missing] = 0
+                else:
+                    obj["signal"][missing] = np.nan
+
+            # scale of the bits to voltage conversion
+            if keep_bits or obj.dv is None:
+                scale = None
+            else:
+                # - same scalars as `HDFReadData._build_obj` so the
+                #   conversion is identical
+                scale = (obj.dv.value, abs(obj.info["voltage offset"].value))
+
+            # define (board, channel, shot-range) tasks
+            bounds = HDFReadData._block_bounds(
+                _index, _sni, chunk_shots, dsets["dset"].chunks
+            )
+            for start, stop in bounds:
+                rows = _index[_index_start[start] : _index_start[stop]]
+                if rows.size == 0:
+                    continue
+                if rows.size == stop - start:
+                    dest = (start, stop)
+                else:
+                    dest = np.flatnonzero(_sni[start:stop]) + start
+                tasks.append(
+                    _ReadTask(
+                        dset_path=dsets["dset"].name,
+                        rows=rows,
+                        dest=dest,
+                        shm_name=shm.name,
+                        shape=shape,
+                        dtype=dtype["signal"].base.str,
+                        time_index=_time_index,
+                        scale=scale,
+                    )
+                )
+
+        # ---- Execute tasks                                       ----
+        if max_workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                _fill_task(hdf_file, task)
+        else:
+            hdf_file.flush()
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_workers, len(tasks)),
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(os.path.abspath(hdf_file.filename),),
+            ) as pool:
+                for _ in pool.map(_run_task, tasks):
+                    pass
+    finally:
+        # the blocks stay mapped in this process, only their names
+        # are removed
+        for shm in blocks:
+            shm.unlink()
+
+    return data
@@ -0,0 +1,155 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the shot number index cache
+`~bapsflib._hdf.utils.shotnum_cache.ShotnumIndexCache` used by
+`~bapsflib._hdf.utils.file.File`.
+"""
+
+__all__ = ["ShotnumIndex", "ShotnumIndexCache"]
+
+import numpy as np
+
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Union
+
+from bapsflib.utils import profiling
+
+
+class ShotnumIndex(NamedTuple):
+    """
+    The shot number index of one dataset configuration, as built by
+    `~bapsflib._hdf.utils.helpers.build_shotnum_dset_relation`.
+    """
+
+    #: shot numbers of the dataset rows belonging to the configuration
+    shotnum: np.ndarray
+
+    #: boolean mask of the dataset rows belonging to the configuration
+    config_mask: np.ndarray
+
+    #: `True` if :attr:`shotnum` is strictly increasing
+    is_sorted: bool
+
+    #: `True` if the dataset shot number column can be binary searched
+    #: on disk (i.e. it is sorted and all non-zero rows belong to the
+    #: configuration)
+    searchable: bool
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index arrays."""
+        return self.shotnum.nbytes + self.config_mask.nbytes
+
+
+class ShotnumIndexCache:
+    """
+    A least-recently-used cache of `ShotnumIndex` entries, keyed by
+    dataset path and configuration, with bounded memory.
+
+    When an entry is evicted, whether its dataset can be binary
+    searched on disk is still remembered, so later look-ups of that
+    dataset only read the probed shot numbers.
+    """
+
+    #: default memory limit (in bytes) of the cached index arrays
+    DEFAULT_MAX_BYTES = 128 * 1024**2
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Parameters
+        ----------
+        max_bytes : `int`, optional
+            memory limit (in bytes) of the cached index arrays
+            (DEFAULT `DEFAULT_MAX_BYTES`)
+        """
+        self._entries = OrderedDict()  # type: OrderedDict[Hashable, ShotnumIndex]
+        self._searchable = {}  # type: Dict[Hashable, bool]
+        self._nbytes = 0
+        self.max_bytes = max_bytes
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory limit (in bytes) of the cached index arrays."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValueError(
+                f"Argument `max_bytes` must be a non-negative int, got {value}."
+            )
+        self._max_bytes = value
+        self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the cached index arrays."""
+        return self._nbytes
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._entries.clear()
+        self._searchable.clear()
+        self._nbytes = 0
+
+    def get(self, key: Hashable) -> Union[ShotnumIndex, None]:
+        """
+        Get the `ShotnumIndex` for ``key``, or `None` if it is not
+        cached.
+        """
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            profiling.record_cache("shotnum index", False)
+            return None
+
+        profiling.record_cache("shotnum index", True)
+        self._entries.move_to_end(key)
+        return entry
+
+    def is_searchable(self, key: Hashable) -> bool:
+        """
+        `True` if the dataset of ``key`` is known to be binary
+        searchable on disk, even if its entry was evicted.
+        """
+        return self._searchable.get(key, False)
+
+    def put(self, key: Hashable, entry: ShotnumIndex):
+        """
+        Add ``entry`` to the cache under ``key``, evicting the least
+        recently used entries to stay within :attr:`max_bytes`.
+        """
+        self._searchable[key] = entry.searchable
+
+        old_entry = self._entries.pop(key, None)
+        if old_entry is not None:
+            self._nbytes -= old_entry.nbytes
+
+        if entry.nbytes > self.max_bytes:
+            # never fits
+            return
+
+        self._entries[key] = entry
+        self._nbytes += entry.nbytes
+        self._evict()
+
+    def _evict(self):
+        """Evict least recently used entries until within :attr:`max_bytes`."""
+        while self._nbytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= entry.nbytes
@@ -0,0 +1,272 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the probe position index
+`~bapsflib._hdf.utils.spatial_index.SpatialIndex` used by
+`~bapsflib._hdf.utils.file.File` to select shots by probe position.
+"""
+
+__all__ = ["build_spatial_index", "condition_motion_control", "SpatialIndex"]
+
+import numpy as np
+
+from typing import Any, Dict, Tuple, Union
+
+from bapsflib._hdf.maps.controls.types import ConType
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.helpers import condition_controls
+from bapsflib.utils import profiling
+
+
+class SpatialIndex:
+    """
+    Index of the shot numbers of a motion control device grouped by
+    probe position.
+
+    Probe positions are (typically) visited on a grid with several
+    shots per position, so the index stores the unique ``xyz``
+    positions and, for each position, the sorted shot numbers recorded
+    there.  A region query (see :meth:`select`) is evaluated on the
+    unique positions only and then gathers the shot numbers of the
+    matching positions.  Shots without a recorded position (i.e.
+    `numpy.nan` values) are not indexed.
+    """
+
+    #: names of the ``xyz`` position components
+    AXES = ("x", "y", "z")
+
+    #: default absolute tolerance used to compare positions
+    DEFAULT_ATOL = 1.0e-4
+
+    def __init__(
+        self,
+        shotnum: np.ndarray,
+        xyz: np.ndarray,
+        control: Union[Tuple[str, Any], None] = None,
+    ):
+        """
+        Parameters
+        ----------
+        shotnum : `numpy.ndarray`
+            1D array of the shot numbers
+
+        xyz : `numpy.ndarray`
+            array of shape ``(N, 3)`` of the probe position of each shot
+            number in ``shotnum``
+
+        control : Tuple[str, Any], optional
+            ``(name, config)`` of the control device the positions were
+            read from
+        """
+        shotnum = np.asarray(shotnum)
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if shotnum.ndim != 1 or xyz.shape != shotnum.shape + (3,):
+            raise ValueError(
+                f"Arguments `shotnum` and `xyz` must have shapes (N,) and "
+                f"(N, 3), got {shotnum.shape} and {xyz.shape}."
+            )
+
+        # shots without a recorded position are not indexed
+        valid = np.logical_not(np.isnan(xyz).any(axis=1))
+        shotnum = shotnum[valid]
+        xyz = xyz[valid]
+
+        # group shot numbers by position
+        positions, inverse = np.unique(xyz, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.lexsort((shotnum, inverse))
+
+        self._positions = positions  # type: np.ndarray
+        self._shotnum = shotnum[order]  # type: np.ndarray
+        self._counts = np.bincount(inverse, minlength=positions.shape[0])
+        self._control = control
+
+    def __len__(self) -> int:
+        return self._shotnum.size
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(control={self._control}, "
+            f"positions={self._positions.shape[0]}, shots={self._shotnum.size})"
+        )
+
+    @property
+    def control(self) -> Union[Tuple[str, Any], None]:
+        """
+        ``(name, config)`` of the control device the positions were
+        read from.
+        """
+        return self._control
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of shots recorded at each of :attr:`positions`."""
+        return self._counts
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index arrays."""
+        return self._positions.nbytes + self._shotnum.nbytes + self._counts.nbytes
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Sorted unique probe positions, array of shape ``(M, 3)``."""
+        return self._positions
+
+    @property
+    def shotnum(self) -> np.ndarray:
+        """All indexed shot numbers, in ascending order."""
+        return np.sort(self._shotnum)
+
+    def position_mask(
+        self, region: Dict[str, Any], atol: float = DEFAULT_ATOL
+    ) -> np.ndarray:
+        """
+        Boolean mask of the :attr:`positions` inside ``region`` (see
+        :meth:`select`).
+        """
+        if not isinstance(region, dict):
+            raise TypeError(f"Argument `region` must be a dict, got type {type(region)}.")
+        unknown = set(region) - set(self.AXES + ("center", "radius"))
+        if unknown:
+            raise ValueError(
+                f"Argument `region` has unknown keys {sorted(unknown)}, expected "
+                f"any of {self.AXES + ('center', 'radius')}."
+            )
+
+        positions = self._positions
+        mask = np.ones(positions.shape[0], dtype=bool)
+
+        # -- axis values and bounds                                 ----
+        for ii, axis in enumerate(self.AXES):
+            if axis not in region:
+                continue
+
+            value = region[axis]
+            if isinstance(value, (tuple, list)):
+                if len(value) != 2:
+                    raise ValueError(
+                        f"Bounds of region axis '{axis}' must be a 2-element "
+                        f"tuple (lo, hi), got {value}."
+                    )
+                lo, hi = value
+                if lo is not None:
+                    mask &= positions[:, ii] >= lo - atol
+                if hi is not None:
+                    mask &= positions[:, ii] <= hi + atol
+            else:
+                mask &= np.abs(positions[:, ii] - value) <= atol
+
+        # -- distance from center                                   ----
+        if ("center" in region) != ("radius" in region):
+            raise ValueError("Region keys 'center' and 'radius' must be given together.")
+        elif "center" in region:
+            center = np.asarray(region["center"], dtype=np.float64)
+            if center.shape not in ((2,), (3,)):
+                raise ValueError(
+                    f"Region 'center' must be an (x, y) or (x, y, z) position, "
+                    f"got {region['center']}."
+                )
+            dist2 = np.sum((positions[:, : center.size] - center) ** 2, axis=1)
+            mask &= dist2 <= (region["radius"] + atol) ** 2
+
+        return mask
+
+    def select(self, region: Dict[str, Any], atol: float = DEFAULT_ATOL) -> np.ndarray:
+        """
+        Select the shot numbers with a probe position inside
+        ``region``.
+
+        Parameters
+        ----------
+        region : Dict[str, Any]
+            region of the probe positions to be selected.  The keys
+            ``'x'``, ``'y'``, and ``'z'`` select an axis value (e.g.
+            ``{'y': 0.0}`` selects the :math:`y=0` plane) or, for a
+            2-element tuple ``(lo, hi)``, the inclusive axis bounds
+            (`None` for unbounded).  The keys ``'center'`` and
+            ``'radius'`` select the positions within ``radius`` of the
+            ``(x, y)`` or ``(x, y, z)`` position ``center``.  All given
+            keys must be satisfied.
+
+        atol : `float`, optional
+            absolute tolerance used to compare positions (DEFAULT
+            `DEFAULT_ATOL`)
+
+        Returns
+        -------
+        `numpy.ndarray`
+            ascending shot numbers of the selected shots
+
+        Examples
+        --------
+
+        >>> # all shots within 1 cm of (x, y) = (0, 0)
+        >>> sindex.select({'center': (0.0, 0.0), 'radius': 1.0})
+        >>>
+        >>> # the y = 0 plane with x in [-10, 10]
+        >>> sindex.select({'x': (-10.0, 10.0), 'y': 0.0})
+        """
+        mask = self.position_mask(region, atol=atol)
+        shot_mask = np.repeat(mask, self._counts)
+        return np.sort(self._shotnum[shot_mask])
+
+
+def condition_motion_control(hdf_file: File, control=None) -> Tuple[str, Any]:
+    """
+    Condition the motion ``control`` device the probe positions are
+    read from into a ``(name, config)`` tuple.  If ``control`` is
+    `None`, then the only motion control device of the file is
+    assumed.
+    """
+    _controls = hdf_file.file_map.controls
+    if control is None:
+        motion = [
+            name for name, _map in _controls.items() if _map.contype == ConType.MOTION
+        ]
+        if len(motion) == 0:
+            raise ValueError("There are no motion control devices in the HDF5 file.")
+        elif len(motion) > 1:
+            raise ValueError(
+                f"There are several motion control devices {motion} in the HDF5 "
+                f"file, need to specify `control`."
+            )
+        control = motion[0]
+
+    control = condition_controls(hdf_file, [control])[0]
+    if _controls[control[0]].contype != ConType.MOTION:
+        raise ValueError(f"Control device '{control[0]}' is not a motion control device.")
+
+    return control
+
+
+def build_spatial_index(hdf_file: File, control=None) -> SpatialIndex:
+    """
+    Build the `SpatialIndex` of the probe positions recorded by the
+    motion ``control`` device (see `condition_motion_control`).  Only
+    the control device data is read.
+
+    Parameters
+    ----------
+    hdf_file : `~bapsflib._hdf.utils.file.File`
+        HDF5 file object
+
+    control : Union[str, Tuple[str, Any]], optional
+        name, or ``(name, config)``, of the motion control device
+    """
+    control = condition_motion_control(hdf_file, control)
+    with profiling.span("spatial index", control=control[0]):
+        cdata = HDFReadControls(hdf_file, [control], assume_controls_conditioned=True)
+        if "xyz" not in cdata.dtype.names:  # pragma: no cover
+            raise ValueError(f"Control device '{control[0]}' does not record 'xyz'.")
+
+        return SpatialIndex(cdata["shotnum"], cdata["xyz"], control=control)
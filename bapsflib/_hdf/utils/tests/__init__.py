@@ -10,7 +10,13 @@
 #
 __all__ = ["TestBase", "with_bf"]
 
+import os
+import tempfile
+
+from unittest import mock
+
 from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib._hdf.utils.map_cache import MAP_CACHE_DIR_ENV
 from bapsflib.utils.decorators import with_bf
 from bapsflib.utils.tests import BaPSFTestCase
 
@@ -18,6 +24,23 @@ from bapsflib.utils.tests import BaPSFTestCase
 class TestBase(BaPSFTestCase):
     """Base test class for all test classes here."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        # keep mapping cache entries out of the user cache directory
+        cls._map_cache_dir = tempfile.TemporaryDirectory(prefix="map-cache_")
+        cls._map_cache_env = mock.patch.dict(
+            os.environ, {MAP_CACHE_DIR_ENV: cls._map_cache_dir.name}
+        )
+        cls._map_cache_env.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._map_cache_env.stop()
+        cls._map_cache_dir.cleanup()
+        super().tearDownClass()
+
     def setUp(self) -> None:
         if not hasattr(self, "_f") or self._f is None:
             self._f = FauxHDFBuilder()
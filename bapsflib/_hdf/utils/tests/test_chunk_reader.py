@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.utils import chunk_reader
+from bapsflib._hdf.utils.chunk_reader import (
+    can_read_chunks,
+    condition_engine,
+    read_dset_rows_threaded,
+)
+from bapsflib._hdf.utils.tests import TestBase
+
+
+class TestReadDsetRowsThreaded(TestBase):
+    """Test Case for read_dset_rows_threaded"""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(7)
+        self.data = rng.integers(-2000, 2000, size=(90, 50), dtype=np.int16)
+        self.f.create_dataset("gzip", data=self.data, chunks=(16, 20), compression="gzip")
+        self.f.create_dataset(
+            "shuffle",
+            data=self.data.astype(">i4"),
+            chunks=(7, 50),
+            compression="gzip",
+            shuffle=True,
+        )
+        self.f.create_dataset("contiguous", data=self.data)
+
+    def test_read(self):
+        _conditions = [
+            # (label, index, columns)
+            ("all rows", np.arange(90), None),
+            ("one chunk", np.arange(2, 9), None),
+            ("scattered", np.arange(1, 90, 7), slice(5, 33)),
+            ("columns in one chunk", np.arange(20, 70), slice(21, 27)),
+            ("single row", np.array([57]), slice(None, None)),
+            ("empty", np.array([], dtype=np.intp), slice(3, 10)),
+        ]
+        for name in ("gzip", "shuffle", "contiguous"):
+            dset = self.f[name]
+            for label, index, columns in _conditions:
+                with self.subTest(dset=name, label=label):
+                    _columns = slice(None) if columns is None else columns
+                    expected = self.data[index, _columns]
+
+                    arr = read_dset_rows_threaded(
+                        dset, index, columns=columns, max_workers=3
+                    )
+                    self.assertEqual(arr.dtype, dset.dtype)
+                    self.assertTrue(np.array_equal(arr, expected))
+
+                    # output array w/ type conversion
+                    out = np.empty(expected.shape, dtype=np.float32)
+                    arr = read_dset_rows_threaded(dset, index, out=out, columns=columns)
+                    self.assertIs(arr, out)
+                    self.assertTrue(np.array_equal(out, expected))
+
+                    # non-contiguous output array (field of structured array)
+                    sarr = np.zeros(
+                        index.size,
+                        dtype=[("a", np.int8), ("b", np.float32, expected.shape[1:])],
+                    )
+                    read_dset_rows_threaded(dset, index, out=sarr["b"], columns=columns)
+                    self.assertTrue(np.array_equal(sarr["b"], expected))
+
+    def test_chunks_read_once(self):
+        """Every needed chunk is read and decoded once."""
+        dset = self.f["gzip"]
+        index = np.concatenate((np.arange(3, 10), np.arange(40, 60)))
+        with mock.patch.object(
+            chunk_reader, "read_dset_rows", wraps=chunk_reader.read_dset_rows
+        ) as mock_read, mock.patch.object(
+            chunk_reader, "_fill_chunk", wraps=chunk_reader._fill_chunk
+        ) as mock_fill:
+            arr = read_dset_rows_threaded(dset, index, columns=slice(15, 45))
+        mock_read.assert_not_called()
+        self.assertTrue(np.array_equal(arr, self.data[index, 15:45]))
+
+        # rows 3-9 -> chunk row 0, rows 40-59 -> chunk rows 32 & 48
+        # columns 15-44 -> chunk columns 0, 20 & 40
+        self.assertEqual(mock_fill.call_count, 9)
+        dests = [call.args[6] for call in mock_fill.call_args_list]
+        self.assertEqual(
+            sorted((rows.start, cols.start) for rows, cols in dests),
+            sorted((row, col) for row in (0, 7, 15) for col in (0, 5, 25)),
+        )
+
+    def test_unallocated_chunks(self):
+        dset = self.f.create_dataset(
+            "sparse",
+            shape=(40, 10),
+            dtype=np.int16,
+            chunks=(8, 10),
+            compression="gzip",
+            fillvalue=-1,
+        )
+        dset[8:16] = self.data[:8, :10]
+        expected = np.full((40, 10), -1, dtype=np.int16)
+        expected[8:16] = self.data[:8, :10]
+
+        arr = read_dset_rows_threaded(dset, np.arange(40))
+        self.assertTrue(np.array_equal(arr, expected))
+
+    def test_fallback(self):
+        """Undecodable datasets are read with read_dset_rows."""
+        self.f.create_dataset(
+            "fletcher", data=self.data, chunks=(16, 50), fletcher32=True
+        )
+        self.f.create_dataset("lzf", data=self.data, chunks=(16, 50), compression="lzf")
+        self.f.create_dataset(
+            "records",
+            data=np.zeros(10, dtype=[("a", np.int16), ("b", np.float32)]),
+            chunks=(5,),
+            compression="gzip",
+        )
+
+        self.assertTrue(can_read_chunks(self.f["gzip"]))
+        self.assertTrue(can_read_chunks(self.f["shuffle"]))
+        for name in ("contiguous", "fletcher", "lzf", "records"):
+            with self.subTest(dset=name):
+                self.assertFalse(can_read_chunks(self.f[name]))
+
+        index = np.arange(4, 60, 3)
+        for name in ("contiguous", "fletcher", "lzf"):
+            with self.subTest(dset=name), mock.patch.object(
+                chunk_reader, "read_dset_rows", wraps=chunk_reader.read_dset_rows
+            ) as mock_read:
+                arr = read_dset_rows_threaded(self.f[name], index, columns=slice(2, 9))
+                mock_read.assert_called_once()
+                self.assertTrue(np.array_equal(arr, self.data[index, 2:9]))
+
+    def test_raises(self):
+        dset = self.f["gzip"]
+        _conditions = [
+            # (exception, index, kwargs)
+            (ValueError, np.array([[1, 2], [3, 4]]), {}),  # not 1D
+            (ValueError, np.array([4, 3, 5]), {}),  # not increasing
+            (IndexError, np.array([3, 90]), {}),  # out of range
+            (ValueError, np.arange(5), {"out": np.empty((4, 50))}),
+            (ValueError, np.arange(5), {"max_workers": 0}),
+            (ValueError, np.arange(5), {"max_workers": True}),
+        ]
+        for exc, index, kwargs in _conditions:
+            with self.subTest(index=index, kwargs=kwargs), self.assertRaises(exc):
+                read_dset_rows_threaded(dset, index, **kwargs)
+
+    def test_condition_engine(self):
+        for engine in ("h5py", "threads"):
+            self.assertEqual(condition_engine(engine), engine)
+        for engine in ("thread", None, 5):
+            with self.subTest(engine=engine), self.assertRaises(ValueError):
+                condition_engine(engine)
+
+
+if __name__ == "__main__":
+    ut.main()
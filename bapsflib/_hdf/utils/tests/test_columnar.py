@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.columnar import ColumnarData, condition_layout, LAYOUTS
+
+
+class TestColumnarData(ut.TestCase):
+    """Test Case for ColumnarData"""
+
+    def setUp(self):
+        self.dtype = np.dtype(
+            [
+                ("shotnum", np.uint32),
+                ("signal", np.float32, (8,)),
+                ("xyz", np.float32, (3,)),
+            ]
+        )
+
+    def test_empty(self):
+        data = ColumnarData.empty((5,), self.dtype, info={"a": 1})
+        self.assertEqual(data.shape, (5,))
+        self.assertEqual(data.dtype, self.dtype)
+        self.assertEqual(data.names, self.dtype.names)
+        self.assertEqual(list(data), list(self.dtype.names))
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data.info, {"a": 1})
+        self.assertEqual(data["signal"].shape, (5, 8))
+        self.assertEqual(data.nbytes, 5 * self.dtype.itemsize)
+        for name in data:
+            self.assertTrue(data[name].flags.c_contiguous)
+            self.assertEqual(data[name].dtype, self.dtype[name].base)
+
+    def test_indexing(self):
+        data = ColumnarData.empty((6,), self.dtype)
+
+        # in place assignment
+        signal = data["signal"]
+        data["signal"] = 2.0
+        data["shotnum"] = np.arange(1, 7)
+        data["xyz"] = 0.0
+        self.assertIs(data["signal"], signal)
+        self.assertTrue(np.all(signal == 2.0))
+        with self.assertRaises(KeyError):
+            data["not a field"] = 1
+
+        # row selections are views of the columns
+        rows = data[2:4]
+        self.assertIsInstance(rows, ColumnarData)
+        self.assertEqual(rows.shape, (2,))
+        self.assertIs(rows.info, data.info)
+        self.assertTrue(np.array_equal(rows["shotnum"], [3, 4]))
+        self.assertTrue(rows["signal"].flags.c_contiguous)
+        rows["signal"] = -1.0
+        self.assertTrue(np.all(data["signal"][2:4] == -1.0))
+
+        # conversion to a structured array
+        sdata = data.to_structured()
+        self.assertEqual(sdata.dtype, self.dtype)
+        for name in data:
+            self.assertTrue(np.array_equal(sdata[name], data[name]))
+
+    def test_raises(self):
+        with self.assertRaises(ValueError):
+            ColumnarData({"a": np.zeros(3), "b": np.zeros(4)})
+
+    def test_condition_layout(self):
+        for layout in LAYOUTS:
+            self.assertEqual(condition_layout(layout), layout)
+        for layout in ("rows", None, 1):
+            with self.subTest(layout=layout), self.assertRaises(ValueError):
+                condition_layout(layout)
+
+
+if __name__ == "__main__":
+    ut.main()
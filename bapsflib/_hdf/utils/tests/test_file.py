@@ -11,6 +11,7 @@
 # License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
 #   license terms and contributor agreement.
 #
+import astropy.units as u
 import h5py
 import numpy as np
 import os
@@ -18,15 +19,22 @@ import os
 from unittest import mock
 
 from bapsflib._hdf import HDFMapper
+from bapsflib._hdf.maps.digitizers.sis3301 import HDFMapDigiSIS3301
 from bapsflib._hdf.maps.digitizers.siscrate import HDFMapDigiSISCrate
 from bapsflib._hdf.maps.digitizers.templates import HDFMapDigiTemplate
+from bapsflib._hdf.utils import parallel
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.hdfoverview import HDFOverview
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
 from bapsflib._hdf.utils.hdfreaddata import HDFReadData
 from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
+from bapsflib._hdf.utils.hdfreducedata import HDFReduceData
+from bapsflib._hdf.utils.map_cache import map_cache_path
+from bapsflib._hdf.utils.shotnum_cache import ShotnumIndex, ShotnumIndexCache
+from bapsflib._hdf.utils.spatial_index import SpatialIndex
 from bapsflib._hdf.utils.tests import TestBase
 from bapsflib.utils.decorators import with_bf
+from bapsflib.utils.profiling import profile
 from bapsflib.utils.warnings import HDFMappingWarning
 
 
@@ -54,10 +62,15 @@ class TestFile(TestBase):
             "controls",
             "digitizers",
             "msi",
+            "invalidate_map_cache",
             # read data attributes/methods
+            "iter_data",
             "read_data",
+            "read_data_many",
             "read_controls",
             "read_msi",
+            "reduce_data",
+            "shotnum_cache",
             # other attributes/methods
             "overview",
         ]
@@ -98,6 +111,7 @@ class TestFile(TestBase):
             "digitizers",
             "msi",
             "overview",
+            "shotnum_cache",
         ]
         for attr_name in _conditions:
             with self.subTest(attr_name=attr_name):
@@ -147,6 +161,7 @@ class TestFile(TestBase):
             extras = {
                 "shotnum": 2,
                 "intersection_set": True,
+                "layout": "columnar",
             }
             cdata = _bf.read_controls(["control"], **extras, silent=False)
             self.assertTrue(mock_rc.called)
@@ -167,13 +182,98 @@ class TestFile(TestBase):
                 "config_name": "config01",
                 "keep_bits": True,
                 "add_controls": ["control"],
+                "add_msi": [("Discharge", ["peak current"])],
+                "where": ("peak current", ">", 5.0),
                 "intersection_set": True,
+                "time_index": slice(2, 10),
+                "time_window": None,
+                "layout": "columnar",
+                "out": None,
+                "engine": "threads",
             }
             data = _bf.read_data(1, 2, **extras, silent=False)
             self.assertTrue(mock_rd.called)
             self.assertEqual(data, "read data")
             mock_rd.assert_called_once_with(_bf, 1, 2, **extras)
 
+    @with_bf
+    def test_read_data_many(self, _bf: File):
+        with mock.patch.object(
+            HDFReadData, "read_many", return_value=["read data"]
+        ) as mock_rdm:
+            extras = {
+                "index": 1,
+                "shotnum": 2,
+                "digitizer": "digi",
+                "adc": "SIS",
+                "config_name": "config01",
+                "keep_bits": True,
+                "add_controls": ["control"],
+                "add_msi": [("Discharge", ["peak current"])],
+                "where": ("peak current", ">", 5.0),
+                "intersection_set": True,
+                "time_index": slice(2, 10),
+                "time_window": None,
+                "layout": "columnar",
+                "engine": "threads",
+            }
+            data = _bf.read_data_many([(1, 2), (1, 3)], **extras, silent=False)
+            self.assertTrue(mock_rdm.called)
+            self.assertEqual(data, ["read data"])
+            mock_rdm.assert_called_once_with(_bf, [(1, 2), (1, 3)], **extras)
+
+    @with_bf
+    def test_read_data_parallel(self, _bf: File):
+        with mock.patch(
+            f"{parallel.__name__}.read_data_parallel", return_value=["read data"]
+        ) as mock_rdp:
+            extras = {
+                "max_workers": 2,
+                "chunk_shots": 20,
+                "index": 1,
+                "shotnum": 2,
+                "digitizer": "digi",
+                "adc": "SIS",
+                "config_name": "config01",
+                "keep_bits": True,
+                "add_controls": ["control"],
+                "add_msi": [("Discharge", ["peak current"])],
+                "where": ("peak current", ">", 5.0),
+                "intersection_set": True,
+                "time_index": slice(2, 10),
+                "time_window": None,
+            }
+            data = _bf.read_data_parallel([(1, 2), (1, 3)], **extras, silent=False)
+            self.assertTrue(mock_rdp.called)
+            self.assertEqual(data, ["read data"])
+            mock_rdp.assert_called_once_with(_bf, [(1, 2), (1, 3)], **extras)
+
+    @with_bf
+    def test_iter_data(self, _bf: File):
+        with mock.patch.object(
+            HDFReadData, "iter_blocks", return_value=iter(["block 1", "block 2"])
+        ) as mock_ib:
+            extras = {
+                "chunk_shots": 20,
+                "index": 1,
+                "shotnum": 2,
+                "digitizer": "digi",
+                "adc": "SIS",
+                "config_name": "config01",
+                "keep_bits": True,
+                "add_controls": ["control"],
+                "add_msi": [("Discharge", ["peak current"])],
+                "where": ("peak current", ">", 5.0),
+                "intersection_set": True,
+                "time_index": slice(2, 10),
+                "time_window": None,
+                "engine": "threads",
+            }
+            blocks = _bf.iter_data(1, 2, **extras, silent=False)
+            self.assertFalse(mock_ib.called)  # generators are lazy
+            self.assertEqual(list(blocks), ["block 1", "block 2"])
+            mock_ib.assert_called_once_with(_bf, 1, 2, **extras)
+
     @with_bf
     def test_read_msi(self, _bf: File):
         with mock.patch(
@@ -182,7 +282,128 @@ class TestFile(TestBase):
             mdata = _bf.read_msi("Discharge", silent=False)
             self.assertTrue(mock_rm.called)
             self.assertEqual(mdata, "read msi")
-            mock_rm.assert_called_once_with(_bf, "Discharge")
+            mock_rm.assert_called_once_with(
+                _bf, "Discharge", shotnum=slice(None), fields=None, meta_only=False
+            )
+
+            mock_rm.reset_mock()
+            _bf.read_msi("Discharge", shotnum=[1, 2], fields=["peak current"])
+            mock_rm.assert_called_once_with(
+                _bf, "Discharge", shotnum=[1, 2], fields=["peak current"], meta_only=False
+            )
+
+    @with_bf
+    def test_reduce_data(self, _bf: File):
+        with mock.patch(
+            f"{HDFReduceData.__module__}.{HDFReduceData.__qualname__}",
+            return_value="reduced data",
+        ) as mock_rd:
+            extras = {
+                "group_by": "xyz",
+                "stats": ("mean", "std"),
+                "chunk_shots": 20,
+                "add_controls": ["control"],
+            }
+            rdata = _bf.reduce_data(1, 2, **extras, silent=False)
+            self.assertTrue(mock_rd.called)
+            self.assertEqual(rdata, "reduced data")
+            mock_rd.assert_called_once_with(_bf, 1, 2, **extras)
+
+    @with_bf
+    def test_shotnum_cache(self, _bf: File):
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 10})
+        self.f.add_module("Waveform", {"n_configs": 1, "sn_size": 50})
+        _bf._map_file()  # re-map file
+
+        cache = _bf.shotnum_cache
+        self.assertIsInstance(cache, ShotnumIndexCache)
+        self.assertIs(_bf.shotnum_cache, cache)
+        self.assertEqual(len(cache), 0)
+
+        # reads share the cached shot number indices
+        kwargs = {"config_name": "config01", "add_controls": ["Waveform"], "silent": True}
+        data = _bf.read_data(0, 0, shotnum=slice(1, 20), **kwargs)
+        self.assertEqual(len(cache), 2)
+        with mock.patch(
+            "bapsflib._hdf.utils.helpers.ShotnumIndex", wraps=ShotnumIndex
+        ) as mock_index:
+            data2 = _bf.read_data(0, 0, shotnum=[5, 10], **kwargs)
+            mock_index.assert_not_called()
+        self.assertTrue(np.array_equal(data2["signal"], data["signal"][[4, 9]]))
+        self.assertTrue(np.array_equal(data2["FREQ"], data["FREQ"][[4, 9]]))
+
+        # max_bytes is retained, but the cache is reset when re-mapping
+        cache.max_bytes = 1024
+        _bf._map_file()
+        self.assertIsNot(_bf.shotnum_cache, cache)
+        self.assertEqual(len(_bf.shotnum_cache), 0)
+        self.assertEqual(_bf.shotnum_cache.max_bytes, 1024)
+
+        # no cache for read/write files
+        _bf2 = File(
+            self.f.filename,
+            mode="r+",
+            control_path="Raw data + config",
+            digitizer_path="Raw data + config",
+            msi_path="MSI",
+            silent=True,
+        )
+        self.assertIsNone(_bf2.shotnum_cache)
+        _bf2.close()
+
+    @with_bf
+    def test_select_shots(self, _bf: File):
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 10})
+        self.f.add_module("6K Compumotor", {"n_configs": 1, "sn_size": 50})
+        _bf._map_file()  # re-map file
+
+        # the index is built once and cached
+        with profile() as prof:
+            sindex = _bf.get_spatial_index()
+        self.assertIsInstance(sindex, SpatialIndex)
+        self.assertIn("spatial index", prof.spans)
+        self.assertEqual(prof.cache_stats["spatial index"]["misses"], 1)
+        with profile() as prof:
+            self.assertIs(_bf.get_spatial_index("6K Compumotor"), sindex)
+        self.assertNotIn("spatial index", prof.spans)
+        self.assertEqual(prof.cache_stats["spatial index"]["hits"], 1)
+
+        # selected shots are fed to read_data
+        x0, y0, z0 = sindex.positions[0]
+        region = {"center": (x0, y0), "radius": 0.5}
+        shotnum = _bf.select_shots(region)
+        self.assertTrue(np.array_equal(shotnum, sindex.select(region)))
+        self.assertTrue(
+            np.array_equal(
+                _bf.select_shots({"y": y0 + 0.01}, atol=0.1), sindex.select({"y": y0})
+            )
+        )
+        data = _bf.read_data(
+            0,
+            0,
+            shotnum=shotnum,
+            config_name="config01",
+            add_controls=["6K Compumotor"],
+            silent=True,
+        )
+        self.assertTrue(np.array_equal(data["shotnum"], shotnum))
+        self.assertTrue(np.all(data["xyz"] == sindex.positions[0]))
+
+        # the cache is reset when re-mapping
+        _bf._map_file()
+        self.assertIsNot(_bf.get_spatial_index(), sindex)
+
+        # no cache for read/write files
+        _bf2 = File(
+            self.f.filename,
+            mode="r+",
+            control_path="Raw data + config",
+            digitizer_path="Raw data + config",
+            msi_path="MSI",
+            silent=True,
+        )
+        self.assertIsNot(_bf2.get_spatial_index(), _bf2.get_spatial_index())
+        _bf2.close()
 
     @with_bf
     def test_file_wrong_open_mode(self, _bf: File):
@@ -224,11 +445,114 @@ class TestFile(TestBase):
                 control_path="Raw data + config",
                 digitizer_path="Raw data + config",
                 msi_path="MSI",
+                map_cache=False,
             )
             self.assertTrue(mock_mf.called)
             self.assertTrue(mock_bi.called)
             _bf2.close()
 
+    @with_bf
+    def test_map_cache(self, _bf: File):
+        self.f.add_module("SIS 3301")
+        self.f.add_module("Waveform")
+        self.f.add_module("Discharge")
+        self.f.flush()
+        _bf.invalidate_map_cache()
+        cache_path = map_cache_path(self.f.filename)
+        build_configs = HDFMapDigiSIS3301._build_configs
+        self.assertFalse(os.path.exists(cache_path))
+        kwargs = {
+            "control_path": "Raw data + config",
+            "digitizer_path": "Raw data + config",
+            "msi_path": "MSI",
+        }
+
+        # first open maps the file and writes the cache
+        _bf2 = File(self.f.filename, **kwargs)
+        self.assertTrue(_bf2._map_cache)
+        self.assertTrue(os.path.exists(cache_path))
+
+        # second open restores the mapping and info from the cache
+        with mock.patch.object(
+            HDFMapDigiSIS3301, "_build_configs"
+        ) as mock_bc, mock.patch.object(File, "_build_info") as mock_bi:
+            _bf3 = File(self.f.filename, **kwargs)
+            mock_bc.assert_not_called()
+            mock_bi.assert_not_called()
+        self.assertEqual(_bf3.info, _bf2.info)
+        for name in ("controls", "digitizers", "msi"):
+            maps2 = getattr(_bf2, name)
+            maps3 = getattr(_bf3, name)
+            self.assertEqual(list(maps3), list(maps2))
+            for device, _map in maps3.items():
+                self.assertIsInstance(_map, type(maps2[device]))
+                self.assertEqual(_map.info, maps2[device].info)
+                self.assertEqual(_map.group.file, _bf3)
+                self.assertEqual(repr(_map.configs), repr(maps2[device].configs))
+        data2 = _bf2.read_data(0, 0, config_name="config01", silent=True)
+        data3 = _bf3.read_data(0, 0, config_name="config01", silent=True)
+        for field in ("shotnum", "signal"):
+            self.assertTrue(np.array_equal(data3[field], data2[field]))
+        _bf3.close()
+
+        # opt-out or read/write mode does not use the cache
+        for file_kwargs in ({"map_cache": False}, {"mode": "r+"}):
+            with self.subTest(file_kwargs=file_kwargs), mock.patch.object(
+                HDFMapDigiSIS3301, "_build_configs", autospec=True
+            ) as mock_bc:
+                mock_bc.side_effect = build_configs
+                _bf3 = File(self.f.filename, **kwargs, **file_kwargs)
+                self.assertFalse(_bf3._map_cache)
+                mock_bc.assert_called_once()
+                _bf3.close()
+
+        # re-mapping does not use the cache
+        with mock.patch.object(
+            HDFMapDigiSIS3301, "_build_configs", autospec=True
+        ) as mock_bc:
+            mock_bc.side_effect = build_configs
+            _bf2._map_file()
+            mock_bc.assert_called_once()
+
+        # a modified file is re-mapped
+        stat = os.stat(self.f.filename)
+        os.utime(self.f.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        with mock.patch.object(
+            HDFMapDigiSIS3301, "_build_configs", autospec=True
+        ) as mock_bc:
+            mock_bc.side_effect = build_configs
+            _bf3 = File(self.f.filename, **kwargs)
+            mock_bc.assert_called_once()
+            _bf3.close()
+
+        # invalidate the cache
+        _bf2.invalidate_map_cache()
+        self.assertFalse(os.path.exists(cache_path))
+        _bf2.close()
+
+    @with_bf
+    def test_lazy_map(self, _bf: File):
+        self.assertFalse(_bf._lazy_map)
+        self.f.add_module("SIS 3301")
+        with mock.patch(
+            f"{File.__module__}.{HDFMapper.__qualname__}", wraps=HDFMapper
+        ) as mock_map:
+            _bf2 = File(
+                self.f.filename,
+                control_path="Raw data + config",
+                digitizer_path="Raw data + config",
+                msi_path="MSI",
+                lazy_map=True,
+                map_cache=False,
+            )
+            self.assertTrue(_bf2._lazy_map)
+            self.assertTrue(mock_map.called)
+            self.assertTrue(mock_map.call_args.kwargs["lazy"])
+            self.assertEqual(_bf2.digitizers.pending, ("SIS 3301",))
+            self.assertIs(_bf2.file_map.get("SIS 3301"), _bf2.digitizers["SIS 3301"])
+            self.assertEqual(_bf2.digitizers.pending, ())
+            _bf2.close()
+
     @with_bf
     def test_get_digitizer_specs_one_digi(self, _bf: File):
         self.f.reset()
@@ -392,6 +716,8 @@ class TestFile(TestBase):
         data2 = _bf.read_data(1, 1, index=1, adc="SIS 3302", silent=True)
         data2.info["nt"] = data2["signal"].shape[1]
 
+        data3 = _bf.read_data(1, 1, adc="SIS 3302", layout="columnar", silent=True)
+
         cases = [
             # (_with, data_info)
             ("info dict", d_info1),
@@ -399,12 +725,34 @@ class TestFile(TestBase):
             ("info dict with 'sample average' missing", d_info3),
             ("HDFReadData", data1),
             ("HDFReadData with 'nt' in info", data2),
+            ("HDFReadDataColumns", data3),
         ]
         for _with, data_info in cases:
             with self.subTest(_with=_with):
                 time = _bf.get_time_array(data_info)
                 self.assertTrue(np.allclose(time, expected_time))
 
+        # time array of a time-windowed read is offset
+        cases = [
+            # (_with, read kwargs)
+            ("time_index", {"time_index": slice(10, 25)}),
+            ("time_window", {"time_window": (10 * dt, 24 * dt)}),
+            ("time_window Quantity", {"time_window": (0.1 * u.us, 0.24 * u.us)}),
+        ]
+        for _with, kwargs in cases:
+            with self.subTest(_with=_with):
+                data = _bf.read_data(1, 1, index=0, adc="SIS 3302", silent=True, **kwargs)
+                self.assertEqual(data.info["time index"], slice(10, 25))
+                time = _bf.get_time_array(data)
+                self.assertTrue(np.allclose(time, expected_time[10:25]))
+
+                # columnar layout
+                data = _bf.read_data(
+                    1, 1, adc="SIS 3302", layout="columnar", silent=True, **kwargs
+                )
+                time = _bf.get_time_array(data)
+                self.assertTrue(np.allclose(time, expected_time[10:25]))
+
     @with_bf
     def test_get_time_array_with_time_dset(self, _bf: File):
         self.f.reset()
@@ -419,8 +767,24 @@ class TestFile(TestBase):
             # (_with, data_info)
             ("info dict", _bf.get_digitizer_specs(0, 1, silent=True)),
             ("HDFReadData", _bf.read_data(0, 1, index=0, silent=True)),
+            (
+                "HDFReadDataColumns",
+                _bf.read_data(0, 1, layout="columnar", silent=True),
+            ),
         ]
         for _with, data_info in cases:
             with self.subTest(_with=_with):
                 time = _bf.get_time_array(data_info)
                 self.assertTrue(np.allclose(time, expected_time))
+
+        # time array of a time-windowed read is offset
+        cases = [
+            # (_with, read kwargs)
+            ("time_index", {"time_index": slice(5, 20)}),
+            ("time_window", {"time_window": (expected_time[5], expected_time[19])}),
+        ]
+        for _with, kwargs in cases:
+            with self.subTest(_with=_with):
+                data = _bf.read_data(0, 1, index=0, silent=True, **kwargs)
+                time = _bf.get_time_array(data)
+                self.assertTrue(np.allclose(time, expected_time[5:20]))
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.columnar import ColumnarData
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.grid import GridCube, to_grid
+from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData, HDFReadDataColumns
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+class TestToGrid(ut.TestCase):
+    """Test case for `~bapsflib._hdf.utils.grid.to_grid`."""
+
+    def setUp(self):
+        # raster scan of a 4 x 3 x 1 grid, x varies fastest, with 5 shots
+        # per position and a small jitter on the recorded positions
+        self.nx, self.ny, self.nper, self.nt = 4, 3, 5, 7
+        self.x = np.linspace(-3.0, 3.0, self.nx)
+        self.y = np.array([-1.0, 0.5, 2.0])
+        nshots = self.nx * self.ny * self.nper
+
+        rng = np.random.default_rng(5)
+        data = np.zeros(
+            nshots,
+            dtype=[
+                ("shotnum", np.uint32),
+                ("signal", np.float32, (self.nt,)),
+                ("xyz", np.float32, (3,)),
+            ],
+        )
+        data["shotnum"] = np.arange(1, nshots + 1)
+        data["signal"] = rng.normal(size=(nshots, self.nt))
+        iy, ix = np.divmod(np.arange(nshots) // self.nper, self.nx)
+        data["xyz"][:, 0] = self.x[ix] + rng.uniform(-1e-4, 1e-4, nshots)
+        data["xyz"][:, 1] = self.y[iy] + rng.uniform(-1e-4, 1e-4, nshots)
+        data["xyz"][:, 2] = 7.0
+        self.data = data
+        self.ix, self.iy = ix, iy
+
+    def assertCube(self, grid: GridCube, data: np.ndarray, field="signal"):
+        self.assertEqual(grid.cube.shape[:4], (self.nx, self.ny, 1, self.nper))
+        self.assertTrue(np.allclose(grid.x, self.x, atol=1e-4))
+        self.assertTrue(np.allclose(grid.y, self.y, atol=1e-4))
+        self.assertTrue(np.allclose(grid.z, [7.0]))
+
+        # every row of `data` is at its cube index
+        self.assertEqual(grid.index.shape, (data.size, 4))
+        values = data if field is None else data[field]
+        self.assertTrue(np.array_equal(grid.cube[tuple(grid.index.T)], values))
+        for row in range(0, data.size, 7):
+            ix, iy, iz, _ = grid.index[row]
+            self.assertTrue(np.allclose(grid.x[ix], data["xyz"][row, 0], atol=1e-3))
+            self.assertTrue(np.allclose(grid.y[iy], data["xyz"][row, 1], atol=1e-3))
+
+    def test_raster_view(self):
+        """A raster scan is returned as a view of the data."""
+        grid = to_grid(self.data)
+        self.assertIsInstance(grid, GridCube)
+        self.assertNotIsInstance(grid.cube, np.ma.MaskedArray)
+        self.assertTrue(np.shares_memory(grid.cube, self.data))
+        self.assertCube(grid, self.data)
+        self.assertTrue(
+            np.array_equal(
+                grid.cube[1, 2, 0], self.data["signal"][(2 * self.nx + 1) * 5 :][:5]
+            )
+        )
+
+        # y varies fastest
+        order = np.lexsort((np.arange(self.data.size) % 5, self.iy, self.ix))
+        data = self.data[order]
+        grid = to_grid(data)
+        self.assertTrue(np.shares_memory(grid.cube, data))
+        self.assertCube(grid, data)
+
+        # records
+        grid = to_grid(self.data, field=None)
+        self.assertTrue(np.shares_memory(grid.cube, self.data))
+        self.assertCube(grid, self.data, field=None)
+
+    def test_unordered(self):
+        """Shuffled shots are copied into the cube in recorded order."""
+        order = np.random.default_rng(2).permutation(self.data.size)
+        data = self.data[order]
+        grid = to_grid(data)
+        self.assertNotIsInstance(grid.cube, np.ma.MaskedArray)
+        self.assertFalse(np.shares_memory(grid.cube, data))
+        self.assertCube(grid, data)
+
+        # shots of a position keep their recorded order
+        sn = to_grid(data, field="shotnum").cube
+        first = sn[0, 0, 0]
+        expected = data["shotnum"][(self.ix[order] == 0) & (self.iy[order] == 0)]
+        self.assertTrue(np.array_equal(first, expected))
+
+    def test_incomplete(self):
+        """An incomplete grid returns a masked array."""
+        data = self.data[:-3]
+        grid = to_grid(data)
+        self.assertIsInstance(grid.cube, np.ma.MaskedArray)
+        self.assertCube(grid, data)
+        self.assertTrue(np.all(grid.cube.mask[-1, -1, 0, 2:]))
+        self.assertFalse(np.any(grid.cube.mask[-1, -1, 0, :2]))
+        self.assertEqual(grid.cube.count(), data["signal"].size)
+
+        # missing position
+        data = self.data[self.nper :]
+        grid = to_grid(data)
+        self.assertEqual(grid.cube.shape[:4], (self.nx, self.ny, 1, self.nper))
+        self.assertTrue(np.all(grid.cube.mask[0, 0]))
+
+    def test_atol(self):
+        # tolerance finer than the jitter splits the coordinates
+        grid = to_grid(self.data, atol=1e-6)
+        self.assertGreater(grid.x.size, self.nx)
+
+        # per axis tolerance
+        grid = to_grid(self.data, atol=(1e-3, 1e-3, 0.0))
+        self.assertCube(grid, self.data)
+
+        # tolerance from '6K Compumotor' and 'NI_XYZ' motion lists
+        data = self.data.copy()
+        data["xyz"][:, 0] += np.random.default_rng(1).uniform(-0.2, 0.2, data.size)
+        grid = to_grid(data)
+        self.assertGreater(grid.x.size, self.nx)
+        for ml in (
+            {"delta": np.array([2.0, 1.5, 0.0])},
+            {"dx": 2.0, "dy": 1.5, "dz": None},
+        ):
+            with self.subTest(ml=ml):
+                cdata = ColumnarData(
+                    {name: data[name] for name in data.dtype.names},
+                    info={"controls": {"drive": {"motion lists": {"ml-0001": ml}}}},
+                )
+                grid = to_grid(cdata)
+                self.assertEqual(grid.cube.shape[:4], (self.nx, self.ny, 1, self.nper))
+
+    def test_raises(self):
+        no_xyz = np.zeros(5, dtype=[("shotnum", np.uint32), ("signal", np.float32)])
+        nan_xyz = self.data.copy()
+        nan_xyz["xyz"][3] = np.nan
+        _conditions = [
+            # (_raises, data, kwargs)
+            (ValueError, no_xyz, {}),
+            (ValueError, nan_xyz, {}),
+            (ValueError, self.data[:0], {}),
+            (ValueError, self.data, {"atol": -1.0}),
+            (ValueError, self.data, {"atol": (1.0, np.nan, 1.0)}),
+            (TypeError, self.data, {"field": 5}),
+            (
+                TypeError,
+                ColumnarData({name: self.data[name] for name in self.data.dtype.names}),
+                {"field": None},
+            ),
+        ]
+        for _raises, data, kwargs in _conditions:
+            with self.subTest(kwargs=kwargs), self.assertRaises(_raises):
+                to_grid(data, **kwargs)
+
+
+class TestReadDataToGrid(TestBase):
+    """Test case for the ``to_grid`` methods of the read data."""
+
+    @with_bf
+    def test_to_grid(self, _bf: File):
+        sn_size = 24
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": sn_size, "nt": 10})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": sn_size, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+
+        # record a 3 x 4 grid with 2 shots per position
+        sixk = self.f.modules["6K Compumotor"]
+        cname = list(sixk._configs)[0]
+        dset = self.f[
+            f"{self.control_path}/6K Compumotor/{sixk._configs[cname]['dset name']}"
+        ]
+        pos = np.arange(sn_size) // 2
+        cdset = dset[...]
+        cdset["x"] = (pos % 3) * 1.0 + 0.01
+        cdset["y"] = (pos // 3) * 1.0 - 0.02
+        cdset["z"] = 0.0
+        dset[...] = cdset
+        _bf._map_file()  # re-map file
+
+        controls = [("6K Compumotor", sixk._configs[cname]["receptacle"])]
+        for layout in ("structured", "columnar"):
+            with self.subTest(layout=layout):
+                data = HDFReadData(
+                    _bf,
+                    brd,
+                    ch,
+                    digitizer=digi,
+                    config_name=config_name,
+                    add_controls=controls,
+                    layout=layout,
+                )
+                self.assertIsInstance(
+                    data, HDFReadData if layout == "structured" else HDFReadDataColumns
+                )
+                grid = data.to_grid()
+                self.assertEqual(grid.cube.shape, (3, 4, 1, 2, 10))
+                self.assertTrue(np.allclose(grid.x, [0.01, 1.01, 2.01]))
+                self.assertTrue(np.allclose(grid.y, [-0.02, 0.98, 1.98, 2.98]))
+                self.assertTrue(np.shares_memory(grid.cube, data["signal"]))
+                self.assertTrue(np.array_equal(grid.cube[1, 2, 0], data["signal"][14:16]))
+
+        cdata = HDFReadControls(_bf, controls)
+        grid = cdata.to_grid()
+        self.assertEqual(grid.cube.shape, (3, 4, 1, 2))
+        self.assertEqual(grid.cube.dtype, cdata.dtype)
+        self.assertTrue(np.array_equal(grid.cube["shotnum"][1, 2, 0], [15, 16]))
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -20,6 +20,8 @@ from unittest import mock
 
 from bapsflib._hdf.maps import ConType, HDFMapper
 from bapsflib._hdf.maps.controls.templates import HDFMapControlTemplate
+from bapsflib._hdf.utils import hdfreadcontrols
+from bapsflib._hdf.utils.columnar import ColumnarData
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
 from bapsflib._hdf.utils.tests import TestBase
@@ -107,6 +109,99 @@ class TestHDFReadControl(TestBase):
         )
         self.assertCDataObj(data, _bf, control_plus)
 
+    @with_bf
+    def test_single_pass_dataset_read(self, _bf: File):
+        """Test the rows of a control dataset are read only once."""
+        # setup HDF5 file
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("6K Compumotor", sixk_cspec)]
+        config = _bf.file_map.controls["6K Compumotor"].configs[sixk_cspec]
+        dset = _bf.get(config["dset paths"][0])
+
+        read_dset_rows = hdfreadcontrols.read_dset_rows
+        with mock.patch.object(
+            hdfreadcontrols, "read_dset_rows", side_effect=read_dset_rows
+        ) as mock_read:
+            data = HDFReadControls(_bf, controls, shotnum=[2, 5, 6, 7, 30])
+
+            # several state values, but only one read of the dataset
+            self.assertGreater(len(config["state values"]), 1)
+            self.assertEqual(mock_read.call_count, 1)
+
+        rows = dset[[1, 4, 5, 6, 29]]
+        for field, state_config in config["state values"].items():
+            for npi, df_name in enumerate(state_config["dset field"]):
+                values = (
+                    data[field]
+                    if data.dtype[field].shape == ()
+                    else data[field][..., npi]
+                )
+                self.assertTrue(np.array_equal(values, rows[df_name]))
+
+    @with_bf
+    def test_layout(self, _bf: File):
+        """Test the columnar layout of the control data."""
+        # setup HDF5 file
+        self.f.add_module("Waveform", {"n_configs": 1, "sn_size": 50})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("Waveform", "config01"), ("6K Compumotor", sixk_cspec)]
+
+        for kwargs in ({}, {"shotnum": [5, 10, 60], "intersection_set": False}):
+            with self.subTest(kwargs=kwargs):
+                expected = HDFReadControls(_bf, controls, **kwargs)
+                data = HDFReadControls(_bf, controls, layout="columnar", **kwargs)
+                self.assertIsInstance(data, ColumnarData)
+                self.assertEqual(data.dtype, expected.dtype)
+                self.assertEqual(
+                    list(data.info["controls"]), ["Waveform", "6K Compumotor"]
+                )
+                for field in expected.dtype.names:
+                    self.assertTrue(data[field].flags.c_contiguous)
+                    self.assertTrue(
+                        np.array_equal(data[field], expected[field], equal_nan=True)
+                    )
+
+        with self.assertRaises(ValueError):
+            HDFReadControls(_bf, controls, layout="rows")
+
+    @with_bf
+    def test_long_command_list(self, _bf: File):
+        """Test command list fill with hundreds of commands."""
+        # setup HDF5 file
+        self.f.add_module("Waveform", {"n_configs": 1, "sn_size": 1000})
+        group = self.f[f"{self.control_path}/Waveform"]
+        freqs = 1000.0 * np.arange(1, 301)
+        group["config01"].attrs["Waveform command list"] = np.bytes_(
+            "".join(f"FREQ {freq:f} \n" for freq in freqs)
+        )
+        rng = np.random.default_rng(10)
+        ci_arr = rng.integers(0, 300, size=1000, dtype=np.int32)
+        ci_arr[[3, 7]] = [-1, 300]  # indices outside of the command list
+        group["Run time list"]["Command index"] = ci_arr
+        _bf._map_file()  # re-map file
+
+        controls = [("Waveform", "config01")]
+        valid = np.ones(1000, dtype=bool)
+        valid[[3, 7]] = False
+        sn = np.arange(1, 1001)
+        sn_requested = [sn, sn[100:300], sn[::7]]
+        for shotnum in sn_requested:
+            with self.subTest(shotnum=shotnum):
+                data = HDFReadControls(_bf, controls, shotnum=shotnum)
+                mask = valid[shotnum - 1]
+                self.assertTrue(np.array_equal(data["shotnum"], shotnum))
+                self.assertTrue(
+                    np.array_equal(data["FREQ"][mask], freqs[ci_arr[shotnum - 1][mask]])
+                )
+
     @with_bf
     @mock.patch.object(HDFMapper, "controls", new_callable=mock.PropertyMock)
     def test_missing_dataset_fields(self, _bf: File, mock_controls):
@@ -23,16 +23,21 @@ from bapsflib._hdf.maps import HDFMapper
 from bapsflib._hdf.maps.digitizers.sis3301 import HDFMapDigiSIS3301
 from bapsflib._hdf.maps.digitizers.tests.fauxlecroy180e import FauxLeCroy180E
 from bapsflib._hdf.maps.digitizers.tests.fauxsis3301 import FauxSIS3301
+from bapsflib._hdf.utils.chunk_reader import read_dset_rows_threaded
+from bapsflib._hdf.utils.columnar import ColumnarData
 from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
-from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData, HDFReadDataColumns, VoltageView
 from bapsflib._hdf.utils.helpers import (
     build_shotnum_dset_relation,
     condition_shotnum,
     do_shotnum_intersection,
+    read_dset_rows,
 )
 from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.plasma import core, vectorized
 from bapsflib.utils.decorators import with_bf
+from bapsflib.utils.profiling import profile
 from bapsflib.utils.warnings import BaPSFWarning, HDFMappingWarning
 
 
@@ -553,6 +558,41 @@ class TestHDFReadData(TestBase):
         self.assertDataArrayValues(data, dset, indices, keep_bits=True)
         self.assertEqual(data.info["signal units"], u.bit)
 
+        # voltage view of the raw bits
+        kwargs = {"config_name": config_name, "adc": adc, "digitizer": digi}
+        bits = HDFReadData(_bf, brd, ch, keep_bits=True, **kwargs)
+        volts = HDFReadData(_bf, brd, ch, keep_bits=False, **kwargs)
+        view = bits.voltage
+        self.assertIsInstance(view, VoltageView)
+        self.assertEqual(view.shape, (sn_size, 1000))
+        self.assertEqual(view.ndim, 2)
+        self.assertEqual(len(view), sn_size)
+        self.assertEqual(view.dtype, np.float32)
+        self.assertTrue(np.issubdtype(bits["signal"].dtype, np.integer))
+        self.assertEqual(view[3:7].dtype, np.float32)
+        self.assertTrue(np.allclose(view[3:7], volts["signal"][3:7], rtol=6e-5))
+        self.assertTrue(np.allclose(np.asarray(view), volts["signal"], rtol=6e-5))
+        chunks = list(view.iter_chunks(chunk_shots=16))
+        self.assertEqual([chunk.shape[0] for chunk in chunks], [16, 16, 16, 2])
+        self.assertTrue(np.allclose(np.concatenate(chunks), volts["signal"], rtol=6e-5))
+        for chunk_shots in (0, 2.5, True):
+            with self.subTest(chunk_shots=chunk_shots), self.assertRaises(ValueError):
+                next(view.iter_chunks(chunk_shots=chunk_shots))
+
+        # voltage view of a signal already in volts
+        view = volts.voltage
+        self.assertTrue(np.array_equal(view[...], volts["signal"]))
+
+        # voltage view of the columnar layout
+        view = HDFReadData(_bf, brd, ch, keep_bits=True, layout="columnar", **kwargs)
+        self.assertTrue(np.allclose(view.voltage[...], volts["signal"], rtol=6e-5))
+
+        # voltage step size can not be calculated
+        with mock.patch.object(
+            HDFReadData, "dv", new_callable=mock.PropertyMock(return_value=None)
+        ):
+            self.assertIsNone(bits.voltage)
+
     @with_bf
     @mock.patch(
         "bapsflib._hdf.utils.hdfreaddata.do_shotnum_intersection",
@@ -1055,6 +1095,10 @@ class TestHDFReadData(TestBase):
             self.assertTrue(np.all(data["shotnum"] == 6))
             self.assertTrue(np.all(data["signal"] == 5234))
 
+        # the raw bits can not be viewed as voltage
+        self.assertIsNone(data.info["signal units"])
+        self.assertIsNone(data.voltage)
+
     @with_bf
     @mock.patch(
         "bapsflib._hdf.utils.hdfreaddata.condition_shotnum", side_effect=condition_shotnum
@@ -1239,6 +1283,874 @@ class TestHDFReadData(TestBase):
                 self.assertTrue(np.allclose(data["shotnum"], expected["index"] + 1))
                 self.assertTrue(np.allclose(data["signal"], dset[expected["index"]]))
 
+    @with_bf
+    def test_read_many(self, _bf: File):
+        """Test reading several connections with `HDFReadData.read_many`."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 100})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        bc_arr = _mod.knobs.active_brdch
+        bc_arr[...] = False
+        bc_arr[0, (0, 3)] = True
+        bc_arr[2, 5] = True
+        _mod.knobs.active_brdch = bc_arr
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        connections = [(0, 0), (0, 3), (2, 5)]
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("6K Compumotor", sixk_cspec)]
+
+        cases = [
+            {},
+            {"index": [2, 5, 30]},
+            {"shotnum": [3, 10, 45, 60]},
+            {"shotnum": [3, 10, 45, 60], "intersection_set": False},
+            {"shotnum": slice(5, 20, 2), "add_controls": controls},
+            {"keep_bits": True, "add_controls": controls},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                data_list = HDFReadData.read_many(
+                    _bf, connections, digitizer=digi, config_name=config_name, **kwargs
+                )
+                self.assertEqual(len(data_list), len(connections))
+
+                for (brd, ch), data in zip(connections, data_list):
+                    expected = HDFReadData(
+                        _bf,
+                        brd,
+                        ch,
+                        digitizer=digi,
+                        config_name=config_name,
+                        **kwargs,
+                    )
+                    self.assertDataObj(
+                        data,
+                        _bf,
+                        motion_added="add_controls" in kwargs,
+                        keep_bits=kwargs.get("keep_bits", False),
+                    )
+                    self.assertEqual(data.info["board"], brd)
+                    self.assertEqual(data.info["channel"], ch)
+                    self.assertEqual(data.dtype, expected.dtype)
+                    self.assertTrue(np.array_equal(data["shotnum"], expected["shotnum"]))
+                    self.assertTrue(
+                        np.array_equal(data["signal"], expected["signal"], equal_nan=True)
+                    )
+                    self.assertTrue(
+                        np.array_equal(data["xyz"], expected["xyz"], equal_nan=True)
+                    )
+
+                # all connections share the same shot numbers
+                for data in data_list[1:]:
+                    self.assertTrue(
+                        np.array_equal(data["shotnum"], data_list[0]["shotnum"])
+                    )
+
+        # a single (board, channel) tuple is allowed
+        data_list = HDFReadData.read_many(
+            _bf, connections[0], digitizer=digi, config_name=config_name
+        )
+        self.assertEqual(len(data_list), 1)
+
+        # control data is only read once
+        with mock.patch(
+            "bapsflib._hdf.utils.hdfreaddata.HDFReadControls", wraps=HDFReadControls
+        ) as mock_rc:
+            HDFReadData.read_many(
+                _bf,
+                connections,
+                digitizer=digi,
+                config_name=config_name,
+                add_controls=controls,
+            )
+            self.assertEqual(mock_rc.call_count, 1)
+
+        # raise errors
+        for _conns, _exc in (
+            ([], TypeError),
+            ("not connections", TypeError),
+            ([(1, 2, 3)], ValueError),
+            ([connections[0], connections[0]], ValueError),
+        ):
+            with self.subTest(connections=_conns), self.assertRaises(_exc):
+                HDFReadData.read_many(
+                    _bf, _conns, digitizer=digi, config_name=config_name
+                )
+
+    @with_bf
+    def test_time_selection(self, _bf: File):
+        """Test reading a time sample range with `time_index` and `time_window`."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 100})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        dset_name = f"{config_name} [{brd}:{ch}]"
+        dset = self.f[f"{self.digitizer_path}/{digi}/{dset_name}"]
+        dset[...] = np.arange(50 * 100, dtype=np.int16).reshape(50, 100)
+        _bf._map_file()  # re-map file
+        time = _bf.get_time_array(_bf.get_digitizer_specs(brd, ch, adc=digi, silent=True))
+        dt = float(time[1])
+
+        cases = [
+            # (time kwargs, expected slice)
+            ({}, slice(0, 100)),
+            ({"time_index": slice(20, 40)}, slice(20, 40)),
+            ({"time_index": slice(-10, None)}, slice(90, 100)),
+            ({"time_window": (20 * dt, 39 * dt)}, slice(20, 40)),
+            ({"time_window": (20.5 * dt, 39.5 * dt)}, slice(21, 40)),
+            ({"time_window": (-1.0, 4 * dt)}, slice(0, 5)),
+        ]
+        read_cases = [
+            {"index": slice(None)},
+            {"index": [2, 3, 4, 30]},
+            {"shotnum": [5, 10, 60], "intersection_set": False},
+        ]
+        for tkwargs, expected in cases:
+            for rkwargs in read_cases:
+                with self.subTest(tkwargs=tkwargs, rkwargs=rkwargs):
+                    full = HDFReadData(
+                        _bf,
+                        brd,
+                        ch,
+                        digitizer=digi,
+                        config_name=config_name,
+                        keep_bits=True,
+                        **rkwargs,
+                    )
+                    data = HDFReadData(
+                        _bf,
+                        brd,
+                        ch,
+                        digitizer=digi,
+                        config_name=config_name,
+                        keep_bits=True,
+                        **rkwargs,
+                        **tkwargs,
+                    )
+                    self.assertEqual(data.info["time index"], expected)
+                    self.assertEqual(
+                        data["signal"].shape[1], expected.stop - expected.start
+                    )
+                    self.assertTrue(np.array_equal(data["shotnum"], full["shotnum"]))
+                    self.assertTrue(
+                        np.array_equal(data["signal"], full["signal"][:, expected])
+                    )
+
+        # read_many applies the same time selection to every connection
+        data_list = HDFReadData.read_many(
+            _bf,
+            [(brd, ch)],
+            digitizer=digi,
+            config_name=config_name,
+            time_index=slice(20, 40),
+        )
+        self.assertEqual(data_list[0].info["time index"], slice(20, 40))
+        self.assertEqual(data_list[0]["signal"].shape[1], 20)
+
+        # raise errors
+        _conditions = [
+            # (_raises, time kwargs)
+            (ValueError, {"time_index": slice(0, 10), "time_window": (0.0, 1.0)}),
+            (TypeError, {"time_index": (0, 10)}),
+            (ValueError, {"time_index": slice(0, 10, 2)}),
+            (ValueError, {"time_index": slice(50, 20)}),
+            (TypeError, {"time_window": 1.0}),
+            (TypeError, {"time_window": ("a", "b")}),
+            (ValueError, {"time_window": (1.0 * u.m, 2.0 * u.m)}),
+            (ValueError, {"time_window": (40 * dt, 20 * dt)}),
+            (ValueError, {"time_window": (200 * dt, 300 * dt)}),
+        ]
+        for _raises, tkwargs in _conditions:
+            with self.subTest(tkwargs=tkwargs), self.assertRaises(_raises):
+                HDFReadData(
+                    _bf, brd, ch, digitizer=digi, config_name=config_name, **tkwargs
+                )
+
+    @with_bf
+    def test_iter_blocks(self, _bf: File):
+        """Test iterating over blocks of shots with `HDFReadData.iter_blocks`."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 20})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        dset_path = f"{self.digitizer_path}/{digi}/{config_name} [{brd}:{ch}]"
+        self.f[dset_path][...] = np.arange(50 * 20, dtype=np.int16).reshape(50, 20)
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        controls = [("6K Compumotor", sixk_cspec)]
+
+        cases = [
+            {"chunk_shots": 7},
+            {"chunk_shots": 100},
+            {"chunk_shots": 1, "index": [3, 4, 20]},
+            {"chunk_shots": 4, "shotnum": slice(10, 40, 3)},
+            {"chunk_shots": 4, "shotnum": [5, 10, 48, 60], "intersection_set": False},
+            {"chunk_shots": 16, "add_controls": controls},
+            {"chunk_shots": 16, "keep_bits": True, "time_index": slice(5, 9)},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                kwargs = kwargs.copy()
+                chunk_shots = kwargs.pop("chunk_shots")
+                expected = HDFReadData(
+                    _bf, brd, ch, digitizer=digi, config_name=config_name, **kwargs
+                )
+
+                blocks = []
+                for block in HDFReadData.iter_blocks(
+                    _bf,
+                    brd,
+                    ch,
+                    chunk_shots=chunk_shots,
+                    digitizer=digi,
+                    config_name=config_name,
+                    **kwargs,
+                ):
+                    self.assertIsInstance(block, HDFReadData)
+                    self.assertLessEqual(block.size, chunk_shots)
+                    self.assertEqual(block.dtype, expected.dtype)
+                    self.assertEqual(block.info["board"], brd)
+                    self.assertEqual(
+                        block.info["signal units"], expected.info["signal units"]
+                    )
+                    if blocks:
+                        # blocks share the same output buffer
+                        self.assertTrue(np.shares_memory(block, blocks[-1][0]))
+                    blocks.append((block, block.copy()))
+
+                data = np.concatenate([copy for _, copy in blocks])
+                for field in expected.dtype.names:
+                    self.assertTrue(
+                        np.array_equal(data[field], expected[field], equal_nan=True)
+                    )
+
+        # blocks align to the HDF5 chunk layout
+        self.f.move(dset_path, f"{dset_path} - old")
+        self.f.create_dataset(
+            dset_path, data=self.f[f"{dset_path} - old"][...], chunks=(8, 20)
+        )
+        del self.f[f"{dset_path} - old"]
+        with mock.patch(
+            f"{HDFReadData.__module__}.read_dset_rows", wraps=read_dset_rows
+        ) as mock_read:
+            sizes = [
+                block.size
+                for block in HDFReadData.iter_blocks(
+                    _bf,
+                    brd,
+                    ch,
+                    chunk_shots=20,
+                    index=slice(3, None),
+                    digitizer=digi,
+                    config_name=config_name,
+                )
+            ]
+        self.assertEqual(sizes, [13, 16, 16, 2])
+        for call in mock_read.call_args_list:
+            if "columns" not in call.kwargs:
+                # not a signal read
+                continue
+            rows = call.args[1]
+            self.assertEqual(rows[0] // 16, rows[-1] // 16)
+
+        # an empty selection yields no blocks
+        index = np.array([], dtype=int)
+        with self.assertWarns(Warning):
+            expected = HDFReadData(
+                _bf, brd, ch, index=index, digitizer=digi, config_name=config_name
+            )
+        self.assertEqual(expected.shape, (0,))
+        blocks = HDFReadData.iter_blocks(
+            _bf,
+            brd,
+            ch,
+            chunk_shots=4,
+            index=index,
+            digitizer=digi,
+            config_name=config_name,
+        )
+        self.assertEqual(list(blocks), [])
+
+        # raise errors
+        for chunk_shots in (0, -5, 2.5, True):
+            with self.subTest(chunk_shots=chunk_shots), self.assertRaises(ValueError):
+                next(
+                    HDFReadData.iter_blocks(
+                        _bf,
+                        brd,
+                        ch,
+                        chunk_shots=chunk_shots,
+                        digitizer=digi,
+                        config_name=config_name,
+                    )
+                )
+
+    @with_bf
+    def test_layout(self, _bf: File):
+        """Test the columnar layout of the read data."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 20})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        _bf._map_file()  # re-map file
+        sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+        read_kwargs = {"digitizer": digi, "config_name": config_name}
+
+        cases = [
+            {},
+            {"keep_bits": True, "time_index": slice(5, 9)},
+            {"add_controls": [("6K Compumotor", sixk_cspec)], "shotnum": [2, 4, 9]},
+            {"shotnum": [5, 10, 48, 60], "intersection_set": False},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                expected = HDFReadData(_bf, brd, ch, **read_kwargs, **kwargs)
+                data = HDFReadData(
+                    _bf, brd, ch, layout="columnar", **read_kwargs, **kwargs
+                )
+                self.assertIsInstance(data, HDFReadDataColumns)
+                self.assertEqual(data.shape, expected.shape)
+                self.assertEqual(data.dtype, expected.dtype)
+                self.assertEqual(data.names, expected.dtype.names)
+                for field in expected.dtype.names:
+                    self.assertTrue(data[field].flags.c_contiguous)
+                    self.assertTrue(
+                        np.array_equal(data[field], expected[field], equal_nan=True)
+                    )
+
+                # same accessors
+                self.assertEqual(list(data.info), list(expected.info))
+                self.assertEqual(data.info["signal units"], expected.info["signal units"])
+                self.assertEqual(data.dt, expected.dt)
+                self.assertEqual(data.dv, expected.dv)
+                self.assertEqual(list(data.plasma), list(expected.plasma))
+
+        # iter_blocks and read_many
+        expected = HDFReadData(_bf, brd, ch, **read_kwargs)
+        blocks = [
+            {field: block[field].copy() for field in block}
+            for block in HDFReadData.iter_blocks(
+                _bf, brd, ch, chunk_shots=16, layout="columnar", **read_kwargs
+            )
+        ]
+        self.assertEqual([block["shotnum"].size for block in blocks], [16, 16, 16, 2])
+        signal = np.concatenate([block["signal"] for block in blocks])
+        self.assertTrue(np.array_equal(signal, expected["signal"]))
+        data = HDFReadData.read_many(_bf, [(brd, ch)], layout="columnar", **read_kwargs)
+        self.assertIsInstance(data[0], HDFReadDataColumns)
+        self.assertTrue(np.array_equal(data[0]["signal"], expected["signal"]))
+
+        # invalid layout
+        for layout in ("rows", None):
+            with self.subTest(layout=layout), self.assertRaises(ValueError):
+                HDFReadData(_bf, brd, ch, layout=layout, **read_kwargs)
+
+    @with_bf
+    def test_out(self, _bf: File):
+        """Test reading into caller provided output buffers."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 20})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        _bf._map_file()  # re-map file
+        read_kwargs = {"digitizer": digi, "config_name": config_name}
+        expected = HDFReadData(_bf, brd, ch, **read_kwargs)
+
+        # structured buffer (larger than needed) reused across reads
+        buffer = np.empty(60, dtype=expected.dtype)
+        for shotnum in ([3, 4, 5], slice(None), slice(10, 20)):
+            with self.subTest(shotnum=shotnum):
+                data = HDFReadData(
+                    _bf, brd, ch, shotnum=shotnum, out=buffer, **read_kwargs
+                )
+                sn = expected["shotnum"][np.isin(expected["shotnum"], data["shotnum"])]
+                self.assertIsInstance(data, HDFReadData)
+                self.assertTrue(np.shares_memory(data, buffer))
+                self.assertEqual(data.shape, sn.shape)
+                self.assertTrue(np.array_equal(buffer["shotnum"][: sn.size], sn))
+                self.assertTrue(
+                    np.array_equal(data["signal"], expected["signal"][sn - 1])
+                )
+                self.assertEqual(data.info["signal units"], u.volt)
+
+        # columnar buffer
+        buffer = ColumnarData.empty((50,), expected.dtype)
+        with mock.patch.object(
+            h5py.Dataset,
+            "read_direct",
+            autospec=True,
+            side_effect=h5py.Dataset.read_direct,
+        ) as mock_rd:
+            data = HDFReadData(_bf, brd, ch, out=buffer, **read_kwargs)
+            self.assertTrue(mock_rd.called)
+        self.assertIsInstance(data, HDFReadDataColumns)
+        self.assertTrue(np.shares_memory(data["signal"], buffer["signal"]))
+        self.assertTrue(np.array_equal(buffer["signal"], expected["signal"]))
+
+        # iter_blocks
+        buffer = np.empty(16, dtype=expected.dtype)
+        signal = []
+        for block in HDFReadData.iter_blocks(
+            _bf, brd, ch, chunk_shots=16, out=buffer, **read_kwargs
+        ):
+            self.assertTrue(np.shares_memory(block, buffer))
+            signal.append(block["signal"].copy())
+        self.assertTrue(np.array_equal(np.concatenate(signal), expected["signal"]))
+
+        # raise errors
+        _conditions = [
+            # (_raises, out)
+            (TypeError, [1, 2, 3]),
+            (TypeError, np.empty(50, dtype=np.float32)),
+            (ValueError, np.empty((50, 2), dtype=expected.dtype)),
+            (ValueError, np.empty(49, dtype=expected.dtype)),
+            (ValueError, np.empty(50, dtype=expected.dtype.descr[::-1])),
+        ]
+        for _raises, out in _conditions:
+            with self.subTest(out=out), self.assertRaises(_raises):
+                HDFReadData(_bf, brd, ch, out=out, **read_kwargs)
+        with self.assertRaises(ValueError):
+            next(
+                HDFReadData.iter_blocks(
+                    _bf,
+                    brd,
+                    ch,
+                    chunk_shots=16,
+                    out=np.empty(8, expected.dtype),
+                    **read_kwargs,
+                )
+            )
+
+    @with_bf
+    def test_engine(self, _bf: File):
+        """Test reading compressed digitizer datasets with engine='threads'."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 40})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        read_kwargs = {"digitizer": digi, "config_name": config_name}
+
+        # replace the digitizer dataset with a compressed copy
+        dset_path = f"{self.digitizer_path}/{digi}/{config_name} [{brd}:{ch}]"
+        rng = np.random.default_rng(3)
+        self.f[dset_path][...] = rng.integers(-500, 500, size=(50, 40), dtype=np.int16)
+        self.f.move(dset_path, f"{dset_path} - old")
+        self.f.create_dataset(
+            dset_path,
+            data=self.f[f"{dset_path} - old"][...],
+            chunks=(8, 16),
+            compression="gzip",
+            shuffle=True,
+        )
+        del self.f[f"{dset_path} - old"]
+        _bf._map_file()  # re-map file
+
+        _conditions = [
+            # (kwargs)
+            {},
+            {"keep_bits": True},
+            {"index": [2, 3, 4, 20, 41]},
+            {"time_index": slice(10, 30)},
+            {"shotnum": [5, 10, 80], "intersection_set": False},
+            {"layout": "columnar"},
+        ]
+        for kwargs in _conditions:
+            with self.subTest(kwargs=kwargs), mock.patch(
+                f"{HDFReadData.__module__}.read_dset_rows_threaded",
+                wraps=read_dset_rows_threaded,
+            ) as mock_read:
+                expected = HDFReadData(_bf, brd, ch, **read_kwargs, **kwargs)
+                mock_read.assert_not_called()
+                data = HDFReadData(
+                    _bf, brd, ch, engine="threads", **read_kwargs, **kwargs
+                )
+                mock_read.assert_called_once()
+                self.assertEqual(data.dtype, expected.dtype)
+                for field in expected.dtype.names:
+                    self.assertTrue(
+                        np.array_equal(data[field], expected[field], equal_nan=True)
+                    )
+
+        # read_many and iter_blocks
+        data = HDFReadData.read_many(_bf, [(brd, ch)], engine="threads", **read_kwargs)
+        self.assertTrue(np.array_equal(data[0]["signal"], expected["signal"]))
+        blocks = [
+            block["signal"].copy()
+            for block in HDFReadData.iter_blocks(
+                _bf, brd, ch, chunk_shots=16, engine="threads", **read_kwargs
+            )
+        ]
+        self.assertTrue(np.array_equal(np.concatenate(blocks), expected["signal"]))
+
+        # raise errors
+        with self.assertRaises(ValueError):
+            HDFReadData(_bf, brd, ch, engine="processes", **read_kwargs)
+
+    @with_bf
+    def test_profiling(self, _bf: File):
+        """Test the read phases are reported to `bapsflib.profile`."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 40})
+        self.f.add_module("6K Compumotor", {"n_configs": 1, "sn_size": 50})
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        _bf._map_file()  # re-map file
+        dset_path = f"/{self.digitizer_path}/{digi}/{config_name} [{brd}:{ch}]"
+
+        with profile() as prof:
+            data = HDFReadData(
+                _bf,
+                brd,
+                ch,
+                shotnum=[5, 6, 7],
+                digitizer=digi,
+                config_name=config_name,
+                add_controls=["6K Compumotor"],
+            )
+
+        self.assertEqual(
+            set(prof.spans),
+            {
+                "read data",
+                "mapping lookup",
+                "shotnum conditioning",
+                "control read",
+                "signal read",
+                "conversion",
+            },
+        )
+        self.assertEqual(prof.spans["read data"]["calls"], 1)
+        self.assertEqual(prof.bytes_read[dset_path], 3 * 40 * 2)
+        self.assertIn("shotnum index", prof.cache_stats)
+        read_data_span = next(event for event in prof.events if event.name == "read data")
+        self.assertEqual(read_data_span.attrs, {"board": brd, "channel": ch})
+        signal_span = next(event for event in prof.events if event.name == "signal read")
+        self.assertEqual(signal_span.attrs["dataset"], dset_path)
+        self.assertLessEqual(read_data_span.start_ns, signal_span.start_ns)
+
+        # shot number index is cached
+        with profile() as prof:
+            HDFReadData(_bf, brd, ch, shotnum=[5, 6, 7], digitizer=digi)
+        self.assertGreater(prof.cache_stats["shotnum index"]["hits"], 0)
+
+        # nothing is reported outside the profile
+        with mock.patch("bapsflib.utils.profiling._emit") as mock_emit:
+            HDFReadData(_bf, brd, ch, digitizer=digi)
+            mock_emit.assert_not_called()
+
+        # `timeit` is deprecated
+        with self.assertWarns(FutureWarning):
+            HDFReadData(_bf, brd, ch, digitizer=digi, timeit=True)
+        self.assertTrue(np.array_equal(data["shotnum"], [5, 6, 7]))
+
+    @with_bf
+    def test_plasma(self, _bf: File):
+        """Test setting the plasma parameters with scalars and arrays."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 10, "nt": 40})
+        _mod = self.f.modules["SIS 3301"]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        _bf._map_file()  # re-map file
+        data = HDFReadData(_bf, brd, ch, digitizer="SIS 3301")
+        args = {"kTe": 5.0, "kTi": 1.0, "m_i": 4.0 * core.MP, "n_e": 1.0e12, "Z": 1}
+
+        # scalars
+        data.set_plasma(Bo=1000.0, **args)
+        self.assertIsInstance(data.plasma["Bo"], core.FloatUnit)
+        self.assertIsInstance(data.plasma["Z"], core.IntUnit)
+        self.assertIsInstance(data.plasma["fce"], core.FloatUnit)
+        self.assertEqual(data.plasma["fce"], core.fce(1000.0))
+        self.assertEqual(data.plasma["kT"], 5.0)
+
+        # per-shot arrays
+        Bo = np.linspace(500.0, 1500.0, data.shape[0]) * u.G
+        data.set_plasma(Bo=Bo, **args)
+        self.assertIsInstance(data.plasma["Bo"], u.Quantity)
+        self.assertEqual(data.plasma["n_e"].unit, u.cm**-3)
+        self.assertEqual(data.plasma["fce"].shape, (10,))
+        self.assertTrue(u.allclose(data.plasma["fce"], vectorized.fce(Bo)))
+        self.assertTrue(
+            u.allclose(data.plasma["VA"], vectorized.VA(Bo, n_i=1.0e12, **args))
+        )
+        self.assertEqual(data.plasma["fpe"].shape, ())
+
+        # re-define a base value
+        data.set_plasma_value("n_e", np.full(10, 2.0e12))
+        self.assertTrue(u.allclose(data.plasma["n_i"], 2.0e12 * u.cm**-3))
+        self.assertTrue(u.allclose(data.plasma["fpe"], vectorized.fpe(2.0e12)))
+        data.set_plasma_value("kTe", 10.0 * u.eV)
+        self.assertTrue(u.allclose(data.plasma["vTe"], vectorized.vTe(10.0)))
+
+    @with_bf
+    def test_add_msi(self, _bf: File):
+        """Test merging MSI diagnostic data with keyword `add_msi`."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 40})
+        self.f.add_module("Discharge")
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+
+        # re-fill 'Discharge' with (unsorted) shot numbers 10 to 60
+        rng = np.random.default_rng(0)
+        gpath = f"/{self.msi_path}/Discharge"
+        summary = self.fill_discharge(rng.permutation(np.arange(10, 61)))
+        _bf._map_file()  # re-map file
+        peak_current = dict(zip(summary["Shot number"], summary["Peak current"]))
+        meta_fields = ("timestamp", "data valid", "pulse length", "peak current")
+        meta_fields += ("bank voltage",)
+
+        # -- select fields                                          ----
+        with profile() as prof:
+            data = HDFReadData(
+                _bf, brd, ch, digitizer=digi, add_msi=[("Discharge", ["peak current"])]
+            )
+        self.assertEqual(data.dtype.names, ("shotnum", "signal", "xyz", "peak current"))
+        self.assertTrue(np.array_equal(data["shotnum"], np.arange(10, 51)))
+        self.assertTrue(
+            np.array_equal(
+                data["peak current"], [peak_current[sn] for sn in data["shotnum"]]
+            )
+        )
+        self.assertIn("msi read", prof.spans)
+        for path in (f"{gpath}/Cathode-anode voltage", f"{gpath}/Discharge current"):
+            self.assertNotIn(path, prof.bytes_read)
+
+        # a single diagnostic name merges all 'meta' fields
+        data = HDFReadData(_bf, brd, ch, digitizer=digi, add_msi="Discharge")
+        self.assertEqual(data.dtype.names[3:], meta_fields)
+
+        # signal fields can be merged too
+        data = HDFReadData(
+            _bf,
+            brd,
+            ch,
+            shotnum=[12, 15],
+            digitizer=digi,
+            add_msi=("Discharge", "current"),
+        )
+        self.assertEqual(data.dtype["current"].shape, (20,))
+        dset = self.f[f"{gpath}/Discharge current"]
+        for sn, current in zip(data["shotnum"], data["current"]):
+            row = np.flatnonzero(summary["Shot number"] == sn)[0]
+            self.assertTrue(np.array_equal(current, dset[row]))
+
+        # -- intersection_set=False                                 ----
+        data = HDFReadData(
+            _bf,
+            brd,
+            ch,
+            shotnum=[5, 20, 55],
+            digitizer=digi,
+            add_msi=[("Discharge", ["peak current", "data valid"])],
+            intersection_set=False,
+        )
+        self.assertTrue(np.array_equal(data["shotnum"], [5, 20, 55]))
+        self.assertTrue(np.isnan(data["peak current"][0]))
+        self.assertEqual(data["peak current"][1], peak_current[20])
+        self.assertEqual(data["peak current"][2], peak_current[55])
+        self.assertTrue(np.array_equal(data["data valid"], [0, 1, 1]))
+
+        # MSI and digitizer shot ranges do not overlap
+        data = HDFReadData(
+            _bf,
+            brd,
+            ch,
+            shotnum=[1, 2, 3],
+            digitizer=digi,
+            add_msi=[("Discharge", ["peak current", "data valid", "current"])],
+            intersection_set=False,
+        )
+        self.assertTrue(np.array_equal(data["shotnum"], [1, 2, 3]))
+        self.assertTrue(np.all(np.isnan(data["peak current"])))
+        self.assertTrue(np.array_equal(data["data valid"], [0, 0, 0]))
+        self.assertEqual(data["current"].shape, (3, 20))
+        self.assertTrue(np.all(np.isnan(data["current"])))
+        data = HDFReadData(
+            _bf,
+            brd,
+            ch,
+            shotnum=[1, 2, 3],
+            digitizer=digi,
+            add_msi="Discharge",
+            intersection_set=False,
+        )
+        self.assertEqual(data.dtype.names[3:], meta_fields)
+        self.assertTrue(np.all(np.isnan(data["peak current"])))
+
+        # -- read_many and iter_blocks                              ----
+        add_msi = [("Discharge", ["peak current"])]
+        expected = HDFReadData(_bf, brd, ch, digitizer=digi, add_msi=add_msi)
+        (data,) = HDFReadData.read_many(_bf, [(brd, ch)], digitizer=digi, add_msi=add_msi)
+        for field in ("shotnum", "signal", "peak current"):
+            self.assertTrue(np.array_equal(data[field], expected[field]))
+        blocks = [
+            block.copy()
+            for block in HDFReadData.iter_blocks(
+                _bf, brd, ch, chunk_shots=7, digitizer=digi, add_msi=add_msi
+            )
+        ]
+        data = np.concatenate(blocks)
+        for field in ("shotnum", "signal", "peak current"):
+            self.assertTrue(np.array_equal(data[field], expected[field]))
+
+        # -- errors                                                 ----
+        for add_msi, error in (
+            ("Not Diagnostic", ValueError),
+            (["Discharge", "Discharge"], ValueError),
+            ([("Discharge", ["not a field"])], ValueError),
+            (5, TypeError),
+            ([5], TypeError),
+        ):
+            with self.subTest(add_msi=add_msi), self.assertRaises(error):
+                HDFReadData(_bf, brd, ch, digitizer=digi, add_msi=add_msi)
+
+        # no shot numbers in common
+        with self.assertRaises(ValueError):
+            HDFReadData(_bf, brd, ch, shotnum=[1, 2], digitizer=digi, add_msi="Discharge")
+
+        # invalid fields still raise without shot numbers in common
+        with self.assertRaises(ValueError):
+            HDFReadData(
+                _bf,
+                brd,
+                ch,
+                shotnum=[1, 2],
+                digitizer=digi,
+                add_msi=[("Discharge", ["not a field"])],
+                intersection_set=False,
+            )
+
+    @with_bf
+    def test_where(self, _bf: File):
+        """Test selecting shots with the `where` predicates."""
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 40})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        self.f.add_module("Discharge")
+        _mod = self.f.modules["SIS 3301"]
+        digi = "SIS 3301"
+        config_name = _mod.knobs.active_config[0]
+        brd, ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        self.fill_discharge(np.arange(10, 61))
+        _bf._map_file()  # re-map file
+        dset_path = f"/{self.digitizer_path}/{digi}/{config_name} [{brd}:{ch}]"
+        kwargs = {
+            "digitizer": digi,
+            "add_controls": ["6K Compumotor"],
+            "add_msi": [("Discharge", ["peak current"])],
+        }
+        full = HDFReadData(_bf, brd, ch, **kwargs)
+
+        # -- predicates                                             ----
+        def even(d):
+            return d["shotnum"] % 2 == 0
+
+        _conditions = [
+            # (where, mask)
+            (("peak current", ">", 0.5), full["peak current"] > 0.5),
+            (("shotnum", "in", [12, 13, 40]), np.isin(full["shotnum"], [12, 13, 40])),
+            (even, full["shotnum"] % 2 == 0),
+            (
+                [("peak current", "<=", 0.5), even],
+                (full["peak current"] <= 0.5) & (full["shotnum"] % 2 == 0),
+            ),
+        ]
+        for where, mask in _conditions:
+            with self.subTest(where=where):
+                with profile() as prof:
+                    data = HDFReadData(_bf, brd, ch, where=where, **kwargs)
+                self.assertIn("shot filtering", prof.spans)
+                for field in ("shotnum", "signal", "peak current"):
+                    self.assertTrue(np.array_equal(data[field], full[field][mask]))
+
+                # only the selected digitizer rows are read
+                self.assertEqual(prof.bytes_read[dset_path], mask.sum() * 40 * 2)
+
+        # -- intersection_set=False                                 ----
+        # - NaN filled shots do not satisfy the comparison
+        data = HDFReadData(
+            _bf,
+            brd,
+            ch,
+            shotnum=[5, 20, 55],
+            intersection_set=False,
+            where=("peak current", ">=", 0.0),
+            **kwargs,
+        )
+        self.assertTrue(np.array_equal(data["shotnum"], [20, 55]))
+        self.assertTrue(np.array_equal(data["signal"][0], full["signal"][10]))
+        self.assertTrue(np.all(np.isnan(data["signal"][1])))
+
+        # -- read_many and iter_blocks                              ----
+        where = ("peak current", ">", 0.5)
+        expected = HDFReadData(_bf, brd, ch, where=where, **kwargs)
+        (data,) = HDFReadData.read_many(_bf, [(brd, ch)], where=where, **kwargs)
+        for field in ("shotnum", "signal", "xyz", "peak current"):
+            self.assertTrue(np.array_equal(data[field], expected[field]))
+        data = np.concatenate(
+            [
+                block.copy()
+                for block in HDFReadData.iter_blocks(
+                    _bf, brd, ch, chunk_shots=7, where=where, **kwargs
+                )
+            ]
+        )
+        for field in ("shotnum", "signal", "xyz", "peak current"):
+            self.assertTrue(np.array_equal(data[field], expected[field]))
+
+        # -- errors                                                 ----
+        for where, error in (
+            (5, TypeError),
+            ([("peak current", ">")], TypeError),
+            (("peak current", "~", 1.0), ValueError),
+            (("not a field", ">", 1.0), ValueError),
+            (lambda d: d["xyz"] > 0, ValueError),
+            (lambda d: d["shotnum"], ValueError),
+            (("peak current", ">", 2.0), ValueError),
+        ):
+            with self.subTest(where=where), self.assertRaises(error):
+                HDFReadData(_bf, brd, ch, where=where, **kwargs)
+
+    def fill_discharge(self, shotnum: np.ndarray) -> np.ndarray:
+        """
+        Re-fill the 'Discharge' MSI datasets with the shot numbers
+        ``shotnum`` and random data, returning the 'Discharge summary'
+        data.
+        """
+        rng = np.random.default_rng(0)
+        size = shotnum.size
+        gpath = f"/{self.msi_path}/Discharge"
+        summary = np.empty(size, dtype=self.f[f"{gpath}/Discharge summary"].dtype)
+        summary["Shot number"] = shotnum
+        for field in ("Timestamp", "Pulse length", "Peak current", "Bank voltage"):
+            summary[field] = rng.random(size)
+        summary["Data valid"] = 1
+        for dset_name, data in (
+            ("Cathode-anode voltage", rng.random((size, 20), dtype=np.float32)),
+            ("Discharge current", rng.random((size, 20), dtype=np.float32)),
+            ("Discharge summary", summary),
+        ):
+            del self.f[f"{gpath}/{dset_name}"]
+            self.f[gpath].create_dataset(dset_name, data=data)
+
+        return summary
+
     def assertControlInData(
         self, cdata: HDFReadControls, data: HDFReadData, shotnum: np.ndarray
     ):
@@ -19,6 +19,7 @@ from bapsflib._hdf.utils.file import File
 from bapsflib._hdf.utils.hdfreadmsi import HDFReadMSI
 from bapsflib._hdf.utils.tests import TestBase
 from bapsflib.utils.decorators import with_bf
+from bapsflib.utils.profiling import profile
 
 
 class TestHDFReadMSI(TestBase):
@@ -113,6 +114,87 @@ class TestHDFReadMSI(TestBase):
         _map = _bf.file_map.msi["Interferometer array"]
         self.assertDataObj(self.read(_bf, "Interferometer array"), _bf, _map)
 
+    @with_bf
+    def test_read_selective(self, _bf: File):
+        """Test reading only the requested shot numbers and fields."""
+        # Using 'Interferometer array' as a test case
+        # - re-fill datasets with 20 shots and random data
+        self.f.add_module("Interferometer array")
+        rng = np.random.default_rng(0)
+        for name in self.f["MSI/Interferometer array"]:
+            gpath = f"/MSI/Interferometer array/{name}"
+            trace = rng.random((20, 100), dtype=np.float32)
+            summary = np.empty(
+                20, dtype=self.f[f"{gpath}/Interferometer summary list"].dtype
+            )
+            summary["Shot number"] = np.arange(1, 21)
+            summary["Timestamp"] = rng.random(20)
+            summary["Data valid"] = 1
+            summary["Peak density"] = rng.random(20)
+            for dset_name, data in (
+                ("Interferometer trace", trace),
+                ("Interferometer summary list", summary),
+            ):
+                del self.f[f"{gpath}/{dset_name}"]
+                self.f[gpath].create_dataset(dset_name, data=data)
+        _bf._map_file()  # re-map file
+        _map = _bf.file_map.msi["Interferometer array"]
+        full = self.read(_bf, "Interferometer array")
+        self.assertEqual(full.shape, (20,))
+
+        # -- `shotnum`                                              ----
+        with profile() as prof:
+            data = HDFReadMSI(_bf, "Interferometer array", shotnum=[2, 6, 7, 8])
+        self.assertEqual(data.dtype, full.dtype)
+        self.assertTrue(np.array_equal(data, full[[1, 5, 6, 7]]))
+        self.assertEqual(data.info, full.info)
+
+        # only the requested rows were read
+        for path in _map.configs["signals"]["signal"]["dset paths"]:
+            self.assertEqual(prof.bytes_read[path], 4 * 100 * 4)
+
+        # shot numbers not recorded are dropped
+        data = HDFReadMSI(_bf, "Interferometer array", shotnum=np.array([1, 30]))
+        self.assertTrue(np.array_equal(data, full[:1]))
+        data = HDFReadMSI(_bf, "Interferometer array", shotnum=slice(3, 6))
+        self.assertTrue(np.array_equal(data["shotnum"], [3, 4, 5]))
+
+        # -- `fields`                                               ----
+        data = HDFReadMSI(
+            _bf,
+            "Interferometer array",
+            shotnum=[2, 3],
+            fields=["peak density", "timestamp"],
+        )
+        self.assertEqual(data.dtype.names, ("shotnum", "meta"))
+        self.assertEqual(data.dtype["meta"].base.names, ("timestamp", "peak density"))
+        for field in ("timestamp", "peak density"):
+            self.assertTrue(np.array_equal(data["meta"][field], full["meta"][field][1:3]))
+
+        data = HDFReadMSI(_bf, "Interferometer array", fields="signal")
+        self.assertEqual(data.dtype.names, ("shotnum", "signal"))
+        self.assertTrue(np.array_equal(data["signal"], full["signal"]))
+
+        # -- `meta_only`                                            ----
+        with profile() as prof:
+            data = HDFReadMSI(_bf, "Interferometer array", meta_only=True)
+        self.assertEqual(data.dtype.names, ("shotnum", "meta"))
+        self.assertTrue(np.array_equal(data["meta"], full["meta"]))
+        for path in _map.configs["signals"]["signal"]["dset paths"]:
+            self.assertNotIn(path, prof.bytes_read)
+
+        # -- errors                                                 ----
+        with self.assertRaises(ValueError):
+            HDFReadMSI(_bf, "Interferometer array", fields=["not a field"])
+        with self.assertRaises(ValueError):
+            HDFReadMSI(_bf, "Interferometer array", fields=["signal"], meta_only=True)
+        with self.assertRaises(ValueError):
+            HDFReadMSI(_bf, "Interferometer array", fields=[])
+        with self.assertRaises(ValueError):
+            HDFReadMSI(_bf, "Interferometer array", shotnum=[30])
+        with self.assertRaises(ValueError):
+            HDFReadMSI(_bf, "Interferometer array", shotnum=[-1])
+
     def assertDataObj(self, _data: HDFReadMSI, _bf, _map):
         # data is a structured numpy array
         self.assertIsInstance(_data, np.ndarray)
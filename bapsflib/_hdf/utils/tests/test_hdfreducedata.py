@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+
+from h5py import Dataset
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData
+from bapsflib._hdf.utils.hdfreducedata import HDFReduceData
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+class TestHDFReduceData(TestBase):
+    """Test class for HDFReduceData"""
+
+    def setUp(self):
+        super().setUp()
+
+        # setup digitizer and 6K Compumotor
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 60, "nt": 16})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 60, "n_motionlists": 1}
+        )
+        _mod = self.f.modules["SIS 3301"]
+        self.digi = "SIS 3301"
+        self.config_name = _mod.knobs.active_config[0]
+        self.brd, self.ch = (int(val[0]) for val in np.where(_mod.knobs.active_brdch))
+        self.sixk_cspec = self.f.modules["6K Compumotor"].config_names[0]
+
+        # fill digitizer signal with random values
+        rng = np.random.default_rng(7)
+        dset_path = (
+            f"{self.digitizer_path}/{self.digi}/"
+            f"{self.config_name} [{self.brd}:{self.ch}]"
+        )
+        self.f[dset_path][...] = rng.integers(-500, 500, size=(60, 16), dtype=np.int16)
+
+        # define 8 probe positions, with several shots at each position
+        sixk_group = self.f[f"{self.control_path}/6K Compumotor"]
+        sixk_dset = sixk_group[
+            next(name for name in sixk_group if isinstance(sixk_group[name], Dataset))
+        ]
+        data = sixk_dset[...]
+        data["x"] = np.tile([-1.0, 0.0, 1.0, 2.0], 15)
+        data["y"] = np.repeat([0.5, -0.5], 30)
+        data["z"] = 0.0
+        sixk_dset[...] = data
+
+    @property
+    def read_kwargs(self):
+        return {
+            "digitizer": self.digi,
+            "config_name": self.config_name,
+            "add_controls": [("6K Compumotor", self.sixk_cspec)],
+        }
+
+    def assertStats(self, rdata: HDFReduceData, data: HDFReadData, stats):
+        keys, inverse = np.unique(data["xyz"], axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        self.assertEqual(rdata.shape, (keys.shape[0],))
+        self.assertTrue(np.array_equal(rdata["xyz"], keys))
+
+        signal = data["signal"].astype(np.float64)
+        for ii in range(keys.shape[0]):
+            group = signal[inverse == ii]
+            self.assertEqual(rdata["count"][ii], group.shape[0])
+            for stat in stats:
+                expected = getattr(np, stat)(group, axis=0)
+                self.assertTrue(np.allclose(rdata[stat][ii], expected, rtol=1e-10))
+
+    @with_bf
+    def test_reduce(self, _bf: File):
+        _bf._map_file()  # re-map file
+        data = HDFReadData(_bf, self.brd, self.ch, **self.read_kwargs)
+
+        _conditions = [
+            # (stats, chunk_shots)
+            (("mean", "var"), 1000),
+            (("mean", "var"), 7),
+            (("mean", "var", "std", "min", "max"), 1),
+            (("max", "mean"), 16),
+        ]
+        for stats, chunk_shots in _conditions:
+            with self.subTest(stats=stats, chunk_shots=chunk_shots):
+                rdata = HDFReduceData(
+                    _bf,
+                    self.brd,
+                    self.ch,
+                    stats=stats,
+                    chunk_shots=chunk_shots,
+                    **self.read_kwargs,
+                )
+                self.assertIsInstance(rdata, HDFReduceData)
+                self.assertEqual(rdata.dtype.names, ("xyz", "count") + stats)
+                self.assertEqual(rdata.info["group by"], "xyz")
+                self.assertEqual(rdata.info["stats"], stats)
+                self.assertEqual(rdata.info["nshots"], 60)
+                self.assertEqual(rdata.info["board"], self.brd)
+                self.assertStats(rdata, data, stats)
+
+        # stats as a string
+        rdata = HDFReduceData(_bf, self.brd, self.ch, stats="mean", **self.read_kwargs)
+        self.assertEqual(rdata.dtype.names, ("xyz", "count", "mean"))
+
+        # reduce a subset of shots and time samples
+        kwargs = {"shotnum": slice(5, 40), "time_index": slice(2, 10)}
+        data = HDFReadData(_bf, self.brd, self.ch, **self.read_kwargs, **kwargs)
+        rdata = HDFReduceData(
+            _bf, self.brd, self.ch, chunk_shots=6, **self.read_kwargs, **kwargs
+        )
+        self.assertEqual(rdata.info["nshots"], 35)
+        self.assertEqual(rdata["mean"].shape, (8, 8))
+        self.assertStats(rdata, data, ("mean", "var"))
+
+        # group by a scalar field
+        rdata = HDFReduceData(
+            _bf,
+            self.brd,
+            self.ch,
+            group_by="shotnum",
+            chunk_shots=9,
+            digitizer=self.digi,
+            config_name=self.config_name,
+        )
+        self.assertEqual(rdata.shape, (60,))
+        self.assertTrue(np.array_equal(rdata["shotnum"], np.arange(1, 61)))
+        self.assertTrue(np.all(rdata["var"] == 0.0))
+
+    @with_bf
+    def test_raises(self, _bf: File):
+        _bf._map_file()  # re-map file
+
+        _conditions = [
+            # (_raises, kwargs)
+            (TypeError, {"stats": ()}),
+            (TypeError, {"stats": [1, 2]}),
+            (ValueError, {"stats": ("mean", "median")}),
+            (ValueError, {"stats": ("mean", "mean")}),
+            (ValueError, {"group_by": "not a field"}),
+            (TypeError, {"group_by": 5}),
+            (TypeError, {"group_by": 5, "index": np.array([], dtype=int)}),
+            (ValueError, {"index": np.array([], dtype=int)}),
+            (ValueError, {"chunk_shots": 0}),
+            (TypeError, {"intersection_set": False}),
+        ]
+        for _raises, kwargs in _conditions:
+            with self.subTest(kwargs=kwargs), self.assertRaises(_raises):
+                HDFReduceData(_bf, self.brd, self.ch, **self.read_kwargs, **kwargs)
+
+        # hdf_file not a File
+        with self.assertRaises(TypeError):
+            HDFReduceData(self.f, self.brd, self.ch)
@@ -14,8 +14,9 @@
 import numpy as np
 import unittest as ut
 
-from h5py import Group
+from h5py import Dataset, Group
 from numpy.lib import recfunctions as rfn
+from unittest import mock
 
 from bapsflib._hdf.maps.controls.waveform import HDFMapControlWaveform
 from bapsflib._hdf.maps.digitizers.tests.fauxlecroy180e import FauxLeCroy180E
@@ -25,7 +26,10 @@ from bapsflib._hdf.utils.helpers import (
     condition_controls,
     condition_shotnum,
     do_shotnum_intersection,
+    HYPERSLAB_MIN_RUN_LENGTH,
+    read_dset_rows,
 )
+from bapsflib._hdf.utils.shotnum_cache import ShotnumIndexCache
 from bapsflib._hdf.utils.tests import TestBase
 from bapsflib.utils import _bytes_to_str
 from bapsflib.utils.decorators import with_bf
@@ -525,6 +529,124 @@ class TestBuildShotnumDsetRelation(TestBase):
                 self.assertTrue(np.allclose(shotnum[sni], expected_shotnums))
                 self.assertTrue(np.allclose(index, expected_index))
 
+    def test_index_cache(self):
+        """
+        Test the cached shot number index and the fast path for
+        datasets with sorted shot numbers.
+        """
+        shotnum_dtype = np.dtype([("Shot number", np.uint32), ("Config", "S7")])
+        sorted_sn = np.arange(1, 5001, dtype=np.uint32)
+        zero_padded_sn = np.append(np.zeros(50, dtype=np.uint32), sorted_sn[:4950])
+        unsorted_sn = sorted_sn.copy()
+        unsorted_sn[10:20] = unsorted_sn[10:20][::-1]
+
+        _conditions = [
+            # (name, shot numbers, configs, n_configs, is sorted)
+            ("sorted", sorted_sn, [b"config"], 1, True),
+            ("zero padded", zero_padded_sn, [b"config"], 1, True),
+            ("unsorted", unsorted_sn, [b"config"], 1, False),
+            (
+                "two configs",
+                np.repeat(sorted_sn[:2500], 2),
+                [b"config", b"other"],
+                2,
+                False,
+            ),
+        ]
+        shotnums = [
+            np.array([1, 2, 3], dtype=np.uint32),
+            np.array([7, 15, 2600, 4999, 5000, 6000], dtype=np.uint32),
+            np.arange(1, 6000, 3, dtype=np.uint32),
+        ]
+        for name, dset_sn, configs, n_configs, is_sorted in _conditions:
+            data = np.empty(dset_sn.size, dtype=shotnum_dtype)
+            data["Shot number"] = dset_sn
+            data["Config"] = np.resize(configs, dset_sn.size)
+            dset = self.f.create_dataset(name, data=data)
+            kwargs = {
+                "dset": dset,
+                "shotnumkey": "Shot number",
+                "n_configs": n_configs,
+                "config_column_value": "config",
+                "config_column": "Config",
+            }
+
+            cache_key = ("/" + name, "Shot number", "Config", "config")
+            for max_bytes in (ShotnumIndexCache.DEFAULT_MAX_BYTES, 0):
+                index_cache = ShotnumIndexCache(max_bytes=max_bytes)
+                for ii, shotnum in enumerate(shotnums * 2):
+                    with self.subTest(
+                        name=name, max_bytes=max_bytes, shotnum=shotnum, ii=ii
+                    ):
+                        self.assertIndexCache(shotnum, kwargs, index_cache)
+                        self.assertEqual(index_cache.is_searchable(cache_key), is_sorted)
+                        self.assertEqual(cache_key in index_cache, max_bytes > 0)
+
+            # a cached index does not read the dataset
+            getitem = Dataset.__getitem__
+            reads = []
+
+            def counted_getitem(_dset, *args, **kw):
+                reads.append(args)
+                return getitem(_dset, *args, **kw)
+
+            with mock.patch.object(Dataset, "__getitem__", counted_getitem):
+                index_cache = ShotnumIndexCache()
+                build_shotnum_dset_relation(
+                    shotnum=shotnums[1], index_cache=index_cache, **kwargs
+                )
+                self.assertTrue(len(reads) > 0)
+                reads.clear()
+
+                build_shotnum_dset_relation(
+                    shotnum=shotnums[2], index_cache=index_cache, **kwargs
+                )
+                self.assertEqual(reads, [])
+
+            # an evicted sorted dataset only reads O(k log n) shot numbers
+            if is_sorted:
+                index_cache.max_bytes = 0
+                with mock.patch(
+                    f"{build_shotnum_dset_relation.__module__}.read_dset_rows",
+                    wraps=read_dset_rows,
+                ) as mock_read:
+                    build_shotnum_dset_relation(
+                        shotnum=shotnums[1], index_cache=index_cache, **kwargs
+                    )
+                    nread = sum(
+                        np.size(call.args[1]) for call in mock_read.call_args_list
+                    )
+                    self.assertTrue(mock_read.called)
+                    self.assertLessEqual(nread, 6 * (np.log2(dset.shape[0]) + 2))
+
+        # dataset without a shot number column
+        dset = self.f.create_dataset("no shotnum", data=np.zeros((10, 2)))
+        index, sni = build_shotnum_dset_relation(
+            shotnum=np.array([2, 5, 11], dtype=np.uint32),
+            dset=dset,
+            shotnumkey=None,
+            n_configs=1,
+            config_column_value=None,
+            index_cache=ShotnumIndexCache(),
+        )
+        self.assertTrue(np.array_equal(index, [1, 4]))
+        self.assertTrue(np.array_equal(sni, [True, True, False]))
+
+    def assertIndexCache(self, shotnum, kwargs, index_cache):
+        """
+        Assert `build_shotnum_dset_relation` gives the same result with
+        and without ``index_cache``.
+        """
+        dset = kwargs["dset"]
+        expected = build_shotnum_dset_relation(shotnum=shotnum, **kwargs)
+        index, sni = build_shotnum_dset_relation(
+            shotnum=shotnum, index_cache=index_cache, **kwargs
+        )
+        self.assertTrue(np.array_equal(index, expected[0]))
+        self.assertTrue(np.array_equal(sni, expected[1]))
+        self.assertTrue(np.array_equal(shotnum[sni], np.sort(dset["Shot number"][index])))
+        self.assertTrue(np.all(dset["Config"][index] == b"config"))
+
 
 class TestConditionControls(TestBase):
     """Test Case for condition_controls"""
@@ -1017,3 +1139,82 @@ class TestDoShotnumIntersection(ut.TestCase):
 
 if __name__ == "__main__":
     ut.main()
+
+
+class TestReadDsetRows(TestBase):
+    """Test Case for read_dset_rows"""
+
+    def setUp(self):
+        super().setUp()
+        self.data = np.arange(200 * 12, dtype=np.int16).reshape(200, 12)
+        self.f.create_dataset("signal", data=self.data)
+        header = np.empty(200, dtype=[("Shot", np.uint32), ("Offset", np.float64)])
+        header["Shot"] = np.arange(1, 201, dtype=np.uint32)
+        header["Offset"] = -2.5
+        self.header = header
+        self.f.create_dataset("header", data=header)
+
+    def test_read(self):
+        n = HYPERSLAB_MIN_RUN_LENGTH
+        _conditions = [
+            # (label, index)
+            ("single run", np.arange(10, 150)),
+            ("few runs", np.concatenate((np.arange(0, 3 * n), np.arange(100, 200)))),
+            ("scattered", np.arange(0, 200, 3)),
+            ("single index", np.array([57])),
+            ("empty", np.array([], dtype=np.intp)),
+        ]
+        for label, index in _conditions:
+            with self.subTest(label=label):
+                # no field
+                arr = read_dset_rows(self.f["signal"], index)
+                self.assertTrue(np.array_equal(arr, self.data[index, ...]))
+                self.assertEqual(arr.dtype, self.data.dtype)
+
+                # structured field
+                arr = read_dset_rows(self.f["header"], index, field="Shot")
+                self.assertTrue(np.array_equal(arr, self.header["Shot"][index]))
+
+                # multiple structured fields
+                arr = read_dset_rows(self.f["header"], index, field=["Offset", "Shot"])
+                self.assertEqual(arr.dtype.names, ("Offset", "Shot"))
+                for name in arr.dtype.names:
+                    self.assertTrue(np.array_equal(arr[name], self.header[name][index]))
+                arr = read_dset_rows(self.f["header"], index, field=["Shot"])
+                self.assertEqual(arr.dtype.names, ("Shot",))
+                self.assertTrue(np.array_equal(arr["Shot"], self.header["Shot"][index]))
+
+                # C-contiguous output array w/ type conversion
+                out = np.empty((index.size, 12), dtype=np.float32)
+                arr = read_dset_rows(self.f["signal"], index, out=out)
+                self.assertIs(arr, out)
+                self.assertTrue(np.array_equal(out, self.data[index, ...]))
+
+                # non-contiguous output array (field of structured array)
+                sarr = np.zeros(
+                    index.size, dtype=[("a", np.int8), ("b", np.float32, (12,))]
+                )
+                read_dset_rows(self.f["signal"], index, out=sarr["b"])
+                self.assertTrue(np.array_equal(sarr["b"], self.data[index, ...]))
+
+    def test_hyperslab_coalescing(self):
+        """Consecutive indices should be read as a few hyperslabs."""
+        dset = self.f["signal"]
+        index = np.concatenate((np.arange(5, 50), np.arange(120, 180)))
+        out = np.empty((index.size, 12), dtype=np.int16)
+        with mock.patch.object(
+            type(dset), "read_direct", autospec=True, side_effect=type(dset).read_direct
+        ) as mock_rd:
+            read_dset_rows(dset, index, out=out)
+            self.assertEqual(mock_rd.call_count, 2)
+        self.assertTrue(np.array_equal(out, self.data[index, ...]))
+
+    def test_raises(self):
+        _conditions = [
+            np.array([[1, 2], [3, 4]]),  # not 1D
+            np.array([4, 3, 5]),  # not increasing
+            np.array([3, 3, 4]),  # duplicates
+        ]
+        for index in _conditions:
+            with self.subTest(index=index), self.assertRaises(ValueError):
+                read_dset_rows(self.f["signal"], index)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import astropy.units as u
+import json
+import numpy as np
+import os
+import pickle
+import re
+import tempfile
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.maps.controls.sixk import HDFMapControl6K
+from bapsflib._hdf.maps.templates import _HDFObjectPath
+from bapsflib._hdf.utils.map_cache import (
+    invalidate_map_cache,
+    load_map_cache,
+    MAP_CACHE_DIR_ENV,
+    map_cache_path,
+    save_map_cache,
+)
+
+
+class TestMapCache(ut.TestCase):
+    """Test Case for the mapping cache functions."""
+
+    def setUp(self):
+        super().setUp()
+        self._tempdir = tempfile.TemporaryDirectory(prefix="map-cache-test_")
+        self.filename = os.path.join(self._tempdir.name, "run.hdf5")
+        with open(self.filename, "wb") as file:
+            file.write(b"not really HDF5")
+
+        self.device_paths = {"control": "/", "digitizer": "/", "msi": "MSI"}
+        self.state = {"maps": {"msi": {}}, "info": {"file": "run.hdf5"}}
+
+        # make sure the user cache directory is not touched
+        self._env = mock.patch.dict(
+            os.environ, {"XDG_CACHE_HOME": os.path.join(self._tempdir.name, "cache")}
+        )
+        self._env.start()
+        os.environ.pop(MAP_CACHE_DIR_ENV, None)
+
+    def tearDown(self):
+        self._env.stop()
+        self._tempdir.cleanup()
+        super().tearDown()
+
+    def test_map_cache_path(self):
+        path = map_cache_path(self.filename)
+        self.assertTrue(
+            path.startswith(os.path.join(self._tempdir.name, "cache", "bapsflib"))
+        )
+
+        # path depends on the absolute file path
+        self.assertNotEqual(
+            map_cache_path(self.filename),
+            map_cache_path(os.path.join(self._tempdir.name, "run2.hdf5")),
+        )
+
+        # forced cache directory
+        cache_dir = os.path.join(self._tempdir.name, "forced")
+        with mock.patch.dict(os.environ, {MAP_CACHE_DIR_ENV: cache_dir}):
+            self.assertEqual(os.path.dirname(map_cache_path(self.filename)), cache_dir)
+
+    def test_save_load(self):
+        # nothing cached
+        self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # cache round trip
+        self.assertTrue(save_map_cache(self.filename, self.device_paths, self.state))
+        self.assertTrue(os.path.exists(map_cache_path(self.filename)))
+        self.assertEqual(load_map_cache(self.filename, self.device_paths), self.state)
+
+        # nothing is written next to the HDF5 file
+        self.assertEqual(sorted(os.listdir(self._tempdir.name)), ["cache", "run.hdf5"])
+
+        # different device paths
+        self.assertIsNone(
+            load_map_cache(self.filename, {**self.device_paths, "msi": "/"})
+        )
+
+        # file changed
+        with open(self.filename, "ab") as file:
+            file.write(b"more data")
+        self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # file modification time changed
+        save_map_cache(self.filename, self.device_paths, self.state)
+        stat = os.stat(self.filename)
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # bapsflib version changed
+        save_map_cache(self.filename, self.device_paths, self.state)
+        with mock.patch("bapsflib.__version__", "not a version"):
+            self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # corrupt cache entry
+        with open(map_cache_path(self.filename), "wb") as file:
+            file.write(b"garbage")
+        self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # file does not exist
+        missing = os.path.join(self._tempdir.name, "missing.hdf5")
+        self.assertIsNone(load_map_cache(missing, self.device_paths))
+        self.assertFalse(save_map_cache(missing, self.device_paths, self.state))
+
+        # state can not be cached
+        for state in (
+            {"maps": lambda: None},
+            {"maps": os.system},
+            {"maps": tempfile.TemporaryDirectory},
+            {"maps": np.array([None], dtype=object)},
+        ):
+            with self.subTest(state=state):
+                self.assertFalse(save_map_cache(self.filename, self.device_paths, state))
+
+        # no cache directory writable
+        with mock.patch(
+            "bapsflib._hdf.utils.map_cache.tempfile.mkstemp",
+            side_effect=PermissionError("read-only directory"),
+        ):
+            self.assertFalse(save_map_cache(self.filename, self.device_paths, self.state))
+
+    def test_state_types(self):
+        state = {
+            "maps": {
+                "control": {
+                    "6K Compumotor": (
+                        HDFMapControl6K,
+                        {
+                            "_configs": {
+                                3: {
+                                    "dset paths": (_HDFObjectPath("/a/b"),),
+                                    "dtype": np.uint32,
+                                    "field dtype": np.dtype([("x", "<f8", (3,))]),
+                                    "center": np.array([1.0, np.nan]),
+                                    "count": np.uint32(7),
+                                    "port": np.uint8(5),
+                                    "name": np.bytes_(b"probe"),
+                                    "clock rate": 100.0 * u.MHz,
+                                    "pattern": re.compile(r"(?P<VOLT>\d+)", re.I),
+                                    "command list": [1.0, b"\x00", 1j, None, True],
+                                }
+                            }
+                        },
+                    )
+                }
+            },
+            "info": {"file": "run.hdf5"},
+        }
+        self.assertTrue(save_map_cache(self.filename, self.device_paths, state))
+        loaded = load_map_cache(self.filename, self.device_paths)
+        map_class, map_state = loaded["maps"]["control"]["6K Compumotor"]
+        self.assertIs(map_class, HDFMapControl6K)
+        config = map_state["_configs"][3]
+        expected = state["maps"]["control"]["6K Compumotor"][1]["_configs"][3]
+        for key, val in expected.items():
+            with self.subTest(key=key):
+                self.assertIs(type(config[key]), type(val))
+                if isinstance(val, np.ndarray):
+                    self.assertTrue(np.array_equal(config[key], val, equal_nan=True))
+                    self.assertEqual(config[key].dtype, val.dtype)
+                else:
+                    self.assertEqual(config[key], val)
+        self.assertEqual(loaded["info"], state["info"])
+
+    def test_no_code_execution(self):
+        save_map_cache(self.filename, self.device_paths, self.state)
+        path = map_cache_path(self.filename)
+        with open(path, "r") as file:
+            header = file.readline()
+
+        # a pickled payload is never unpickled
+        with open(path, "wb") as file:
+            file.write(header.encode("utf-8"))
+            file.write(pickle.dumps({"maps": {}, "info": {}}))
+        with mock.patch("pickle.loads") as mock_loads, mock.patch(
+            "pickle.load"
+        ) as mock_load:
+            self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+            mock_loads.assert_not_called()
+            mock_load.assert_not_called()
+
+        # only allowed types are restored
+        for module, qualname in (
+            ("os", "system"),
+            ("subprocess", "Popen"),
+            ("builtins", "eval"),
+            ("numpy", "load"),
+            ("bapsflib._hdf.utils.file", "File"),
+        ):
+            body = {"t": "type", "v": [module, qualname]}
+            with self.subTest(type=f"{module}.{qualname}"):
+                with open(path, "w") as file:
+                    file.write(header)
+                    file.write(json.dumps(body))
+                self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # the state of an entry for another file is not decoded
+        other = os.path.join(self._tempdir.name, "run2.hdf5")
+        with open(other, "wb") as file:
+            file.write(b"also not HDF5")
+        save_map_cache(other, self.device_paths, self.state)
+        os.replace(map_cache_path(other), path)
+        with mock.patch("bapsflib._hdf.utils.map_cache._decode") as mock_decode:
+            self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+            mock_decode.assert_not_called()
+
+    def test_invalidate(self):
+        save_map_cache(self.filename, self.device_paths, self.state)
+        invalidate_map_cache(self.filename)
+        self.assertFalse(os.path.exists(map_cache_path(self.filename)))
+        self.assertIsNone(load_map_cache(self.filename, self.device_paths))
+
+        # nothing to invalidate
+        invalidate_map_cache(self.filename)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import gc
+import numpy as np
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreaddata import HDFReadData, HDFReadDataColumns
+from bapsflib._hdf.utils.parallel import read_data_parallel
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+class TestReadDataParallel(TestBase):
+    """Test case for `~bapsflib._hdf.utils.parallel.read_data_parallel`."""
+
+    def setUp(self):
+        super().setUp()
+
+        # setup digitizer, 6K Compumotor, and Discharge
+        self.f.add_module("SIS 3301", {"n_configs": 1, "sn_size": 50, "nt": 16})
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 50, "n_motionlists": 1}
+        )
+        self.f.add_module("Discharge")
+        _mod = self.f.modules["SIS 3301"]
+        self.digi = "SIS 3301"
+        self.config_name = _mod.knobs.active_config[0]
+        brds, chs = np.where(_mod.knobs.active_brdch)
+        self.connections = [(int(brd), int(ch)) for brd, ch in zip(brds, chs)][:3]
+
+        # fill digitizer signals with random values
+        rng = np.random.default_rng(11)
+        for brd, ch in self.connections:
+            dset_path = (
+                f"{self.digitizer_path}/{self.digi}/{self.config_name} [{brd}:{ch}]"
+            )
+            self.f[dset_path][...] = rng.integers(
+                -500, 500, size=(50, 16), dtype=np.int16
+            )
+
+    @property
+    def read_kwargs(self):
+        return {
+            "digitizer": self.digi,
+            "config_name": self.config_name,
+            "add_controls": ["6K Compumotor"],
+        }
+
+    def assertDataEqual(self, pdata, data):
+        self.assertEqual(len(pdata), len(data))
+        for pd, dd in zip(pdata, data):
+            self.assertIsInstance(pd, HDFReadDataColumns)
+            self.assertEqual(pd.dtype, dd.dtype)
+            for name in dd.dtype.names:
+                self.assertTrue(np.array_equal(pd[name], dd[name], equal_nan=True))
+            self.assertEqual(pd.info["signal units"], dd.info["signal units"])
+            self.assertEqual(pd.info["board"], dd.info["board"])
+            self.assertEqual(pd.info["channel"], dd.info["channel"])
+
+    @with_bf
+    def test_read_in_process(self, _bf: File):
+        _bf._map_file()  # re-map file
+
+        _conditions = [
+            # (kwargs, chunk_shots)
+            ({}, None),
+            ({}, 7),
+            ({"keep_bits": True}, 9),
+            ({"shotnum": slice(5, 40), "time_index": slice(2, 10)}, 4),
+            ({"where": ("shotnum", "in", [6, 9, 30, 31])}, 3),
+            ({"shotnum": [2, 10, 60, 70], "intersection_set": False}, 1),
+            (
+                {
+                    "shotnum": [2, 10, 19251],
+                    "intersection_set": False,
+                    "add_msi": [("Discharge", ["peak current"])],
+                },
+                2,
+            ),
+        ]
+        for kwargs, chunk_shots in _conditions:
+            with self.subTest(kwargs=kwargs, chunk_shots=chunk_shots):
+                pdata = read_data_parallel(
+                    _bf,
+                    self.connections,
+                    max_workers=1,
+                    chunk_shots=chunk_shots,
+                    **self.read_kwargs,
+                    **kwargs,
+                )
+                data = HDFReadData.read_many(
+                    _bf, self.connections, **self.read_kwargs, **kwargs
+                )
+                self.assertDataEqual(pdata, data)
+
+        # 'signal' arrays outlive their containers
+        pdata = read_data_parallel(_bf, self.connections, max_workers=1)
+        signal = pdata[0]["signal"][1:]
+        expected = signal.copy()
+        del pdata
+        gc.collect()
+        self.assertTrue(np.array_equal(signal, expected))
+
+        # invalid arguments
+        for kwargs in (
+            {"max_workers": 0},
+            {"max_workers": True},
+            {"chunk_shots": -1},
+            {"chunk_shots": 2.5},
+        ):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                read_data_parallel(_bf, self.connections, **kwargs)
+
+    @with_bf
+    def test_read_process_pool(self, _bf: File):
+        _bf._map_file()  # re-map file
+
+        pdata = read_data_parallel(
+            _bf, self.connections, max_workers=2, chunk_shots=8, **self.read_kwargs
+        )
+        data = HDFReadData.read_many(_bf, self.connections, **self.read_kwargs)
+        self.assertDataEqual(pdata, data)
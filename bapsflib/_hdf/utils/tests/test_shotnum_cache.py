@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.shotnum_cache import ShotnumIndex, ShotnumIndexCache
+
+
+class TestShotnumIndexCache(ut.TestCase):
+    """Test Case for ShotnumIndexCache"""
+
+    @staticmethod
+    def index_entry(size: int, searchable=True) -> ShotnumIndex:
+        return ShotnumIndex(
+            shotnum=np.arange(1, size + 1, dtype=np.uint32),
+            config_mask=np.ones(size, dtype=bool),
+            is_sorted=True,
+            searchable=searchable,
+        )
+
+    def test_entry(self):
+        entry = self.index_entry(10)
+        self.assertEqual(entry.nbytes, 10 * 4 + 10)
+
+    def test_lru(self):
+        entry_nbytes = self.index_entry(10).nbytes
+        cache = ShotnumIndexCache(max_bytes=3 * entry_nbytes)
+        self.assertEqual(cache.max_bytes, 3 * entry_nbytes)
+
+        for key in "abc":
+            cache.put(key, self.index_entry(10, searchable=key != "b"))
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.nbytes, 3 * entry_nbytes)
+
+        # touch 'a', so 'b' is the least recently used
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("d", self.index_entry(10))
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        for key in "acd":
+            self.assertIn(key, cache)
+
+        # replacing an entry does not double count
+        cache.put("a", self.index_entry(10))
+        self.assertEqual(cache.nbytes, 3 * entry_nbytes)
+
+        # entries larger than the limit are not stored
+        cache.put("e", self.index_entry(1000))
+        self.assertNotIn("e", cache)
+        self.assertEqual(len(cache), 3)
+
+        # searchability is remembered after eviction
+        self.assertTrue(cache.is_searchable("e"))
+        self.assertFalse(cache.is_searchable("b"))
+        self.assertFalse(cache.is_searchable("not a key"))
+
+        # shrinking the limit evicts entries
+        cache.max_bytes = entry_nbytes
+        self.assertEqual(len(cache), 1)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.nbytes, entry_nbytes)
+
+        # clear
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+        self.assertFalse(cache.is_searchable("a"))
+
+    def test_raises(self):
+        for max_bytes in (-1, 1.5, True, None):
+            with self.subTest(max_bytes=max_bytes), self.assertRaises(ValueError):
+                ShotnumIndexCache(max_bytes=max_bytes)
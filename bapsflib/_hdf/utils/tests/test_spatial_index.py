@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import numpy as np
+import unittest as ut
+
+from bapsflib._hdf.utils.file import File
+from bapsflib._hdf.utils.hdfreadcontrols import HDFReadControls
+from bapsflib._hdf.utils.spatial_index import (
+    build_spatial_index,
+    condition_motion_control,
+    SpatialIndex,
+)
+from bapsflib._hdf.utils.tests import TestBase
+from bapsflib.utils.decorators import with_bf
+
+
+def rows_in(arr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Boolean mask of the rows of ``arr`` that are in ``rows``."""
+    rows = {tuple(row) for row in np.asarray(rows, dtype=np.float64).tolist()}
+    return np.array(
+        [tuple(row) in rows for row in np.asarray(arr, dtype=np.float64).tolist()],
+        dtype=bool,
+    )
+
+
+class TestSpatialIndex(ut.TestCase):
+    """Test Case for SpatialIndex"""
+
+    def setUp(self):
+        # 5 x 5 grid in the xy-plane (z = 2), 4 shots per position
+        # - shots are recorded in a shuffled order
+        x, y = np.meshgrid(np.arange(-2.0, 3.0), np.arange(-2.0, 3.0), indexing="ij")
+        positions = np.stack((x.ravel(), y.ravel(), np.full(x.size, 2.0)), axis=1)
+        self.xyz = np.repeat(positions, 4, axis=0).astype(np.float32)
+        self.shotnum = np.random.default_rng(0).permutation(np.arange(1, 101))
+
+    def brute_force(self, mask: np.ndarray) -> np.ndarray:
+        return np.sort(self.shotnum[mask])
+
+    def test_index(self):
+        sindex = SpatialIndex(self.shotnum, self.xyz, control=("6K Compumotor", 3))
+        self.assertEqual(len(sindex), 100)
+        self.assertEqual(sindex.positions.shape, (25, 3))
+        self.assertTrue(np.all(sindex.counts == 4))
+        self.assertTrue(np.array_equal(sindex.shotnum, np.arange(1, 101)))
+        self.assertEqual(sindex.control, ("6K Compumotor", 3))
+        self.assertGreater(sindex.nbytes, 0)
+
+        # shots without a position are not indexed
+        xyz = self.xyz.copy()
+        xyz[:10] = np.nan
+        sindex = SpatialIndex(self.shotnum, xyz)
+        self.assertEqual(len(sindex), 90)
+        self.assertTrue(np.array_equal(sindex.shotnum, np.sort(self.shotnum[10:])))
+
+    def test_select(self):
+        sindex = SpatialIndex(self.shotnum, self.xyz)
+        x, y, z = self.xyz.T
+        _conditions = [
+            # (region, mask)
+            ({}, np.ones(100, dtype=bool)),
+            ({"y": 0.0}, y == 0),
+            ({"x": (-1.0, 1.0)}, np.abs(x) <= 1),
+            ({"x": (None, -1.0), "y": (1.0, None)}, (x <= -1) & (y >= 1)),
+            ({"x": 0.0, "y": 0.0, "z": 2.0}, (x == 0) & (y == 0)),
+            ({"center": (0.0, 0.0), "radius": 1.0}, x**2 + y**2 <= 1),
+            (
+                {"center": (1.0, 1.0, 3.0), "radius": 1.5},
+                (x - 1) ** 2 + (y - 1) ** 2 + 1 <= 1.5**2,
+            ),
+            (
+                {"center": [0.0, 0.0], "radius": 2.0, "y": 0.0},
+                (y == 0) & (np.abs(x) <= 2),
+            ),
+            ({"z": 0.0}, np.zeros(100, dtype=bool)),
+        ]
+        for region, mask in _conditions:
+            with self.subTest(region=region):
+                shotnum = sindex.select(region)
+                self.assertTrue(np.array_equal(shotnum, self.brute_force(mask)))
+                self.assertTrue(
+                    np.array_equal(
+                        sindex.position_mask(region),
+                        rows_in(sindex.positions, self.xyz[mask]),
+                    )
+                )
+
+        # tolerance
+        self.assertEqual(sindex.select({"y": 0.01}).size, 0)
+        self.assertTrue(
+            np.array_equal(sindex.select({"y": 0.01}, atol=0.1), self.brute_force(y == 0))
+        )
+
+    def test_raises(self):
+        with self.assertRaises(ValueError):
+            SpatialIndex(self.shotnum, self.xyz[:, :2])
+        with self.assertRaises(ValueError):
+            SpatialIndex(self.shotnum[:10], self.xyz)
+
+        sindex = SpatialIndex(self.shotnum, self.xyz)
+        for region, error in (
+            ([("y", 0.0)], TypeError),
+            ({"r": 1.0}, ValueError),
+            ({"x": (1.0, 2.0, 3.0)}, ValueError),
+            ({"center": (0.0, 0.0)}, ValueError),
+            ({"radius": 1.0}, ValueError),
+            ({"center": (0.0,), "radius": 1.0}, ValueError),
+        ):
+            with self.subTest(region=region), self.assertRaises(error):
+                sindex.select(region)
+
+
+class TestBuildSpatialIndex(TestBase):
+    """Test Case for building a SpatialIndex from a HDF5 file"""
+
+    @with_bf
+    def test_build(self, _bf: File):
+        self.f.add_module(
+            "6K Compumotor", {"n_configs": 1, "sn_size": 60, "n_motionlists": 2}
+        )
+        _bf._map_file()  # re-map file
+        config = self.f.modules["6K Compumotor"].config_names[0]
+        cdata = HDFReadControls(_bf, [("6K Compumotor", config)])
+
+        for control in (None, "6K Compumotor", ("6K Compumotor", config)):
+            with self.subTest(control=control):
+                self.assertEqual(
+                    condition_motion_control(_bf, control), ("6K Compumotor", config)
+                )
+                sindex = build_spatial_index(_bf, control)
+                self.assertEqual(sindex.control, ("6K Compumotor", config))
+                self.assertTrue(np.array_equal(sindex.shotnum, cdata["shotnum"]))
+
+        # select against a brute force scan of the control data
+        sindex = build_spatial_index(_bf)
+        x0, y0 = sindex.positions[0, :2]
+        for region in (
+            {"y": y0},
+            {"center": (x0, y0), "radius": 1.0},
+            {"x": (x0, x0 + 5.0)},
+        ):
+            with self.subTest(region=region):
+                mask = sindex.position_mask(region)
+                expected = cdata["shotnum"][rows_in(cdata["xyz"], sindex.positions[mask])]
+                self.assertTrue(np.array_equal(sindex.select(region), expected))
+                self.assertGreater(expected.size, 0)
+
+    @with_bf
+    def test_raises(self, _bf: File):
+        # no motion control devices
+        self.f.add_module("Waveform", {"n_configs": 1, "sn_size": 50})
+        _bf._map_file()  # re-map file
+        with self.assertRaises(ValueError):
+            condition_motion_control(_bf)
+
+        # not a motion control device
+        with self.assertRaises(ValueError):
+            condition_motion_control(_bf, "Waveform")
+
+        # several motion control devices
+        self.f.add_module("NI_XZ", {"n_configs": 1, "sn_size": 50})
+        self.f.add_module("6K Compumotor", {"n_configs": 1, "sn_size": 50})
+        _bf._map_file()  # re-map file
+        with self.assertRaises(ValueError):
+            condition_motion_control(_bf)
+        self.assertEqual(condition_motion_control(_bf, "NI_XZ")[0], "NI_XZ")
+
+
+if __name__ == "__main__":
+    ut.main()
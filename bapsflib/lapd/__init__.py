@@ -19,8 +19,9 @@ relevant for calculating LaPD parameters (e.g. converting port number
 to axial z location, etc.).
 """
 
-__all__ = ["ConType", "File"]
+__all__ = ["Catalog", "ConType", "File"]
 
 from bapsflib._hdf.maps.controls.types import ConType
 from bapsflib.lapd import _hdf, constants, tools
+from bapsflib.lapd._hdf.catalog import Catalog
 from bapsflib.lapd._hdf.file import File
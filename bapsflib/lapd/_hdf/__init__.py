@@ -15,4 +15,4 @@ written in the HDF5 files generated by the Large Plasma Device (LaPD).
 
 __all__ = []
 
-from bapsflib.lapd._hdf import file, lapdoverview, mapper
+from bapsflib.lapd._hdf import catalog, file, lapdoverview, mapper
@@ -0,0 +1,672 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Module containing the `~bapsflib.lapd._hdf.catalog.Catalog`, a local
+SQLite index of the run metadata of a collection of LaPD HDF5 files.
+
+`Catalog.scan` walks a directory tree and, with a pool of worker
+processes, maps every HDF5 file found.  The experiment and run info,
+the digitizer connections (with their adc, clock rate, bit depth,
+etc.), the control device configurations (with their motion lists),
+and the MSI diagnostics of each file are stored in the database.  A
+file is only re-mapped when its size or modification time changed
+since the last scan.  `Catalog.query` then finds the files, and their
+digitizer ``(board, channel)`` connections, matching a set of
+criteria without opening any HDF5 file.
+"""
+
+__all__ = ["Catalog", "CatalogConnection", "CatalogEntry"]
+
+import astropy.units as u
+import concurrent.futures
+import fnmatch
+import multiprocessing
+import numpy as np
+import os
+import sqlite3
+import warnings
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from bapsflib._hdf.maps.controls.types import ConType
+from bapsflib.lapd._hdf.file import File
+
+#: version of the catalog database schema (stored as the SQLite
+#: ``user_version``)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    lapd_version TEXT,
+    investigator TEXT,
+    exp_name TEXT,
+    exp_description TEXT,
+    exp_set_name TEXT,
+    exp_set_description TEXT,
+    run_name TEXT,
+    run_description TEXT,
+    run_status TEXT,
+    run_date TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS connections (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    digitizer TEXT NOT NULL,
+    config_name TEXT NOT NULL,
+    adc TEXT NOT NULL,
+    board INTEGER NOT NULL,
+    channel INTEGER NOT NULL,
+    clock_rate REAL,
+    bit INTEGER,
+    nshotnum INTEGER,
+    nt INTEGER,
+    sample_average INTEGER,
+    shot_average INTEGER
+);
+CREATE TABLE IF NOT EXISTS controls (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    control TEXT NOT NULL,
+    contype TEXT NOT NULL,
+    config_name TEXT NOT NULL,
+    motion_list TEXT
+);
+CREATE TABLE IF NOT EXISTS msi (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    diagnostic TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_connections_file ON connections (file_id);
+CREATE INDEX IF NOT EXISTS ix_connections_digitizer
+    ON connections (digitizer, adc, clock_rate);
+CREATE INDEX IF NOT EXISTS ix_connections_adc ON connections (adc, clock_rate);
+CREATE INDEX IF NOT EXISTS ix_controls_file ON controls (file_id);
+CREATE INDEX IF NOT EXISTS ix_controls_control ON controls (control, motion_list);
+CREATE INDEX IF NOT EXISTS ix_controls_contype ON controls (contype);
+CREATE INDEX IF NOT EXISTS ix_msi_file ON msi (file_id);
+CREATE INDEX IF NOT EXISTS ix_msi_diagnostic ON msi (diagnostic);
+"""
+
+#: `~bapsflib.lapd._hdf.mapper.LaPDMapper` info keys and their
+#: ``files`` table columns
+_INFO_COLUMNS = {
+    "lapd version": "lapd_version",
+    "investigator": "investigator",
+    "exp name": "exp_name",
+    "exp description": "exp_description",
+    "exp set name": "exp_set_name",
+    "exp set description": "exp_set_description",
+    "run name": "run_name",
+    "run description": "run_description",
+    "run status": "run_status",
+    "run date": "run_date",
+}
+
+#: relative tolerance used to match clock rates
+_CLOCK_RATE_RTOL = 1.0e-6
+
+
+class CatalogConnection(NamedTuple):
+    """A digitizer ``(board, channel)`` connection of a cataloged file."""
+
+    digitizer: str
+    config_name: str
+    adc: str
+    board: int
+    channel: int
+
+    @property
+    def read_kwargs(self) -> Dict[str, Any]:
+        """
+        Keywords to read the connection with
+        `~bapsflib.lapd._hdf.file.File.read_data`.
+        """
+        return {
+            "board": self.board,
+            "channel": self.channel,
+            "digitizer": self.digitizer,
+            "adc": self.adc,
+            "config_name": self.config_name,
+        }
+
+
+class CatalogEntry(NamedTuple):
+    """A cataloged file matching a `Catalog.query`."""
+
+    path: str
+    connections: List[CatalogConnection]
+
+
+def _extract_file_info(path: str) -> Union[Dict[str, Any], None]:
+    """
+    Map the HDF5 file ``path`` and gather the metadata stored in the
+    catalog.  Errors raised while mapping the file are recorded in the
+    ``'error'`` entry instead of being raised.  Returns `None` if the
+    file can no longer be accessed (e.g. it was deleted after the
+    directory walk).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    entry = {
+        "path": path,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "info": {},
+        "connections": [],
+        "controls": [],
+        "msi": [],
+        "error": None,
+    }  # type: Dict[str, Any]
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with File(path, silent=True, map_cache=False) as hdf_file:
+                file_map = hdf_file.file_map
+                entry["info"] = {
+                    "lapd version": file_map.lapd_version,
+                    **file_map.exp_info,
+                    **file_map.run_info,
+                }
+
+                # -- digitizer connections                          ----
+                for digi_name, _dmap in file_map.digitizers.items():
+                    for config_name in _dmap.active_configs:
+                        entry["connections"].extend(
+                            _config_connections(
+                                digi_name, config_name, _dmap.configs[config_name]
+                            )
+                        )
+
+                # -- control device configurations                 ----
+                for control, _cmap in file_map.controls.items():
+                    for config_name, config in _cmap.configs.items():
+                        motion_lists = list(config.get("motion lists", [])) or [None]
+                        entry["controls"].extend(
+                            (control, _cmap.contype.value, str(config_name), ml)
+                            for ml in motion_lists
+                        )
+
+                # -- MSI diagnostics                                ----
+                entry["msi"] = list(file_map.msi)
+    except Exception as err:
+        entry["error"] = f"{type(err).__name__}: {err}"
+
+    return entry
+
+
+def _as_int(val) -> Union[int, None]:
+    """Convert integer setup values to `int`, leaving `None` as is."""
+    return None if val is None else int(val)
+
+
+def _config_connections(
+    digitizer: str, config_name: str, config: Dict[str, Any]
+) -> List[Tuple]:
+    """
+    ``connections`` table rows (without the file id) of the digitizer
+    configuration ``config``.
+    """
+    rows = []
+    for adc in config["adc"]:
+        for brd, chs, setup in config[adc]:
+            clock_rate = setup.get("clock rate", None)
+            clock_rate = (
+                float(clock_rate.to_value(u.Hz))
+                if isinstance(clock_rate, u.Quantity)
+                else None
+            )
+            setup_vals = tuple(
+                _as_int(setup.get(key, None))
+                for key in (
+                    "bit",
+                    "nshotnum",
+                    "nt",
+                    "sample average (hardware)",
+                    "shot average (software)",
+                )
+            )
+            rows.extend(
+                (digitizer, str(config_name), adc, int(brd), int(ch), clock_rate)
+                + setup_vals
+                for ch in chs
+            )
+    return rows
+
+
+class Catalog:
+    """
+    Local SQLite index of the run metadata of a collection of LaPD
+    HDF5 files.
+
+    Examples
+    --------
+
+    >>> from bapsflib.lapd import Catalog
+    >>> with Catalog('archive.sqlite') as cat:
+    ...     cat.scan('/data/lapd', max_workers=8)
+    ...     matches = cat.query(
+    ...         adc='SIS 3305',
+    ...         clock_rate=1.25 * u.GHz,
+    ...         control='6K Compumotor',
+    ...     )
+    >>> matches[0].path
+    '/data/lapd/2019/run_01.hdf5'
+    >>> matches[0].connections[0]
+    CatalogConnection(digitizer='SIS crate', config_name='config01',
+    adc='SIS 3305', board=1, channel=1)
+    >>>
+    >>> # read a matching connection
+    >>> with File(matches[0].path) as f:
+    ...     data = f.read_data(**matches[0].connections[0].read_kwargs)
+    """
+
+    def __init__(self, database: str):
+        """
+        Parameters
+        ----------
+        database : `str`
+            path of the SQLite database file, which is created if it
+            does not exist (``':memory:'`` for an in-memory database)
+        """
+        self._database = database
+        self._conn = sqlite3.connect(database)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._conn.close()
+            raise ValueError(
+                f"Catalog database '{database}' has schema version {version}, "
+                f"expected {SCHEMA_VERSION}."
+            )
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self._database}', files={len(self)})"
+
+    @property
+    def database(self) -> str:
+        """Path of the SQLite database file."""
+        return self._database
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """
+        Dictionary of the cataloged files that could not be mapped and
+        their error message.
+        """
+        rows = self._conn.execute(
+            "SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path"
+        )
+        return dict(rows.fetchall())
+
+    @property
+    def paths(self) -> List[str]:
+        """Sorted paths of all cataloged files."""
+        rows = self._conn.execute("SELECT path FROM files ORDER BY path")
+        return [row[0] for row in rows]
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def info(self, path: str) -> Dict[str, Any]:
+        """
+        Experiment and run info of the cataloged file ``path`` (same
+        keys as :attr:`~bapsflib.lapd._hdf.file.File.info`).
+        """
+        row = self._conn.execute(
+            f"SELECT {', '.join(_INFO_COLUMNS.values())} FROM files WHERE path = ?",
+            (os.path.abspath(path),),
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"File '{path}' is not in the catalog.")
+        return dict(zip(_INFO_COLUMNS.keys(), row))
+
+    def scan(
+        self,
+        root: str,
+        patterns: Union[str, Iterable[str]] = ("*.hdf5", "*.h5"),
+        recursive: bool = True,
+        max_workers: Union[int, None] = None,
+        mp_context=None,
+    ) -> Dict[str, int]:
+        """
+        Scan the directory tree ``root`` and catalog the HDF5 files
+        found.
+
+        Files already cataloged with the same size and modification
+        time are skipped, all other files are mapped by a pool of
+        worker processes.  Files deleted during the scan are skipped.  Files that could not be mapped are
+        cataloged with their error (see :attr:`failed`) and are only
+        re-mapped once modified.  Cataloged files under ``root`` that
+        no longer exist are removed from the catalog.
+
+        Parameters
+        ----------
+        root : `str`
+            directory to be scanned
+
+        patterns : Union[str, Iterable[str]], optional
+            shell-style patterns of the file names to be cataloged
+            (DEFAULT ``('*.hdf5', '*.h5')``)
+
+        recursive : `bool`, optional
+            set `False` to only scan the files directly in ``root``
+            (`True` DEFAULT)
+
+        max_workers : `int`, optional
+            maximum number of worker processes.  If `None` (DEFAULT),
+            then `os.cpu_count` workers are used.  If ``1``, then the
+            files are mapped in the calling process.
+
+        mp_context : `multiprocessing.context.BaseContext`, optional
+            multiprocessing context of the process pool.  If `None`
+            (DEFAULT), then the ``'spawn'`` context is used.
+
+        Returns
+        -------
+        Dict[str, int]
+            number of files ``'added'``, ``'updated'``, ``'unchanged'``,
+            ``'removed'``, and ``'failed'`` (mapping errors among the
+            added and updated files)
+        """
+        # ---- Condition arguments                                 ----
+        if not os.path.isdir(root):
+            raise ValueError(f"Argument `root` '{root}' is not a directory.")
+        root = os.path.abspath(root)
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        patterns = tuple(patterns)
+        if max_workers is not None and (
+            not isinstance(max_workers, (int, np.integer))
+            or isinstance(max_workers, bool)
+            or max_workers < 1
+        ):
+            raise ValueError(
+                f"Argument `max_workers` must be a positive integer, got {max_workers}."
+            )
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+
+        # ---- Find new and modified files                         ----
+        cataloged = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self._conn.execute(
+                "SELECT path, size, mtime_ns FROM files"
+            )
+        }
+        counts = dict.fromkeys(("added", "updated", "unchanged", "removed", "failed"), 0)
+        paths = []
+        for path in self._walk(root, patterns, recursive):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # deleted since the walk
+                continue
+            if cataloged.get(path, None) == (stat.st_size, stat.st_mtime_ns):
+                counts["unchanged"] += 1
+            else:
+                paths.append(path)
+
+        # ---- Map files and update catalog                        ----
+        if max_workers == 1 or len(paths) <= 1:
+            entries = map(_extract_file_info, paths)
+            self._update(entries, cataloged, counts)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_workers, len(paths)),
+                mp_context=mp_context,
+            ) as pool:
+                entries = pool.map(_extract_file_info, paths)
+                self._update(entries, cataloged, counts)
+
+        # ---- Remove deleted files                                ----
+        prefix = os.path.join(root, "")
+        removed = [
+            (path,)
+            for path in cataloged
+            if path.startswith(prefix) and not os.path.isfile(path)
+        ]
+        with self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", removed)
+        counts["removed"] = len(removed)
+
+        return counts
+
+    @staticmethod
+    def _walk(root: str, patterns: Tuple[str, ...], recursive: bool) -> List[str]:
+        """Sorted paths of the files under ``root`` matching ``patterns``."""
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            paths.extend(
+                os.path.join(dirpath, name)
+                for name in filenames
+                if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+            )
+            if not recursive:
+                break
+        return sorted(paths)
+
+    def _update(
+        self,
+        entries: Iterable[Union[Dict[str, Any], None]],
+        cataloged: Dict[str, Tuple[int, int]],
+        counts: Dict[str, int],
+    ):
+        """
+        Write the extracted file ``entries`` into the catalog, skipping
+        the `None` entries of files that could not be accessed.
+        """
+        columns = (
+            ("path", "size", "mtime_ns") + tuple(_INFO_COLUMNS.values()) + ("error",)
+        )
+        insert_file = (
+            f"INSERT INTO files ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        with self._conn:
+            for entry in entries:
+                if entry is None:
+                    continue
+
+                path = entry["path"]
+                counts["updated" if path in cataloged else "added"] += 1
+                if entry["error"] is not None:
+                    counts["failed"] += 1
+
+                # replacing the file row cascades to its device rows
+                self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+                file_id = self._conn.execute(
+                    insert_file,
+                    (path, entry["size"], entry["mtime_ns"])
+                    + tuple(entry["info"].get(key, None) for key in _INFO_COLUMNS)
+                    + (entry["error"],),
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO connections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((file_id,) + conn for conn in entry["connections"]),
+                )
+                self._conn.executemany(
+                    "INSERT INTO controls VALUES (?, ?, ?, ?, ?)",
+                    ((file_id,) + control for control in entry["controls"]),
+                )
+                self._conn.executemany(
+                    "INSERT INTO msi VALUES (?, ?)",
+                    ((file_id, name) for name in entry["msi"]),
+                )
+
+    def query(
+        self,
+        digitizer: Union[str, None] = None,
+        adc: Union[str, None] = None,
+        config_name: Union[str, None] = None,
+        clock_rate: Union[float, u.Quantity, None] = None,
+        control: Union[str, None] = None,
+        contype: Union[str, ConType, None] = None,
+        motion_list: Union[str, None] = None,
+        msi: Union[str, Iterable[str], None] = None,
+        info: Union[Dict[str, str], None] = None,
+    ) -> List[CatalogEntry]:
+        """
+        Query the catalog for the files matching all given criteria.
+
+        Parameters
+        ----------
+        digitizer : `str`, optional
+            name of the digitizer recording the connections
+
+        adc : `str`, optional
+            analog-digital-converter of the connections
+
+        config_name : `str`, optional
+            digitizer configuration of the connections
+
+        clock_rate : Union[float, `~astropy.units.Quantity`], optional
+            clock rate of the connections, in Hz if a `float`
+
+        control : `str`, optional
+            name of a control device used in the file
+
+        contype : Union[str, `~bapsflib._hdf.maps.controls.types.ConType`], optional
+            type of a control device used in the file
+
+        motion_list : `str`, optional
+            name of a motion list of the ``control`` device (or of any
+            control device)
+
+        msi : Union[str, Iterable[str]], optional
+            name(s) of MSI diagnostics recorded in the file
+
+        info : Dict[str, str], optional
+            dictionary of shell-style patterns matched against the
+            experiment and run info of the file, e.g.
+            ``{'run name': '*bdot*'}``.  Valid keys are those of
+            :attr:`~bapsflib.lapd._hdf.mapper.LaPDMapper.exp_info`,
+            :attr:`~bapsflib.lapd._hdf.mapper.LaPDMapper.run_info`, and
+            ``'lapd version'``.
+
+        Returns
+        -------
+        List[CatalogEntry]
+            the matching files, sorted by path, and the digitizer
+            connections of each file matching ``digitizer``, ``adc``,
+            ``config_name``, and ``clock_rate`` (all connections of the
+            file if none are given)
+
+        Notes
+        -----
+        Files that could not be mapped (see :attr:`failed`) never
+        match.
+        """
+        conditions = ["f.error IS NULL"]
+        params = []  # type: List[Any]
+
+        # -- digitizer connection criteria                          ----
+        conn_conditions = []
+        for column, val in (
+            ("digitizer", digitizer),
+            ("adc", adc),
+            ("config_name", config_name),
+        ):
+            if val is not None:
+                conn_conditions.append(f"d.{column} = ?")
+                params.append(val)
+        if clock_rate is not None:
+            if isinstance(clock_rate, u.Quantity):
+                clock_rate = clock_rate.to_value(u.Hz)
+            clock_rate = float(clock_rate)
+            conn_conditions.append("ABS(d.clock_rate - ?) <= ?")
+            params.extend([clock_rate, abs(clock_rate) * _CLOCK_RATE_RTOL])
+        conditions.extend(conn_conditions)
+
+        # -- control device criteria                                ----
+        control_conditions = []
+        control_params = []  # type: List[Any]
+        if contype is not None:
+            try:
+                contype = ConType(contype)
+            except ValueError:
+                raise ValueError(
+                    f"Argument `contype` must be one of "
+                    f"{[member.value for member in ConType]}, got {contype}."
+                )
+            control_conditions.append("c.contype = ?")
+            control_params.append(contype.value)
+        for column, val in (("control", control), ("motion_list", motion_list)):
+            if val is not None:
+                control_conditions.append(f"c.{column} = ?")
+                control_params.append(val)
+        if control_conditions:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM controls c WHERE c.file_id = f.id AND "
+                f"{' AND '.join(control_conditions)})"
+            )
+            params.extend(control_params)
+
+        # -- MSI criteria                                           ----
+        if msi is not None:
+            for name in (msi,) if isinstance(msi, str) else msi:
+                conditions.append(
+                    "EXISTS (SELECT 1 FROM msi m "
+                    "WHERE m.file_id = f.id AND m.diagnostic = ?)"
+                )
+                params.append(name)
+
+        # -- experiment and run info criteria                       ----
+        for key, pattern in (info or {}).items():
+            if key not in _INFO_COLUMNS:
+                raise ValueError(
+                    f"Argument `info` has unknown key '{key}', expected any of "
+                    f"{list(_INFO_COLUMNS)}."
+                )
+            conditions.append(f"f.{_INFO_COLUMNS[key]} GLOB ?")
+            params.append(pattern)
+
+        # ---- Execute query                                       ----
+        # - without connection criteria files without any digitizer
+        #   connections still match
+        join = "JOIN" if conn_conditions else "LEFT JOIN"
+        rows = self._conn.execute(
+            f"SELECT f.path, d.digitizer, d.config_name, d.adc, d.board, d.channel "
+            f"FROM files f {join} connections d ON d.file_id = f.id "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY f.path, d.digitizer, d.config_name, d.adc, d.board, d.channel",
+            params,
+        )
+
+        entries = {}  # type: Dict[str, CatalogEntry]
+        for path, *conn in rows:
+            if path not in entries:
+                entries[path] = CatalogEntry(path=path, connections=[])
+            if conn[0] is not None:
+                entries[path].connections.append(CatalogConnection(*conn))
+
+        return list(entries.values())
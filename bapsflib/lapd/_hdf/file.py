@@ -30,7 +30,7 @@ if TYPE_CHECKING:
 class File(BaseFile):
     """Open a HDF5 file created by the LaPD at BaPSF."""
 
-    def __init__(self, name: str, mode="r", silent=False, **kwargs):
+    def __init__(self, name: str, mode="r", silent=False, lazy_map=False, **kwargs):
         """
         Parameters
         ----------
@@ -43,6 +43,10 @@ class File(BaseFile):
         silent : `bool`, optional
             set `True` to suppress warnings (`False` DEFAULT)
 
+        lazy_map : `bool`, optional
+            set `True` to only build a device mapping when the device
+            is first accessed (`False` DEFAULT)
+
         kwargs : `dict`, optional
             additional keywords passed on to `h5py.File`
 
@@ -65,6 +69,7 @@ class File(BaseFile):
             digitizer_path="Raw data + config",
             msi_path="MSI",
             silent=silent,
+            lazy_map=lazy_map,
             **kwargs,
         )
 
@@ -89,6 +94,8 @@ class File(BaseFile):
             control_path=self.CONTROL_PATH,
             digitizer_path=self.DIGITIZER_PATH,
             msi_path=self.MSI_PATH,
+            lazy=self._lazy_map,
+            cached_maps=self._cached_maps,
         )
 
     @property
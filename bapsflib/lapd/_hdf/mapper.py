@@ -39,6 +39,8 @@ class LaPDMapper(HDFMapper):
         control_path="Raw data + config",
         digitizer_path="Raw data + config",
         msi_path="MSI",
+        lazy: bool = False,
+        cached_maps=None,
     ):
         """
         Parameters
@@ -57,12 +59,22 @@ class LaPDMapper(HDFMapper):
         msi_path : `str`, optional
             internal HDF5 path to group containing MSI diagnostics
             (DEFAULT ``'MSI'``)
+
+        lazy : `bool`, optional
+            If `True`, then device mapping objects are only built when
+            they are first accessed.  (DEFAULT `False`)
+
+        cached_maps : `dict`, optional
+            previously cached device mappings to restore instead of
+            re-mapping (DEFAULT `None`)
         """
         super().__init__(
             hdf_obj,
             control_path=control_path,
             digitizer_path=digitizer_path,
             msi_path=msi_path,
+            lazy=lazy,
+            cached_maps=cached_maps,
         )
 
         # is HDF5 file generated by the LaPD
@@ -10,10 +10,14 @@
 #
 __all__ = ["BaseFile", "TestBase", "with_bf", "with_lapdf"]
 
+import os
 import unittest as ut
 
+from unittest import mock
+
 from bapsflib._hdf import File as BaseFile
 from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib._hdf.utils.map_cache import MAP_CACHE_DIR_ENV
 from bapsflib.utils.decorators import with_bf, with_lapdf
 
 
@@ -35,6 +39,12 @@ class TestBase(ut.TestCase):
         super().setUpClass()
         cls.f = FauxHDFBuilder()
 
+        # keep mapping cache entries out of the user cache directory
+        cls._map_cache_env = mock.patch.dict(
+            os.environ, {MAP_CACHE_DIR_ENV: cls.f.tempdir.name}
+        )
+        cls._map_cache_env.start()
+
     def tearDown(self):
         self.f.reset()
 
@@ -42,6 +52,7 @@ class TestBase(ut.TestCase):
     def tearDownClass(cls):
         # cleanup and close HDF5 file
         super().tearDownClass()
+        cls._map_cache_env.stop()
         cls.f.cleanup()
 
     def assertMethodOverride(self, base_class, obj, method):
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import astropy.units as u
+import numpy as np
+import os
+import sqlite3
+import tempfile
+import unittest as ut
+
+from unittest import mock
+
+from bapsflib._hdf.maps.controls.types import ConType
+from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib._hdf.utils.map_cache import MAP_CACHE_DIR_ENV
+from bapsflib.lapd._hdf import catalog
+from bapsflib.lapd._hdf.catalog import Catalog, CatalogConnection, CatalogEntry
+from bapsflib.lapd._hdf.file import File
+
+
+class TestCatalog(ut.TestCase):
+    """Test Case for Catalog"""
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory(prefix="catalog-test_")
+        self.root = self._tempdir.name
+        self.db = os.path.join(self.root, "catalog.sqlite")
+
+        # keep mapping cache entries out of the user cache directory
+        self._map_cache_env = mock.patch.dict(
+            os.environ, {MAP_CACHE_DIR_ENV: os.path.join(self.root, "map-cache")}
+        )
+        self._map_cache_env.start()
+
+        # run_a: SIS crate, 6K Compumotor, and Discharge
+        self.run_a = self.build(
+            "run_a.hdf5",
+            {"SIS crate": {}, "6K Compumotor": {}, "Discharge": {}},
+            {"Data run": b"bdot run", "Investigator": b"Everson"},
+        )
+
+        # run_b: SIS 3301 and Waveform
+        self.run_b = self.build(
+            os.path.join("sub", "run_b.hdf5"),
+            {"SIS 3301": {}, "Waveform": {}},
+            {"Data run": b"langmuir run"},
+        )
+
+        # not a HDF5 file and not a cataloged file
+        self.bad = os.path.join(self.root, "sub", "bad.hdf5")
+        with open(self.bad, "wb") as fh:
+            fh.write(b"not a HDF5 file")
+        with open(os.path.join(self.root, "notes.txt"), "w") as fh:
+            fh.write("not cataloged")
+
+    def tearDown(self):
+        self._map_cache_env.stop()
+        self._tempdir.cleanup()
+
+    def build(self, name, add_modules, attrs) -> str:
+        """Build a faux LaPD HDF5 file in the scanned directory."""
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fbuilder = FauxHDFBuilder(name=path, add_modules=add_modules)
+        fbuilder["Raw data + config"].attrs.update(attrs)
+        fbuilder.close()
+        return path
+
+    @staticmethod
+    def connections(path, digitizer, adc=None):
+        """All connections of ``digitizer`` in file ``path``."""
+        conns = []
+        with File(path, silent=True, map_cache=False) as lapdf:
+            _dmap = lapdf.file_map.digitizers[digitizer]
+            for config_name in _dmap.active_configs:
+                config = _dmap.configs[config_name]
+                for _adc in config["adc"]:
+                    if adc is not None and _adc != adc:
+                        continue
+                    for brd, chs, _ in config[_adc]:
+                        conns.extend(
+                            CatalogConnection(digitizer, config_name, _adc, brd, ch)
+                            for ch in chs
+                        )
+        return sorted(conns)
+
+    def test_scan(self):
+        with Catalog(self.db) as cat:
+            counts = cat.scan(self.root, max_workers=1)
+            self.assertEqual(
+                counts,
+                {"added": 3, "updated": 0, "unchanged": 0, "removed": 0, "failed": 1},
+            )
+            self.assertEqual(len(cat), 3)
+            self.assertEqual(cat.paths, sorted([self.run_a, self.run_b, self.bad]))
+            self.assertEqual(list(cat.failed), [self.bad])
+            self.assertEqual(cat.info(self.run_a)["run name"], "bdot run")
+            self.assertEqual(cat.info(self.run_a)["investigator"], "Everson")
+            self.assertEqual(cat.info(self.run_b)["lapd version"], "0.0.0")
+
+            # unchanged files are skipped
+            counts = cat.scan(self.root, max_workers=1)
+            self.assertEqual(counts["unchanged"], 3)
+            self.assertEqual(counts["added"] + counts["updated"], 0)
+
+            # modified files are re-mapped
+            self.build(
+                os.path.join("sub", "run_b.hdf5"),
+                {"SIS 3301": {}, "NI_XZ": {}},
+                {"Data run": b"langmuir run"},
+            )
+            os.utime(self.run_b, ns=(0, os.stat(self.run_b).st_mtime_ns + 10**9))
+            counts = cat.scan(self.root, max_workers=1)
+            self.assertEqual((counts["updated"], counts["unchanged"]), (1, 2))
+            self.assertEqual([e.path for e in cat.query(control="Waveform")], [])
+            self.assertEqual([e.path for e in cat.query(control="NI_XZ")], [self.run_b])
+
+            # deleted files are removed
+            os.remove(self.run_a)
+            counts = cat.scan(self.root, max_workers=1)
+            self.assertEqual(counts["removed"], 1)
+            self.assertEqual(cat.paths, sorted([self.run_b, self.bad]))
+            self.assertEqual(cat.query(msi="Discharge"), [])
+
+            # non-recursive scan
+            cat.scan(os.path.join(self.root, "sub"), recursive=False, max_workers=1)
+            self.assertEqual(len(cat), 2)
+
+        # catalog persists on disk
+        with Catalog(self.db) as cat:
+            self.assertEqual(cat.paths, sorted([self.run_b, self.bad]))
+
+    def test_scan_vanished(self):
+        walk = Catalog._walk
+        extract = catalog._extract_file_info
+        missing = os.path.join(self.root, "missing.hdf5")
+
+        def walk_with_missing(*args):
+            # a file that is deleted before it is stat'ed
+            return sorted(walk(*args) + [missing])
+
+        def extract_after_remove(path):
+            # a file deleted between the walk and the mapping
+            if path == self.run_a:
+                os.remove(path)
+            return extract(path)
+
+        with Catalog(self.db) as cat, mock.patch.object(
+            Catalog, "_walk", side_effect=walk_with_missing
+        ), mock.patch.object(
+            catalog, "_extract_file_info", side_effect=extract_after_remove
+        ):
+            counts = cat.scan(self.root, max_workers=1)
+            self.assertEqual(
+                counts,
+                {"added": 2, "updated": 0, "unchanged": 0, "removed": 0, "failed": 1},
+            )
+            self.assertEqual(cat.paths, sorted([self.run_b, self.bad]))
+
+        self.assertIsNone(catalog._extract_file_info(missing))
+
+    def test_scan_parallel(self):
+        with Catalog(":memory:") as serial, Catalog(self.db) as parallel:
+            serial.scan(self.root, max_workers=1)
+            counts = parallel.scan(self.root, max_workers=2)
+            self.assertEqual((counts["added"], counts["failed"]), (3, 1))
+            self.assertEqual(parallel.paths, serial.paths)
+            self.assertEqual(parallel.query(), serial.query())
+
+    def test_query(self):
+        with Catalog(self.db) as cat:
+            cat.scan(self.root, max_workers=1)
+
+            # -- all mapped files                                   ----
+            entries = cat.query()
+            self.assertEqual([e.path for e in entries], [self.run_a, self.run_b])
+            self.assertIsInstance(entries[0], CatalogEntry)
+            self.assertEqual(
+                entries[0].connections, self.connections(self.run_a, "SIS crate")
+            )
+
+            # -- digitizer criteria                                 ----
+            sis3305 = self.connections(self.run_a, "SIS crate", adc="SIS 3305")
+            for kwargs in (
+                {"adc": "SIS 3305"},
+                {"adc": "SIS 3305", "clock_rate": 1.25 * u.GHz},
+                {"digitizer": "SIS crate", "clock_rate": 1.25e9},
+                {"clock_rate": 1250.0 * u.MHz, "control": "6K Compumotor"},
+            ):
+                with self.subTest(kwargs=kwargs):
+                    self.assertEqual(
+                        cat.query(**kwargs), [CatalogEntry(self.run_a, sis3305)]
+                    )
+            entries = cat.query(clock_rate=100 * u.MHz)
+            self.assertEqual([e.path for e in entries], [self.run_a, self.run_b])
+            self.assertEqual(
+                entries[1].connections, self.connections(self.run_b, "SIS 3301")
+            )
+            self.assertEqual(cat.query(clock_rate=1.0 * u.Hz), [])
+            self.assertEqual(cat.query(adc="SIS 3305", config_name="not a config"), [])
+
+            # -- control, msi, and info criteria                    ----
+            for kwargs, paths in (
+                ({"control": "6K Compumotor"}, [self.run_a]),
+                ({"control": "6K Compumotor", "motion_list": "ml-0001"}, [self.run_a]),
+                ({"motion_list": "not a motion list"}, []),
+                ({"contype": ConType.MOTION}, [self.run_a]),
+                ({"contype": "waveform"}, [self.run_b]),
+                ({"msi": "Discharge"}, [self.run_a]),
+                ({"msi": ["Discharge", "Interferometer array"]}, []),
+                ({"info": {"run name": "*run"}}, [self.run_a, self.run_b]),
+                ({"info": {"run name": "bdot*", "investigator": "Ev*"}}, [self.run_a]),
+                ({"info": {"investigator": "Ev*"}, "adc": "SIS 3301"}, []),
+            ):
+                with self.subTest(kwargs=kwargs):
+                    self.assertEqual([e.path for e in cat.query(**kwargs)], paths)
+
+            # -- connections can be read                            ----
+            conn = cat.query(adc="SIS 3305")[0].connections[0]
+            with File(self.run_a, silent=True) as lapdf:
+                data = lapdf.read_data(**conn.read_kwargs)
+                self.assertEqual(data.info["adc"], "SIS 3305")
+                self.assertEqual(
+                    (data.info["board"], data.info["channel"]), (conn.board, conn.channel)
+                )
+
+    def test_raises(self):
+        with Catalog(self.db) as cat:
+            with self.assertRaises(ValueError):
+                cat.scan(self.bad)
+            for max_workers in (0, 1.5, True):
+                with self.subTest(max_workers=max_workers), self.assertRaises(ValueError):
+                    cat.scan(self.root, max_workers=max_workers)
+            with self.assertRaises(ValueError):
+                cat.query(contype="not a type")
+            with self.assertRaises(ValueError):
+                cat.query(info={"not a key": "*"})
+            with self.assertRaises(ValueError):
+                cat.info(self.run_a)
+
+        # unknown schema version
+        conn = sqlite3.connect(self.db)
+        conn.execute("PRAGMA user_version = 99")
+        conn.close()
+        with self.assertRaises(ValueError):
+            Catalog(self.db)
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -15,4 +15,4 @@ especially its physical parameters.
 
 __all__ = []
 
-from bapsflib.plasma import core
+from bapsflib.plasma import core, vectorized
@@ -0,0 +1,135 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import astropy.units as u
+import numpy as np
+import unittest as ut
+
+from bapsflib.plasma import core, vectorized
+
+
+class TestVectorized(ut.TestCase):
+    """Test case for `bapsflib.plasma.vectorized`."""
+
+    args = {
+        "Bo": 1000.0,
+        "gamma": 5.0 / 3.0,
+        "kT": 4.0,
+        "kTe": 5.0,
+        "kTi": 1.0,
+        "m_i": 4.0 * core.MP,
+        "n": 2.0e12,
+        "n_e": 1.0e12,
+        "n_i": 5.0e11,
+        "Z": 2,
+    }
+    units = {
+        "cs": u.cm / u.s,
+        "fce": u.Hz,
+        "fci": u.Hz,
+        "fLH": u.Hz,
+        "fpe": u.Hz,
+        "fpi": u.Hz,
+        "fUH": u.Hz,
+        "lD": u.cm,
+        "lpe": u.cm,
+        "lpi": u.cm,
+        "oce": u.rad / u.s,
+        "oci": u.rad / u.s,
+        "oLH": u.rad / u.s,
+        "ope": u.rad / u.s,
+        "opi": u.rad / u.s,
+        "oUH": u.rad / u.s,
+        "rce": u.cm,
+        "rci": u.cm,
+        "VA": u.cm / u.s,
+        "vTe": u.cm / u.s,
+        "vTi": u.cm / u.s,
+    }
+
+    def test_scalars(self):
+        """Scalar arguments reproduce `bapsflib.plasma.core`."""
+        for name, unit in self.units.items():
+            with self.subTest(name=name):
+                val = getattr(vectorized, name)(**self.args)
+                self.assertIsInstance(val, u.Quantity)
+                self.assertEqual(val.unit, unit)
+                self.assertEqual(val.shape, ())
+                self.assertTrue(np.isclose(val.value, getattr(core, name)(**self.args)))
+
+    def test_arrays(self):
+        """Array arguments broadcast like `numpy` ufuncs."""
+        Bo = np.linspace(500.0, 1500.0, 5)
+        n_e = np.array([[1.0e11], [1.0e12], [1.0e13]])
+        args = {**self.args, "Bo": Bo, "n_e": n_e, "n_i": n_e / 2.0, "n": n_e}
+        self.assertEqual(vectorized.fce(**args).shape, (5,))
+        self.assertEqual(vectorized.fpe(**args).shape, (3, 1))
+        self.assertEqual(vectorized.VA(**args).shape, (3, 5))
+
+        # compare against the scalar version element by element
+        shape = (3, 5)
+        for name in self.units:
+            with self.subTest(name=name):
+                val = np.broadcast_to(getattr(vectorized, name)(**args).value, shape)
+                for index in np.ndindex(shape):
+                    _args = {
+                        key: np.broadcast_to(arg, shape)[index].item()
+                        for key, arg in args.items()
+                    }
+                    self.assertTrue(np.isclose(val[index], getattr(core, name)(**_args)))
+
+    def test_quantities(self):
+        """Quantity arguments are converted to cgs."""
+        self.assertTrue(u.allclose(vectorized.fce(0.1 * u.T), vectorized.fce(1000.0)))
+        self.assertTrue(
+            u.allclose(vectorized.fpe(1.0e18 * u.m**-3), vectorized.fpe(1.0e12))
+        )
+        self.assertTrue(
+            u.allclose(vectorized.lD(5.0 * u.eV, 1.0e12), vectorized.lD(5.0, 1.0e12))
+        )
+        self.assertTrue(
+            u.allclose(
+                vectorized.vTe(
+                    (5.0 * u.eV).to(u.K, equivalencies=u.temperature_energy())
+                ),
+                vectorized.vTe(5.0),
+            )
+        )
+        self.assertTrue(
+            u.allclose(
+                vectorized.VA(1000.0, 4.0 * core.MP * u.g, 1.0e12),
+                vectorized.VA(1000.0, 4.0 * core.MP, 1.0e12),
+            )
+        )
+
+        # as_quantity
+        Bo = vectorized.as_quantity("Bo", [0.1, 0.2] * u.T)
+        self.assertEqual(Bo.unit, u.G)
+        self.assertTrue(np.allclose(Bo.value, [1000.0, 2000.0]))
+        n_e = vectorized.as_quantity("n_e", 1.0e12)
+        self.assertEqual(n_e.unit, u.cm**-3)
+        self.assertEqual(n_e.value, 1.0e12)
+
+    def test_raises(self):
+        # undefined parameter
+        with self.assertRaises(ValueError):
+            vectorized.fce(None)
+
+        # inconvertible units
+        with self.assertRaises(ValueError):
+            vectorized.fce(1.0 * u.cm)
+
+        # shapes that do not broadcast
+        with self.assertRaises(ValueError):
+            vectorized.VA(np.ones(3), core.MP, np.ones(4))
+
+
+if __name__ == "__main__":
+    ut.main()
@@ -0,0 +1,520 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Array versions of the `bapsflib.plasma.core` plasma parameters (in cgs).
+
+The functions here have the same names, arguments, and formulas as in
+`bapsflib.plasma.core`, but accept scalars, `numpy` arrays, or
+`astropy.units.Quantity` objects, broadcast over their arguments, and
+return an `astropy.units.Quantity` in cgs units.  Arguments that are not
+a `~astropy.units.Quantity` are taken to be in the cgs units of
+`bapsflib.plasma.core` (i.e. Gauss, eV, g, and :math:`cm^{-3}`), while
+a `~astropy.units.Quantity` is converted to those units (temperatures
+may also be given in kelvin).
+
+Examples
+--------
+
+>>> import astropy.units as u
+>>> import numpy as np
+>>> from bapsflib.plasma import core, vectorized
+>>>
+>>> # electron-plasma frequency across a density profile
+>>> n_e = np.linspace(1.0e11, 1.0e12, 1_000_000)
+>>> vectorized.fpe(n_e).shape
+(1000000,)
+>>>
+>>> # arguments broadcast and may carry units
+>>> vectorized.VA([[0.1], [0.2]] * u.T, 4.0 * core.MP, n_e[::500_000]).shape
+(2, 2)
+"""
+
+__all__ = [
+    "as_quantity",
+    "PARAMETER_UNITS",
+    "cs",
+    "fce",
+    "fci",
+    "fLH",
+    "fpe",
+    "fpi",
+    "fUH",
+    "lD",
+    "lpe",
+    "lpi",
+    "oce",
+    "oci",
+    "oLH",
+    "ope",
+    "opi",
+    "oUH",
+    "rce",
+    "rci",
+    "VA",
+    "vTe",
+    "vTi",
+]
+
+import astropy.units as u
+import numpy as np
+
+from scipy import constants
+from typing import Union
+
+from bapsflib.plasma.core import C, E, ME
+
+#: cgs unit of each plasma parameter argument (see
+#: `~bapsflib._hdf.utils.hdfreaddata.HDFReadData.plasma`)
+PARAMETER_UNITS = {
+    "Bo": u.G,
+    "gamma": u.dimensionless_unscaled,
+    "kT": u.eV,
+    "kTe": u.eV,
+    "kTi": u.eV,
+    "m_e": u.g,
+    "m_i": u.g,
+    "n": u.cm**-3,
+    "n_e": u.cm**-3,
+    "n_i": u.cm**-3,
+    "Z": u.dimensionless_unscaled,
+}
+
+_RAD_PER_S = u.rad / u.s
+_CM_PER_S = u.cm / u.s
+
+#: eV to erg conversion factor
+_EV_TO_ERG = constants.e * 1.0e7
+
+ArrayLike = Union[float, np.ndarray, u.Quantity]
+
+
+def _value(name: str, value: ArrayLike) -> np.ndarray:
+    """
+    Condition the plasma parameter ``name`` into a `float` array in the
+    cgs unit `PARAMETER_UNITS` ``[name]``.
+    """
+    if value is None:
+        raise ValueError(f"Plasma parameter `{name}` is not defined.")
+    elif isinstance(value, u.Quantity):
+        try:
+            return value.to_value(
+                PARAMETER_UNITS[name], equivalencies=u.temperature_energy()
+            )
+        except u.UnitConversionError as err:
+            raise ValueError(
+                f"Plasma parameter `{name}` has units {value.unit} not "
+                f"convertible to {PARAMETER_UNITS[name]}."
+            ) from err
+
+    return np.asarray(value, dtype=np.float64)
+
+
+def as_quantity(name: str, value: ArrayLike) -> u.Quantity:
+    """
+    Convert the value of plasma parameter ``name`` (e.g. ``'Bo'``) to
+    a `~astropy.units.Quantity` in its cgs unit (see `PARAMETER_UNITS`).
+
+    Examples
+    --------
+
+    >>> as_quantity('Bo', 0.1 * u.T)
+    <Quantity 1000. G>
+    >>> as_quantity('n_e', [1e12, 2e12])
+    <Quantity [1.e+12, 2.e+12] 1 / cm3>
+    """
+    return _value(name, value) << PARAMETER_UNITS[name]
+
+
+# ---- raw (unit-less) parameters ----
+def _oce(Bo: np.ndarray) -> np.ndarray:
+    return (-E / (ME * C)) * Bo
+
+
+def _oci(Bo: np.ndarray, m_i: np.ndarray, Z: np.ndarray) -> np.ndarray:
+    return Z * E * Bo / (m_i * C)
+
+
+def _ope(n_e: np.ndarray) -> np.ndarray:
+    return np.sqrt((4.0 * np.pi * E * E / ME) * n_e)
+
+
+def _opi(m_i: np.ndarray, n_i: np.ndarray, Z: np.ndarray) -> np.ndarray:
+    return np.sqrt(4.0 * np.pi * n_i * (Z * E) ** 2 / m_i)
+
+
+def _vT(kT: np.ndarray, m: np.ndarray) -> np.ndarray:
+    return np.sqrt(_EV_TO_ERG * kT / m)
+
+
+# ---- frequency constants ----
+def fce(Bo, **kwargs) -> u.Quantity:
+    """
+    Electron-cyclotron frequency (Hz), see `bapsflib.plasma.core.fce`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+    """
+    return (_oce(_value("Bo", Bo)) / (2.0 * np.pi)) << u.Hz
+
+
+def fci(Bo, m_i, Z, **kwargs) -> u.Quantity:
+    """
+    Ion-cyclotron frequency (Hz), see `bapsflib.plasma.core.fci`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    _fci = _oci(_value("Bo", Bo), _value("m_i", m_i), _value("Z", Z)) / (2.0 * np.pi)
+    return _fci << u.Hz
+
+
+def fLH(Bo, m_i, n_i, Z, **kwargs) -> u.Quantity:
+    """
+    Lower-Hybrid Resonance frequency (Hz), see `bapsflib.plasma.core.fLH`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    n_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion number density (in :math:`cm^{-3}`)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    _olh = oLH(Bo, m_i, n_i, Z).value
+    return (_olh / (2.0 * np.pi)) << u.Hz
+
+
+def fpe(n_e, **kwargs) -> u.Quantity:
+    """
+    Electron-plasma frequency (Hz), see `bapsflib.plasma.core.fpe`.
+
+    Parameters
+    ----------
+    n_e : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron number density (in :math:`cm^{-3}`)
+    """
+    return (_ope(_value("n_e", n_e)) / (2.0 * np.pi)) << u.Hz
+
+
+def fpi(m_i, n_i, Z, **kwargs) -> u.Quantity:
+    """
+    Ion-plasma frequency (Hz), see `bapsflib.plasma.core.fpi`.
+
+    Parameters
+    ----------
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    n_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion number density (in :math:`cm^{-3}`)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    _fpi = _opi(_value("m_i", m_i), _value("n_i", n_i), _value("Z", Z)) / (2.0 * np.pi)
+    return _fpi << u.Hz
+
+
+def fUH(Bo, n_e, **kwargs) -> u.Quantity:
+    """
+    Upper-Hybrid Resonance frequency (Hz), see `bapsflib.plasma.core.fUH`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    n_e : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron number density (in :math:`cm^{-3}`)
+    """
+    return (oUH(Bo, n_e).value / (2.0 * np.pi)) << u.Hz
+
+
+def oce(Bo, **kwargs) -> u.Quantity:
+    """
+    Electron-cyclotron frequency (rad/s), see `bapsflib.plasma.core.oce`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+    """
+    return _oce(_value("Bo", Bo)) << _RAD_PER_S
+
+
+def oci(Bo, m_i, Z, **kwargs) -> u.Quantity:
+    """
+    Ion-cyclotron frequency (rad/s), see `bapsflib.plasma.core.oci`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    _oci_ = _oci(_value("Bo", Bo), _value("m_i", m_i), _value("Z", Z))
+    return _oci_ << _RAD_PER_S
+
+
+def oLH(Bo, m_i, n_i, Z, **kwargs) -> u.Quantity:
+    """
+    Lower-Hybrid Resonance frequency (rad/s), see
+    `bapsflib.plasma.core.oLH`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    n_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion number density (in :math:`cm^{-3}`)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    Bo = _value("Bo", Bo)
+    m_i = _value("m_i", m_i)
+    Z = _value("Z", Z)
+    _oci_ = _oci(Bo, m_i, Z)
+    first_term = 1.0 / (_oci_**2 + _opi(m_i, _value("n_i", n_i), Z) ** 2)
+    second_term = 1.0 / np.abs(_oce(Bo) * _oci_)
+    return np.sqrt(1.0 / (first_term + second_term)) << _RAD_PER_S
+
+
+def ope(n_e, **kwargs) -> u.Quantity:
+    """
+    Electron-plasma frequency (rad/s), see `bapsflib.plasma.core.ope`.
+
+    Parameters
+    ----------
+    n_e : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron number density (in :math:`cm^{-3}`)
+    """
+    return _ope(_value("n_e", n_e)) << _RAD_PER_S
+
+
+def opi(m_i, n_i, Z, **kwargs) -> u.Quantity:
+    """
+    Ion-plasma frequency (rad/s), see `bapsflib.plasma.core.opi`.
+
+    Parameters
+    ----------
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    n_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion number density (in :math:`cm^{-3}`)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    _opi_ = _opi(_value("m_i", m_i), _value("n_i", n_i), _value("Z", Z))
+    return _opi_ << _RAD_PER_S
+
+
+def oUH(Bo, n_e, **kwargs) -> u.Quantity:
+    """
+    Upper-Hybrid Resonance frequency (rad/s), see
+    `bapsflib.plasma.core.oUH`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    n_e : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron number density (in :math:`cm^{-3}`)
+    """
+    _ouh = np.hypot(_ope(_value("n_e", n_e)), _oce(_value("Bo", Bo)))
+    return _ouh << _RAD_PER_S
+
+
+# ---- length constants ----
+def lD(kT, n, **kwargs) -> u.Quantity:
+    """
+    Debye Length (cm), see `bapsflib.plasma.core.lD`.
+
+    Parameters
+    ----------
+    kT : Union[float, numpy.ndarray, astropy.units.Quantity]
+        temperature (in eV)
+
+    n : Union[float, numpy.ndarray, astropy.units.Quantity]
+        number density (in :math:`cm^{-3}`)
+    """
+    kT = _EV_TO_ERG * _value("kT", kT)
+    _lD = np.sqrt(kT / (4.0 * np.pi * _value("n", n))) / E
+    return _lD << u.cm
+
+
+def lpe(n_e, **kwargs) -> u.Quantity:
+    """
+    Electron-inertial length (cm), see `bapsflib.plasma.core.lpe`.
+
+    Parameters
+    ----------
+    n_e : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron number density (in :math:`cm^{-3}`)
+    """
+    return (C / _ope(_value("n_e", n_e))) << u.cm
+
+
+def lpi(m_i, n_i, Z, **kwargs) -> u.Quantity:
+    """
+    Ion-inertial length (cm), see `bapsflib.plasma.core.lpi`.
+
+    Parameters
+    ----------
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    n_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion number density (in :math:`cm^{-3}`)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    _lpi = C / _opi(_value("m_i", m_i), _value("n_i", n_i), _value("Z", Z))
+    return _lpi << u.cm
+
+
+def rce(Bo, kTe, **kwargs) -> u.Quantity:
+    """
+    Electron gyroradius (cm), see `bapsflib.plasma.core.rce`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    kTe : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron temperature (in eV)
+    """
+    _rce = _vT(_value("kTe", kTe), ME) / np.abs(_oce(_value("Bo", Bo)))
+    return _rce << u.cm
+
+
+def rci(Bo, kTi, m_i, Z, **kwargs) -> u.Quantity:
+    """
+    Ion gyroradius (cm), see `bapsflib.plasma.core.rci`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    kTi : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion temperature (in eV)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+    """
+    m_i = _value("m_i", m_i)
+    _rci = _vT(_value("kTi", kTi), m_i) / _oci(_value("Bo", Bo), m_i, _value("Z", Z))
+    return _rci << u.cm
+
+
+# ---- velocity constants ----
+def cs(kTe, m_i, Z, gamma=1.0, **kwargs) -> u.Quantity:
+    """
+    Ion sound speed (cm/s), see `bapsflib.plasma.core.cs`.
+
+    Parameters
+    ----------
+    kTe : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron temperature (in eV)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    Z : Union[int, numpy.ndarray]
+        ion charge number
+
+    gamma : Union[float, numpy.ndarray]
+        adiabatic index (DEFAULT 1.0)
+    """
+    kTe = _value("gamma", gamma) * _value("Z", Z) * _value("kTe", kTe)
+    return _vT(kTe, _value("m_i", m_i)) << _CM_PER_S
+
+
+def VA(Bo, m_i, n_i, **kwargs) -> u.Quantity:
+    """
+    Alfvén Velocity (cm/s), see `bapsflib.plasma.core.VA`.
+
+    Parameters
+    ----------
+    Bo : Union[float, numpy.ndarray, astropy.units.Quantity]
+        magnetic field (in Gauss)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+
+    n_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion number density (in :math:`cm^{-3}`)
+    """
+    _VA = _value("Bo", Bo) / np.sqrt(
+        4.0 * np.pi * _value("n_i", n_i) * _value("m_i", m_i)
+    )
+    return _VA << _CM_PER_S
+
+
+def vTe(kTe, **kwargs) -> u.Quantity:
+    """
+    Electron thermal velocity (cm/s), see `bapsflib.plasma.core.vTe`.
+
+    Parameters
+    ----------
+    kTe : Union[float, numpy.ndarray, astropy.units.Quantity]
+        electron temperature (in eV)
+    """
+    return _vT(_value("kTe", kTe), ME) << _CM_PER_S
+
+
+def vTi(kTi, m_i, **kwargs) -> u.Quantity:
+    """
+    Ion thermal velocity (cm/s), see `bapsflib.plasma.core.vTi`.
+
+    Parameters
+    ----------
+    kTi : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion temperature (in eV)
+
+    m_i : Union[float, numpy.ndarray, astropy.units.Quantity]
+        ion mass (in g)
+    """
+    return _vT(_value("kTi", kTi), _value("m_i", m_i)) << _CM_PER_S
@@ -0,0 +1,428 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2019 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Instrumentation hooks for profiling and tracing the `bapsflib` read
+routines.
+
+The read routines (e.g. `~bapsflib._hdf.utils.hdfreaddata.HDFReadData`
+and `~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls`) emit
+`ProfileEvent` instances to the callbacks registered with
+`add_callback`:
+
+* ``'span'`` events time a named read phase, i.e. ``'read data'``,
+  ``'read controls'``, ``'mapping lookup'``,
+  ``'shotnum conditioning'``, ``'control read'``, ``'msi read'``,
+  ``'shot filtering'``, ``'signal read'``, ``'spatial index'``, and
+  ``'conversion'``
+* ``'bytes'`` events record the number of bytes read from a dataset
+* ``'cache'`` events record hits and misses of the ``'shotnum index'``,
+  ``'file map'``, and ``'spatial index'`` caches
+
+When no callback is registered, the hooks reduce to a single truth
+test, so the instrumentation costs nothing in production.  The
+`profile` context manager collects the events of a code block into a
+`Profile`, which renders a summary table or exports a Chrome trace.
+
+Examples
+--------
+
+>>> import bapsflib
+>>> with bapsflib.profile() as prof:
+...     data = f.read_data(0, 0, add_controls=['6K Compumotor'])
+>>> print(prof.summary())
+>>> prof.to_chrome_trace('read_data.json')  # open with chrome://tracing
+"""
+
+__all__ = [
+    "add_callback",
+    "is_active",
+    "Profile",
+    "profile",
+    "ProfileEvent",
+    "record_bytes",
+    "record_cache",
+    "remove_callback",
+    "span",
+]
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from bapsflib.utils import TableDisplay
+
+
+class ProfileEvent(NamedTuple):
+    """An instrumentation event delivered to the registered callbacks."""
+
+    #: event kind, ``'span'``, ``'bytes'``, or ``'cache'``
+    kind: str
+
+    #: span name, dataset path (``'bytes'``), or cache name (``'cache'``)
+    name: str
+
+    #: start time of the event (`time.perf_counter_ns`) in nanoseconds
+    start_ns: int
+
+    #: duration of a ``'span'`` in nanoseconds, 0 for other kinds
+    duration_ns: int
+
+    #: number of bytes read (``'bytes'``), 1 for a hit and 0 for a miss
+    #: (``'cache'``), 0 for a ``'span'``
+    value: int
+
+    #: identifier of the thread that emitted the event
+    thread_id: int
+
+    #: additional attributes of the event (e.g. the board and channel
+    #: of a ``'read data'`` span)
+    attrs: Dict[str, Any]
+
+
+#: registered callbacks, replaced (never mutated) on (un-)registration
+#: so events can be dispatched without holding the lock
+_callbacks = ()  # type: Tuple[Callable[[ProfileEvent], Any], ...]
+_callbacks_lock = threading.Lock()
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def add_callback(callback: Callable[[ProfileEvent], Any]):
+    """
+    Register ``callback`` to be called with every `ProfileEvent`
+    emitted by the read routines.  Callbacks are called in the thread
+    that emitted the event, and exceptions raised by a callback
+    propagate to the read routine.
+    """
+    global _callbacks
+
+    if not callable(callback):
+        raise TypeError(f"Argument `callback` must be callable, got {type(callback)}.")
+
+    with _callbacks_lock:
+        _callbacks = _callbacks + (callback,)
+
+
+def remove_callback(callback: Callable[[ProfileEvent], Any]):
+    """
+    Un-register ``callback`` (see `add_callback`).  Raises a
+    `ValueError` if ``callback`` is not registered.
+    """
+    global _callbacks
+
+    with _callbacks_lock:
+        callbacks = list(_callbacks)
+        try:
+            callbacks.remove(callback)
+        except ValueError:
+            raise ValueError(f"Callback {callback} is not registered.")
+        _callbacks = tuple(callbacks)
+
+
+def is_active() -> bool:
+    """`True` if any callback is registered."""
+    return bool(_callbacks)
+
+
+def _emit(event: ProfileEvent):
+    """Dispatch ``event`` to all registered callbacks."""
+    for callback in _callbacks:
+        callback(event)
+
+
+class _Span:
+    """Context manager emitting a ``'span'`` `ProfileEvent` on exit."""
+
+    __slots__ = ("name", "attrs", "_start")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        stop = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        _emit(
+            ProfileEvent(
+                kind="span",
+                name=self.name,
+                start_ns=self._start,
+                duration_ns=stop - self._start,
+                value=0,
+                thread_id=threading.get_ident(),
+                attrs=self.attrs,
+            )
+        )
+        return False
+
+
+def span(name: str, **attrs):
+    """
+    Context manager timing the read phase ``name``.  On exit a
+    ``'span'`` `ProfileEvent` with the keyword attributes ``attrs`` is
+    emitted.  If no callback is registered, then a no-op context
+    manager is returned.
+
+    Examples
+    --------
+
+    >>> with span('signal read', dataset=dset.name):
+    ...     data = dset[...]
+    """
+    if not _callbacks:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+
+def record_bytes(dataset: str, nbytes: int, **attrs):
+    """
+    Emit a ``'bytes'`` `ProfileEvent` recording that ``nbytes`` bytes
+    were read from the dataset at path ``dataset``.
+    """
+    if not _callbacks:
+        return
+    _emit(
+        ProfileEvent(
+            kind="bytes",
+            name=dataset,
+            start_ns=time.perf_counter_ns(),
+            duration_ns=0,
+            value=int(nbytes),
+            thread_id=threading.get_ident(),
+            attrs=attrs,
+        )
+    )
+
+
+def record_cache(cache: str, hit: bool, **attrs):
+    """
+    Emit a ``'cache'`` `ProfileEvent` recording a hit (``hit=True``)
+    or miss of the cache named ``cache``.
+    """
+    if not _callbacks:
+        return
+    _emit(
+        ProfileEvent(
+            kind="cache",
+            name=cache,
+            start_ns=time.perf_counter_ns(),
+            duration_ns=0,
+            value=int(bool(hit)),
+            thread_id=threading.get_ident(),
+            attrs=attrs,
+        )
+    )
+
+
+class Profile:
+    """
+    Collector of the `ProfileEvent` instances emitted while it is
+    registered as a callback (see `profile`).
+    """
+
+    def __init__(self):
+        self._events = []  # type: List[ProfileEvent]
+
+    def __call__(self, event: ProfileEvent):
+        # list.append is atomic, so events of multiple threads can be
+        # collected without a lock
+        self._events.append(event)
+
+    def __enter__(self):
+        add_callback(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        remove_callback(self)
+        return False
+
+    @property
+    def events(self) -> List[ProfileEvent]:
+        """All collected events, in emission order."""
+        return list(self._events)
+
+    @property
+    def spans(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statistics of the collected spans keyed by span name, each a
+        dictionary of ``'calls'``, and the ``'total'``, ``'mean'``, and
+        ``'max'`` durations in seconds.
+        """
+        stats = {}  # type: Dict[str, Dict[str, float]]
+        for event in self._events:
+            if event.kind != "span":
+                continue
+            duration = event.duration_ns * 1.0e-9
+            entry = stats.setdefault(
+                event.name, {"calls": 0, "total": 0.0, "mean": 0.0, "max": 0.0}
+            )
+            entry["calls"] += 1
+            entry["total"] += duration
+            entry["max"] = max(entry["max"], duration)
+        for entry in stats.values():
+            entry["mean"] = entry["total"] / entry["calls"]
+        return stats
+
+    @property
+    def bytes_read(self) -> Dict[str, int]:
+        """Total number of bytes read keyed by dataset path."""
+        nbytes = {}  # type: Dict[str, int]
+        for event in self._events:
+            if event.kind == "bytes":
+                nbytes[event.name] = nbytes.get(event.name, 0) + event.value
+        return nbytes
+
+    @property
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Number of ``'hits'`` and ``'misses'`` keyed by cache name.
+        """
+        stats = {}  # type: Dict[str, Dict[str, int]]
+        for event in self._events:
+            if event.kind == "cache":
+                entry = stats.setdefault(event.name, {"hits": 0, "misses": 0})
+                entry["hits" if event.value else "misses"] += 1
+        return stats
+
+    def clear(self):
+        """Discard all collected events."""
+        self._events.clear()
+
+    def summary(self) -> str:
+        """
+        Summary tables of the span timings, bytes read per dataset, and
+        cache hits.
+        """
+        tables = []
+        spans = self.spans
+        if spans:
+            rows = [
+                [
+                    name,
+                    f"{entry['calls']:d}",
+                    f"{entry['total'] * 1.0e3:.3f}",
+                    f"{entry['mean'] * 1.0e3:.3f}",
+                    f"{entry['max'] * 1.0e3:.3f}",
+                ]
+                for name, entry in sorted(
+                    spans.items(), key=lambda item: item[1]["total"], reverse=True
+                )
+            ]
+            tables.append(
+                TableDisplay(
+                    rows, headers=["span", "calls", "total (ms)", "mean (ms)", "max (ms)"]
+                ).table_string()
+            )
+
+        nbytes = self.bytes_read
+        if nbytes:
+            rows = [[name, f"{val:d}"] for name, val in sorted(nbytes.items())]
+            tables.append(
+                TableDisplay(rows, headers=["dataset", "bytes read"]).table_string()
+            )
+
+        cache_stats = self.cache_stats
+        if cache_stats:
+            rows = [
+                [name, f"{entry['hits']:d}", f"{entry['misses']:d}"]
+                for name, entry in sorted(cache_stats.items())
+            ]
+            tables.append(
+                TableDisplay(rows, headers=["cache", "hits", "misses"]).table_string()
+            )
+
+        if not tables:
+            return "No events recorded.\n"
+        return "\n".join(tables)
+
+    def to_chrome_trace(self, filename: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Export the collected events in the Chrome trace event format
+        (viewable with ``chrome://tracing`` or https://ui.perfetto.dev).
+        Spans are exported as complete (``'X'``) events, and bytes read
+        and cache look-ups as instant (``'i'``) events.
+
+        Parameters
+        ----------
+        filename : `str`, optional
+            if given, the trace is also written to ``filename`` as JSON
+
+        Returns
+        -------
+        Dict[str, Any]
+            the trace dictionary
+        """
+        pid = os.getpid()
+        t0 = min((event.start_ns for event in self._events), default=0)
+        trace_events = []
+        for event in self._events:
+            args = {key: _json_value(val) for key, val in event.attrs.items()}
+            entry = {
+                "name": event.name,
+                "cat": event.kind,
+                "ts": (event.start_ns - t0) * 1.0e-3,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": args,
+            }
+            if event.kind == "span":
+                entry.update(ph="X", dur=event.duration_ns * 1.0e-3)
+            else:
+                entry.update(ph="i", s="t")
+                args["nbytes" if event.kind == "bytes" else "hit"] = (
+                    event.value if event.kind == "bytes" else bool(event.value)
+                )
+            trace_events.append(entry)
+
+        trace = {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+        if filename is not None:
+            with open(filename, "w") as trace_file:
+                json.dump(trace, trace_file)
+        return trace
+
+
+def _json_value(value: Any) -> Any:
+    """Convert an event attribute to a JSON serializable value."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_json_value(val) for val in value]
+    try:
+        # numpy scalars
+        return value.item()
+    except (AttributeError, ValueError):
+        return str(value)
+
+
+def profile() -> Profile:
+    """
+    Context manager collecting the `ProfileEvent` instances emitted
+    within its block into a `Profile`.
+
+    Examples
+    --------
+
+    >>> with profile() as prof:
+    ...     data = f.read_data(0, 0)
+    >>> print(prof.summary())
+    >>> prof.to_chrome_trace('trace.json')
+    """
+    return Profile()
@@ -9,12 +9,14 @@
 #   license terms and contributor agreement.
 #
 import inspect
+import os
 import unittest as ut
 
 from unittest import mock
 
 from bapsflib._hdf import File as BaPSFFile
 from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib._hdf.utils.map_cache import MAP_CACHE_DIR_ENV
 from bapsflib.lapd import File as LaPDFile
 from bapsflib.utils.decorators import with_bf, with_lapdf
 
@@ -32,6 +34,12 @@ class TestWithBF(ut.TestCase):
         super().setUpClass()
         cls.f = FauxHDFBuilder()
 
+        # keep mapping cache entries out of the user cache directory
+        cls._map_cache_env = mock.patch.dict(
+            os.environ, {MAP_CACHE_DIR_ENV: cls.f.tempdir.name}
+        )
+        cls._map_cache_env.start()
+
     def setUp(self) -> None:
         super().setUp()
 
@@ -43,6 +51,7 @@ class TestWithBF(ut.TestCase):
     def tearDownClass(cls) -> None:
         # cleanup and close HDF5 file
         super().tearDownClass()
+        cls._map_cache_env.stop()
         cls.f.cleanup()
 
     @property
@@ -337,6 +346,12 @@ class TestWithLaPDF(ut.TestCase):
         super().setUpClass()
         cls.f = FauxHDFBuilder()
 
+        # keep mapping cache entries out of the user cache directory
+        cls._map_cache_env = mock.patch.dict(
+            os.environ, {MAP_CACHE_DIR_ENV: cls.f.tempdir.name}
+        )
+        cls._map_cache_env.start()
+
     def setUp(self) -> None:
         super().setUp()
 
@@ -348,6 +363,7 @@ class TestWithLaPDF(ut.TestCase):
     def tearDownClass(cls) -> None:
         # cleanup and close HDF5 file
         super().tearDownClass()
+        cls._map_cache_env.stop()
         cls.f.cleanup()
 
     @property
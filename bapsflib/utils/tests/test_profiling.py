@@ -0,0 +1,175 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2019 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+import json
+import numpy as np
+import os
+import tempfile
+import threading
+import unittest as ut
+
+from unittest import mock
+
+import bapsflib
+
+from bapsflib.utils import profiling
+from bapsflib.utils.profiling import Profile, ProfileEvent
+
+
+class TestProfiling(ut.TestCase):
+    """Test case for `bapsflib.utils.profiling`."""
+
+    def tearDown(self):
+        # never leak a registered callback into other tests
+        for callback in profiling._callbacks:
+            profiling.remove_callback(callback)
+
+    def test_inactive(self):
+        """Without callbacks the hooks are no-ops."""
+        self.assertFalse(profiling.is_active())
+        self.assertIs(profiling.span("a"), profiling.span("b", x=1))
+        with mock.patch.object(profiling, "_emit") as mock_emit:
+            with profiling.span("a"):
+                pass
+            profiling.record_bytes("/dset", 10)
+            profiling.record_cache("cache", True)
+            mock_emit.assert_not_called()
+
+    def test_callbacks(self):
+        events = []
+        profiling.add_callback(events.append)
+        self.assertTrue(profiling.is_active())
+
+        with profiling.span("outer", board=1):
+            with profiling.span("inner"):
+                pass
+        profiling.record_bytes("/dset", np.int64(80), stored=20)
+        profiling.record_cache("cache", True)
+        profiling.record_cache("cache", False)
+        with self.assertRaises(KeyError), profiling.span("failed"):
+            raise KeyError
+
+        self.assertEqual(
+            [(event.kind, event.name) for event in events],
+            [
+                ("span", "inner"),
+                ("span", "outer"),
+                ("bytes", "/dset"),
+                ("cache", "cache"),
+                ("cache", "cache"),
+                ("span", "failed"),
+            ],
+        )
+        self.assertTrue(all(isinstance(event, ProfileEvent) for event in events))
+        inner, outer = events[:2]
+        self.assertEqual(outer.attrs, {"board": 1})
+        self.assertLessEqual(outer.start_ns, inner.start_ns)
+        self.assertGreaterEqual(outer.duration_ns, inner.duration_ns)
+        self.assertEqual(outer.thread_id, threading.get_ident())
+        self.assertEqual(events[2].value, 80)
+        self.assertEqual(events[2].attrs, {"stored": 20})
+        self.assertEqual([events[3].value, events[4].value], [1, 0])
+        self.assertEqual(events[5].attrs, {"error": "KeyError"})
+
+        # un-register
+        profiling.remove_callback(events.append)
+        self.assertFalse(profiling.is_active())
+        with profiling.span("ignored"):
+            pass
+        self.assertEqual(len(events), 6)
+
+        # callback errors propagate
+        profiling.add_callback(mock.Mock(side_effect=RuntimeError))
+        with self.assertRaises(RuntimeError), profiling.span("a"):
+            pass
+
+    def test_raises(self):
+        with self.assertRaises(TypeError):
+            profiling.add_callback("not callable")
+        with self.assertRaises(ValueError):
+            profiling.remove_callback(print)
+
+    def test_profile(self):
+        prof = bapsflib.profile()
+        self.assertIsInstance(prof, Profile)
+        self.assertEqual(prof.summary(), "No events recorded.\n")
+
+        with prof:
+            self.assertTrue(profiling.is_active())
+            for _ in range(3):
+                with profiling.span("read", dataset="/dset"):
+                    profiling.record_bytes("/dset", 100)
+            profiling.record_cache("cache", True)
+            profiling.record_cache("cache", False)
+            profiling.record_cache("cache", True)
+        self.assertFalse(profiling.is_active())
+
+        # events
+        self.assertEqual(len(prof.events), 9)
+        prof.events.clear()  # a copy
+        self.assertEqual(len(prof.events), 9)
+
+        # statistics
+        spans = prof.spans
+        self.assertEqual(list(spans), ["read"])
+        self.assertEqual(spans["read"]["calls"], 3)
+        self.assertAlmostEqual(spans["read"]["mean"] * 3, spans["read"]["total"])
+        self.assertLessEqual(spans["read"]["max"], spans["read"]["total"])
+        self.assertEqual(prof.bytes_read, {"/dset": 300})
+        self.assertEqual(prof.cache_stats, {"cache": {"hits": 2, "misses": 1}})
+
+        # summary
+        summary = prof.summary()
+        for text in ("span", "read", "/dset", "300", "cache", "hits"):
+            self.assertIn(text, summary)
+
+        # chrome trace
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "trace.json")
+            trace = prof.to_chrome_trace(filename)
+            with open(filename) as trace_file:
+                self.assertEqual(json.load(trace_file), trace)
+        events = trace["traceEvents"]
+        self.assertEqual(len(events), 9)
+        self.assertEqual([event["ph"] for event in events].count("X"), 3)
+        span_event = next(event for event in events if event["ph"] == "X")
+        self.assertEqual(span_event["args"], {"dataset": "/dset"})
+        self.assertGreaterEqual(span_event["dur"], 0.0)
+        self.assertEqual(min(event["ts"] for event in events), 0.0)
+        self.assertIn({"nbytes": 100}, [event["args"] for event in events])
+
+        prof.clear()
+        self.assertEqual(prof.events, [])
+
+    def test_threads(self):
+        """Events of multiple threads are collected."""
+
+        barrier = threading.Barrier(4)
+
+        def work():
+            # keep all threads alive so their identifiers are distinct
+            barrier.wait()
+            for _ in range(50):
+                with profiling.span("work"):
+                    pass
+
+        with bapsflib.profile() as prof:
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(prof.spans["work"]["calls"], 200)
+        self.assertEqual(len({event.thread_id for event in prof.events}), 4)
+
+
+if __name__ == "__main__":
+    ut.main()
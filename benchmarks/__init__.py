@@ -0,0 +1,29 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Performance benchmarks of bapsflib, written for
+`airspeed velocity (asv) <https://asv.readthedocs.io/>`_.
+
+The benchmarks run against synthetic HDF5 files generated with
+`~bapsflib._hdf.maps.tests.fauxhdfbuilder.FauxHDFBuilder` (see
+`benchmarks.common`), parameterized by the number of shots, samples,
+and channels, the attached control devices, and the dataset
+compression.
+
+Run the suite against the current checkout with::
+
+    asv run --python=same --quick   # single pass, no history
+    asv continuous main HEAD        # compare HEAD against main
+
+or time one benchmark with::
+
+    asv run --python=same --bench ReadDataSuite.time_read_data_index
+"""
@@ -0,0 +1,70 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""Benchmarks of opening (mapping) a file and generating its overview."""
+
+import contextlib
+import io
+
+from bapsflib._hdf.utils.map_cache import invalidate_map_cache
+from benchmarks.common import build_files, open_file
+
+
+class FileOpenSuite:
+    """Opening and mapping a file."""
+
+    params = ([100, 1000], [False, True], [False, True])
+    param_names = ["nshots", "lazy_map", "map_cache"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_files(self.params, self.param_names)
+
+    def setup(self, files, nshots, lazy_map, map_cache):
+        self.filename = files[(nshots, lazy_map, map_cache)]
+        invalidate_map_cache(self.filename)
+        if map_cache:
+            # populate the on-disk mapping cache
+            with open_file(self.filename, lazy_map=lazy_map, map_cache=True) as f:
+                f.file_map
+
+    def teardown(self, files, nshots, lazy_map, map_cache):
+        invalidate_map_cache(self.filename)
+
+    def time_open(self, files, nshots, lazy_map, map_cache):
+        with open_file(self.filename, lazy_map=lazy_map, map_cache=map_cache):
+            pass
+
+    def time_open_and_map(self, files, nshots, lazy_map, map_cache):
+        with open_file(self.filename, lazy_map=lazy_map, map_cache=map_cache) as f:
+            f.file_map.digitizers
+            f.file_map.controls
+            f.file_map.msi
+
+
+class OverviewSuite:
+    """Generating the file overview report."""
+
+    params = [100, 1000]
+    param_names = ["nshots"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_files([self.params], self.param_names)
+
+    def setup(self, files, nshots):
+        self.f = open_file(files[(nshots,)], map_cache=False)
+
+    def teardown(self, files, nshots):
+        self.f.close()
+
+    def time_overview(self, files, nshots):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.f.overview.print()
@@ -0,0 +1,75 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""Benchmarks of reading control device data."""
+
+from benchmarks.common import build_files, open_file
+
+
+class ReadControlsSuite:
+    """Reading control device data with `bapsflib._hdf.utils.file.File.read_controls`."""
+
+    params = [100, 1000]
+    param_names = ["nshots"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_files([self.params], self.param_names)
+
+    def setup(self, files, nshots):
+        self.f = open_file(files[(nshots,)])
+
+    def teardown(self, files, nshots):
+        self.f.close()
+
+    def time_read_6k(self, files, nshots):
+        self.f.read_controls(["6K Compumotor"], silent=True)
+
+    def time_read_waveform(self, files, nshots):
+        self.f.read_controls(["Waveform"], silent=True)
+
+    def time_read_all(self, files, nshots):
+        self.f.read_controls(["6K Compumotor", "Waveform"], silent=True)
+
+    def time_read_shotnum(self, files, nshots):
+        self.f.read_controls(
+            ["6K Compumotor"], shotnum=list(range(1, nshots + 1, 3)), silent=True
+        )
+
+    def time_to_grid(self, files, nshots):
+        self.f.read_controls(["6K Compumotor"], silent=True).to_grid()
+
+
+class ReadWaveformCommandsSuite:
+    """
+    Reading a 'Waveform' control device with a long command list with
+    `bapsflib._hdf.utils.file.File.read_controls`.
+    """
+
+    params = ([3, 300, 1000], [1000, 10000])
+    param_names = ["ncommands", "nshots"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_files(self.params, self.param_names)
+
+    def setup(self, files, ncommands, nshots):
+        self.f = open_file(files[(ncommands, nshots)])
+
+    def teardown(self, files, ncommands, nshots):
+        self.f.close()
+
+    def time_read_waveform(self, files, ncommands, nshots):
+        self.f.read_controls(["Waveform"], silent=True)
+
+    def time_read_shotnum(self, files, ncommands, nshots):
+        self.f.read_controls(
+            ["Waveform"], shotnum=list(range(1, nshots + 1, 3)), silent=True
+        )
@@ -0,0 +1,60 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""Benchmarks of reading digitizer data."""
+
+from benchmarks.common import build_files, connections, DIGITIZER, open_file
+
+
+class ReadDataSuite:
+    """Reading digitizer data with `bapsflib._hdf.utils.file.File.read_data`."""
+
+    params = ([100, 1000], [None, "gzip"])
+    param_names = ["nshots", "compression"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_files(self.params, self.param_names)
+
+    def setup(self, files, nshots, compression):
+        self.f = open_file(files[(nshots, compression)])
+        self.connections = connections(self.f)
+        self.brd, self.ch = self.connections[0]
+        self.kwargs = {"digitizer": DIGITIZER, "silent": True}
+
+    def teardown(self, files, nshots, compression):
+        self.f.close()
+
+    def time_read_data_all(self, files, nshots, compression):
+        self.f.read_data(self.brd, self.ch, **self.kwargs)
+
+    def time_read_data_index(self, files, nshots, compression):
+        self.f.read_data(self.brd, self.ch, index=slice(None, None, 2), **self.kwargs)
+
+    def time_read_data_shotnum(self, files, nshots, compression):
+        self.f.read_data(
+            self.brd, self.ch, shotnum=list(range(1, nshots + 1, 3)), **self.kwargs
+        )
+
+    def time_read_data_controls(self, files, nshots, compression):
+        self.f.read_data(self.brd, self.ch, add_controls=["6K Compumotor"], **self.kwargs)
+
+    def time_read_data_many(self, files, nshots, compression):
+        self.f.read_data_many(self.connections, **self.kwargs)
+
+    def time_read_data_threads(self, files, nshots, compression):
+        self.f.read_data(self.brd, self.ch, engine="threads", **self.kwargs)
+
+    def time_iter_data(self, files, nshots, compression):
+        for _ in self.f.iter_data(self.brd, self.ch, chunk_shots=64, **self.kwargs):
+            pass
+
+    def peakmem_read_data(self, files, nshots, compression):
+        self.f.read_data(self.brd, self.ch, **self.kwargs)
@@ -0,0 +1,33 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""Benchmarks of reading MSI diagnostic data."""
+
+from benchmarks.common import build_files, MSI, open_file
+
+
+class ReadMSISuite:
+    """Reading MSI diagnostic data with `bapsflib._hdf.utils.file.File.read_msi`."""
+
+    params = list(MSI)
+    param_names = ["msi_diag"]
+    timeout = 300
+
+    def setup_cache(self):
+        return build_files([self.params], self.param_names)
+
+    def setup(self, files, msi_diag):
+        self.f = open_file(files[(msi_diag,)])
+
+    def teardown(self, files, msi_diag):
+        self.f.close()
+
+    def time_read_msi(self, files, msi_diag):
+        self.f.read_msi(msi_diag, silent=True)
@@ -0,0 +1,226 @@
+# This file is part of the bapsflib package, a Python toolkit for the
+# BaPSF group at UCLA.
+#
+# http://plasma.physics.ucla.edu/
+#
+# Copyright 2017-2018 Erik T. Everson and contributors
+#
+# License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
+#   license terms and contributor agreement.
+#
+"""
+Helpers to generate the synthetic HDF5 files used by the benchmarks.
+"""
+
+__all__ = [
+    "build_file",
+    "build_files",
+    "connections",
+    "CONTROLS",
+    "DIGITIZER",
+    "MSI",
+    "open_file",
+]
+
+import h5py
+import inspect
+import itertools
+import math
+import numpy as np
+import os
+
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from bapsflib._hdf.maps.tests import FauxHDFBuilder
+from bapsflib._hdf.utils.file import File
+
+#: name of the digitizer in the generated files
+DIGITIZER = "SIS 3301"
+
+#: control devices added to the generated files
+CONTROLS = ("6K Compumotor", "Waveform")
+
+#: MSI diagnostics added to the generated files
+MSI = ("Discharge", "Magnetic field")
+
+
+def build_file(
+    filename: str,
+    nshots: int = 100,
+    nt: int = 2048,
+    nchannels: int = 4,
+    controls: bool = True,
+    msi: bool = True,
+    compression: Union[str, None] = None,
+    chunk_shots: int = 64,
+    ncommands: Union[int, None] = None,
+) -> str:
+    """
+    Generate a synthetic BaPSF HDF5 file with
+    `~bapsflib._hdf.maps.tests.fauxhdfbuilder.FauxHDFBuilder`.
+
+    Parameters
+    ----------
+    filename : `str`
+        path of the generated file
+
+    nshots : `int`
+        number of shots (rows) of every dataset
+
+    nt : `int`
+        number of time samples of each digitizer dataset
+
+    nchannels : `int`
+        number of active digitizer channels (at most 8 per board)
+
+    controls : `bool`
+        `True` to add the `CONTROLS` devices, the '6K Compumotor' probe
+        positions are filled as a raster scan of a complete 2D grid
+
+    msi : `bool`
+        `True` to add the `MSI` diagnostics
+
+    compression : `str`, optional
+        filter of the (chunked) digitizer datasets, ``'gzip'`` (with
+        the shuffle filter) or ``'lzf'``.  If `None`, then the datasets
+        are stored contiguously.
+
+    chunk_shots : `int`
+        number of shots per chunk of compressed digitizer datasets
+
+    ncommands : `int`, optional
+        number of commands in the command list of the 'Waveform'
+        control device, each shot is assigned a random command.  If
+        `None`, then the default 3-command list of
+        `~bapsflib._hdf.maps.controls.tests.fauxwaveform.FauxWaveform`
+        is kept.
+
+    Returns
+    -------
+    str
+        ``filename``
+    """
+    modules = {DIGITIZER: {"n_configs": 1, "sn_size": nshots, "nt": nt}}
+    if controls:
+        modules["6K Compumotor"] = {
+            "n_configs": 1,
+            "n_motionlists": 1,
+            "sn_size": nshots,
+        }
+        modules["Waveform"] = {"n_configs": 1, "sn_size": nshots}
+    if msi:
+        modules.update({name: {} for name in MSI})
+
+    faux = FauxHDFBuilder(name=filename, add_modules=modules)
+    try:
+        # activate the digitizer channels
+        brdch = np.zeros((13, 8), dtype=bool)
+        for ii in range(nchannels):
+            brdch[ii // 8, ii % 8] = True
+        faux.modules[DIGITIZER].knobs.active_brdch = brdch
+
+        # fill the digitizer signals with a noisy sine wave
+        rng = np.random.default_rng(0)
+        time = np.arange(nt)
+        digi_group = faux[f"Raw data + config/{DIGITIZER}"]
+        for name in list(digi_group):
+            dset = digi_group[name]
+            if not isinstance(dset, h5py.Dataset) or dset.dtype.names is not None:
+                # configuration group or header dataset
+                continue
+
+            phase = rng.uniform(0.0, 2.0 * np.pi, size=(nshots, 1))
+            signal = 4000.0 * np.sin(2.0 * np.pi * time / 256.0 + phase)
+            signal += rng.normal(scale=40.0, size=signal.shape)
+            signal = signal.astype(np.int16)
+            if compression is None:
+                dset[...] = signal
+            else:
+                del digi_group[name]
+                digi_group.create_dataset(
+                    name,
+                    data=signal,
+                    chunks=(min(chunk_shots, nshots), nt),
+                    compression=compression,
+                    shuffle=compression == "gzip",
+                )
+
+        # fill the probe positions as a raster scan of a 2D grid
+        if controls:
+            sixk = faux["Raw data + config/6K Compumotor"]
+            for name in list(sixk):
+                dset = sixk[name]
+                if isinstance(dset, h5py.Dataset) and "x" in dset.dtype.names:
+                    data = dset[...]
+                    nx = max(
+                        ii for ii in range(1, math.isqrt(nshots) + 1) if nshots % ii == 0
+                    )
+                    data["x"] = np.arange(nshots) % nx
+                    data["y"] = np.arange(nshots) // nx
+                    data["z"] = 0.0
+                    dset[...] = data
+
+        # replace the 'Waveform' command list
+        if controls and ncommands is not None:
+            waveform = faux["Raw data + config/Waveform"]
+            waveform["config01"].attrs["Waveform command list"] = np.bytes_(
+                "".join(f"FREQ {1000.0 * (ii + 1):f} \n" for ii in range(ncommands))
+            )
+            data = waveform["Run time list"][...]
+            data["Command index"] = rng.integers(0, ncommands, size=nshots)
+            waveform["Run time list"][...] = data
+    finally:
+        faux.close()
+
+    return filename
+
+
+def open_file(filename: str, **kwargs) -> File:
+    """Open a file generated by `build_file` (read-only)."""
+    return File(
+        filename,
+        control_path="Raw data + config",
+        digitizer_path="Raw data + config",
+        msi_path="MSI",
+        silent=True,
+        **kwargs,
+    )
+
+
+def connections(hdf_file: File) -> List[Tuple[int, int]]:
+    """
+    The ``(board, channel)`` connections of the active configuration
+    of the `DIGITIZER` in ``hdf_file``.
+    """
+    _map = hdf_file.digitizers[DIGITIZER]
+    config = _map.configs[_map.active_configs[0]]
+    return [(brd, ch) for brd, chs, _ in config[DIGITIZER] for ch in chs]
+
+
+def build_files(
+    params: Sequence[Sequence[Any]], param_names: Sequence[str], **kwargs
+) -> Dict[Tuple, str]:
+    """
+    Generate one file (see `build_file`) in the current working
+    directory for every combination of the asv benchmark ``params``,
+    whose names ``param_names`` are keywords of `build_file`.  Names
+    that are not keywords of `build_file` are ignored.  ``kwargs`` are
+    passed to every `build_file` call.  Returns the dictionary of the
+    file paths keyed by the parameter combination.
+    """
+    build_args = inspect.signature(build_file).parameters
+    files = {}
+    built = {}  # type: Dict[Tuple, str]
+    for combo in itertools.product(*params):
+        _kwargs = kwargs.copy()
+        _kwargs.update(
+            {name: val for name, val in zip(param_names, combo) if name in build_args}
+        )
+
+        # only build one file per distinct set of build arguments
+        key = tuple(sorted(_kwargs.items()))
+        if key not in built:
+            built[key] = build_file(os.path.abspath(f"faux_{len(built)}.hdf5"), **_kwargs)
+        files[combo] = built[key]
+
+    return files